@@ -0,0 +1,144 @@
+"""Benchmark: repeated fetches with and without the on-disk HTTP cache.
+
+Starts a local server that answers after ``--latency`` seconds with an
+HTML page (``/page``, ``Cache-Control: max-age=600``) and a document
+served with ``no-cache`` + ``ETag`` (``/doc``, always revalidated), then
+times ``--runs`` repeats of:
+
+* ``http_request`` of ``/page`` with ``bypass_cache=True`` vs cached;
+* ``http_request`` of ``/doc`` (each repeat is a ``304`` revalidation);
+* ``download`` of ``/page`` with ``convert_to_markdown=True``, with the
+  cache emptied before each call vs cached (a hit also skips the
+  MarkItDown conversion).
+
+Usage::
+
+    python benchmarks/bench_http_cache.py [--runs 20] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+from loguru import logger  # noqa: E402
+
+from aria.tools.http import http_request  # noqa: E402
+from aria.tools.http.cache import get_http_cache  # noqa: E402
+from aria.tools.http.client import aclose_http_clients  # noqa: E402
+from aria.tools.search import download  # noqa: E402
+
+_PAGE = (
+    "<html><head><title>Reference</title></head><body>"
+    + "".join(
+        f"<h2>Section {i}</h2><p>{'Lorem ipsum dolor sit amet. ' * 40}</p>"
+        f"<ul>{'<li><a href=/x>item</a></li>' * 10}</ul>"
+        for i in range(60)
+    )
+    + "</body></html>"
+).encode()
+
+
+def _serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            if self.path == "/doc":
+                if self.headers.get("If-None-Match") == '"doc-v1"':
+                    self.send_response(304)
+                    self.send_header("ETag", '"doc-v1"')
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                headers = {"Cache-Control": "no-cache", "ETag": '"doc-v1"'}
+            else:
+                headers = {"Cache-Control": "max-age=600"}
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(_PAGE)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(_PAGE)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _timed(runs: int, call) -> float:
+    call()  # prime the cache (and the connection)
+    start = time.perf_counter()
+    for _ in range(runs):
+        call()
+    return (time.perf_counter() - start) / runs
+
+
+async def _downloads(url: str, runs: int, cold: bool) -> float:
+    async def once() -> None:
+        if cold:
+            get_http_cache().clear()
+        await download(reason="bench", url=url, convert_to_markdown=True)
+
+    await once()
+    start = time.perf_counter()
+    for _ in range(runs):
+        await once()
+    elapsed = (time.perf_counter() - start) / runs
+    await aclose_http_clients()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="s per request")
+    args = parser.parse_args()
+    logger.remove()
+
+    server = _serve(args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def request(path: str, bypass: bool):
+        return lambda: http_request(
+            reason="bench", method="GET", url=base + path, bypass_cache=bypass
+        )
+
+    rows = [
+        ("http_request", "bypass", _timed(args.runs, request("/page", True))),
+        ("http_request", "fresh hit", _timed(args.runs, request("/page", False))),
+        ("http_request", "revalidated", _timed(args.runs, request("/doc", False))),
+        (
+            "download+md",
+            "cold",
+            asyncio.run(_downloads(base + "/page", args.runs, cold=True)),
+        ),
+        (
+            "download+md",
+            "fresh hit",
+            asyncio.run(_downloads(base + "/page", args.runs, cold=False)),
+        ),
+    ]
+    server.shutdown()
+
+    header = f"{'call':<14} {'cache':<12} {'ms / call':>10}"
+    print(f"page size {len(_PAGE) / 1024:.0f} KiB, origin latency {args.latency}s")
+    print(header)
+    print("-" * len(header))
+    for call, mode, seconds in rows:
+        print(f"{call:<14} {mode:<12} {seconds * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
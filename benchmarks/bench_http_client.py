@@ -0,0 +1,130 @@
+"""Benchmark: 100 sequential requests, per-call clients vs the shared pool.
+
+Starts a local HTTP/1.1 keep-alive server and times ``--requests``
+sequential GETs four ways:
+
+* ``sync per-call``  — ``with httpx.Client() as c: c.get(url)`` each time
+  (how ``http_request``, ``classify_url`` and the old SearXNG client
+  worked);
+* ``sync shared``    — :func:`aria.tools.http.client.get_sync_client`;
+* ``async per-call`` — ``async with httpx.AsyncClient()`` each time (the
+  old ``download`` path);
+* ``async shared``   — :func:`aria.tools.http.client.get_async_client`.
+
+The server is on loopback, so the numbers cover client setup, TCP
+connects and DNS only — TLS handshakes to real hosts add more per call.
+
+Usage::
+
+    python benchmarks/bench_http_client.py [--requests 100]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+import httpx  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from aria.tools.http.client import (  # noqa: E402
+    aclose_http_clients,
+    get_async_client,
+    get_sync_client,
+)
+
+
+def _serve() -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this the
+        # second one waits on the client's delayed ACK.
+        disable_nagle_algorithm = True
+        connections = 0
+
+        def setup(self) -> None:
+            super().setup()
+            Handler.connections += 1
+
+        def do_GET(self) -> None:
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.handler = Handler  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _sync_per_call(url: str, n: int) -> None:
+    for _ in range(n):
+        with httpx.Client(timeout=10, follow_redirects=True) as client:
+            client.get(url).raise_for_status()
+
+
+def _sync_shared(url: str, n: int) -> None:
+    client = get_sync_client()
+    for _ in range(n):
+        client.get(url, timeout=10, follow_redirects=True).raise_for_status()
+
+
+async def _async_per_call(url: str, n: int) -> None:
+    for _ in range(n):
+        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+            (await client.get(url)).raise_for_status()
+
+
+async def _async_shared(url: str, n: int) -> None:
+    client = get_async_client()
+    for _ in range(n):
+        (await client.get(url, timeout=10, follow_redirects=True)).raise_for_status()
+    await aclose_http_clients()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+    logger.remove()
+
+    server = _serve()
+    # A host name, so per-call clients pay for name resolution as well.
+    url = f"http://localhost:{server.server_address[1]}/api"
+    handler = server.handler  # type: ignore[attr-defined]
+
+    runs = (
+        ("sync per-call", lambda: _sync_per_call(url, args.requests)),
+        ("sync shared", lambda: _sync_shared(url, args.requests)),
+        ("async per-call", lambda: asyncio.run(_async_per_call(url, args.requests))),
+        ("async shared", lambda: asyncio.run(_async_shared(url, args.requests))),
+    )
+    header = f"{'path':<16} {'total ms':>10} {'ms / req':>10} {'connections':>12}"
+    print(header)
+    print("-" * len(header))
+    for label, run in runs:
+        before = handler.connections
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<16} {elapsed * 1000:>10.1f} "
+            f"{elapsed * 1000 / args.requests:>10.2f} "
+            f"{handler.connections - before:>12}"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
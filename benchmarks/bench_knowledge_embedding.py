@@ -0,0 +1,155 @@
+"""Benchmark: knowledge store latency with inline vs background batched embedding.
+
+Stores ``--entries`` knowledge entries, once embedding each entry inline
+(the naive approach) and once through the background batching index, then
+times semantic queries.
+
+By default a simulated model is used whose cost is a fixed per-call
+overhead plus a per-text cost (``--call-ms``/``--item-ms``), which is how
+sentence-transformers behaves on CPU.  Pass ``--model`` to use a real
+HuggingFace embedding model instead.
+
+Usage::
+
+    python benchmarks/bench_knowledge_embedding.py [--entries 500]
+        [--model sentence-transformers/all-MiniLM-L6-v2]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="aria-bench-"))
+os.environ.setdefault("ARIA_HOME", str(_SANDBOX))
+
+import chromadb  # noqa: E402
+
+from aria.tools import database as tools_db_module  # noqa: E402
+from aria.tools.database import ToolsDatabase  # noqa: E402
+from aria.tools.knowledge.database import KnowledgeDatabase  # noqa: E402
+from aria.tools.knowledge.semantic import (  # noqa: E402
+    get_semantic_index,
+    set_semantic_backend,
+)
+
+_AGENT = "bench"
+_FACTS = [
+    "The user prefers dark mode in every editor",
+    "Production database is PostgreSQL 16 on a managed host",
+    "Deployments run through GitHub Actions every weekday",
+    "The team's standup is at 9:30 in the morning",
+    "Invoices are sent on the first business day of the month",
+    "The cat is named Miso and eats twice a day",
+]
+_QUERIES = ["what theme does the user like", "which database", "pet food"]
+
+
+class _SimulatedEmbedding:
+    """Embedding model stand-in with a per-call plus per-text CPU cost."""
+
+    def __init__(self, call_ms: float, item_ms: float, dim: int = 384):
+        self._call = call_ms / 1000
+        self._item = item_ms / 1000
+        self._dim = dim
+
+    def _vector(self, text: str) -> list[float]:
+        vector = [0.0] * self._dim
+        for word in text.lower().split():
+            vector[hash(word) % self._dim] += 1.0
+        return vector
+
+    def get_text_embedding(self, text: str) -> list[float]:
+        return self.get_text_embedding_batch([text])[0]
+
+    def get_text_embedding_batch(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(self._call + self._item * len(texts))
+        return [self._vector(t) for t in texts]
+
+    def get_query_embedding(self, query: str) -> list[float]:
+        return self.get_text_embedding(query)
+
+
+def _fresh_db(tag: str) -> KnowledgeDatabase:
+    KnowledgeDatabase._instance = None
+    tools_db_module._db_instance = ToolsDatabase(str(_SANDBOX / f"{tag}.db"))
+    return KnowledgeDatabase()
+
+
+def _store_all(db: KnowledgeDatabase, count: int, inline_model=None) -> list[float]:
+    timings = []
+    for i in range(count):
+        value = f"{_FACTS[i % len(_FACTS)]} (note {i})"
+        start = time.perf_counter()
+        entry_id = uuid.uuid4().hex
+        db.store(entry_id, _AGENT, f"fact_{i}", value)
+        if inline_model is not None:
+            inline_model.get_text_embedding(f"fact_{i}\n{value}")
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _row(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{label:<28} {statistics.mean(timings):>9.2f} "
+        f"{statistics.median(timings):>9.2f} {p95:>9.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--model", help="HuggingFace model (default: simulated)")
+    parser.add_argument("--call-ms", type=float, default=12.0)
+    parser.add_argument("--item-ms", type=float, default=1.5)
+    args = parser.parse_args()
+
+    if args.model:
+        from aria.llm import get_embeddings_model
+
+        model = get_embeddings_model(model_name=args.model)
+    else:
+        model = _SimulatedEmbedding(args.call_ms, args.item_ms)
+    model.get_text_embedding("warm up")
+
+    print(f"{'store latency (ms)':<28} {'mean':>9} {'median':>9} {'p95':>9}")
+
+    db = _fresh_db("inline")
+    _row("inline embedding", _store_all(db, args.entries, inline_model=model))
+
+    db = _fresh_db("batched")
+    client = chromadb.PersistentClient(path=str(_SANDBOX / "chroma"))
+    set_semantic_backend(model, client)
+    index = get_semantic_index()
+    assert index is not None
+
+    start = time.perf_counter()
+    timings = _store_all(db, args.entries)
+    index.flush()
+    drained = time.perf_counter() - start
+    _row("background batched", timings)
+    print(f"\nbatched: all {args.entries} entries embedded after {drained:.2f}s")
+
+    start = time.perf_counter()
+    index.reindex(db.index_entries())
+    print(f"reindex: {args.entries} entries in {time.perf_counter() - start:.2f}s")
+
+    query_timings = []
+    for query in _QUERIES * 10:
+        start = time.perf_counter()
+        results = db.semantic_search(_AGENT, query, 5)
+        query_timings.append((time.perf_counter() - start) * 1000)
+        assert results
+    print()
+    _row("semantic query (ms)", query_timings)
+
+    set_semantic_backend(None, None)
+
+
+if __name__ == "__main__":
+    main()
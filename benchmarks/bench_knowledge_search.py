@@ -0,0 +1,97 @@
+"""Benchmark: knowledge search at 100k entries, FTS5 vs substring scan.
+
+Usage::
+
+    python benchmarks/bench_knowledge_search.py [--entries 100000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="aria-bench-"))
+os.environ.setdefault("ARIA_HOME", str(_SANDBOX))
+
+from sqlalchemy import insert  # noqa: E402
+
+from aria.tools import database as tools_db_module  # noqa: E402
+from aria.tools.database import ToolsDatabase  # noqa: E402
+from aria.tools.knowledge.database import KnowledgeDatabase  # noqa: E402
+from aria.tools.knowledge.models import KnowledgeEntryModel  # noqa: E402
+
+_TOPICS = (
+    "deploy docker kubernetes python postgres redis cache latency backup "
+    "invoice customer meeting roadmap budget release migration schema index "
+    "monitoring alert incident design review frontend backend token session"
+).split()
+_QUERIES = ["deploy", "postgres backup", "migr", "incident review", "w1234"]
+
+
+def _vocabulary(size: int = 20_000) -> list[str]:
+    """Synthetic filler words so topic terms are selective, like real notes."""
+    return [f"w{i}" for i in range(size)]
+
+
+_AGENT = "bench"
+
+
+def _populate(db: KnowledgeDatabase, count: int) -> None:
+    rng = random.Random(42)
+    vocabulary = _vocabulary()
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "id": uuid.uuid4().hex,
+            "agent_id": _AGENT,
+            "key": f"{rng.choice(_TOPICS)}_{i}",
+            "value": " ".join(rng.choices(vocabulary, k=40) + [rng.choice(_TOPICS)]),
+            "tags": None,
+            "created_at": now,
+            "updated_at": now,
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+    with db.get_session() as session:
+        for start in range(0, count, 10_000):
+            session.execute(insert(KnowledgeEntryModel), rows[start : start + 10_000])
+        session.commit()
+
+
+def _time(fn, query: str, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(_AGENT, query, 10)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tools_db = ToolsDatabase(str(_SANDBOX / "tools.db"))
+    tools_db_module._db_instance = tools_db
+    db = KnowledgeDatabase()
+
+    start = time.perf_counter()
+    _populate(db, args.entries)
+    print(f"inserted {args.entries} entries in {time.perf_counter() - start:.1f}s")
+
+    print(f"{'query':>18}  {'fts ms':>8}  {'substring ms':>13}")
+    for query in _QUERIES:
+        fts = _time(db.search, query)
+        substring = _time(db._search_substring, query)
+        print(f"{query:>18}  {fts:>8.2f}  {substring:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark: wall-clock time of agent turns with multi-call responses.
+
+Runs a StatefulAgentWorkflow on a mock LLM that answers each turn with
+``--calls`` tool calls (read-only lookups of ``--latency`` seconds each,
+plus one write in the middle), then a final text answer.  Compares
+serialized execution (every call treated as unsafe) with the default,
+where read-only calls run concurrently.
+
+Usage::
+
+    python benchmarks/bench_parallel_tool_calls.py [--calls 4] [--latency 0.3]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+from llama_index.core.agent.workflow import FunctionAgent  # noqa: E402
+from llama_index.core.base.llms.types import (  # noqa: E402
+    ChatMessage,
+    MessageRole,
+    ToolCallBlock,
+)
+from llama_index.core.llms.mock import MockFunctionCallingLLM  # noqa: E402
+from llama_index.core.memory import Memory  # noqa: E402
+from llama_index.core.tools import FunctionTool  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from aria.llm import _parallel  # noqa: E402
+from aria.llm._state import StatefulAgentWorkflow, initial_workflow_state  # noqa: E402
+from aria.tools.registry import is_parallel_safe  # noqa: E402
+
+
+def _workflow(calls: int, latency: float) -> StatefulAgentWorkflow:
+    async def read_file(file_name: str) -> str:
+        """Read a file."""
+        await asyncio.sleep(latency)
+        return f"contents of {file_name}"
+
+    async def write_file(file_name: str) -> str:
+        """Write a file."""
+        await asyncio.sleep(latency / 3)
+        return f"wrote {file_name}"
+
+    def respond(messages, **kwargs) -> ChatMessage:
+        if any(m.role == MessageRole.TOOL for m in messages):
+            return ChatMessage(role="assistant", content="done")
+        blocks = [
+            ToolCallBlock(
+                tool_call_id=f"call_{i}",
+                tool_name="write_file" if i == calls // 2 else "read_file",
+                tool_kwargs={"file_name": f"/tmp/f{i}"},
+            )
+            for i in range(calls + 1)
+        ]
+        return ChatMessage(role="assistant", blocks=blocks)
+
+    agent = FunctionAgent(
+        name="Aria",
+        description="bench agent",
+        llm=MockFunctionCallingLLM(response_generator=respond),
+        tools=[
+            FunctionTool.from_defaults(async_fn=read_file),
+            FunctionTool.from_defaults(async_fn=write_file),
+        ],
+    )
+    return StatefulAgentWorkflow(
+        agents=[agent],
+        root_agent="Aria",
+        initial_state=dict(initial_workflow_state("Aria")),
+        timeout=120,
+    )
+
+
+async def _turns(calls: int, latency: float, turns: int) -> float:
+    """Run ``turns`` agent turns; return mean seconds per turn."""
+    workflow = _workflow(calls, latency)
+    start = time.perf_counter()
+    for _ in range(turns):
+        await workflow.run(user_msg="go", memory=Memory.from_defaults())
+    return (time.perf_counter() - start) / turns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=4, help="read calls per turn")
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--turns", type=int, default=3)
+    args = parser.parse_args()
+    logger.remove()
+
+    header = f"{'mode':<12} {'calls':>6} {'s / turn':>10}"
+    print(header)
+    print("-" * len(header))
+    for label, safe in (
+        ("serialized", lambda name, kwargs: False),
+        ("parallel", is_parallel_safe),
+    ):
+        _parallel.is_parallel_safe = safe
+        per_turn = asyncio.run(_turns(args.calls, args.latency, args.turns))
+        print(f"{label:<12} {args.calls + 1:>6} {per_turn:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark: paging through a multi-GB file with read_file.
+
+Compares the previous line reader (count the whole file, then iterate
+from line 0 to the requested offset on every call) with the sparse
+line-offset index: cold index build, per-page reads once the index is
+warm, and a reload of the persisted index as after a restart.
+
+Usage::
+
+    python benchmarks/bench_read_file_paging.py [--size-mb 2048] [--pages 50]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="aria-bench-"))
+os.environ.setdefault("ARIA_HOME", str(_SANDBOX))
+
+from aria.tools.files._line_index import (  # noqa: E402
+    clear_line_index_cache,
+    count_lines,
+    read_lines,
+)
+
+_PAGE = 200
+
+
+def _generate(path: Path, size_mb: int) -> None:
+    rng = random.Random(1)
+    pool = [
+        f"2026-01-01T00:00:{i % 60:02}Z INFO worker-{i % 16} "
+        + "x" * rng.randint(20, 160)
+        + "\n"
+        for i in range(4096)
+    ]
+    block = "".join(pool).encode()
+    with open(path, "wb") as f:
+        for _ in range(size_mb * 1024 * 1024 // len(block) + 1):
+            f.write(block)
+
+
+def _old_page(path: Path, offset: int) -> int:
+    """The read_file implementation before the line index."""
+    total = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(8192), b""):
+            total += chunk.count(b"\n")
+    lines = []
+    with open(path, encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            if i < offset:
+                continue
+            if i >= offset + _PAGE:
+                break
+            lines.append(line.rstrip("\n\r"))
+    return len(lines)
+
+
+def _new_page(path: Path, offset: int) -> int:
+    count_lines(path)
+    return len(read_lines(path, offset, _PAGE))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument(
+        "--old-pages",
+        type=int,
+        default=3,
+        help="pages to time with the old reader (each one scans the file)",
+    )
+    args = parser.parse_args()
+
+    path = _SANDBOX / "big.log"
+    start = time.perf_counter()
+    _generate(path, args.size_mb)
+    size_gb = path.stat().st_size / 1024**3
+    print(f"Generated {size_gb:.2f} GB in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    total = count_lines(path)
+    build = time.perf_counter() - start
+    print(f"{total:,} lines; cold index build {build:.2f}s\n")
+
+    rng = random.Random(2)
+    offsets = [rng.randrange(total) for _ in range(args.pages)]
+
+    def per_page(fn, sample):
+        timings = []
+        for offset in sample:
+            t = time.perf_counter()
+            fn(path, offset)
+            timings.append(time.perf_counter() - t)
+        return statistics.median(timings), max(timings)
+
+    header = f"{'reader':<22} {'pages':>6} {'median (ms)':>12} {'max (ms)':>10}"
+    print(header)
+    print("-" * len(header))
+    old_sample = sorted(offsets)[-args.old_pages :] if args.old_pages else []
+    if old_sample:
+        med, worst = per_page(_old_page, old_sample)
+        print(
+            f"{'old (rescan)':<22} {len(old_sample):>6} {med * 1e3:>12.1f} "
+            f"{worst * 1e3:>10.1f}"
+        )
+    med, worst = per_page(_new_page, offsets)
+    print(
+        f"{'index (warm)':<22} {len(offsets):>6} {med * 1e3:>12.2f} "
+        f"{worst * 1e3:>10.2f}"
+    )
+
+    clear_line_index_cache()
+    start = time.perf_counter()
+    _new_page(path, offsets[0])
+    print(
+        f"{'index (from disk)':<22} {1:>6} "
+        f"{(time.perf_counter() - start) * 1e3:>12.2f} {'':>10}"
+    )
+
+    shutil.rmtree(_SANDBOX, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark: per-call latency of the ``reasoning`` tool as a session grows.
+
+With the registry session cache, adding step N costs the same as adding
+step 1.  Without it, every call reloads the whole session from SQLite.
+
+Usage::
+
+    python benchmarks/bench_reasoning_session_cache.py [--steps 10 100 1000]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="aria-bench-"))
+os.environ.setdefault("ARIA_HOME", str(_SANDBOX))
+
+from aria.tools import database as tools_db_module  # noqa: E402
+from aria.tools.database import ToolsDatabase  # noqa: E402
+from aria.tools.reasoning import reasoning, registry  # noqa: E402
+from aria.tools.reasoning.database import ReasoningDatabase  # noqa: E402
+
+_SAMPLE = 10
+
+
+def _fresh_database() -> None:
+    tools_db = ToolsDatabase(str(_SANDBOX / f"tools-{time.time_ns()}.db"))
+    tools_db.create_tables()
+    tools_db_module._db_instance = tools_db
+    ReasoningDatabase._instance = None
+    registry._db = ReasoningDatabase()
+    registry.clear_all()
+
+
+def _measure(total_steps: int, cached: bool) -> float:
+    """Return mean milliseconds per step for the last ``_SAMPLE`` steps."""
+    _fresh_database()
+    agent_id = f"bench_{total_steps}_{cached}"
+    reasoning("bench", action="start", agent_id=agent_id)
+
+    timings: list[float] = []
+    for i in range(total_steps):
+        if not cached:
+            registry.clear_all()
+        start = time.perf_counter()
+        reasoning("bench", action="step", content=f"step {i}", agent_id=agent_id)
+        if i >= total_steps - _SAMPLE:
+            timings.append((time.perf_counter() - start) * 1000)
+
+    reasoning("bench", action="end", agent_id=agent_id)
+    return statistics.mean(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'steps':>7}  {'cached ms/call':>15}  {'reload ms/call':>15}")
+    for total in args.steps:
+        cached = _measure(total, cached=True)
+        reload = _measure(total, cached=False)
+        print(f"{total:>7}  {cached:>15.2f}  {reload:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark: sanitizing a long agent history before every LLM call.
+
+Builds a history of ``--messages`` messages shaped like an agent turn
+(user prompt, then assistant tool calls with JSON arguments, some of them
+large, and tool results).  Replays it the way the agent loop does — one
+sanitization pass per step over the growing history — with and without
+the per-message cache.
+
+Usage::
+
+    python benchmarks/bench_sanitize_messages.py [--messages 500] [--steps 50]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+from llama_index.core.base.llms.types import ChatMessage, ToolCallBlock  # noqa: E402
+
+from aria.llm._sanitize import (  # noqa: E402
+    _clear_sanitize_cache,
+    _sanitize_message,
+    _sanitize_messages,
+)
+
+
+def _history(count: int) -> list[ChatMessage]:
+    messages = [ChatMessage(role="user", content="Refactor the project.")]
+    i = 0
+    while len(messages) < count:
+        content = "def f():\n    return 1\n" * (200 if i % 5 == 0 else 5)
+        args = json.dumps({"path": f"/tmp/f{i}.py", "content": content})
+        messages.append(
+            ChatMessage(
+                role="assistant",
+                blocks=[
+                    ToolCallBlock(
+                        tool_call_id=f"call_{i}",
+                        tool_name="write_file",
+                        tool_kwargs=args,
+                    )
+                ],
+            )
+        )
+        messages.append(ChatMessage(role="tool", content='{"status": "ok"}'))
+        i += 1
+    return messages[:count]
+
+
+def _replay(history: list[ChatMessage], steps: int, sanitize) -> float:
+    """Sanitize growing prefixes of ``history``; return seconds per step."""
+    cuts = [len(history) * (s + 1) // steps for s in range(steps)]
+    start = time.perf_counter()
+    for cut in cuts:
+        sanitize(history[:cut])
+    return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args()
+
+    history = _history(args.messages)
+    size_kb = (
+        sum(
+            len(b.tool_kwargs)
+            for m in history
+            for b in m.blocks
+            if isinstance(b, ToolCallBlock)
+        )
+        / 1024
+    )
+    print(f"{len(history)} messages, {size_kb:.0f} KB of tool arguments\n")
+
+    header = f"{'path':<24} {'ms / step':>10} {'ms full history':>16}"
+    print(header)
+    print("-" * len(header))
+
+    def uncached(messages):
+        return [_sanitize_message(m) for m in messages]
+
+    for label, sanitize in (("uncached", uncached), ("cached", _sanitize_messages)):
+        _clear_sanitize_cache()
+        per_step = _replay(history, args.steps, sanitize)
+        start = time.perf_counter()
+        sanitize(history)
+        full = time.perf_counter() - start
+        print(f"{label:<24} {per_step * 1e3:>10.2f} {full * 1e3:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark: search_files content mode on a generated 50k-file tree.
+
+Compares the streaming parallel engine with the previous implementation
+(``rglob`` list, 100-file cap, 1 MB size cap, per-line regex) and with
+that same per-line approach run without its caps, which is what it would
+cost to actually find every match.
+
+Usage::
+
+    python benchmarks/bench_search_files.py [--files 50000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="aria-bench-"))
+os.environ.setdefault("ARIA_HOME", str(_SANDBOX))
+
+from aria.tools.files._search import search_content  # noqa: E402
+
+_WORDS = (
+    "def class return import self value result config request response "
+    "user data items index error logger path file open close read write"
+).split()
+
+_QUERIES = [
+    ("rare literal", r"NEEDLE_[0-9]+", 500),
+    ("common word, early exit", r"\bconfig\b", 50),
+    ("regex, many hits", r"self \w+ (value|result)", 500),
+]
+
+
+def _generate(root: Path, count: int) -> None:
+    rng = random.Random(1)
+    per_dir = 100
+    for i in range(count):
+        directory = root / f"pkg{i // per_dir:04}"
+        if i % per_dir == 0:
+            directory.mkdir(parents=True)
+        lines = [
+            " ".join(rng.choices(_WORDS, k=rng.randint(3, 10)))
+            for _ in range(rng.randint(20, 120))
+        ]
+        if i % 997 == 0:
+            lines[len(lines) // 2] = f"NEEDLE_{i}"
+        (directory / f"mod{i}.py").write_text("\n".join(lines) + "\n")
+    # A vendored directory the engine should prune via .gitignore.
+    vendor = root / "node_modules"
+    vendor.mkdir()
+    for i in range(2000):
+        (vendor / f"dep{i}.js").write_text("config NEEDLE_0\n" * 50)
+    (root / ".gitignore").write_text("node_modules/\n")
+
+
+def _old_search(root: Path, regex: re.Pattern, max_results: int, capped: bool):
+    """The search_files content loop before the streaming engine."""
+    matches = []
+    files_searched = 0
+    for file_path in list(root.rglob("**/*")):
+        if not file_path.is_file():
+            continue
+        if capped and files_searched >= 100:
+            break
+        if capped and file_path.stat().st_size > 1024 * 1024:
+            continue
+        files_searched += 1
+        lines = []
+        with open(file_path, encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                lines.append(line)
+                if capped and len(lines) > 10000:
+                    break
+        for line_num, line in enumerate(lines):
+            if len(matches) >= max_results:
+                break
+            if regex.search(line):
+                start = max(0, line_num - 2)
+                end = min(len(lines), line_num + 3)
+                matches.append(
+                    (
+                        str(file_path.relative_to(root)),
+                        line_num + 1,
+                        [lines[i] for i in range(start, line_num)],
+                        [lines[i] for i in range(line_num + 1, end)],
+                    )
+                )
+        if len(matches) >= max_results:
+            break
+    return len(matches), files_searched
+
+
+def _new_search(root: Path, regex: re.Pattern, max_results: int):
+    result = search_content(root, regex, max_results=max_results)
+    return len(result.matches), result.files_searched
+
+
+def _time(fn, repeat: int):
+    timings, outcome = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outcome = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), outcome
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    root = _SANDBOX / "tree"
+    start = time.perf_counter()
+    _generate(root, args.files)
+    print(f"Generated {args.files} files in {time.perf_counter() - start:.1f}s\n")
+
+    header = f"{'query':<26} {'engine':<16} {'time (s)':>9} {'matches':>8} {'files':>7}"
+    print(header)
+    print("-" * len(header))
+    engines = [
+        ("old (capped)", lambda r, n: _old_search(root, r, n, capped=True)),
+        ("old (uncapped)", lambda r, n: _old_search(root, r, n, capped=False)),
+        ("streaming", lambda r, n: _new_search(root, r, n)),
+    ]
+    for label, pattern, max_results in _QUERIES:
+        regex = re.compile(pattern)
+        for name, engine in engines:
+            seconds, (found, files) = _time(
+                lambda e=engine: e(regex, max_results), args.repeat
+            )
+            print(f"{label:<26} {name:<16} {seconds:>9.3f} {found:>8} {files:>7}")
+        print()
+
+    shutil.rmtree(_SANDBOX, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
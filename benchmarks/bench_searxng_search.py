@@ -0,0 +1,127 @@
+"""Benchmark: SearXNG web search latency against a local stub server.
+
+Starts a threaded HTTP server that answers ``/search`` like SearXNG,
+after ``--latency`` seconds per page, and compares:
+
+* ``serial``  — the previous client: a new ``httpx.Client`` per search,
+  pages fetched one after another;
+* ``cold``    — ``searxng_web_search`` with the result cache cleared
+  before each search (concurrent pages, shared keep-alive client);
+* ``cached``  — ``searxng_web_search`` repeating the same search.
+
+Usage::
+
+    python benchmarks/bench_searxng_search.py [--max-results 30] [--latency 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+import httpx  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from aria.tools.http.client import aclose_http_clients  # noqa: E402
+from aria.tools.search import searxng  # noqa: E402
+
+
+def _serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query["pageno"][0])
+            time.sleep(latency)
+            body = json.dumps(
+                {
+                    "results": [
+                        {
+                            "url": f"https://example.com/{page}/{i}",
+                            "title": f"Result {page}.{i}",
+                            "content": "stub result " * 20,
+                        }
+                        for i in range(10)
+                    ]
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _serial_search(base_url: str, query: str, max_results: int) -> int:
+    """The pre-async client: one Client per call, pages in sequence."""
+    rows = 0
+    with httpx.Client(timeout=10.0) as client:
+        for page in range(1, (max_results + 9) // 10 + 1):
+            params = {"format": "json", "q": query, "pageno": page}
+            response = client.get(f"{base_url}/search?{urlencode(params)}")
+            rows += len(response.json()["results"])
+            if rows >= max_results:
+                break
+    return rows
+
+
+async def _async_searches(max_results: int, runs: int, cached: bool) -> float:
+    start = time.perf_counter()
+    for i in range(runs):
+        if not cached:
+            searxng.clear_search_cache()
+        await searxng.searxng_web_search(
+            reason="bench", query="aria" if cached else f"q{i}", max_results=max_results
+        )
+    elapsed = (time.perf_counter() - start) / runs
+    await aclose_http_clients()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-results", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.1, help="s per page")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    logger.remove()
+
+    server = _serve(args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    searxng.SEARXNG_URL = base_url
+
+    start = time.perf_counter()
+    for i in range(args.runs):
+        _serial_search(base_url, f"q{i}", args.max_results)
+    serial = (time.perf_counter() - start) / args.runs
+    cold = asyncio.run(_async_searches(args.max_results, args.runs, cached=False))
+    warm = asyncio.run(_async_searches(args.max_results, args.runs, cached=True))
+    server.shutdown()
+
+    pages = (args.max_results + 9) // 10
+    header = f"{'mode':<8} {'pages':>6} {'ms / search':>12} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for label, seconds in (("serial", serial), ("cold", cold), ("cached", warm)):
+        print(
+            f"{label:<8} {pages:>6} {seconds * 1000:>12.1f} {serial / seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: peak memory of the shell tool on a command with huge output.
+
+Runs ``yes | head -c <size>`` through
+
+* ``subprocess.run(capture_output=True)`` followed by truncation (how
+  the shell tool captured output before streaming), and
+* the ``shell`` tool, which streams output into bounded head/tail
+  buffers,
+
+each in a fresh interpreter, and reports its peak RSS, wall time and
+how much output reached the response.  The baseline holds the whole
+output in memory (twice, as bytes and as text): at the default 2G it
+needs over 4 GiB of RAM, so use ``--size`` or ``--skip-baseline`` on
+smaller machines.
+
+Usage::
+
+    python benchmarks/bench_shell_output.py [--size 2G] [--skip-baseline]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+
+def _child(mode: str, command: str) -> None:
+    from loguru import logger
+
+    logger.remove()
+    start = time.perf_counter()
+    if mode == "baseline":
+        from aria.tools.shell.constants import MAX_OUTPUT_SIZE
+
+        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        kept = len(result.stdout[:MAX_OUTPUT_SIZE])
+        dropped = len(result.stdout) - kept
+    else:
+        from aria.tools.shell import shell
+
+        data = json.loads(shell(reason="bench", commands=command, timeout=600))
+        kept = len(data["data"].get("stdout", ""))
+        dropped = data["data"].get("stdout_dropped_bytes", 0)
+    elapsed = time.perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "peak_mib": peak_kib / 1024,
+                "kept": kept,
+                "dropped": dropped,
+            }
+        )
+    )
+
+
+def _measure(mode: str, command: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode, "--command", command],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="2G", help="bytes of output (head -c)")
+    parser.add_argument("--skip-baseline", action="store_true")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--command", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.command)
+        return
+
+    command = f"yes | head -c {args.size}"
+    modes = ["streaming"] if args.skip_baseline else ["baseline", "streaming"]
+    rows = [(mode, _measure(mode, command)) for mode in modes]
+
+    header = f"{'capture':<10} {'peak RSS MiB':>13} {'seconds':>8} {'kept':>8} {'dropped':>12}"
+    print(f"command: {command}")
+    print(header)
+    print("-" * len(header))
+    for mode, r in rows:
+        print(
+            f"{mode:<10} {r['peak_mib']:>13.0f} {r['seconds']:>8.2f} "
+            f"{r['kept']:>8} {r['dropped']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark: N concurrent writer processes against one SQLite file.
+
+Compares SQLAlchemy's default SQLite engine with the Aria tuning profile
+(``aria.helpers.sqlite``: WAL, synchronous=NORMAL, busy_timeout, ...).
+Each writer performs small committed inserts, like tool audit events.
+"Locked" counts commits that failed with "database is locked".
+
+Usage::
+
+    python benchmarks/bench_sqlite_contention.py [--writers 8] [--commits 200]
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from aria.helpers.sqlite import create_sqlite_engine
+
+
+def _make_engine(db_path: Path, tuned: bool):
+    url = f"sqlite:///{db_path}"
+    if tuned:
+        return create_sqlite_engine(url)
+    return create_engine(url, pool_pre_ping=True)
+
+
+def _writer(db_path: Path, tuned: bool, commits: int, results) -> None:
+    engine = _make_engine(db_path, tuned)
+    locked = 0
+    start = time.perf_counter()
+    for i in range(commits):
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    text("INSERT INTO events (payload) VALUES (:p)"),
+                    {"p": f"event {i} " * 8},
+                )
+        except OperationalError:
+            locked += 1
+    results.put((time.perf_counter() - start, locked))
+    engine.dispose()
+
+
+def _run(writers: int, commits: int, tuned: bool) -> tuple[float, float, int]:
+    db_path = Path(tempfile.mkdtemp(prefix="aria-bench-")) / "contention.db"
+    engine = _make_engine(db_path, tuned)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT)"))
+    engine.dispose()
+
+    results: mp.Queue = mp.Queue()
+    procs = [
+        mp.Process(target=_writer, args=(db_path, tuned, commits, results))
+        for _ in range(writers)
+    ]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    outcomes = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    wall = time.perf_counter() - start
+
+    locked = sum(lock for _, lock in outcomes)
+    committed = writers * commits - locked
+    return wall, committed / wall, locked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--commits", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers x {args.commits} commits")
+    print(f"{'profile':>8}  {'wall s':>8}  {'commits/s':>10}  {'locked':>7}")
+    for tuned in (False, True):
+        wall, rate, locked = _run(args.writers, args.commits, tuned)
+        label = "tuned" if tuned else "default"
+        print(f"{label:>8}  {wall:>8.2f}  {rate:>10.0f}  {locked:>7}")
+
+
+if __name__ == "__main__":
+    main()
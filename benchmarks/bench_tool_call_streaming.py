@@ -0,0 +1,149 @@
+"""Benchmark: streaming a large tool-call argument through SanitizedOpenAILike.
+
+Streams one ``write_file`` call whose JSON arguments are ``--kb``
+kilobytes, split into ``--delta`` character deltas as vLLM emits them.
+Compares the previous per-chunk handling (``update_tool_calls`` plus a
+full re-sanitize of the accumulated arguments on every chunk) with the
+incremental assembler, and times ``_astream_chat`` end to end on a fake
+client.  The old path is quadratic, so it is timed on a smaller payload
+(``--old-kb``) by default.
+
+Usage::
+
+    python benchmarks/bench_tool_call_streaming.py [--kb 200] [--delta 8]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("ARIA_HOME", tempfile.mkdtemp(prefix="aria-bench-"))
+
+from llama_index.core.base.llms.types import ChatMessage, ToolCallBlock  # noqa: E402
+from llama_index.llms.openai.utils import update_tool_calls  # noqa: E402
+from loguru import logger  # noqa: E402
+from openai.types.chat.chat_completion_chunk import (  # noqa: E402
+    ChatCompletionChunk,
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+
+from aria.llm._sanitize import (  # noqa: E402
+    SanitizedOpenAILike,
+    _sanitize_tool_call_arguments_json,
+    _ToolCallAssembler,
+)
+
+
+def _chunk(args=None, name=None, id=None, finish_reason=None):
+    tool_call = ChoiceDeltaToolCall(
+        index=0,
+        id=id,
+        function=ChoiceDeltaToolCallFunction(name=name, arguments=args),
+    )
+    return ChatCompletionChunk(
+        id="bench",
+        created=0,
+        model="bench",
+        object="chat.completion.chunk",
+        choices=[
+            Choice(
+                index=0,
+                delta=ChoiceDelta(tool_calls=None if finish_reason else [tool_call]),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+
+
+def _chunks(kb: int, delta: int) -> list[ChatCompletionChunk]:
+    line = "    result = compute(value, other)  # padding\n"
+    content = line * (kb * 1024 // len(line))
+    args = json.dumps({"path": "/tmp/big.py", "content": content})
+    chunks = [_chunk(name="write_file", id="call_0")]
+    chunks += [_chunk(args[i : i + delta]) for i in range(0, len(args), delta)]
+    chunks.append(_chunk(finish_reason="tool_calls"))
+    return chunks
+
+
+def _old(chunks: list[ChatCompletionChunk]) -> None:
+    """The per-chunk tool-call handling before the assembler."""
+    tool_calls: list[ChoiceDeltaToolCall] = []
+    for chunk in chunks:
+        delta = chunk.choices[0].delta
+        tool_calls = update_tool_calls(tool_calls, delta.tool_calls)
+        for tool_call in tool_calls:
+            ToolCallBlock(
+                tool_call_id=tool_call.id,
+                tool_kwargs=_sanitize_tool_call_arguments_json(
+                    tool_call.function.arguments or "{}"
+                ),
+                tool_name=tool_call.function.name or "",
+            )
+
+
+def _new(chunks: list[ChatCompletionChunk]) -> None:
+    assembler = _ToolCallAssembler()
+    for chunk in chunks:
+        assembler.feed(chunk.choices[0].delta.tool_calls)
+    assembler.finish()
+
+
+async def _end_to_end(chunks: list[ChatCompletionChunk]) -> None:
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def create(**kwargs):
+        return stream()
+
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    SanitizedOpenAILike._get_aclient = lambda self: client
+    llm = SanitizedOpenAILike(model="bench", api_base="http://localhost", api_key="x")
+    gen = await llm._astream_chat([ChatMessage(role="user", content="write it")])
+    async for _ in gen:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kb", type=int, default=200)
+    parser.add_argument("--delta", type=int, default=8)
+    parser.add_argument(
+        "--old-kb",
+        type=int,
+        default=50,
+        help="argument size for the old path (0 = skip)",
+    )
+    args = parser.parse_args()
+    # Recovery warnings for partial JSON would dominate the old path.
+    logger.remove()
+
+    header = f"{'path':<28} {'KB':>5} {'chunks':>8} {'time (s)':>10}"
+    print(header)
+    print("-" * len(header))
+    runs = [
+        ("assembler", args.kb, _new),
+        ("_astream_chat end to end", args.kb, lambda c: asyncio.run(_end_to_end(c))),
+    ]
+    if args.old_kb:
+        runs.insert(0, ("old (re-sanitize per chunk)", args.old_kb, _old))
+    for label, kb, run in runs:
+        # Fresh chunks each time: update_tool_calls mutates its input.
+        chunks = _chunks(kb, args.delta)
+        start = time.perf_counter()
+        run(chunks)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28} {kb:>5} {len(chunks):>8,} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark: list_files / search_files name mode with the workspace index.
+
+Compares the previous ``Path.rglob`` walks with the cached index on a
+generated tree, cold (first call) and warm (repeat calls, as an agent
+does while exploring a project).
+
+Usage::
+
+    python benchmarks/bench_workspace_index.py [--files 50000] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="aria-bench-"))
+os.environ.setdefault("ARIA_HOME", str(_SANDBOX))
+
+from aria.tools.files._index import WorkspaceIndex  # noqa: E402
+from aria.tools.files._search import _glob_to_regex  # noqa: E402
+
+
+def _generate(root: Path, count: int) -> None:
+    per_dir = 50
+    for i in range(count):
+        directory = root / f"pkg{i // 2500:02}" / f"mod{i // per_dir:04}"
+        if i % per_dir == 0:
+            directory.mkdir(parents=True)
+        suffix = ".py" if i % 3 else ".md"
+        (directory / f"file{i}{suffix}").write_text("x")
+    # Keep every directory outside the racy-mtime window.
+    old = time.time() - 60
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (old, old))
+
+
+def _old_name_search(root: Path, regex: re.Pattern) -> int:
+    return sum(1 for p in root.rglob("*") if p.is_file() and regex.search(p.name))
+
+
+def _old_flat_list(root: Path, pattern: str) -> int:
+    return sum(1 for p in root.rglob(pattern) if p.is_file())
+
+
+def _new_name_search(index: WorkspaceIndex, root: Path, regex: re.Pattern) -> int:
+    return sum(1 for _, e in index.walk(root) if not e.is_dir and regex.search(e.name))
+
+
+def _new_flat_list(index: WorkspaceIndex, root: Path, pattern: str) -> int:
+    pattern_re = re.compile("(?:.*/)?" + _glob_to_regex(pattern) + r"\Z")
+    return sum(
+        1 for rel, e in index.walk(root) if not e.is_dir and pattern_re.match(rel)
+    )
+
+
+def _time(fn, repeat: int):
+    timings, outcome = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outcome = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), outcome
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    root = _SANDBOX / "tree"
+    _generate(root, args.files)
+    regex = re.compile(r"file1\d*\.py$")
+
+    header = f"{'operation':<22} {'engine':<14} {'time (s)':>9} {'results':>8}"
+    print(header)
+    print("-" * len(header))
+    for label, old, new in [
+        (
+            "name search",
+            lambda: _old_name_search(root, regex),
+            lambda index: _new_name_search(index, root, regex),
+        ),
+        (
+            "flat list *.md",
+            lambda: _old_flat_list(root, "*.md"),
+            lambda index: _new_flat_list(index, root, "*.md"),
+        ),
+    ]:
+        seconds, found = _time(old, args.repeat)
+        print(f"{label:<22} {'rglob':<14} {seconds:>9.3f} {found:>8}")
+
+        seconds, found = _time(lambda: new(WorkspaceIndex(root)), args.repeat)
+        print(f"{label:<22} {'index (cold)':<14} {seconds:>9.3f} {found:>8}")
+
+        index = WorkspaceIndex(root)
+        new(index)
+        seconds, found = _time(lambda i=index: new(i), args.repeat)
+        print(f"{label:<22} {'index (warm)':<14} {seconds:>9.3f} {found:>8}")
+        print()
+
+    shutil.rmtree(_SANDBOX, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -115,6 +115,7 @@ def _isolate_data_dirs(tmp_path, monkeypatch):
     monkeypatch.setattr(_folders.Uploads, "path", aria_home / "uploads")
     monkeypatch.setattr(_folders.DB, "path", aria_home / "db")
     monkeypatch.setattr(_folders.Models, "path", aria_home / "models")
+    monkeypatch.setattr(_folders.Cache, "path", aria_home / "cache")
 
     # ── Isolate workspace / BASE_DIR for file + shell tools ────
     workspace_dir = aria_home / "workspace"
@@ -234,8 +235,13 @@ def _reset_all_db_singletons():
     import aria.tools.reasoning.registry as reasoning_reg
 
     reasoning_reg._db = None
+    reasoning_reg.clear_all()
     planner_reg._db = None
 
+    from aria.tools.knowledge.semantic import set_semantic_backend
+
+    set_semantic_backend(None, None)
+
 
 @pytest.fixture()
 def test_tools_db(tmp_path):
@@ -15,11 +15,11 @@ Example:
 
 import contextlib
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 from aria.config.database import SQLite
 from aria.db.models import Base
+from aria.helpers.sqlite import create_sqlite_engine
 
 _engine = None
 
@@ -36,7 +36,7 @@ def _get_engine():
         from aria.config.folders import DB
 
         DB.path.mkdir(parents=True, exist_ok=True)
-        _engine = create_engine(SQLite.db_url)
+        _engine = create_sqlite_engine(SQLite.db_url)
         Base.metadata.create_all(_engine)
     return _engine
 
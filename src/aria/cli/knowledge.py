@@ -64,6 +64,23 @@ def search_cmd(
     typer.echo(result)
 
 
+@app.command("semantic-search")
+def semantic_search_cmd(
+    query: str = typer.Argument(..., help="Search query"),
+    max_results: int = typer.Option(10, "--max-results", "-n", help="Maximum results"),
+):
+    """Find stored knowledge entries by meaning (embedding similarity)."""
+    from aria.tools.knowledge.functions import knowledge
+
+    result = knowledge(
+        reason="CLI knowledge semantic search",
+        action="semantic_search",
+        query=query,
+        max_results=max_results,
+    )
+    typer.echo(result)
+
+
 @app.command("list")
 def list_cmd(
     tags: list[str] | None = typer.Option(None, "--tags", "-t", help="Filter by tags"),
@@ -111,3 +128,22 @@ def delete_cmd(
         entry_id=entry_id,
     )
     typer.echo(result)
+
+
+@app.command("reindex")
+def reindex_cmd():
+    """Re-embed all knowledge entries into the semantic search index."""
+    from aria.tools.knowledge.database import get_database
+    from aria.tools.knowledge.semantic import load_semantic_index
+
+    index = load_semantic_index()
+    if index is None:
+        typer.echo("Embeddings model or ChromaDB unavailable; nothing indexed.")
+        raise typer.Exit(1)
+
+    entries = get_database().index_entries()
+    count = index.reindex(
+        entries,
+        progress=lambda done: typer.echo(f"Embedded {done}/{len(entries)} entries"),
+    )
+    typer.echo(f"Re-indexed {count} knowledge entries")
@@ -39,10 +39,12 @@ def search_cmd(
     """
     from aria.tools.search import web_search
 
-    result = web_search(
-        reason="CLI web search",
-        query=query,
-        max_results=max_results,
+    result = asyncio.run(
+        web_search(
+            reason="CLI web search",
+            query=query,
+            max_results=max_results,
+        )
     )
     typer.echo(result)
 
@@ -76,7 +78,9 @@ def fetch_cmd(
     url_type = classify_url(url)
 
     if url_type == URLType.FILE:
-        result = _download(reason="CLI fetch (auto-classified as file)", url=url)
+        result = asyncio.run(
+            _download(reason="CLI fetch (auto-classified as file)", url=url)
+        )
     else:
         from aria.tools.browser.functions import open_url as _open_url
 
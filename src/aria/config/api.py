@@ -43,6 +43,8 @@ class Vllm:
     vision_enabled: bool = (
         get_optional_env("ARIA_VLLM_VISION_ENABLED", "").lower() == "true"
     )
+    # Max images described in parallel per message.
+    vision_concurrency: int = int(get_optional_env("ARIA_VLLM_VISION_CONCURRENCY", "4"))
     data_parallel_size: int = int(get_optional_env("ARIA_VLLM_DATA_PARALLEL_SIZE", "1"))
     expert_parallel: bool = (
         get_optional_env("ARIA_VLLM_EXPERT_PARALLEL", "").lower() == "true"
@@ -135,6 +137,18 @@ class Lightpanda:
     version: str = get_optional_env("LIGHTPANDA_VERSION", "nightly")
     port: int = int(get_optional_env("LIGHTPANDA_PORT", "9222"))
 
+    # Page pool: concurrent browser calls, Lightpanda processes serving
+    # them (on consecutive ports from ``port``), and navigations before a
+    # page is replaced.
+    pool_size: int = int(get_optional_env("ARIA_BROWSER_POOL_SIZE", "4"))
+    processes: int = int(get_optional_env("ARIA_BROWSER_PROCESSES", "1"))
+    recycle_after: int = int(get_optional_env("ARIA_BROWSER_RECYCLE_AFTER", "50"))
+
+    # Rendered-content cache: seconds a capture is reused (0 disables)
+    # and the total size of the captures it serves.
+    cache_ttl: float = float(get_optional_env("ARIA_BROWSER_CACHE_TTL", "300"))
+    cache_max_mb: int = int(get_optional_env("ARIA_BROWSER_CACHE_MAX_MB", "64"))
+
     @classmethod
     def get_bin_path(cls) -> Path:
         """Get the resolved binary directory path."""
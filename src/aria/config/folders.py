@@ -5,6 +5,7 @@ is::
 
     ~/.aria/
     ├── workspace/   agent-facing workspace (file tool BASE_DIR)
+    │   └── tool-outputs/  full copies of compressed tool outputs
     ├── bin/         downloaded binaries (lightpanda, etc.)
     ├── logs/        all runtime logs (debug, tool-calls, vllm, processes, workers)
     ├── models/      downloaded model files
@@ -12,6 +13,7 @@ is::
     ├── storage/     local file storage (Chainlit elements)
     ├── uploads/     user-uploaded files
     ├── workers/     worker agent state
+    ├── cache/       rebuildable caches (line indexes, ...)
     └── ...
 
 The ``ARIA_HOME`` environment variable can override the root
@@ -35,6 +37,7 @@ class Workspace:
     """Agent-facing workspace root (file tools default directory)."""
 
     path = _ARIA_HOME / "workspace"
+    tool_outputs_path = path / "tool-outputs"
 
 
 class Bin:
@@ -75,6 +78,12 @@ class Models:
     path = _ARIA_HOME / "models"
 
 
+class Cache:
+    """Rebuildable caches; safe to delete at any time."""
+
+    path = _ARIA_HOME / "cache"
+
+
 def get_augmented_path() -> str:
     """Return ``PATH`` with ``~/.aria/bin`` and the current venv bin prepended.
 
@@ -56,6 +56,10 @@ from chainlit.types import (
     ThreadFilter,
 )
 from chainlit.user import User
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from aria.helpers.sqlite import install_sqlite_pragmas, sqlite_pool_options
 
 if TYPE_CHECKING:
     from chainlit.element import Element
@@ -139,6 +143,27 @@ def _to_local_timestamp_string(value: Any) -> Any:
 class SQLiteSQLAlchemyDataLayer(SQLAlchemyDataLayer):
     """Chainlit SQLAlchemy data layer patched for SQLite."""
 
+    def __init__(
+        self,
+        conninfo: str,
+        connect_args: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(conninfo, connect_args=connect_args, **kwargs)
+        if not conninfo.startswith("sqlite") or ":memory:" in conninfo:
+            return
+
+        # Rebuild the engine with the shared SQLite pool and PRAGMA profile
+        # (WAL, busy_timeout, ...) so the UI does not stall on writes from
+        # workers and tools.  The base engine has not connected yet.
+        self.engine = create_async_engine(
+            conninfo, connect_args=connect_args or {}, **sqlite_pool_options()
+        )
+        self.async_session = sessionmaker(
+            bind=self.engine, expire_on_commit=False, class_=AsyncSession
+        )  # type: ignore[call-overload]
+        install_sqlite_pragmas(self.engine.sync_engine)
+
     def _deserialize_step(self, step: StepDict) -> StepDict:
         """Deserialize JSON fields in a step dict.
 
@@ -590,3 +590,23 @@ class TestRoundTrip:
         assert thread is not None
         assert thread["tags"] == []
         assert thread["metadata"] == {}
+
+
+class TestSQLiteTuning:
+    """The data layer engine uses the shared SQLite tuning profile."""
+
+    @pytest.mark.asyncio
+    async def test_data_layer_engine_uses_wal(self, temp_db_path):
+        from sqlalchemy import text
+
+        layer = SQLiteSQLAlchemyDataLayer(
+            conninfo=f"sqlite+aiosqlite:///{temp_db_path}"
+        )
+        try:
+            async with layer.engine.connect() as conn:
+                journal = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                busy = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+            assert journal == "wal"
+            assert busy > 0
+        finally:
+            await layer.engine.dispose()
@@ -0,0 +1,103 @@
+"""MarkItDown document conversion in a worker process pool.
+
+MarkItDown is CPU-bound and synchronous; a large PDF takes seconds.
+Running it inside a Chainlit handler blocks the event loop for every
+connected user, so uploads are converted in a small process pool
+instead.  Each worker keeps a single ``MarkItDown`` instance, and
+converted markdown is cached on disk by content hash so the same file
+is never converted twice.
+
+This module is deliberately light: workers are started with ``spawn``
+and import only this module (plus ``markitdown``), not the web stack.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+
+from aria.config import get_optional_env
+
+WORKERS = int(
+    get_optional_env("ARIA_MARKITDOWN_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Recycle workers periodically; some converters leak memory on large inputs.
+_MAX_TASKS_PER_WORKER = 50
+
+_converter = None
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def convert_file(file_path: str) -> str:
+    """Convert one file to markdown with this process's MarkItDown instance."""
+    global _converter
+    from markitdown import MarkItDown
+
+    if type(_converter) is not MarkItDown:
+        _converter = MarkItDown()
+    return _converter.convert(file_path).text_content or ""
+
+
+def get_conversion_pool() -> ProcessPoolExecutor:
+    """Return the shared conversion pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max(1, WORKERS),
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=_MAX_TASKS_PER_WORKER,
+            )
+            logger.debug(f"Started document conversion pool ({WORKERS} workers)")
+        return _pool
+
+
+def shutdown_conversion_pool() -> None:
+    """Stop the conversion pool, cancelling queued conversions."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def content_hash(file_path: str | Path) -> str:
+    """Return the SHA-256 of a file's bytes and its extension.
+
+    The extension is part of the key because MarkItDown picks the
+    converter from it.
+    """
+    digest = hashlib.sha256(Path(file_path).suffix.lower().encode())
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cached_markdown(cache_dir: Path, digest: str) -> str | None:
+    """Return previously converted markdown for ``digest``, if any."""
+    try:
+        return (cache_dir / f"{digest}.md").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def store_cached_markdown(cache_dir: Path, digest: str, markdown: str) -> None:
+    """Save converted markdown under ``digest`` (best effort)."""
+    target = cache_dir / f"{digest}.md"
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(markdown, encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError as exc:
+        logger.debug(f"Could not cache converted markdown {digest}: {exc}")
+        tmp.unlink(missing_ok=True)
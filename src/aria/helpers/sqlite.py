@@ -0,0 +1,138 @@
+"""SQLite tuning profile shared by every Aria SQLite engine.
+
+The web UI, background workers, the ``process`` tool and ``ax`` commands
+all write to the same SQLite files concurrently.  With SQLite's defaults
+(rollback journal, ``synchronous=FULL``, no busy timeout) writers block
+readers and a second writer fails immediately with "database is locked".
+
+This module applies a WAL-based profile on every new connection and
+provides pool settings that suit a file database:
+
+- ``journal_mode=WAL`` lets readers run while one writer commits.
+- ``synchronous=NORMAL`` is durable across application crashes in WAL mode
+  and avoids an fsync per commit.
+- ``busy_timeout`` makes a contended writer wait instead of failing.
+- ``mmap_size``, ``cache_size`` and ``temp_store`` keep hot pages and
+  temporary b-trees in memory.
+
+Every value can be overridden with an ``ARIA_SQLITE_*`` environment
+variable.
+"""
+
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Engine, create_engine, event, text
+
+from aria.config import get_optional_env
+
+JOURNAL_MODE = get_optional_env("ARIA_SQLITE_JOURNAL_MODE", "WAL").upper()
+SYNCHRONOUS = get_optional_env("ARIA_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+BUSY_TIMEOUT_MS = int(get_optional_env("ARIA_SQLITE_BUSY_TIMEOUT_MS", "10000"))
+MMAP_SIZE = int(get_optional_env("ARIA_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Negative values are KiB (SQLite convention): -65536 = 64 MiB per connection.
+CACHE_SIZE = int(get_optional_env("ARIA_SQLITE_CACHE_SIZE", "-65536"))
+TEMP_STORE = get_optional_env("ARIA_SQLITE_TEMP_STORE", "MEMORY").upper()
+
+POOL_SIZE = int(get_optional_env("ARIA_SQLITE_POOL_SIZE", "5"))
+POOL_MAX_OVERFLOW = int(get_optional_env("ARIA_SQLITE_POOL_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(get_optional_env("ARIA_SQLITE_POOL_TIMEOUT", "30"))
+
+# Values SQLite reports back for the symbolic settings above.
+_SYNCHRONOUS_LEVELS = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+_TEMP_STORE_LEVELS = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+def sqlite_pragmas() -> dict[str, str | int]:
+    """Return the PRAGMA statements applied to each new connection, in order."""
+    return {
+        "journal_mode": JOURNAL_MODE,
+        "synchronous": SYNCHRONOUS,
+        "busy_timeout": BUSY_TIMEOUT_MS,
+        "mmap_size": MMAP_SIZE,
+        "cache_size": CACHE_SIZE,
+        "temp_store": TEMP_STORE,
+    }
+
+
+def sqlite_pool_options() -> dict[str, Any]:
+    """Return ``create_engine`` keyword arguments for a SQLite file pool.
+
+    A small queue pool keeps connections (and their page cache and mmap)
+    warm between requests.  ``pool_pre_ping`` is deliberately not used: a
+    local SQLite connection cannot go stale, so the extra ``SELECT 1`` per
+    checkout only adds latency.
+    """
+    return {
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+    }
+
+
+def _apply_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def install_sqlite_pragmas(engine: Engine) -> None:
+    """Apply the tuning profile to every new connection of ``engine``.
+
+    For async engines pass ``async_engine.sync_engine``.  Non-SQLite
+    engines are left untouched.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    if not event.contains(engine, "connect", _apply_pragmas):
+        event.listen(engine, "connect", _apply_pragmas)
+
+
+def create_sqlite_engine(url: str, **kwargs: Any) -> Engine:
+    """Create a synchronous SQLite engine with the pool and PRAGMA profile."""
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        # In-memory databases use SQLAlchemy's single-connection pool.
+        engine = create_engine(url, **kwargs)
+    else:
+        engine = create_engine(url, **{**sqlite_pool_options(), **kwargs})
+    install_sqlite_pragmas(engine)
+    return engine
+
+
+def verify_sqlite_pragmas(engine: Engine) -> dict[str, tuple[Any, Any]]:
+    """Check that a fresh connection reports the expected PRAGMA values.
+
+    Returns:
+        Mapping of PRAGMA name to ``(expected, actual)`` for every mismatch.
+        An empty dict means the profile is active.  Mismatches are logged
+        as warnings (e.g. WAL is unavailable on some network filesystems).
+    """
+    # mmap_size is not checked: SQLite silently caps it at compile time.
+    expected: dict[str, Any] = {
+        "journal_mode": JOURNAL_MODE.lower(),
+        "synchronous": _SYNCHRONOUS_LEVELS.get(SYNCHRONOUS, SYNCHRONOUS),
+        "busy_timeout": BUSY_TIMEOUT_MS,
+        "cache_size": CACHE_SIZE,
+        "temp_store": _TEMP_STORE_LEVELS.get(TEMP_STORE, TEMP_STORE),
+    }
+    mismatches: dict[str, tuple[Any, Any]] = {}
+    with engine.connect() as conn:
+        for name, want in expected.items():
+            got = conn.execute(text(f"PRAGMA {name}")).scalar()
+            if isinstance(got, str):
+                got = got.lower()
+            if got != want:
+                mismatches[name] = (want, got)
+
+    if mismatches:
+        details = ", ".join(
+            f"{name}={got!r} (expected {want!r})"
+            for name, (want, got) in mismatches.items()
+        )
+        logger.warning(f"SQLite tuning not fully applied to {engine.url}: {details}")
+    else:
+        logger.debug(f"SQLite tuning verified for {engine.url}")
+    return mismatches
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from aria.helpers import documents
+from aria.helpers.documents import (
+    content_hash,
+    get_conversion_pool,
+    load_cached_markdown,
+    shutdown_conversion_pool,
+    store_cached_markdown,
+)
+
+
+def test_content_hash_depends_on_bytes_and_extension(tmp_path: Path) -> None:
+    a = tmp_path / "a.txt"
+    b = tmp_path / "b.txt"
+    c = tmp_path / "a.csv"
+    for path in (a, b, c):
+        path.write_text("x,y\n")
+
+    assert content_hash(a) == content_hash(b)
+    assert content_hash(a) != content_hash(c)
+
+
+def test_markdown_cache_round_trip(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    assert load_cached_markdown(cache_dir, "abc") is None
+    store_cached_markdown(cache_dir, "abc", "# Title\n")
+    assert load_cached_markdown(cache_dir, "abc") == "# Title\n"
+
+
+def test_convert_file_reuses_converter(tmp_path: Path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_text("hello\n")
+
+    assert "hello" in documents.convert_file(str(path))
+    converter = documents._converter
+    documents.convert_file(str(path))
+    assert documents._converter is converter
+
+
+def test_pool_converts_in_worker_process(tmp_path: Path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_text("from a worker\n")
+    try:
+        future = get_conversion_pool().submit(documents.convert_file, str(path))
+        assert "from a worker" in future.result(timeout=120)
+    finally:
+        shutdown_conversion_pool()
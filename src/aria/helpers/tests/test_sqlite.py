@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from aria.helpers import sqlite as sqlite_helpers
+from aria.helpers.sqlite import (
+    create_sqlite_engine,
+    install_sqlite_pragmas,
+    verify_sqlite_pragmas,
+)
+
+
+def test_create_sqlite_engine_applies_profile(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    try:
+        assert isinstance(engine.pool, QueuePool)
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert (
+                conn.execute(text("PRAGMA busy_timeout")).scalar()
+                == sqlite_helpers.BUSY_TIMEOUT_MS
+            )
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+        assert verify_sqlite_pragmas(engine) == {}
+    finally:
+        engine.dispose()
+
+
+def test_create_sqlite_engine_supports_memory_database() -> None:
+    engine = create_sqlite_engine("sqlite://")
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+    finally:
+        engine.dispose()
+
+
+def test_install_sqlite_pragmas_is_idempotent(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'twice.db'}")
+    try:
+        install_sqlite_pragmas(engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+    finally:
+        engine.dispose()
+
+
+def test_verify_sqlite_pragmas_reports_mismatch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'mismatch.db'}")
+    try:
+        # Open (and pool) a connection with the real profile first.
+        with engine.connect():
+            pass
+        monkeypatch.setattr(sqlite_helpers, "BUSY_TIMEOUT_MS", 1234)
+        mismatches = verify_sqlite_pragmas(engine)
+    finally:
+        engine.dispose()
+
+    assert "busy_timeout" in mismatches
+    assert mismatches["busy_timeout"][0] == 1234
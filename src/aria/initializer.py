@@ -148,12 +148,11 @@ def setup_directories() -> None:
 
 def setup_database() -> None:
     """Create SQLite database and all tables."""
-    from sqlalchemy import create_engine
-
     from aria.config.database import SQLite
     from aria.db.models import Base
+    from aria.helpers.sqlite import create_sqlite_engine
 
-    engine = create_engine(SQLite.db_url)
+    engine = create_sqlite_engine(SQLite.db_url)
     Base.metadata.create_all(engine)
     engine.dispose()
     console.print("   [green]✓[/green] Initialized database")
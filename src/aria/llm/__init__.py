@@ -2,7 +2,7 @@
 
 All public names that were previously available as ``from aria.llm import …``
 continue to work unchanged. The implementation now lives in private submodules
-(``_sanitize``, ``_state``, ``_utils``, ``_factory``).
+(``_sanitize``, ``_state``, ``_tokens``, ``_utils``, ``_factory``).
 """
 
 from ._factory import (
@@ -19,6 +19,7 @@ from ._state import (
     initial_workflow_state,
     state_reducer,
 )
+from ._tokens import TokenCounter, get_token_counter, set_token_counter
 from ._utils import generate_agent_id, get_instructions_extras
 
 __all__ = [
@@ -30,6 +31,10 @@ __all__ = [
     "WorkflowState",
     "initial_workflow_state",
     "state_reducer",
+    # _tokens
+    "TokenCounter",
+    "get_token_counter",
+    "set_token_counter",
     # _utils
     "generate_agent_id",
     "get_instructions_extras",
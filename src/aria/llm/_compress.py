@@ -17,6 +17,12 @@ Strategy
 All thresholds are computed as **fractions of the context window** so they
 scale correctly across hardware profiles (32K, 131K, 262K, etc.).
 
+Thresholds are expressed in nominal chars (``_CHARS_PER_TOKEN`` per
+token).  Each output is measured in tokens with the model's tokenizer
+(see :mod:`aria.llm._tokens`) and converted to nominal chars, so dense
+JSON or non-English text is compressed at the same token size as prose.
+Head and tail cut sizes are scaled by the output's real chars per token.
+
 The notice tells the agent the output was compressed so it can request
 smaller chunks via ``offset``/``length`` or ``max_results``.
 
@@ -46,7 +52,7 @@ def _env_float(key: str, default: float) -> float:
 # Ratio-based thresholds (fractions of context window in chars)
 # ---------------------------------------------------------------------------
 
-# Approximate chars per token (English text average).
+# Chars per token used to express thresholds in chars (English average).
 _CHARS_PER_TOKEN = 4
 
 # Below this fraction of context: no compression.
@@ -219,6 +225,19 @@ def _is_json_like(output: str) -> bool:
     return stripped[:1] in ("{", "[") or stripped[:2] == '{"'
 
 
+def _nominal_length(output: str) -> int:
+    """Return the size of *output* in nominal chars (tokens × 4).
+
+    With the heuristic counter this is just ``len(output)``.
+    """
+    from aria.llm._tokens import get_token_counter
+
+    counter = get_token_counter()
+    if not counter.exact:
+        return len(output)
+    return counter.estimate(output) * _CHARS_PER_TOKEN
+
+
 def compress_tool_output(output: str, tool_name: str = "") -> str:
     """Compress a tool output to fit within the context budget.
 
@@ -247,16 +266,19 @@ def compress_tool_output(output: str, tool_name: str = "") -> str:
 
     t = _get_thresholds()
     length = len(output)
+    size = _nominal_length(output)
 
-    if length <= t["min_chars"]:
+    if size <= t["min_chars"]:
         return output
 
     json_like = _is_json_like(output)
+    # Real chars per nominal char, to turn budgets into cut positions.
+    scale = length / size
 
     # --- Medium compression (head + tail) ---
-    if length <= t["max_chars"]:
-        head_budget = t["head_chars"]
-        tail_budget = t["tail_chars"]
+    if size <= t["max_chars"]:
+        head_budget = int(t["head_chars"] * scale)
+        tail_budget = int(t["tail_chars"] * scale)
 
         if json_like:
             head_end = _find_head_cut(output, head_budget)
@@ -287,8 +309,8 @@ def compress_tool_output(output: str, tool_name: str = "") -> str:
         return result
 
     # --- Aggressive compression (large outputs) ---
-    head_budget = t["aggressive_head"]
-    tail_budget = t["aggressive_tail"]
+    head_budget = int(t["aggressive_head"] * scale)
+    tail_budget = int(t["aggressive_tail"] * scale)
 
     if json_like:
         head_end = _find_head_cut(output, head_budget)
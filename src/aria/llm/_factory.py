@@ -17,6 +17,7 @@ from aria.agents import get_chatter_agent
 
 from ._sanitize import SanitizedOpenAILike
 from ._state import StatefulAgentWorkflow, initial_workflow_state
+from ._tokens import get_token_counter
 from ._utils import get_instructions_extras
 
 
@@ -155,6 +156,8 @@ def get_default_memory(
         token_limit=token_limit,
         chat_history_token_ratio=EmbeddingsConfig.chat_history_token_ratio,
         token_flush_size=EmbeddingsConfig.context_size,
+        # Budget with the served model's tokenizer (cached counts).
+        tokenizer_fn=get_token_counter().tokenize,
     )
 
     return memory
@@ -0,0 +1,206 @@
+"""Turn-scoped memoization of idempotent tool calls.
+
+Agents often repeat a ``read_file``, ``list_files`` or ``ax web search``
+call within one turn.  Each repeat costs I/O or network time and puts a
+second copy of the payload into the context.
+
+For tools with a :class:`~aria.tools.registry.MemoPolicy`, a
+:class:`TurnMemo` remembers which call produced the result for a given
+``(tool name, normalized arguments)`` key.  A repeat is answered with a
+short "same result as call #N" reference instead of running the tool,
+while the result is still valid:
+
+* file tools — the file's mtime and size are unchanged, and no write
+  tool has touched the path (or, for a listing, anything below it);
+  tools that may touch any path (``shell``, ``python``, ...) invalidate
+  every file result;
+* network tools — the policy's TTL has not expired.
+
+Only successful calls are remembered.  Aria tools report most failures
+by returning a ``tool_error_response`` payload instead of raising, so a
+result whose JSON has ``"status": "error"`` (or, for SearXNG,
+``data.success`` false) counts as a failure too, and a retry runs again.
+
+Memos live for one workflow run (one user turn).  ``ARIA_TOOL_MEMO=0``
+disables them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import weakref
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from aria.tools.registry import (
+    WRITE_PATH_ARGS,
+    is_parallel_safe,
+    memo_policy,
+)
+
+
+@dataclass(frozen=True)
+class MemoStamp:
+    """Validity data captured just before a memoizable call runs."""
+
+    key: str
+    tool_id: str
+    path: str | None
+    file_stamp: tuple[int, int] | None
+    expires: float | None
+
+
+@dataclass(frozen=True)
+class MemoEntry:
+    """A remembered call: its turn-wide number and validity data."""
+
+    call_number: int
+    stamp: MemoStamp
+
+
+def _resolve(path: Any) -> str:
+    from aria.tools.constants import BASE_DIR
+
+    raw = str(path or ".")
+    if not os.path.isabs(raw):
+        raw = os.path.join(BASE_DIR, raw)
+    return os.path.normpath(raw)
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _key(tool_name: str, kwargs: dict, path_arg: str | None) -> str:
+    normalized = {k: v for k, v in kwargs.items() if k != "reason"}
+    if path_arg is not None:
+        normalized[path_arg] = _resolve(normalized.get(path_arg))
+    return f"{tool_name}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+def _touches(written: str, path: str) -> bool:
+    return written == path or written.startswith(path.rstrip(os.sep) + os.sep)
+
+
+class TurnMemo:
+    """Results of idempotent tool calls made during one turn."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, MemoEntry] = {}
+        self._numbers: dict[str, int] = {}
+
+    def number_calls(self, tool_ids: Sequence[str]) -> None:
+        """Number the calls of a model response, counting from the turn start."""
+        for tool_id in tool_ids:
+            self._numbers.setdefault(tool_id, len(self._numbers) + 1)
+
+    def lookup(self, tool_name: str, kwargs: dict) -> MemoEntry | None:
+        """Return the earlier call whose result is still valid, if any."""
+        policy = memo_policy(tool_name, kwargs)
+        if policy is None:
+            return None
+        key = _key(tool_name, kwargs, policy.path_arg)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stamp = entry.stamp
+        if stamp.expires is not None and time.monotonic() >= stamp.expires:
+            del self._entries[key]
+            return None
+        if stamp.path is not None and _file_stamp(stamp.path) != stamp.file_stamp:
+            del self._entries[key]
+            return None
+        return entry
+
+    def stamp(self, tool_name: str, kwargs: dict, tool_id: str) -> MemoStamp | None:
+        """Capture validity data before running a memoizable call."""
+        policy = memo_policy(tool_name, kwargs)
+        if policy is None:
+            return None
+        path = None
+        if policy.path_arg is not None:
+            path = _resolve(kwargs.get(policy.path_arg))
+        return MemoStamp(
+            key=_key(tool_name, kwargs, policy.path_arg),
+            tool_id=tool_id,
+            path=path,
+            file_stamp=_file_stamp(path) if path is not None else None,
+            expires=None if policy.ttl_s is None else time.monotonic() + policy.ttl_s,
+        )
+
+    def settle(
+        self,
+        tool_name: str,
+        kwargs: dict,
+        stamp: MemoStamp | None,
+        succeeded: bool,
+    ) -> None:
+        """Remember a successful memoizable call; invalidate after writes."""
+        if stamp is not None:
+            number = self._numbers.get(stamp.tool_id)
+            if succeeded and number is not None:
+                self._entries[stamp.key] = MemoEntry(number, stamp)
+            return
+        if is_parallel_safe(tool_name, kwargs):
+            return
+        arg_names = WRITE_PATH_ARGS.get(tool_name)
+        written = (
+            None
+            if arg_names is None
+            else [_resolve(kwargs.get(a)) for a in arg_names if kwargs.get(a)]
+        )
+        for key, entry in list(self._entries.items()):
+            path = entry.stamp.path
+            if path is None:
+                continue
+            if written is None or any(_touches(w, path) for w in written):
+                del self._entries[key]
+
+
+def reports_error(content: str | None) -> bool:
+    """Whether a tool's output is a JSON error payload."""
+    if not content or not content.lstrip().startswith("{"):
+        return False
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        return False
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("status") == "error":
+        return True
+    data = payload.get("data")
+    return isinstance(data, dict) and data.get("success") is False
+
+
+def repeat_notice(tool_name: str, entry: MemoEntry) -> str:
+    """Tool output returned for a repeated call."""
+    return (
+        f"[Same result as call #{entry.call_number} ({tool_name}, "
+        f"id {entry.stamp.tool_id}) — nothing changed since, so the output "
+        f"is not repeated here. Use that earlier result.]"
+    )
+
+
+# Memo per workflow run, keyed by ``ctx.store`` (shared by all steps).
+_memos: weakref.WeakKeyDictionary[Any, TurnMemo] = weakref.WeakKeyDictionary()
+
+
+def start_turn_memo(ctx: Any) -> None:
+    """Give *ctx*'s run a fresh memo (unless disabled)."""
+    if os.environ.get("ARIA_TOOL_MEMO", "1").strip().lower() in ("0", "false", "no"):
+        _memos.pop(ctx.store, None)
+        return
+    _memos[ctx.store] = TurnMemo()
+
+
+def get_turn_memo(ctx: Any) -> TurnMemo | None:
+    """Return the memo of *ctx*'s run, if any."""
+    return _memos.get(ctx.store)
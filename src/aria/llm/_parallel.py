@@ -0,0 +1,127 @@
+"""Ordering for tool calls that run concurrently.
+
+The workflow runtime hands every ``ToolCall`` of one model response to
+``call_tool`` workers at once (``ARIA_MAX_PARALLEL_TOOL_CALLS``, default
+4).  Left alone, that runs writes concurrently with reads of the same
+file and returns results in completion order.
+
+A :class:`ToolCallBatch` is registered for each multi-call response and
+gates every call on the calls before it:
+
+* a parallel-safe call (see :func:`aria.tools.registry.is_parallel_safe`)
+  waits for the earlier *unsafe* calls only, so consecutive reads run
+  together;
+* any other call waits for *every* earlier call, so writes, edits and
+  shell commands run one at a time, in the order the model emitted them.
+
+Results are handed back to the agent in call order by
+:class:`OrderedResultsContext`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Sequence
+from typing import Any
+
+from aria.llm._compress import _env_float
+from aria.tools.registry import is_parallel_safe
+
+# call_tool workers per workflow run; 1 runs every call in order.
+MAX_PARALLEL_TOOL_CALLS = max(1, int(_env_float("ARIA_MAX_PARALLEL_TOOL_CALLS", 4)))
+
+
+class ToolCallBatch:
+    """Dependency gates for the tool calls of one model response.
+
+    Args:
+        calls: ``(tool_id, parallel_safe)`` pairs in the order the model
+            emitted them.  Tool ids must be unique.
+    """
+
+    def __init__(self, calls: Sequence[tuple[str, bool]]) -> None:
+        self.position = {tool_id: i for i, (tool_id, _) in enumerate(calls)}
+        self._safe = [safe for _, safe in calls]
+        self._done = [asyncio.Event() for _ in calls]
+        # Guards read-modify-write of shared ctx.store entries.
+        self.lock = asyncio.Lock()
+
+    @classmethod
+    def for_calls(cls, tool_calls: Sequence[Any]) -> ToolCallBatch | None:
+        """Build a batch from ``ToolSelection`` objects.
+
+        Returns ``None`` for single calls and when tool ids repeat (calls
+        then run without gating).
+        """
+        ids = [tc.tool_id for tc in tool_calls]
+        if len(ids) < 2 or len(set(ids)) != len(ids):
+            return None
+        parallel = MAX_PARALLEL_TOOL_CALLS > 1
+        return cls(
+            [
+                (
+                    tc.tool_id,
+                    parallel and is_parallel_safe(tc.tool_name, tc.tool_kwargs),
+                )
+                for tc in tool_calls
+            ]
+        )
+
+    async def wait_turn(self, tool_id: str) -> None:
+        """Wait until the calls *tool_id* depends on have finished."""
+        i = self.position.get(tool_id)
+        if i is None:
+            return
+        for j in range(i):
+            if not (self._safe[i] and self._safe[j]):
+                await self._done[j].wait()
+
+    def finish(self, tool_id: str) -> None:
+        """Mark *tool_id* as finished, releasing the calls waiting on it."""
+        i = self.position.get(tool_id)
+        if i is not None:
+            self._done[i].set()
+
+
+# Active batch per workflow run.  Steps of one run receive different
+# Context objects but share ``ctx.store``, so that is the key.
+_batches: weakref.WeakKeyDictionary[Any, ToolCallBatch] = weakref.WeakKeyDictionary()
+
+
+def register_batch(ctx: Any, batch: ToolCallBatch | None) -> None:
+    """Make *batch* the active batch of *ctx*'s run (``None`` clears it)."""
+    if batch is None:
+        _batches.pop(ctx.store, None)
+    else:
+        _batches[ctx.store] = batch
+
+
+def get_batch(ctx: Any) -> ToolCallBatch | None:
+    """Return the active batch of *ctx*'s run, if any."""
+    return _batches.get(ctx.store)
+
+
+class OrderedResultsContext:
+    """View of a workflow context whose ``collect_events`` keeps call order.
+
+    ``ctx.collect_events`` returns events of the same type in arrival
+    order; this re-sorts collected ``ToolCallResult`` events by their
+    position in *batch*.
+    """
+
+    def __init__(self, ctx: Any, batch: ToolCallBatch) -> None:
+        self._ctx = ctx
+        self._batch = batch
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+    def collect_events(self, ev: Any, expected: list, buffer_id: str | None = None):
+        events = self._ctx.collect_events(ev, expected, buffer_id)
+        if events:
+            last = len(self._batch.position)
+            events.sort(
+                key=lambda e: self._batch.position.get(getattr(e, "tool_id", ""), last)
+            )
+        return events
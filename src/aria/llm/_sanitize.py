@@ -9,12 +9,20 @@ data``.
 
 This module provides helpers to clean up such arguments and a subclass of
 :class:`~llama_index.llms.openai_like.OpenAILike` that applies them
-transparently before every API call.
+transparently before every API call (memoized per message, since the
+agent resends the whole history each step).  While streaming, tool-call
+argument deltas are assembled incrementally and each call is sanitized
+once, when it is complete (see :class:`_ToolCallAssembler`).
 """
 
 import copy
 import json
+import operator
 import re
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Iterable, List, Sequence, cast
 
 from llama_index.core.base.llms.types import (
@@ -29,6 +37,10 @@ from llama_index.core.base.llms.types import (
 from llama_index.llms.openai_like import OpenAILike
 from loguru import logger
 from openai.types.chat import ChatCompletionMessageParam
+from openai.types.chat.chat_completion_chunk import (
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
 
 
 def _sanitize_tool_call_args(arguments: Any) -> dict[str, Any]:
@@ -136,8 +148,8 @@ def _sanitize_tool_call_arguments_json(arguments: Any) -> str:
     return json.dumps(sanitized, ensure_ascii=False, separators=(",", ":"))
 
 
-def _sanitize_messages(messages: Sequence[ChatMessage]) -> List[ChatMessage]:
-    """Return *messages* with tool-call arguments guaranteed to be valid JSON.
+def _sanitize_message(msg: ChatMessage) -> ChatMessage:
+    """Return *msg* with tool-call arguments guaranteed to be valid JSON.
 
     Two code paths carry tool calls inside ``ChatMessage``:
 
@@ -145,101 +157,235 @@ def _sanitize_messages(messages: Sequence[ChatMessage]) -> List[ChatMessage]:
     2. ``additional_kwargs["tool_calls"]`` — legacy / streaming path
        using ``ChoiceDeltaToolCall`` objects.
 
-    Both are sanitised here so vLLM never sees malformed JSON.
+    Both are sanitised here so vLLM never sees malformed JSON.  *msg* is
+    returned as-is when nothing needed fixing.
     """
-    sanitized: List[ChatMessage] = []
-    for msg in messages:
-        changed = False
-
-        # --- Path 1: ToolCallBlock in blocks ---
-        # The OpenAI API requires `function.arguments` to be a JSON *string*.
-        # LlamaIndex may store tool_kwargs as a dict (after parsing or via the
-        # `or {}` fallback).  If a dict reaches utils.py, the openai SDK's
-        # Pydantic model coerces it with str() → Python repr with single quotes
-        # → vLLM fails with "Expecting property name enclosed in double quotes".
-        new_blocks = list(msg.blocks)
-        for i, block in enumerate(new_blocks):
-            if isinstance(block, ToolCallBlock):
-                raw = block.tool_kwargs
-                if isinstance(raw, dict):
-                    fixed_str = json.dumps(raw, ensure_ascii=False)
-                elif isinstance(raw, str):
-                    fixed_str = _sanitize_tool_call_arguments_json(raw)
-                else:
-                    fixed_str = json.dumps(
-                        _sanitize_tool_call_args(raw),
-                        ensure_ascii=False,
-                    )
-                if fixed_str != raw:
+    changed = False
+
+    # --- Path 1: ToolCallBlock in blocks ---
+    # The OpenAI API requires `function.arguments` to be a JSON *string*.
+    # LlamaIndex may store tool_kwargs as a dict (after parsing or via the
+    # `or {}` fallback).  If a dict reaches utils.py, the openai SDK's
+    # Pydantic model coerces it with str() → Python repr with single quotes
+    # → vLLM fails with "Expecting property name enclosed in double quotes".
+    new_blocks = list(msg.blocks)
+    for i, block in enumerate(new_blocks):
+        if isinstance(block, ToolCallBlock):
+            raw = block.tool_kwargs
+            if isinstance(raw, dict):
+                fixed_str = json.dumps(raw, ensure_ascii=False)
+            elif isinstance(raw, str):
+                fixed_str = _sanitize_tool_call_arguments_json(raw)
+            else:
+                fixed_str = json.dumps(
+                    _sanitize_tool_call_args(raw),
+                    ensure_ascii=False,
+                )
+            if fixed_str != raw:
+                logger.debug(
+                    "Sanitized ToolCallBlock.tool_kwargs: {} → {}",
+                    repr(raw)[:120],
+                    repr(fixed_str)[:120],
+                )
+                new_blocks[i] = ToolCallBlock(
+                    tool_name=block.tool_name,
+                    tool_kwargs=fixed_str,
+                    tool_call_id=block.tool_call_id,
+                )
+                changed = True
+
+    # --- Path 2: additional_kwargs["tool_calls"] ---
+    ak = msg.additional_kwargs
+    ak_copy: dict[str, Any] | None = None
+    if "tool_calls" in ak:
+        for i, tc in enumerate(ak["tool_calls"]):
+            # ChoiceDeltaToolCall is a Pydantic model; .function.arguments
+            # is the raw string we need to fix.
+            if hasattr(tc, "function") and hasattr(tc.function, "arguments"):
+                raw_args = tc.function.arguments
+                fixed = _sanitize_tool_call_arguments_json(raw_args)
+                if fixed != raw_args:
                     logger.debug(
-                        "Sanitized ToolCallBlock.tool_kwargs: {} → {}",
-                        repr(raw)[:120],
-                        repr(fixed_str)[:120],
-                    )
-                    new_blocks[i] = ToolCallBlock(
-                        tool_name=block.tool_name,
-                        tool_kwargs=fixed_str,
-                        tool_call_id=block.tool_call_id,
+                        "Sanitized additional_kwargs tool_call args: {} → {}",
+                        repr(raw_args)[:120],
+                        repr(fixed)[:120],
                     )
+                    # Deep-copy ak on first mutation to avoid
+                    # mutating the caller's original message, and
+                    # always write to the copy's entry.
+                    if ak_copy is None:
+                        ak_copy = copy.deepcopy(ak)
+                    ak_copy["tool_calls"][i].function.arguments = fixed
                     changed = True
-
-        # --- Path 2: additional_kwargs["tool_calls"] ---
-        ak = msg.additional_kwargs
-        ak_copy: dict[str, Any] | None = None
-        if "tool_calls" in ak:
-            raw_tool_calls = ak["tool_calls"]
-            new_tool_calls = []
-            for tc in raw_tool_calls:
-                # ChoiceDeltaToolCall is a Pydantic model; .function.arguments
-                # is the raw string we need to fix.
-                if hasattr(tc, "function") and hasattr(tc.function, "arguments"):
-                    raw_args = tc.function.arguments
+            elif isinstance(tc, dict):
+                func = tc.get("function", {})
+                if "arguments" in func:
+                    raw_args = func["arguments"]
                     fixed = _sanitize_tool_call_arguments_json(raw_args)
                     if fixed != raw_args:
-                        logger.debug(
-                            "Sanitized additional_kwargs tool_call args: {} → {}",
-                            repr(raw_args)[:120],
-                            repr(fixed)[:120],
-                        )
-                        # Deep-copy ak on first mutation to avoid
-                        # mutating the caller's original message.
                         if ak_copy is None:
                             ak_copy = copy.deepcopy(ak)
-                            raw_tool_calls = ak_copy["tool_calls"]
-                            # Re-point tc to the copy's entry.
-                            tc = raw_tool_calls[len(new_tool_calls)]
-                        tc.function.arguments = fixed
+                        ak_copy["tool_calls"][i]["function"]["arguments"] = fixed
                         changed = True
-                elif isinstance(tc, dict):
-                    func = tc.get("function", {})
-                    if "arguments" in func:
-                        raw_args = func["arguments"]
-                        fixed = _sanitize_tool_call_arguments_json(raw_args)
-                        if fixed != raw_args:
-                            if ak_copy is None:
-                                ak_copy = copy.deepcopy(ak)
-                                raw_tool_calls = ak_copy["tool_calls"]
-                                tc = raw_tool_calls[len(new_tool_calls)]
-                                func = tc.get("function", {})
-                            func["arguments"] = fixed
-                            changed = True
-                new_tool_calls.append(tc)
-
-        if changed:
-            sanitized.append(
-                ChatMessage(
-                    role=msg.role,
-                    blocks=new_blocks,
-                    additional_kwargs=ak_copy or ak,
-                    content=msg.content,
-                )
-            )
-        else:
-            sanitized.append(msg)
 
+    if not changed:
+        return msg
+    return ChatMessage(
+        role=msg.role,
+        blocks=new_blocks,
+        additional_kwargs=ak_copy or ak,
+        content=msg.content,
+    )
+
+
+@dataclass
+class _CachedSanitization:
+    ref: weakref.ref
+    fingerprint: tuple
+    # None when the message was already clean (returned as-is).
+    result: ChatMessage | None
+    # Characters of the strings in ``fingerprint``.
+    size: int
+
+
+# id(message) -> result of sanitizing it.  Entries hold a weak reference
+# to the message, so an id is never matched against a recycled object.
+# The fingerprint keeps the message's parts alive, so an entry is dropped
+# as soon as its message is collected, and the LRU is bounded both by
+# entries and by the characters the fingerprints hold.
+_sanitize_cache: OrderedDict[int, _CachedSanitization] = OrderedDict()
+_sanitize_cache_lock = threading.Lock()
+_sanitize_cache_chars = 0
+_SANITIZE_CACHE_SIZE = 4096
+_SANITIZE_CACHE_MAX_CHARS = 4_000_000
+# Keys of collected messages, appended by weakref callbacks (which may run
+# at any point, including while the lock is held) and purged under the lock.
+_dead_keys: list[int] = []
+
+
+def _fingerprint(msg: ChatMessage) -> tuple | None:
+    """Return the objects sanitization reads from *msg*, or None to skip caching.
+
+    A cached result is reused only while every one of these is still the
+    same object, so reassigning ``blocks``, an ``additional_kwargs``
+    entry, a block's ``tool_kwargs`` or a tool call's ``arguments``
+    invalidates it.  Messages without tool calls are cheap to check and
+    are not cached; neither are messages with dict ``tool_kwargs``, since
+    a dict can change in place.
+    """
+    ak = msg.additional_kwargs
+    tool_calls = ak.get("tool_calls")
+    tool_blocks = [b for b in msg.blocks if isinstance(b, ToolCallBlock)]
+    if tool_calls is None and not tool_blocks:
+        return None
+    parts: list[Any] = [msg.role, ak, *ak.values(), *msg.blocks]
+    for block in tool_blocks:
+        if not isinstance(block.tool_kwargs, str):
+            return None
+        parts += (block.tool_kwargs, block.tool_name, block.tool_call_id)
+    if tool_calls is None:
+        return tuple(parts)
+    parts += (tool_calls, *tool_calls)
+    for tc in tool_calls:
+        func = tc.get("function") if isinstance(tc, dict) else None
+        if func is None:
+            func = getattr(tc, "function", None)
+        parts.append(func)
+        if isinstance(func, dict):
+            parts.append(func.get("arguments"))
+        elif func is not None:
+            parts.append(getattr(func, "arguments", None))
+    return tuple(parts)
+
+
+def _same_objects(a: tuple, b: tuple) -> bool:
+    return len(a) == len(b) and all(map(operator.is_, a, b))
+
+
+def _fingerprint_size(fingerprint: tuple) -> int:
+    return sum(len(part) for part in fingerprint if isinstance(part, str))
+
+
+def _drop_entry(key: int) -> None:
+    """Remove the entry under *key*.  Must be called with the lock held."""
+    global _sanitize_cache_chars
+    entry = _sanitize_cache.pop(key, None)
+    if entry is not None:
+        _sanitize_cache_chars -= entry.size
+
+
+def _purge_dead() -> None:
+    """Drop entries of collected messages.  Must be called with the lock held."""
+    while _dead_keys:
+        key = _dead_keys.pop()
+        entry = _sanitize_cache.get(key)
+        # The id may already belong to a newer, live message.
+        if entry is not None and entry.ref() is None:
+            _drop_entry(key)
+
+
+def _sanitize_messages(messages: Sequence[ChatMessage]) -> List[ChatMessage]:
+    """Return *messages* with every message passed through :func:`_sanitize_message`.
+
+    Agent loops resend the whole history on every step, so results are
+    memoized per message object: a message is re-sanitized only if it is
+    new or has been modified since.  The output is the same as
+    sanitizing every message afresh.
+    """
+    global _sanitize_cache_chars
+    if _dead_keys:
+        with _sanitize_cache_lock:
+            _purge_dead()
+    sanitized: List[ChatMessage] = []
+    for msg in messages:
+        key = id(msg)
+        fingerprint = _fingerprint(msg)
+        if fingerprint is not None:
+            with _sanitize_cache_lock:
+                entry = _sanitize_cache.get(key)
+                if (
+                    entry is not None
+                    and entry.ref() is msg
+                    and _same_objects(entry.fingerprint, fingerprint)
+                ):
+                    _sanitize_cache.move_to_end(key)
+                    sanitized.append(entry.result or msg)
+                    continue
+
+        fixed = _sanitize_message(msg)
+        sanitized.append(fixed)
+        if fingerprint is None:
+            continue
+        try:
+            ref = weakref.ref(msg, lambda _, key=key: _dead_keys.append(key))
+        except TypeError:
+            continue
+        size = _fingerprint_size(fingerprint)
+        with _sanitize_cache_lock:
+            _drop_entry(key)
+            _sanitize_cache[key] = _CachedSanitization(
+                ref=ref,
+                fingerprint=fingerprint,
+                result=None if fixed is msg else fixed,
+                size=size,
+            )
+            _sanitize_cache_chars += size
+            while _sanitize_cache and (
+                len(_sanitize_cache) > _SANITIZE_CACHE_SIZE
+                or _sanitize_cache_chars > _SANITIZE_CACHE_MAX_CHARS
+            ):
+                _drop_entry(next(iter(_sanitize_cache)))
     return sanitized
 
 
+def _clear_sanitize_cache() -> None:
+    global _sanitize_cache_chars
+    with _sanitize_cache_lock:
+        _sanitize_cache.clear()
+        _dead_keys.clear()
+        _sanitize_cache_chars = 0
+
+
 def _reorder_system_messages(messages: List[ChatMessage]) -> List[ChatMessage]:
     """Ensure all system messages precede non-system messages.
 
@@ -252,6 +398,85 @@ def _reorder_system_messages(messages: List[ChatMessage]) -> List[ChatMessage]:
     return system + others
 
 
+@dataclass
+class _PendingToolCall:
+    """A streamed tool call whose argument deltas are still arriving."""
+
+    index: int | None
+    id: str = ""
+    name: str = ""
+    type: str | None = None
+    # Argument deltas, joined once when the call is complete.
+    parts: list[str] = field(default_factory=list)
+
+
+class _ToolCallAssembler:
+    """Assemble streamed tool calls without re-reading their arguments.
+
+    The stock ``update_tool_calls`` helper concatenates each argument
+    delta onto the running string, and building ``ToolCallBlock``s from it
+    on every chunk meant re-sanitizing (and JSON-parsing) the whole
+    argument string per chunk — quadratic in the argument size for large
+    payloads such as ``write_file`` contents.
+
+    Here deltas are appended to a list.  A call is complete when a delta
+    for a different index arrives or the stream ends; only then are its
+    arguments joined and sanitized, exactly once.
+    """
+
+    def __init__(self) -> None:
+        self._pending: _PendingToolCall | None = None
+        self.tool_calls: list[ChoiceDeltaToolCall] = []
+        self.blocks: list[ToolCallBlock] = []
+
+    @property
+    def has_pending(self) -> bool:
+        return self._pending is not None
+
+    def feed(self, deltas: Sequence[ChoiceDeltaToolCall] | None) -> None:
+        """Consume the tool-call deltas of one chunk."""
+        for delta in deltas or ():
+            pending = self._pending
+            if pending is None or pending.index != delta.index:
+                self._complete()
+                pending = self._pending = _PendingToolCall(index=delta.index)
+            pending.id += delta.id or ""
+            pending.type = pending.type or delta.type
+            if delta.function is not None:
+                pending.name += delta.function.name or ""
+                if delta.function.arguments:
+                    pending.parts.append(delta.function.arguments)
+
+    def finish(self) -> None:
+        """Complete the call in progress (the stream has ended)."""
+        self._complete()
+
+    def _complete(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        raw_args = "".join(pending.parts)
+        # Keep tool_kwargs as JSON string (wire format).  Fallback to
+        # "{}" not {} (dict) to avoid repr issues.
+        self.tool_calls.append(
+            ChoiceDeltaToolCall(
+                index=pending.index or 0,
+                id=pending.id or None,
+                type=pending.type,
+                function=ChoiceDeltaToolCallFunction(
+                    name=pending.name, arguments=raw_args
+                ),
+            )
+        )
+        self.blocks.append(
+            ToolCallBlock(
+                tool_call_id=pending.id or None,
+                tool_kwargs=_sanitize_tool_call_arguments_json(raw_args or "{}"),
+                tool_name=pending.name,
+            )
+        )
+
+
 class SanitizedOpenAILike(OpenAILike):
     """OpenAILike subclass that sanitizes tool-call arguments before API calls.
 
@@ -295,17 +520,20 @@ class SanitizedOpenAILike(OpenAILike):
         This override normalises ``delta.content`` so that:
         * Text blocks are extracted and concatenated into a plain string.
         * Thinking blocks are accumulated into ``reasoning_content``.
+
+        Tool calls are assembled with :class:`_ToolCallAssembler` and only
+        attached to chunks once the model has finished (``finish_reason``
+        is set) — every chunk from then on, including a trailing usage
+        chunk, carries the complete calls.  If the stream ends without a
+        ``finish_reason`` while a call is in progress, one extra chunk with
+        an empty delta is yielded so the final response still has it.
         """
         # Lazy imports to avoid circular-dependency issues at module
         # load time.
-        from llama_index.llms.openai.utils import (
-            to_openai_message_dicts,
-            update_tool_calls,
-        )
+        from llama_index.llms.openai.utils import to_openai_message_dicts
         from openai.types.chat.chat_completion_chunk import (
             ChatCompletionChunk,
             ChoiceDelta,
-            ChoiceDeltaToolCall,
         )
 
         aclient = self._get_aclient()
@@ -323,9 +551,10 @@ class SanitizedOpenAILike(OpenAILike):
         async def gen() -> "ChatResponseAsyncGen":
             content = ""
             reasoning_content = ""
-            tool_calls: List[ChoiceDeltaToolCall] = []
-            is_function = False
+            assembler = _ToolCallAssembler()
+            finished = False
             first_chat_chunk = True
+            response: Any = None
 
             async for response in await aclient.chat.completions.create(
                 messages=message_dicts,
@@ -349,6 +578,7 @@ class SanitizedOpenAILike(OpenAILike):
                         first_chat_chunk = False
                         continue
                     delta = response.choices[0].delta
+                    finished = finished or bool(response.choices[0].finish_reason)
                 else:
                     delta = ChoiceDelta()
                 first_chat_chunk = False
@@ -356,8 +586,9 @@ class SanitizedOpenAILike(OpenAILike):
                 if delta is None:
                     continue
 
-                if delta.tool_calls:
-                    is_function = True
+                assembler.feed(delta.tool_calls)
+                if finished:
+                    assembler.finish()
 
                 role = delta.role or MessageRole.ASSISTANT
 
@@ -397,25 +628,9 @@ class SanitizedOpenAILike(OpenAILike):
                 blocks.append(TextBlock(text=content))
 
                 message_additional_kwargs = {}
-                if is_function:
-                    tool_calls = update_tool_calls(tool_calls, delta.tool_calls)
-                    if tool_calls:
-                        message_additional_kwargs["tool_calls"] = tool_calls
-                        for tool_call in tool_calls:
-                            if tool_call.function:
-                                # Keep tool_kwargs as JSON string
-                                # (wire format). Fallback to "{}"
-                                # not {} (dict) to avoid repr issues.
-                                raw_args = tool_call.function.arguments or "{}"
-                                blocks.append(
-                                    ToolCallBlock(
-                                        tool_call_id=tool_call.id,
-                                        tool_kwargs=_sanitize_tool_call_arguments_json(
-                                            raw_args
-                                        ),
-                                        tool_name=(tool_call.function.name or ""),
-                                    )
-                                )
+                if finished and assembler.tool_calls:
+                    message_additional_kwargs["tool_calls"] = list(assembler.tool_calls)
+                    blocks.extend(assembler.blocks)
 
                 response_additional_kwargs = self._get_response_token_counts(response)
                 if reasoning_delta:
@@ -432,4 +647,23 @@ class SanitizedOpenAILike(OpenAILike):
                     additional_kwargs=response_additional_kwargs,
                 )
 
+            if assembler.has_pending or (not finished and assembler.tool_calls):
+                # Stream ended mid-call (no finish_reason): emit the calls.
+                assembler.finish()
+                blocks = []
+                if reasoning_content:
+                    blocks.append(ThinkingBlock(content=reasoning_content))
+                blocks.append(TextBlock(text=content))
+                blocks.extend(assembler.blocks)
+                yield ChatResponse(
+                    message=ChatMessage(
+                        role=MessageRole.ASSISTANT,
+                        blocks=blocks,
+                        additional_kwargs={"tool_calls": list(assembler.tool_calls)},
+                    ),
+                    delta="",
+                    raw=response,
+                    additional_kwargs=self._get_response_token_counts(response),
+                )
+
         return gen()
@@ -0,0 +1,199 @@
+"""Spill store for large tool outputs.
+
+:func:`~aria.llm._compress.compress_tool_output` drops the middle of large
+outputs.  Before this module the full text stayed in memory for the rest
+of the turn (``ToolOutput.raw_output`` and ``WorkflowState.tool_calls``),
+and whatever was dropped could only be recovered by re-running the tool.
+
+Outputs that get compressed are now written to
+``~/.aria/workspace/tool-outputs/`` instead.  Files are named by the
+SHA-256 of their content, so repeated outputs share one file.  The agent
+receives the compressed preview plus the file path, which it can page
+through with ``read_file``; the workflow keeps only a
+:class:`SpillHandle`.
+
+The store is bounded by a TTL (``ARIA_SPILL_TTL_HOURS``, default 24) and
+a total size cap (``ARIA_SPILL_MAX_MB``, default 256; ``0`` disables
+spilling).  Expired and least-recently-written files are pruned as new
+outputs arrive.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from aria.config.folders import Workspace
+from aria.llm._compress import _env_float
+
+# Lines longer than this are wrapped on disk so ``read_file`` can page
+# through minified JSON and other single-line outputs.
+_WRAP_CHARS = 2000
+# Prune at most this often, unless the size cap may have been crossed.
+_PRUNE_INTERVAL_S = 60.0
+
+
+@dataclass(frozen=True)
+class SpillHandle:
+    """Reference to a tool output stored on disk.
+
+    Attributes:
+        path: Absolute path of the stored output.
+        chars: Length of the original output.
+        lines: Number of lines in the stored file.
+    """
+
+    path: Path
+    chars: int
+    lines: int
+
+    def __str__(self) -> str:
+        return f"[{self.chars:,} chars, {self.lines:,} lines stored at {self.path}]"
+
+    def notice(self) -> str:
+        """Tell the agent where the full output is and how to read it."""
+        return (
+            f"\n\n[Full output ({self.chars:,} chars, {self.lines:,} lines) "
+            f"saved to {self.path} — page through it with read_file "
+            f"(offset/length in lines) instead of re-running the tool.]"
+        )
+
+
+def _wrap_long_lines(text: str) -> str:
+    if all(len(line) <= _WRAP_CHARS for line in text.split("\n")):
+        return text
+    wrapped: list[str] = []
+    for line in text.split("\n"):
+        if len(line) <= _WRAP_CHARS:
+            wrapped.append(line)
+            continue
+        wrapped.extend(
+            line[i : i + _WRAP_CHARS] for i in range(0, len(line), _WRAP_CHARS)
+        )
+    return "\n".join(wrapped)
+
+
+class SpillStore:
+    """Content-addressed store of tool outputs with a TTL and a size cap.
+
+    Args:
+        root: Directory holding the stored outputs.
+        ttl_s: Files not written for this many seconds are deleted.
+        max_bytes: Upper bound on the total size of stored files.
+    """
+
+    def __init__(self, root: Path, ttl_s: float, max_bytes: int) -> None:
+        self.root = root
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._written_since_prune = 0
+
+    def put(self, text: str) -> SpillHandle:
+        """Store *text* and return its handle.
+
+        Storing the same text again reuses (and refreshes) the existing
+        file.
+        """
+        data = _wrap_long_lines(text).encode("utf-8", errors="replace")
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        path = self.root / f"{digest}.txt"
+        lines = data.count(b"\n") + 1
+        if path.exists():
+            os.utime(path)
+        else:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            with self._lock:
+                self._written_since_prune += len(data)
+        self._maybe_prune()
+        return SpillHandle(path=path, chars=len(text), lines=lines)
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            due = (
+                now - self._last_prune >= _PRUNE_INTERVAL_S
+                or self._written_since_prune > self.max_bytes // 10
+            )
+            if not due:
+                return
+            self._last_prune = now
+            self._written_since_prune = 0
+        self.prune()
+
+    def prune(self) -> None:
+        """Delete expired files, then the oldest until under the size cap."""
+        cutoff = time.time() - self.ttl_s
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            paths = list(self.root.glob("*.txt"))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                stat = path.stat()
+                if stat.st_mtime < cutoff:
+                    path.unlink()
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+_store: SpillStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_spill_store() -> SpillStore | None:
+    """Return the shared spill store, or ``None`` when spilling is disabled."""
+    global _store
+    max_mb = _env_float("ARIA_SPILL_MAX_MB", 256)
+    if max_mb <= 0:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SpillStore(
+                    Workspace.tool_outputs_path,
+                    ttl_s=_env_float("ARIA_SPILL_TTL_HOURS", 24) * 3600,
+                    max_bytes=int(max_mb * 1024 * 1024),
+                )
+    return _store
+
+
+def set_spill_store(store: SpillStore | None) -> None:
+    """Replace the shared spill store (``None`` recreates it on next use)."""
+    global _store
+    with _store_lock:
+        _store = store
+
+
+def spill(text: str) -> SpillHandle | None:
+    """Store *text* in the shared store; ``None`` if disabled or on error."""
+    store = get_spill_store()
+    if store is None:
+        return None
+    try:
+        return store.put(text)
+    except OSError as exc:
+        logger.warning(f"Could not spill tool output to disk: {exc}")
+        return None
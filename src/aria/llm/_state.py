@@ -6,7 +6,10 @@ pure function, and :class:`StatefulAgentWorkflow` which wires them into
 the LlamaIndex :class:`AgentWorkflow` run-loop.
 """
 
+import asyncio
+import contextlib
 import copy
+import dataclasses
 from typing import Any, cast
 
 from llama_index.core.agent.workflow import (
@@ -25,11 +28,27 @@ from aria.llm._compress import (
     SCRATCHPAD_PRESSURE_THRESHOLD,
     compress_tool_output,
 )
+from aria.llm._memo import (
+    MemoEntry,
+    get_turn_memo,
+    repeat_notice,
+    reports_error,
+    start_turn_memo,
+)
+from aria.llm._parallel import (
+    MAX_PARALLEL_TOOL_CALLS,
+    OrderedResultsContext,
+    ToolCallBatch,
+    get_batch,
+    register_batch,
+)
+from aria.llm._spill import SpillHandle, spill
+from aria.llm._tokens import get_token_counter
 
-# Cumulative tool output budget as fraction of context (chars).
+# Cumulative tool output budget as fraction of context (tokens).
 # When total tool output within a turn exceeds this, even "small"
 # outputs get compressed to prevent silent accumulation.
-_CUMULATIVE_BUDGET_RATIO = 0.15  # 15% of context in chars
+_CUMULATIVE_BUDGET_RATIO = 0.15  # 15% of context
 
 
 class ToolCallRecord(TypedDict):
@@ -39,7 +58,9 @@ class ToolCallRecord(TypedDict):
         agent: Name of the agent that invoked the tool.
         tool: Name of the tool that was called.
         args: Keyword arguments passed to the tool.
-        result: String representation of the tool's output.
+        result: String representation of the tool's output, or of its
+            :class:`~aria.llm._spill.SpillHandle` when the output was
+            compressed and stored on disk.
         error: Error message if the tool raised an exception, else ``None``.
     """
 
@@ -105,7 +126,8 @@ def state_reducer(state: WorkflowState, ev: Any) -> WorkflowState:
 
     * :class:`AgentOutput` — updates ``current_agent``.
     * :class:`ToolCallResult` — appends a :class:`ToolCallRecord` to
-      ``tool_calls`` and updates ``last_error``.
+      ``tool_calls`` and updates ``last_error``.  Outputs spilled to disk
+      are recorded by their handle only.
 
     All other event types are ignored and the state is returned unchanged.
 
@@ -134,12 +156,13 @@ def state_reducer(state: WorkflowState, ev: Any) -> WorkflowState:
         output = ev.tool_output
         is_error: bool = getattr(output, "is_error", False)
         raw_output: str = str(getattr(output, "content", output))
+        handle = getattr(output, "raw_output", None)
 
         record = ToolCallRecord(
             agent=state["current_agent"],
             tool=ev.tool_name,
             args=ev.tool_kwargs,
-            result=raw_output,
+            result=str(handle) if isinstance(handle, SpillHandle) else raw_output,
             error=raw_output if is_error else None,
         )
         state["tool_calls"].append(record)
@@ -160,6 +183,10 @@ class StatefulAgentWorkflow(AgentWorkflow):
     A pristine copy of the initial state is kept in ``_state_template`` so
     that every new workflow run receives a fresh, un-mutated state —
     preventing cross-conversation leakage of accumulated tool-call records.
+
+    When one response contains several tool calls, read-only calls run
+    concurrently while the rest run one at a time in order, and results
+    reach the agent in call order (see :mod:`aria.llm._parallel`).
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -183,6 +210,7 @@ class StatefulAgentWorkflow(AgentWorkflow):
         """
         await super()._init_context(ctx, ev)
         await ctx.store.set("state", copy.deepcopy(self._state_template))
+        start_turn_memo(ctx)
 
     async def reduce_state(self, ctx: Any, ev: Any) -> "WorkflowState":
         """Apply :func:`state_reducer` to the stored state.
@@ -221,13 +249,13 @@ class StatefulAgentWorkflow(AgentWorkflow):
         except Exception:
             return messages
 
-        approx_tokens = sum(len(str(m.content or "")) // 4 for m in messages)
-        usage_ratio = approx_tokens / context_size if context_size else 0
+        tokens = get_token_counter().count_messages(messages)
+        usage_ratio = tokens / context_size if context_size else 0
 
         if usage_ratio >= SCRATCHPAD_PRESSURE_THRESHOLD:
             warning = (
                 f"\u26a0 Context is {usage_ratio:.0%} full "
-                f"({approx_tokens:,}/{context_size:,} tokens). "
+                f"({tokens:,}/{context_size:,} tokens). "
                 f"Consolidate findings and produce a final answer now."
             )
             logger.warning(f"Scratchpad pressure {usage_ratio:.0%} — injecting warning")
@@ -256,10 +284,10 @@ class StatefulAgentWorkflow(AgentWorkflow):
 
         # DIAGNOSTIC: log what's being sent
         msg_count = len(ev.input)
-        approx_tokens = sum(len(str(m.content or "")) // 4 for m in ev.input)
+        tokens = get_token_counter().count_messages(ev.input)
         logger.info(
             f"run_agent_step: {msg_count} messages, "
-            f"~{approx_tokens} tokens "
+            f"{tokens} tokens "
             f"(roles: {[m.role.value for m in ev.input[:5]]}...)"
         )
         # END DIAGNOSTIC
@@ -299,22 +327,43 @@ class StatefulAgentWorkflow(AgentWorkflow):
                     )
         return output
 
+    async def parse_agent_output(self, ctx: Any, ev: AgentOutput) -> Any:
+        """Register the response's tool calls before they are dispatched."""
+        batch = None if ev.retry_messages else ToolCallBatch.for_calls(ev.tool_calls)
+        register_batch(ctx, batch)
+        memo = get_turn_memo(ctx)
+        if memo is not None and not ev.retry_messages:
+            memo.number_calls([tc.tool_id for tc in ev.tool_calls])
+        return await super().parse_agent_output(ctx, ev)
+
+    async def aggregate_tool_results(self, ctx: Any, ev: ToolCallResult) -> Any:
+        """Aggregate tool results in the order the model emitted the calls."""
+        batch = get_batch(ctx)
+        if batch is None:
+            return await super().aggregate_tool_results(ctx, ev)
+        return await super().aggregate_tool_results(
+            OrderedResultsContext(ctx, batch), ev
+        )
+
     async def _get_cumulative_budget(self, ctx: Any) -> int:
-        """Get the cumulative tool-output char budget for this turn."""
+        """Get the cumulative tool-output token budget for this turn."""
         try:
             from aria.config.api import Vllm as VllmConfig
 
-            ctx_chars = VllmConfig.chat_context_size * 4
+            ctx_tokens = VllmConfig.chat_context_size
         except Exception:
-            ctx_chars = 32768 * 4
-        return int(ctx_chars * _CUMULATIVE_BUDGET_RATIO)
+            ctx_tokens = 32768
+        return int(ctx_tokens * _CUMULATIVE_BUDGET_RATIO)
 
     async def call_tool(self, ctx: Any, ev: ToolCall) -> ToolCallResult:
         """Run the parent tool call step and synchronize custom state.
 
         Applies deterministic tool-output compression before the result
-        is injected into the agent context, keeping the full output in
-        ``ToolOutput.raw_output`` for logging/diagnostics.
+        is injected into the agent context.  Compressed outputs are
+        spilled to disk (see :mod:`aria.llm._spill`): the agent gets the
+        preview plus the file path, and ``ToolOutput.raw_output`` and the
+        workflow state keep only the :class:`SpillHandle`.  If spilling is
+        disabled or fails, the full output stays in ``raw_output``.
 
         Tracks cumulative tool output size within the turn. When the
         running total exceeds the budget, even normally-small outputs
@@ -323,7 +372,69 @@ class StatefulAgentWorkflow(AgentWorkflow):
         If the parent ``call_tool`` raises unexpectedly, the error is
         caught and wrapped in an error :class:`ToolCallResult` so the
         agent can surface it instead of crashing the workflow.
+
+        Calls that are part of a multi-call response first wait for the
+        earlier calls they conflict with (see :mod:`aria.llm._parallel`).
+        Repeats of idempotent calls whose earlier result is still valid
+        are answered with a reference to it (see :mod:`aria.llm._memo`).
         """
+        batch = get_batch(ctx)
+        lock = contextlib.nullcontext() if batch is None else batch.lock
+        if batch is not None:
+            await batch.wait_turn(ev.tool_id)
+        try:
+            memo = get_turn_memo(ctx)
+            if memo is None:
+                return await self._run_tool_call(ctx, ev, lock)
+            earlier = memo.lookup(ev.tool_name, ev.tool_kwargs)
+            if earlier is not None:
+                return await self._repeat_tool_call(ctx, ev, lock, earlier)
+            stamp = memo.stamp(ev.tool_name, ev.tool_kwargs, ev.tool_id)
+            result = await self._run_tool_call(ctx, ev, lock)
+            memo.settle(
+                ev.tool_name,
+                ev.tool_kwargs,
+                stamp,
+                succeeded=not result.tool_output.is_error
+                and not reports_error(result.tool_output.content),
+            )
+            return result
+        finally:
+            if batch is not None:
+                batch.finish(ev.tool_id)
+
+    async def _repeat_tool_call(
+        self, ctx: Any, ev: ToolCall, lock: Any, earlier: MemoEntry
+    ) -> ToolCallResult:
+        """Answer a repeated idempotent call without running the tool."""
+        logger.debug(f"Memoized {ev.tool_name}: same as call #{earlier.call_number}")
+        ctx.write_event_to_stream(
+            ToolCall(
+                tool_name=ev.tool_name,
+                tool_kwargs=ev.tool_kwargs,
+                tool_id=ev.tool_id,
+            )
+        )
+        content = repeat_notice(ev.tool_name, earlier)
+        result = ToolCallResult(
+            tool_name=ev.tool_name,
+            tool_kwargs=ev.tool_kwargs,
+            tool_id=ev.tool_id,
+            tool_output=ToolOutput(
+                content=content,
+                tool_name=ev.tool_name,
+                raw_input=ev.tool_kwargs,
+                raw_output=content,
+            ),
+            return_direct=False,
+        )
+        ctx.write_event_to_stream(result)
+        async with lock:
+            await self.reduce_state(ctx, result)
+        return result
+
+    async def _run_tool_call(self, ctx: Any, ev: ToolCall, lock: Any) -> ToolCallResult:
+        """Body of :meth:`call_tool`; *lock* guards shared store updates."""
         try:
             result = await super().call_tool(ctx, ev)
         except Exception as exc:
@@ -343,18 +454,17 @@ class StatefulAgentWorkflow(AgentWorkflow):
                 return_direct=False,
             )
 
-        # --- Record raw output in state BEFORE compression ---
-        await self.reduce_state(ctx, result)
-
         # --- Compress tool output to control scratchpad growth ---
         output = result.tool_output
         if not output.is_error:
             raw_content = str(getattr(output, "content", ""))
 
             # Track cumulative tool output for budget enforcement.
-            cumulative = await ctx.store.get("_turn_tool_chars", default=0)
-            cumulative += len(raw_content)
-            await ctx.store.set("_turn_tool_chars", cumulative)
+            tokens = get_token_counter().estimate(raw_content)
+            async with lock:
+                cumulative = await ctx.store.get("_turn_tool_tokens", default=0)
+                cumulative += tokens
+                await ctx.store.set("_turn_tool_tokens", cumulative)
 
             budget = await self._get_cumulative_budget(ctx)
             force = cumulative > budget
@@ -375,14 +485,24 @@ class StatefulAgentWorkflow(AgentWorkflow):
                     compressed = (
                         head + f"\n\n[...budget-compressed — dropped "
                         f"{dropped:,} chars. Cumulative output "
-                        f"({cumulative:,} chars) exceeds turn "
-                        f"budget ({budget:,} chars).]" + tail
+                        f"({cumulative:,} tokens) exceeds turn "
+                        f"budget ({budget:,} tokens).]" + tail
                     )
 
             if compressed != raw_content:
-                output.raw_output = raw_content
-                output.content = compressed
-
+                handle = await asyncio.to_thread(spill, raw_content)
+                if handle is None:
+                    # Nowhere else to keep it: record the full output.
+                    async with lock:
+                        await self.reduce_state(ctx, result)
+                    output.raw_output = raw_content
+                    output.content = compressed
+                    return result
+                output.raw_output = handle
+                output.content = compressed + handle.notice()
+
+        async with lock:
+            await self.reduce_state(ctx, result)
         return result
 
 
@@ -390,6 +510,13 @@ class StatefulAgentWorkflow(AgentWorkflow):
 StatefulAgentWorkflow.run_agent_step._step_config = (  # type: ignore[attr-defined]
     AgentWorkflow.run_agent_step._step_config
 )
-StatefulAgentWorkflow.call_tool._step_config = (  # type: ignore[attr-defined]
-    AgentWorkflow.call_tool._step_config
+StatefulAgentWorkflow.call_tool._step_config = dataclasses.replace(  # type: ignore[attr-defined]
+    AgentWorkflow.call_tool._step_config,
+    num_workers=MAX_PARALLEL_TOOL_CALLS,
+)
+StatefulAgentWorkflow.parse_agent_output._step_config = (  # type: ignore[attr-defined]
+    AgentWorkflow.parse_agent_output._step_config
+)
+StatefulAgentWorkflow.aggregate_tool_results._step_config = (  # type: ignore[attr-defined]
+    AgentWorkflow.aggregate_tool_results._step_config
 )
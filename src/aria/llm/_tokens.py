@@ -0,0 +1,223 @@
+"""Token counting with the served model's tokenizer.
+
+Context-pressure warnings, the per-turn tool-output budget, tool-output
+compression and memory budgeting all need token counts.  ``len(text) // 4``
+is badly off for code, JSON and non-English text — in both directions, so
+it produced premature "context full" warnings *and* let real overflows
+through.
+
+:func:`get_token_counter` returns a process-wide :class:`TokenCounter`
+that is loaded lazily, in order of preference, from:
+
+1. ``tokenizer.json`` in ``CHAT_MODEL_PATH`` (``tokenizers``, fast);
+2. the same directory via ``transformers.AutoTokenizer`` (e.g.
+   sentencepiece-only models);
+3. LlamaIndex's default tokenizer (tiktoken ``cl100k_base``, bundled) —
+   e.g. in remote mode, where the model is not on disk;
+4. the ``len // 4`` heuristic, if nothing else loads.
+
+Counts are cached per text.  Message histories are re-counted on every
+agent step, but their texts are the same string objects each time, so
+only text not seen before is tokenized.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from llama_index.core.base.llms.types import (
+    ChatMessage,
+    ImageBlock,
+    TextBlock,
+    ToolCallBlock,
+)
+from loguru import logger
+
+# Role markers and separators a chat template adds around each message.
+_MESSAGE_OVERHEAD = 4
+# Same default LlamaIndex's Memory uses for images.
+_IMAGE_TOKENS = 256
+# Texts longer than this are estimated from a head/tail sample by
+# :meth:`TokenCounter.estimate`.
+_SAMPLE_CHARS = 64 * 1024
+# Upper bound on the total length of cached texts.
+_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+
+class TokenCounter:
+    """Count tokens with one tokenizer, caching counts per text.
+
+    Args:
+        encode: Function returning the token ids of a string.  ``None``
+            selects the ``len // 4`` heuristic.
+        name: Human-readable tokenizer name for logs.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[str], Sequence[int]] | None = None,
+        name: str = "len/4 heuristic",
+    ) -> None:
+        self._encode = encode
+        self.name = name
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._cached_chars = 0
+        self._lock = threading.Lock()
+
+    @property
+    def exact(self) -> bool:
+        """False when counts come from the ``len // 4`` heuristic."""
+        return self._encode is not None
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in *text*."""
+        if not text:
+            return 0
+        if self._encode is None:
+            return len(text) // 4
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+        tokens = len(self._encode(text))
+        with self._lock:
+            if text not in self._cache:
+                self._cache[text] = tokens
+                self._cached_chars += len(text)
+                while self._cached_chars > _CACHE_MAX_CHARS and self._cache:
+                    old, _ = self._cache.popitem(last=False)
+                    self._cached_chars -= len(old)
+        return tokens
+
+    def estimate(self, text: str) -> int:
+        """Return the token count of *text*, sampling very long texts.
+
+        Texts over ``_SAMPLE_CHARS`` are extrapolated from their head and
+        tail, which keeps sizing a multi-MB tool output cheap.
+        """
+        if len(text) <= _SAMPLE_CHARS or self._encode is None:
+            return self.count(text)
+        half = _SAMPLE_CHARS // 2
+        sample = text[:half] + text[-half:]
+        return math.ceil(len(self._encode(sample)) * len(text) / len(sample))
+
+    def tokenize(self, text: str) -> Sequence[int]:
+        """Stand-in for token ids when only their number matters.
+
+        LlamaIndex's ``Memory`` only ever takes ``len()`` of its
+        ``tokenizer_fn`` result, so this returns a ``range`` of the cached
+        count instead of re-encoding.
+        """
+        return range(self.count(text))
+
+    def count_message(self, message: ChatMessage) -> int:
+        """Return the tokens *message* contributes to a prompt."""
+        tokens = _MESSAGE_OVERHEAD
+        has_tool_blocks = False
+        for block in message.blocks:
+            if isinstance(block, TextBlock):
+                tokens += self.count(block.text)
+            elif isinstance(block, ToolCallBlock):
+                has_tool_blocks = True
+                tokens += self.count(block.tool_name)
+                kwargs = block.tool_kwargs
+                tokens += self.count(kwargs if isinstance(kwargs, str) else str(kwargs))
+            elif isinstance(block, ImageBlock):
+                tokens += _IMAGE_TOKENS
+        if not has_tool_blocks:
+            for tool_call in message.additional_kwargs.get("tool_calls") or ():
+                tokens += self.count(_tool_call_text(tool_call))
+        return tokens
+
+    def count_messages(self, messages: Sequence[ChatMessage]) -> int:
+        """Return the total prompt tokens of *messages*."""
+        return sum(self.count_message(m) for m in messages)
+
+
+def _tool_call_text(tool_call: Any) -> str:
+    function = (
+        tool_call.get("function")
+        if isinstance(tool_call, dict)
+        else getattr(tool_call, "function", None)
+    )
+    if isinstance(function, dict):
+        return f"{function.get('name') or ''}{function.get('arguments') or ''}"
+    if function is not None:
+        name = getattr(function, "name", None) or ""
+        return f"{name}{getattr(function, 'arguments', None) or ''}"
+    return ""
+
+
+def _load_model_counter(model_path: str) -> TokenCounter | None:
+    path = Path(model_path)
+    if not model_path or not path.is_dir():
+        return None
+    tokenizer_file = path / "tokenizer.json"
+    if tokenizer_file.is_file():
+        try:
+            from tokenizers import Tokenizer
+
+            tokenizer = Tokenizer.from_file(str(tokenizer_file))
+            return TokenCounter(
+                lambda text: tokenizer.encode(text, add_special_tokens=False).ids,
+                name=f"{path.name} (tokenizers)",
+            )
+        except Exception as exc:
+            logger.debug(f"Could not load {tokenizer_file}: {exc}")
+    try:
+        from transformers import AutoTokenizer
+
+        hf_tokenizer = AutoTokenizer.from_pretrained(str(path), local_files_only=True)
+        return TokenCounter(
+            lambda text: hf_tokenizer.encode(text, add_special_tokens=False),
+            name=f"{path.name} (transformers)",
+        )
+    except Exception as exc:
+        logger.debug(f"Could not load a tokenizer from {path}: {exc}")
+    return None
+
+
+def _load_counter() -> TokenCounter:
+    try:
+        from aria.config.models import Chat as ChatConfig
+
+        counter = _load_model_counter(ChatConfig.model_path)
+        if counter is not None:
+            return counter
+    except Exception as exc:
+        logger.debug(f"Chat model tokenizer unavailable: {exc}")
+    try:
+        from llama_index.core.utils import get_tokenizer
+
+        return TokenCounter(get_tokenizer(), name="cl100k_base (fallback)")
+    except Exception as exc:
+        logger.debug(f"Default tokenizer unavailable: {exc}")
+    return TokenCounter()
+
+
+_counter: TokenCounter | None = None
+_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the shared token counter, loading the tokenizer on first use."""
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                _counter = _load_counter()
+                logger.info(f"Token counting with {_counter.name}")
+    return _counter
+
+
+def set_token_counter(counter: TokenCounter | None) -> None:
+    """Replace the shared token counter (``None`` reloads it on next use)."""
+    global _counter
+    with _counter_lock:
+        _counter = counter
@@ -33,9 +33,15 @@ def _reset_env_and_cache(monkeypatch: pytest.MonkeyPatch) -> None:
     # _get_context_size() checks CHAT_CONTEXT_SIZE env first, then
     # VllmConfig; setting the env here ensures consistent test behavior.
     monkeypatch.setenv("CHAT_CONTEXT_SIZE", "32768")
+    # Thresholds below are asserted in chars: measure with the len/4
+    # heuristic rather than whichever tokenizer happens to load.
+    from aria.llm._tokens import TokenCounter, set_token_counter
+
+    set_token_counter(TokenCounter())
     _reset_threshold_cache()
     yield
     _reset_threshold_cache()
+    set_token_counter(None)
 
 
 def _reload_compress():
@@ -0,0 +1,184 @@
+"""Tests for turn-scoped memoization of idempotent tool calls."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from llama_index.core.agent.workflow import FunctionAgent
+from llama_index.core.base.llms.types import ChatMessage, MessageRole, ToolCallBlock
+from llama_index.core.llms.mock import MockFunctionCallingLLM
+from llama_index.core.memory import Memory
+from llama_index.core.tools import FunctionTool
+
+from aria.llm import _memo
+from aria.llm._memo import TurnMemo
+from aria.llm._state import StatefulAgentWorkflow, initial_workflow_state
+from aria.llm._tokens import TokenCounter, set_token_counter
+
+
+def _call(memo: TurnMemo, tool_id: str, name: str, kwargs: dict, ok: bool = True):
+    """Run one call through *memo*; return the earlier entry on a hit."""
+    memo.number_calls([tool_id])
+    earlier = memo.lookup(name, kwargs)
+    if earlier is not None:
+        return earlier
+    stamp = memo.stamp(name, kwargs, tool_id)
+    memo.settle(name, kwargs, stamp, succeeded=ok)
+    return None
+
+
+@pytest.fixture
+def target(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+    return path
+
+
+class TestTurnMemo:
+    def test_repeat_read_hits_regardless_of_reason(self, target):
+        memo = TurnMemo()
+        read = {"reason": "first look", "file_name": str(target)}
+        assert _call(memo, "a", "read_file", read) is None
+        hit = _call(memo, "b", "read_file", {**read, "reason": "again"})
+        assert (hit.call_number, hit.stamp.tool_id) == (1, "a")
+        assert _call(memo, "c", "read_file", {**read, "offset": 10}) is None
+
+    def test_modified_file_misses(self, target):
+        memo = TurnMemo()
+        read = {"file_name": str(target)}
+        _call(memo, "a", "read_file", read)
+        target.write_text("hello, world")
+        assert _call(memo, "b", "read_file", read) is None
+        assert _call(memo, "c", "read_file", read).call_number == 2
+
+    def test_write_to_same_path_invalidates(self, target, tmp_path):
+        memo = TurnMemo()
+        _call(memo, "a", "read_file", {"file_name": str(target)})
+        _call(memo, "b", "list_files", {"path": str(tmp_path)})
+        _call(memo, "c", "write_file", {"file_name": str(tmp_path / "other.txt")})
+        assert _call(memo, "d", "read_file", {"file_name": str(target)}) is not None
+        assert _call(memo, "e", "list_files", {"path": str(tmp_path)}) is None
+
+        _call(memo, "f", "edit_file", {"file_name": str(target)})
+        assert _call(memo, "g", "read_file", {"file_name": str(target)}) is None
+
+    def test_shell_invalidates_file_results_but_not_network(self, target):
+        memo = TurnMemo()
+        search = {"family": "web", "command": "search", "args": {"query": "x"}}
+        _call(memo, "a", "read_file", {"file_name": str(target)})
+        _call(memo, "b", "ax", search)
+        _call(memo, "c", "shell", {"command": "touch x"})
+        assert _call(memo, "d", "read_file", {"file_name": str(target)}) is None
+        assert _call(memo, "e", "ax", search).call_number == 2
+
+    def test_network_results_expire(self, monkeypatch):
+        memo = TurnMemo()
+        stock = {"family": "finance", "command": "stock", "args": {"ticker": "X"}}
+        now = time.monotonic()
+        monkeypatch.setattr(_memo.time, "monotonic", lambda: now)
+        _call(memo, "a", "ax", stock)
+        monkeypatch.setattr(_memo.time, "monotonic", lambda: now + 59)
+        assert _call(memo, "b", "ax", stock) is not None
+        monkeypatch.setattr(_memo.time, "monotonic", lambda: now + 61)
+        assert _call(memo, "c", "ax", stock) is None
+
+    def test_errors_and_unlisted_tools_are_not_memoized(self, target):
+        memo = TurnMemo()
+        read = {"file_name": str(target)}
+        _call(memo, "a", "read_file", read, ok=False)
+        assert _call(memo, "b", "read_file", read) is None
+        _call(memo, "c", "shell", {"command": "ls"})
+        assert _call(memo, "d", "shell", {"command": "ls"}) is None
+
+    def test_error_payloads_are_failures(self):
+        assert _memo.reports_error('{"status": "error", "error": {}}')
+        assert _memo.reports_error(
+            '{"status": "success", "data": {"success": false, "findings": []}}'
+        )
+        assert not _memo.reports_error('{"status": "success", "data": {}}')
+        assert not _memo.reports_error("plain text")
+        assert not _memo.reports_error("{not json")
+
+
+def _workflow(path: str, runs: list[str]) -> StatefulAgentWorkflow:
+    def read_file(reason: str, file_name: str) -> str:
+        """Read a file."""
+        runs.append(file_name)
+        with open(file_name) as f:
+            return f.read()
+
+    def respond(messages, **kwargs) -> ChatMessage:
+        calls = sum(m.role == MessageRole.TOOL for m in messages)
+        if calls == 2:
+            return ChatMessage(role="assistant", content="done")
+        return ChatMessage(
+            role="assistant",
+            blocks=[
+                ToolCallBlock(
+                    tool_call_id=f"call_{calls}",
+                    tool_name="read_file",
+                    tool_kwargs={"reason": f"look {calls}", "file_name": path},
+                )
+            ],
+        )
+
+    agent = FunctionAgent(
+        name="Aria",
+        description="test agent",
+        llm=MockFunctionCallingLLM(response_generator=respond),
+        tools=[FunctionTool.from_defaults(fn=read_file)],
+    )
+    return StatefulAgentWorkflow(
+        agents=[agent],
+        root_agent="Aria",
+        initial_state=dict(initial_workflow_state("Aria")),
+        timeout=30,
+    )
+
+
+class TestWorkflowMemo:
+    @pytest.fixture(autouse=True)
+    def heuristic_counter(self):
+        set_token_counter(TokenCounter())
+        yield
+        set_token_counter(None)
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_returns_reference(self, target):
+        runs: list[str] = []
+        memory = Memory.from_defaults(token_limit=100_000)
+        await _workflow(str(target), runs).run(user_msg="go", memory=memory)
+
+        assert runs == [str(target)]
+        tool_messages = [
+            m.content for m in await memory.aget_all() if m.role == MessageRole.TOOL
+        ]
+        assert tool_messages[0] == "hello"
+        assert "Same result as call #1" in tool_messages[1]
+        assert "call_0" in tool_messages[1]
+
+    @pytest.mark.asyncio
+    async def test_memo_is_per_turn_and_can_be_disabled(self, target, monkeypatch):
+        runs: list[str] = []
+        workflow = _workflow(str(target), runs)
+        await workflow.run(user_msg="go", memory=Memory.from_defaults())
+        await workflow.run(user_msg="go", memory=Memory.from_defaults())
+        assert len(runs) == 2
+
+        monkeypatch.setenv("ARIA_TOOL_MEMO", "0")
+        await workflow.run(user_msg="go", memory=Memory.from_defaults())
+        assert len(runs) == 4
+
+    @pytest.mark.asyncio
+    async def test_error_payload_is_not_memoized(self, target):
+        target.write_text('{"status": "error", "error": {"code": "TIMEOUT"}}')
+        runs: list[str] = []
+        memory = Memory.from_defaults(token_limit=100_000)
+        await _workflow(str(target), runs).run(user_msg="go", memory=memory)
+
+        assert runs == [str(target), str(target)]
+        tool_messages = [
+            m.content for m in await memory.aget_all() if m.role == MessageRole.TOOL
+        ]
+        assert not any("Same result" in m for m in tool_messages)
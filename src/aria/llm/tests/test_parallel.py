@@ -0,0 +1,157 @@
+"""Tests for concurrent execution of tool calls from one model response."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from llama_index.core.agent.workflow import FunctionAgent
+from llama_index.core.base.llms.types import ChatMessage, MessageRole, ToolCallBlock
+from llama_index.core.llms.mock import MockFunctionCallingLLM
+from llama_index.core.memory import Memory
+from llama_index.core.tools import FunctionTool
+
+from aria.llm._parallel import ToolCallBatch
+from aria.llm._state import StatefulAgentWorkflow, initial_workflow_state
+from aria.llm._tokens import TokenCounter, set_token_counter
+from aria.tools.registry import is_parallel_safe
+
+
+class TestIsParallelSafe:
+    def test_read_only_tools(self):
+        assert is_parallel_safe("read_file", {"file_name": "/x"})
+        assert not is_parallel_safe("write_file", {"file_name": "/x"})
+        assert not is_parallel_safe("edit_file")
+        assert not is_parallel_safe("shell", {"command": "ls"})
+
+    def test_ax_commands(self):
+        assert is_parallel_safe("ax", {"family": "web", "command": "search"})
+        assert is_parallel_safe("ax", {"family": " IMDB ", "command": "Movie"})
+        assert not is_parallel_safe("ax", {"family": "web", "command": "click"})
+        assert not is_parallel_safe("ax", {"family": "knowledge", "command": "store"})
+        assert not is_parallel_safe("ax", {})
+
+
+class TestToolCallBatch:
+    @pytest.mark.asyncio
+    async def test_unsafe_call_waits_for_all_earlier_calls(self):
+        batch = ToolCallBatch([("a", True), ("b", True), ("w", False), ("c", True)])
+        order: list[str] = []
+
+        async def run(tool_id: str, delay: float) -> None:
+            await batch.wait_turn(tool_id)
+            order.append(f"start {tool_id}")
+            await asyncio.sleep(delay)
+            order.append(f"end {tool_id}")
+            batch.finish(tool_id)
+
+        await asyncio.gather(
+            run("c", 0), run("w", 0.01), run("b", 0.02), run("a", 0.03)
+        )
+        assert order[:2] == ["start b", "start a"]
+        assert order.index("start w") > max(order.index("end a"), order.index("end b"))
+        assert order.index("start c") > order.index("end w")
+
+    def test_duplicate_ids_disable_gating(self):
+        class Call:
+            def __init__(self, tool_id):
+                self.tool_id, self.tool_name, self.tool_kwargs = tool_id, "t", {}
+
+        assert ToolCallBatch.for_calls([Call("a"), Call("a")]) is None
+        assert ToolCallBatch.for_calls([Call("a")]) is None
+        assert ToolCallBatch.for_calls([Call("a"), Call("b")]) is not None
+
+
+_DELAY = 0.2
+
+
+def _workflow(log: list[str]) -> StatefulAgentWorkflow:
+    async def read_file(file_name: str) -> str:
+        """Read a file."""
+        log.append(f"start {file_name}")
+        # Later calls finish first, to exercise result ordering.
+        await asyncio.sleep(_DELAY * (1 - int(file_name[-1]) / 10))
+        log.append(f"end {file_name}")
+        return f"contents of {file_name}"
+
+    async def write_file(file_name: str) -> str:
+        """Write a file."""
+        log.append(f"start write {file_name}")
+        await asyncio.sleep(_DELAY / 4)
+        log.append(f"end write {file_name}")
+        return f"wrote {file_name}"
+
+    calls = [
+        ("read_file", "/r1"),
+        ("read_file", "/r2"),
+        ("read_file", "/r3"),
+        ("write_file", "/w4"),
+        ("read_file", "/r5"),
+    ]
+
+    def respond(messages, **kwargs) -> ChatMessage:
+        if any(m.role == MessageRole.TOOL for m in messages):
+            return ChatMessage(role="assistant", content="done")
+        return ChatMessage(
+            role="assistant",
+            blocks=[
+                ToolCallBlock(
+                    tool_call_id=f"call_{i}",
+                    tool_name=name,
+                    tool_kwargs={"file_name": path},
+                )
+                for i, (name, path) in enumerate(calls)
+            ],
+        )
+
+    agent = FunctionAgent(
+        name="Aria",
+        description="test agent",
+        llm=MockFunctionCallingLLM(response_generator=respond),
+        tools=[
+            FunctionTool.from_defaults(async_fn=read_file),
+            FunctionTool.from_defaults(async_fn=write_file),
+        ],
+    )
+    return StatefulAgentWorkflow(
+        agents=[agent],
+        root_agent="Aria",
+        initial_state=dict(initial_workflow_state("Aria")),
+        timeout=30,
+    )
+
+
+class TestParallelToolCalls:
+    @pytest.fixture(autouse=True)
+    def heuristic_counter(self):
+        set_token_counter(TokenCounter())
+        yield
+        set_token_counter(None)
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently_and_results_keep_call_order(self):
+        log: list[str] = []
+        workflow = _workflow(log)
+        memory = Memory.from_defaults(token_limit=100_000)
+
+        handler = workflow.run(user_msg="go", memory=memory)
+        await handler
+
+        # r1..r3 overlap, the write waits for them, r5 waits for the write.
+        assert log.index("start /r3") < log.index("end /r1")
+        assert log.index("start write /w4") > log.index("end /r1")
+        assert log.index("start /r5") > log.index("end write /w4")
+
+        tool_messages = [
+            m for m in await memory.aget_all() if m.role == MessageRole.TOOL
+        ]
+        assert [m.additional_kwargs["tool_call_id"] for m in tool_messages] == [
+            f"call_{i}" for i in range(5)
+        ]
+
+        state = await handler.ctx.store.get("state")
+        assert len(state["tool_calls"]) == 5
+        expected_tokens = sum(
+            len(m.content) // 4 for m in tool_messages if m.content is not None
+        )
+        assert await handler.ctx.store.get("_turn_tool_tokens") == expected_tokens
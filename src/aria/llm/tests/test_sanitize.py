@@ -0,0 +1,299 @@
+"""Tests for tool-call sanitization, its cache, and streamed tool-call assembly."""
+
+from __future__ import annotations
+
+import gc
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+from llama_index.core.base.llms.types import ChatMessage, TextBlock, ToolCallBlock
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+
+from aria.llm import _sanitize
+from aria.llm._sanitize import (
+    SanitizedOpenAILike,
+    _clear_sanitize_cache,
+    _sanitize_message,
+    _sanitize_messages,
+    _sanitize_tool_call_arguments_json,
+    _ToolCallAssembler,
+)
+
+
+def _tc(index, args=None, name=None, id=None):
+    return ChoiceDeltaToolCall(
+        index=index,
+        id=id,
+        type="function" if id else None,
+        function=ChoiceDeltaToolCallFunction(name=name, arguments=args),
+    )
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, choices=True):
+    return ChatCompletionChunk(
+        id="c",
+        created=0,
+        model="m",
+        object="chat.completion.chunk",
+        choices=[
+            Choice(
+                index=0,
+                delta=ChoiceDelta(content=content, tool_calls=tool_calls),
+                finish_reason=finish_reason,
+            )
+        ]
+        if choices
+        else [],
+    )
+
+
+def _tool_call_chunks(args: str, size: int = 7) -> list[ChatCompletionChunk]:
+    chunks = [_chunk(tool_calls=[_tc(0, name="write_file", id="call_1")])]
+    for i in range(0, len(args), size):
+        chunks.append(_chunk(tool_calls=[_tc(0, args[i : i + size])]))
+    return chunks
+
+
+async def _stream(monkeypatch, chunks):
+    async def aiter_chunks():
+        for chunk in chunks:
+            yield chunk
+
+    async def create(**kwargs):
+        return aiter_chunks()
+
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    monkeypatch.setattr(SanitizedOpenAILike, "_get_aclient", lambda self: client)
+    llm = SanitizedOpenAILike(model="m", api_base="http://localhost", api_key="k")
+    gen = await llm._astream_chat([ChatMessage(role="user", content="hi")])
+    return [response async for response in gen]
+
+
+def _tool_blocks(response):
+    return [b for b in response.message.blocks if isinstance(b, ToolCallBlock)]
+
+
+class TestToolCallAssembler:
+    def test_joins_deltas_once_per_call(self):
+        assembler = _ToolCallAssembler()
+        assembler.feed([_tc(0, name="read", id="a")])
+        assembler.feed([_tc(0, '{"path": ')])
+        assembler.feed([_tc(0, '"/x"}')])
+        assert assembler.blocks == []
+        assembler.feed([_tc(1, '{"q": 1}', name="search", id="b")])
+        assert [b.tool_name for b in assembler.blocks] == ["read"]
+        assembler.finish()
+
+        assert [b.tool_kwargs for b in assembler.blocks] == [
+            '{"path": "/x"}',
+            '{"q": 1}',
+        ]
+        assert [tc.id for tc in assembler.tool_calls] == ["a", "b"]
+        assert assembler.tool_calls[0].function.arguments == '{"path": "/x"}'
+        assert not assembler.has_pending
+
+    def test_malformed_arguments_are_sanitized(self):
+        assembler = _ToolCallAssembler()
+        assembler.feed([_tc(0, '{"a": 1}{"b": 2}', name="t", id="x")])
+        assembler.finish()
+        assert json.loads(assembler.blocks[0].tool_kwargs) == {"a": 1}
+
+    def test_missing_arguments_default_to_empty_object(self):
+        assembler = _ToolCallAssembler()
+        assembler.feed([_tc(0, name="t", id="x")])
+        assembler.finish()
+        assert assembler.blocks[0].tool_kwargs == "{}"
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_tool_call_attached_from_finish_chunk(self, monkeypatch):
+        args = json.dumps({"path": "/tmp/a.py", "content": "x = 1\n" * 50})
+        chunks = _tool_call_chunks(args)
+        chunks.append(_chunk(finish_reason="tool_calls"))
+        chunks.append(_chunk(choices=False))  # trailing usage chunk
+
+        responses = await _stream(monkeypatch, chunks)
+
+        assert all(not _tool_blocks(r) for r in responses[:-2])
+        for response in responses[-2:]:
+            (block,) = _tool_blocks(response)
+            assert block.tool_name == "write_file"
+            assert block.tool_call_id == "call_1"
+            assert block.tool_kwargs == _sanitize_tool_call_arguments_json(args)
+            (tool_call,) = response.message.additional_kwargs["tool_calls"]
+            assert tool_call.function.arguments == args
+
+    @pytest.mark.asyncio
+    async def test_stream_ending_mid_call_yields_closing_chunk(self, monkeypatch):
+        chunks = [_chunk(content="Let me write that.")]
+        chunks += _tool_call_chunks('{"path": "/tmp/b"}')
+
+        responses = await _stream(monkeypatch, chunks)
+
+        assert len(responses) == len(chunks) + 1
+        final = responses[-1]
+        assert final.delta == ""
+        assert final.message.content == "Let me write that."
+        (block,) = _tool_blocks(final)
+        assert json.loads(block.tool_kwargs) == {"path": "/tmp/b"}
+
+    @pytest.mark.asyncio
+    async def test_text_only_stream_is_unchanged(self, monkeypatch):
+        chunks = [_chunk(content="Hel"), _chunk(content="lo", finish_reason="stop")]
+        responses = await _stream(monkeypatch, chunks)
+        assert [r.delta for r in responses] == ["Hel", "lo"]
+        assert responses[-1].message.content == "Hello"
+        assert "tool_calls" not in responses[-1].message.additional_kwargs
+
+
+def _random_message(rng: random.Random) -> ChatMessage:
+    args_pool = [
+        '{"path": "/tmp/a"}',
+        '{"q": "x"}{"q": "y"}',
+        'not json "k": "v"',
+        "",
+        '"bare"',
+        '{"n": 1, "ok": true}',
+    ]
+    kind = rng.randrange(5)
+    if kind == 0:
+        return ChatMessage(
+            role=rng.choice(["user", "system", "tool"]), content=f"text {rng.random()}"
+        )
+    if kind == 1:
+        blocks = [
+            ToolCallBlock(
+                tool_call_id=f"call_{i}",
+                tool_name="t",
+                tool_kwargs=rng.choice(args_pool + [{"k": i}]),
+            )
+            for i in range(rng.randint(1, 3))
+        ]
+        return ChatMessage(role="assistant", blocks=blocks)
+    tool_calls: list = []
+    for i in range(rng.randint(1, 3)):
+        args = rng.choice(args_pool)
+        if kind == 2:
+            tool_calls.append(_tc(i, args, name="t", id=f"call_{i}"))
+        else:
+            tool_calls.append(
+                {"id": f"call_{i}", "function": {"name": "t", "arguments": args}}
+            )
+    return ChatMessage(
+        role="assistant",
+        content="" if kind == 4 else None,
+        additional_kwargs={"tool_calls": tool_calls},
+    )
+
+
+def _mutate(rng: random.Random, msg: ChatMessage) -> None:
+    """Modify *msg* the ways a history entry can change between steps."""
+    tool_blocks = [b for b in msg.blocks if isinstance(b, ToolCallBlock)]
+    if tool_blocks:
+        rng.choice(tool_blocks).tool_kwargs = '{"fixed": 1}{'
+    elif "tool_calls" in msg.additional_kwargs:
+        tc = rng.choice(msg.additional_kwargs["tool_calls"])
+        if isinstance(tc, dict):
+            tc["function"]["arguments"] = "{broken"
+        else:
+            tc.function.arguments = "{broken"
+    else:
+        msg.blocks = [TextBlock(text="rewritten")]
+
+
+def _dump(messages):
+    return [m.model_dump() for m in messages]
+
+
+class TestSanitizeMessagesCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _clear_sanitize_cache()
+        yield
+        _clear_sanitize_cache()
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_uncached_sanitization(self, seed):
+        rng = random.Random(seed)
+        history: list[ChatMessage] = []
+        for _step in range(15):
+            history += [_random_message(rng) for _ in range(rng.randint(1, 4))]
+            if rng.random() < 0.4:
+                _mutate(rng, rng.choice(history))
+            expected = _dump([_sanitize_message(m) for m in history])
+            assert _dump(_sanitize_messages(history)) == expected
+            assert _dump(_sanitize_messages(history)) == expected
+
+    def test_only_new_messages_are_sanitized(self, monkeypatch):
+        rng = random.Random(0)
+        history = [_random_message(rng) for _ in range(40)]
+        _sanitize_messages(history)
+
+        calls = []
+        original = _sanitize._sanitize_message
+        monkeypatch.setattr(
+            _sanitize,
+            "_sanitize_message",
+            lambda m: calls.append(m) or original(m),
+        )
+        history.append(ChatMessage(role="user", content="next"))
+        _sanitize_messages(history)
+        # Messages with dict tool_kwargs are never cached.
+        expected = [m for m in history[:-1] if _sanitize._fingerprint(m) is None]
+        assert [id(m) for m in calls] == [id(m) for m in [*expected, history[-1]]]
+
+    def test_input_messages_are_not_mutated(self):
+        tool_calls = [
+            _tc(0, "{bad", name="t", id="a"),
+            _tc(1, "{also bad", name="t", id="b"),
+        ]
+        msg = ChatMessage(
+            role="assistant", additional_kwargs={"tool_calls": tool_calls}
+        )
+        (fixed,) = _sanitize_messages([msg])
+        assert [tc.function.arguments for tc in tool_calls] == ["{bad", "{also bad"]
+        assert [
+            tc.function.arguments for tc in fixed.additional_kwargs["tool_calls"]
+        ] == ["{}", "{}"]
+
+    def test_entries_of_collected_messages_are_dropped(self):
+        msg = ChatMessage(
+            role="assistant",
+            additional_kwargs={"tool_calls": [_tc(0, "{bad", name="t", id="a")]},
+        )
+        _sanitize_messages([msg])
+        assert len(_sanitize._sanitize_cache) == 1
+
+        del msg
+        gc.collect()
+        _sanitize_messages([])
+        assert len(_sanitize._sanitize_cache) == 0
+        assert _sanitize._sanitize_cache_chars == 0
+
+    def test_cache_is_bounded_by_characters(self, monkeypatch):
+        monkeypatch.setattr(_sanitize, "_SANITIZE_CACHE_MAX_CHARS", 250)
+        history = [
+            ChatMessage(
+                role="assistant",
+                additional_kwargs={
+                    "tool_calls": [_tc(0, "x" * 100, name="t", id=str(i))]
+                },
+            )
+            for i in range(5)
+        ]
+        _sanitize_messages(history)
+
+        cached = [entry.ref() for entry in _sanitize._sanitize_cache.values()]
+        assert cached == history[-2:]
+        assert _sanitize._sanitize_cache_chars <= 250
@@ -0,0 +1,156 @@
+"""Tests for the tool-output spill store and its use in call_tool."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from llama_index.core.agent.workflow import AgentWorkflow, ToolCall, ToolCallResult
+from llama_index.core.tools.types import ToolOutput
+
+from aria.llm import _spill
+from aria.llm._spill import SpillHandle, SpillStore, set_spill_store
+from aria.llm._state import StatefulAgentWorkflow, initial_workflow_state
+from aria.llm._tokens import TokenCounter, set_token_counter
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SpillStore(tmp_path / "spill", ttl_s=3600, max_bytes=1024 * 1024)
+    set_spill_store(store)
+    yield store
+    set_spill_store(None)
+
+
+class TestSpillStore:
+    def test_put_writes_content_addressed_file(self, store):
+        handle = store.put("line one\nline two")
+        assert handle.path.parent == store.root
+        assert handle.path.read_text() == "line one\nline two"
+        assert (handle.chars, handle.lines) == (17, 2)
+        assert store.put("line one\nline two") == handle
+        assert store.put("other") != handle
+        assert len(list(store.root.glob("*.txt"))) == 2
+
+    def test_long_lines_are_wrapped(self, store, monkeypatch):
+        monkeypatch.setattr(_spill, "_WRAP_CHARS", 10)
+        handle = store.put("x" * 25 + "\nshort")
+        assert handle.path.read_text().split("\n") == [
+            "x" * 10,
+            "x" * 10,
+            "x" * 5,
+            "short",
+        ]
+        assert (handle.chars, handle.lines) == (31, 4)
+
+    def test_prune_drops_expired_files(self, store):
+        old = store.put("old output")
+        new = store.put("new output")
+        stale = time.time() - store.ttl_s - 10
+        os.utime(old.path, (stale, stale))
+        store.prune()
+        assert not old.path.exists()
+        assert new.path.exists()
+
+    def test_prune_enforces_size_cap_oldest_first(self, store):
+        handles = [store.put(f"{i}" * 100) for i in range(5)]
+        for age, handle in enumerate(reversed(handles)):
+            mtime = time.time() - age * 10
+            os.utime(handle.path, (mtime, mtime))
+        store.max_bytes = 250
+        store.prune()
+        assert [h.path.exists() for h in handles] == [False] * 3 + [True] * 2
+
+    def test_disabled_by_zero_size_cap(self, monkeypatch):
+        set_spill_store(None)
+        monkeypatch.setenv("ARIA_SPILL_MAX_MB", "0")
+        assert _spill.spill("anything") is None
+
+
+class _Store:
+    def __init__(self):
+        self.data = {"state": initial_workflow_state("Aria")}
+
+    async def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    async def set(self, key, value):
+        self.data[key] = value
+
+
+class _Ctx:
+    def __init__(self):
+        self.store = _Store()
+
+
+async def _call_tool(monkeypatch, content: str):
+    async def parent_call_tool(self, ctx, ev):
+        return ToolCallResult(
+            tool_name=ev.tool_name,
+            tool_kwargs=ev.tool_kwargs,
+            tool_id=ev.tool_id,
+            tool_output=ToolOutput(
+                content=content,
+                tool_name=ev.tool_name,
+                raw_input=ev.tool_kwargs,
+                raw_output=content,
+            ),
+            return_direct=False,
+        )
+
+    monkeypatch.setattr(AgentWorkflow, "call_tool", parent_call_tool)
+    ctx = _Ctx()
+    ev = ToolCall(tool_name="web_fetch", tool_kwargs={"url": "x"}, tool_id="t1")
+    result = await StatefulAgentWorkflow.call_tool(
+        StatefulAgentWorkflow.__new__(StatefulAgentWorkflow), ctx, ev
+    )
+    return result, ctx.store.data["state"]
+
+
+class TestCallTool:
+    @pytest.fixture(autouse=True)
+    def small_thresholds(self, monkeypatch):
+        from aria.llm._compress import _reset_threshold_cache
+
+        monkeypatch.setenv("ARIA_COMPRESS_MIN_CHARS", "200")
+        monkeypatch.setenv("ARIA_COMPRESS_MAX_CHARS", "100000")
+        monkeypatch.setenv("ARIA_COMPRESS_HEAD_CHARS", "100")
+        monkeypatch.setenv("ARIA_COMPRESS_TAIL_CHARS", "50")
+        _reset_threshold_cache()
+        set_token_counter(TokenCounter())
+        yield
+        _reset_threshold_cache()
+        set_token_counter(None)
+
+    @pytest.mark.asyncio
+    async def test_compressed_output_is_spilled(self, store, monkeypatch):
+        content = "\n".join(f"row {i}" for i in range(1000))
+        result, state = await _call_tool(monkeypatch, content)
+
+        output = result.tool_output
+        handle = output.raw_output
+        assert isinstance(handle, SpillHandle)
+        assert handle.path.read_text() == content
+        assert str(handle.path) in output.content
+        assert "read_file" in output.content
+        (record,) = state["tool_calls"]
+        assert record["result"] == str(handle)
+        assert content not in record["result"]
+
+    @pytest.mark.asyncio
+    async def test_small_output_is_not_spilled(self, store, monkeypatch):
+        result, state = await _call_tool(monkeypatch, "short")
+        assert result.tool_output.raw_output == "short"
+        assert state["tool_calls"][0]["result"] == "short"
+        assert not store.root.exists()
+
+    @pytest.mark.asyncio
+    async def test_full_output_kept_when_spilling_disabled(self, monkeypatch):
+        set_spill_store(None)
+        monkeypatch.setenv("ARIA_SPILL_MAX_MB", "0")
+        content = "\n".join(f"row {i}" for i in range(1000))
+        result, state = await _call_tool(monkeypatch, content)
+        assert result.tool_output.raw_output == content
+        assert result.tool_output.content != content
+        assert state["tool_calls"][0]["result"] == content
@@ -0,0 +1,149 @@
+"""Tests for the token counting service."""
+
+from __future__ import annotations
+
+import pytest
+from llama_index.core.base.llms.types import ChatMessage, ToolCallBlock
+
+from aria.llm import _tokens
+from aria.llm._tokens import (
+    TokenCounter,
+    get_token_counter,
+    set_token_counter,
+)
+
+
+class _CountingEncoder:
+    """Whitespace 'tokenizer' that records what it was asked to encode."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> list[int]:
+        self.calls.append(text)
+        return [0] * len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    set_token_counter(None)
+    yield
+    set_token_counter(None)
+
+
+def test_heuristic_counter():
+    counter = TokenCounter()
+    assert not counter.exact
+    assert counter.count("x" * 41) == 10
+    assert counter.count("") == 0
+
+
+def test_counts_are_cached_per_text():
+    encode = _CountingEncoder()
+    counter = TokenCounter(encode, name="words")
+    assert counter.exact
+    text = "one two three"
+    assert counter.count(text) == 3
+    assert counter.count("one two " + "three") == 3
+    assert encode.calls == [text]
+
+
+def test_cache_is_bounded_by_total_chars(monkeypatch):
+    monkeypatch.setattr(_tokens, "_CACHE_MAX_CHARS", 10)
+    encode = _CountingEncoder()
+    counter = TokenCounter(encode)
+    counter.count("aaaa bbbb")
+    counter.count("cccc dddd")
+    counter.count("aaaa bbbb")
+    assert encode.calls == ["aaaa bbbb", "cccc dddd", "aaaa bbbb"]
+
+
+def test_estimate_samples_long_texts(monkeypatch):
+    monkeypatch.setattr(_tokens, "_SAMPLE_CHARS", 100)
+    encode = _CountingEncoder()
+    counter = TokenCounter(encode)
+    text = "word " * 1000
+    assert counter.estimate(text) == pytest.approx(1000, rel=0.05)
+    assert all(len(call) <= 100 for call in encode.calls)
+
+
+def test_tokenize_has_token_length():
+    counter = TokenCounter(_CountingEncoder())
+    assert len(counter.tokenize("a b c d")) == 4
+
+
+def test_count_message_includes_tool_calls():
+    counter = TokenCounter(_CountingEncoder())
+    text_only = ChatMessage(role="user", content="hello there")
+    assert counter.count_message(text_only) == _tokens._MESSAGE_OVERHEAD + 2
+
+    with_block = ChatMessage(
+        role="assistant",
+        blocks=[
+            ToolCallBlock(
+                tool_call_id="a", tool_name="write_file", tool_kwargs='{"a": "b c"}'
+            )
+        ],
+    )
+    assert counter.count_message(with_block) == _tokens._MESSAGE_OVERHEAD + 1 + 3
+
+    legacy = ChatMessage(
+        role="assistant",
+        additional_kwargs={
+            "tool_calls": [{"function": {"name": "read", "arguments": '{"p": "x y"}'}}]
+        },
+    )
+    # Name and arguments are counted as one string: 'read{"p":', '"x', 'y"}'.
+    assert counter.count_message(legacy) == _tokens._MESSAGE_OVERHEAD + 3
+
+    assert counter.count_messages([text_only, with_block, legacy]) == (
+        3 * _tokens._MESSAGE_OVERHEAD + 2 + 4 + 3
+    )
+
+
+def test_loads_tokenizer_json_from_model_path(tmp_path):
+    from tokenizers import Tokenizer
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+
+    tokenizer = Tokenizer(WordLevel({"[UNK]": 0, "hello": 1}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    tokenizer.save(str(model_dir / "tokenizer.json"))
+
+    counter = _tokens._load_model_counter(str(model_dir))
+    assert counter is not None and counter.exact
+    assert counter.count("hello brave new world") == 4
+
+
+def test_falls_back_when_model_is_not_on_disk(monkeypatch, tmp_path):
+    assert _tokens._load_model_counter(str(tmp_path / "missing")) is None
+    assert _tokens._load_model_counter("") is None
+
+    monkeypatch.setattr(_tokens, "_load_model_counter", lambda path: None)
+    counter = get_token_counter()
+    assert counter.exact
+    assert "cl100k" in counter.name
+    assert get_token_counter() is counter
+
+
+@pytest.mark.asyncio
+async def test_pressure_warning_uses_token_counts(monkeypatch):
+    from aria.config.api import Vllm as VllmConfig
+    from aria.llm._state import StatefulAgentWorkflow
+
+    monkeypatch.setattr(VllmConfig, "chat_context_size", 100, raising=False)
+    set_token_counter(TokenCounter(_CountingEncoder()))
+    messages = [ChatMessage(role="user", content="word " * 40)]
+
+    result = await StatefulAgentWorkflow._inject_pressure_warning(None, None, messages)
+    assert len(result) == 2
+    assert "44/100 tokens" in result[-1].content
+
+    set_token_counter(TokenCounter())  # 80 chars // 4 + overhead = 24 tokens
+    messages = [ChatMessage(role="user", content="w" * 80)]
+    assert (
+        await StatefulAgentWorkflow._inject_pressure_warning(None, None, messages)
+        == messages
+    )
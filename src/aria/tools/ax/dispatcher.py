@@ -2,6 +2,8 @@
 
 Replaces shell-based `ax <family> <command>` calls with direct function
 dispatch. Same structured JSON responses, zero subprocess overhead.
+Synchronous targets run on bounded per-family thread pools (see
+:mod:`aria.tools.ax.executors`) so they never block the event loop.
 """
 
 import inspect
@@ -13,6 +15,7 @@ from pydantic import BaseModel, Field
 
 from aria.tools import Reason, tool_response
 from aria.tools.ax.exceptions import AxDispatchError
+from aria.tools.ax.executors import run_sync
 from aria.tools.decorators import log_tool_call
 
 # ---------------------------------------------------------------------------
@@ -210,6 +213,7 @@ _DISPATCH: dict[str, dict[str, tuple[Callable, bool]]] = {
         "store": (_knowledge, True),
         "recall": (_knowledge, True),
         "search": (_knowledge, True),
+        "semantic_search": (_knowledge, True),
         "list": (_knowledge, True),
         "update": (_knowledge, True),
         "delete": (_knowledge, True),
@@ -418,12 +422,13 @@ async def ax(
     except (ValueError, TypeError):
         pass  # Built-in or C function — can't inspect, pass everything.
 
-    # Call the function (handle async targets like browser tools)
+    # Async targets (browser tools) run on the loop; blocking ones go to
+    # the family's executor so other sessions keep streaming.
     try:
         if inspect.iscoroutinefunction(fn):
             result = await fn(**kwargs)
         else:
-            result = fn(**kwargs)
+            result = await run_sync(family, fn, **kwargs)
     except TypeError as exc:
         # Likely wrong arguments — give helpful error
         logger.warning(f"ax dispatch: TypeError calling {family}.{command}: {exc}")
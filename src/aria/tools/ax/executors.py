@@ -0,0 +1,183 @@
+"""Bounded per-family executors for synchronous ax targets.
+
+Most ax targets (``http_request``, the yfinance and IMDb scrapers,
+``python``, ``process``) are plain blocking functions.  Calling them
+directly from the async dispatcher freezes the Chainlit event loop — and
+with it every connected session — until the call returns.
+
+Each family gets its own small thread pool instead, so a burst of slow
+IMDb scrapes cannot starve web searches.  Pool sizes default to
+``_DEFAULT_WORKERS`` and can be overridden per family with
+``ARIA_AX_<FAMILY>_WORKERS`` (e.g. ``ARIA_AX_IMDB_WORKERS=2``).
+
+Cancelling the awaiting task (e.g. the user stopping the workflow)
+drops the call if it is still queued.  A call that has already started
+cannot be interrupted; it runs to completion in its thread and its
+result is discarded.
+
+Per-family counters, including queue wait time, are exposed through
+:func:`get_executor_stats` and logged by :func:`shutdown_executors`, so
+the web app's shutdown log shows how saturated each pool was.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from loguru import logger
+
+from aria.config import get_optional_env
+
+_DEFAULT_WORKERS: dict[str, int] = {
+    "web": 8,
+    "http": 8,
+    "knowledge": 4,
+    "finance": 4,
+    "imdb": 4,
+    "dev": 2,
+    "processes": 4,
+    "check": 1,
+    "worker": 2,
+}
+_FALLBACK_WORKERS = 2
+
+# Queue waits above this are logged at INFO so saturation is visible.
+_SLOW_QUEUE_WAIT_S = 1.0
+
+
+@dataclass
+class FamilyStats:
+    """Counters for one family's executor."""
+
+    workers: int
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    running: int = 0
+    queue_wait_total_s: float = 0.0
+    queue_wait_max_s: float = 0.0
+    run_total_s: float = 0.0
+
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_stats: dict[str, FamilyStats] = {}
+_lock = threading.Lock()
+
+
+def family_workers(family: str) -> int:
+    """Return the configured pool size for ``family``."""
+    default = _DEFAULT_WORKERS.get(family, _FALLBACK_WORKERS)
+    value = get_optional_env(f"ARIA_AX_{family.upper()}_WORKERS", str(default))
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Invalid ARIA_AX_{family.upper()}_WORKERS={value!r}")
+        return default
+
+
+def _executor_for(family: str) -> tuple[ThreadPoolExecutor, FamilyStats]:
+    with _lock:
+        executor = _executors.get(family)
+        if executor is None:
+            workers = family_workers(family)
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"ax-{family}"
+            )
+            _executors[family] = executor
+            _stats.setdefault(family, FamilyStats(workers=workers))
+        return executor, _stats[family]
+
+
+async def run_sync(family: str, fn: Callable[..., Any], **kwargs: Any) -> Any:
+    """Run blocking ``fn(**kwargs)`` on ``family``'s pool and await the result.
+
+    The caller's context variables are propagated, as with
+    :func:`asyncio.to_thread`.
+
+    Raises:
+        Whatever ``fn`` raises, and :class:`asyncio.CancelledError` if the
+        awaiting task is cancelled.
+    """
+    executor, stats = _executor_for(family)
+    ctx = contextvars.copy_context()
+    submitted_at = time.perf_counter()
+
+    def call() -> Any:
+        started_at = time.perf_counter()
+        wait = started_at - submitted_at
+        with _lock:
+            stats.running += 1
+            stats.queue_wait_total_s += wait
+            stats.queue_wait_max_s = max(stats.queue_wait_max_s, wait)
+        if wait >= _SLOW_QUEUE_WAIT_S:
+            logger.info(f"ax {family}: call waited {wait:.2f}s for a free worker")
+        try:
+            return ctx.run(fn, **kwargs)
+        finally:
+            with _lock:
+                stats.running -= 1
+                stats.run_total_s += time.perf_counter() - started_at
+
+    def done(future: Future) -> None:
+        with _lock:
+            if future.cancelled():
+                stats.cancelled += 1
+            elif future.exception() is not None:
+                stats.failed += 1
+            else:
+                stats.completed += 1
+
+    with _lock:
+        stats.submitted += 1
+    future = executor.submit(call)
+    future.add_done_callback(done)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # wrap_future already cancelled the pool future; that only takes
+        # effect if the call had not started yet.
+        if future.running():
+            logger.debug(f"ax {family}: cancelled call keeps running in its thread")
+        raise
+
+
+def get_executor_stats() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of per-family executor counters."""
+    with _lock:
+        snapshot = {family: asdict(stats) for family, stats in _stats.items()}
+    for stats in snapshot.values():
+        started = stats["completed"] + stats["failed"] + stats["running"]
+        stats["queue_wait_avg_s"] = (
+            stats["queue_wait_total_s"] / started if started else 0.0
+        )
+    return snapshot
+
+
+def shutdown_executors() -> None:
+    """Stop all family pools, dropping queued calls.
+
+    Pools are recreated on the next dispatch.  Counters are logged, then
+    reset.
+    """
+    for family, stats in get_executor_stats().items():
+        logger.info(
+            f"ax {family}: {stats['submitted']} calls "
+            f"({stats['completed']} ok, {stats['failed']} failed, "
+            f"{stats['cancelled']} cancelled) on {stats['workers']} workers; "
+            f"queue wait avg {stats['queue_wait_avg_s']:.3f}s, "
+            f"max {stats['queue_wait_max_s']:.3f}s"
+        )
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+        _stats.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -65,6 +65,7 @@ class TestDispatchTable:
             "store",
             "recall",
             "search",
+            "semantic_search",
             "list",
             "update",
             "delete",
@@ -0,0 +1,170 @@
+"""Tests for the per-family ax executors."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from aria.tools.ax import executors
+from aria.tools.ax.dispatcher import ax
+from aria.tools.ax.executors import (
+    family_workers,
+    get_executor_stats,
+    run_sync,
+    shutdown_executors,
+)
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors():
+    shutdown_executors()
+    yield
+    shutdown_executors()
+
+
+def test_family_workers_env_override(monkeypatch):
+    assert family_workers("imdb") == executors._DEFAULT_WORKERS["imdb"]
+    assert family_workers("unknown") == executors._FALLBACK_WORKERS
+    monkeypatch.setenv("ARIA_AX_IMDB_WORKERS", "1")
+    assert family_workers("imdb") == 1
+    monkeypatch.setenv("ARIA_AX_IMDB_WORKERS", "lots")
+    assert family_workers("imdb") == executors._DEFAULT_WORKERS["imdb"]
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_does_not_block_loop():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    result = await run_sync("web", lambda reason: time.sleep(0.2) or reason, reason="x")
+    task.cancel()
+    assert result == "x"
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_pool_size_bounds_concurrency(monkeypatch):
+    monkeypatch.setenv("ARIA_AX_IMDB_WORKERS", "2")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def scrape(reason):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return reason
+
+    results = await asyncio.gather(
+        *(run_sync("imdb", scrape, reason=str(i)) for i in range(6))
+    )
+    assert results == [str(i) for i in range(6)]
+    assert peak == 2
+
+    stats = get_executor_stats()["imdb"]
+    assert stats["workers"] == 2
+    assert stats["submitted"] == stats["completed"] == 6
+    assert stats["queue_wait_max_s"] > 0.04
+    assert stats["queue_wait_avg_s"] > 0
+
+
+@pytest.mark.asyncio
+async def test_families_do_not_share_a_pool(monkeypatch):
+    monkeypatch.setenv("ARIA_AX_IMDB_WORKERS", "1")
+    release = threading.Event()
+
+    def stuck(reason):
+        release.wait(5)
+        return reason
+
+    blocked = asyncio.create_task(run_sync("imdb", stuck, reason="slow"))
+    await asyncio.sleep(0.02)
+    assert await run_sync("web", lambda reason: reason, reason="fast") == "fast"
+    release.set()
+    assert await blocked == "slow"
+
+
+@pytest.mark.asyncio
+async def test_cancelling_drops_queued_call(monkeypatch):
+    monkeypatch.setenv("ARIA_AX_FINANCE_WORKERS", "1")
+    release = threading.Event()
+    calls = []
+
+    def work(reason):
+        calls.append(reason)
+        release.wait(5)
+        return reason
+
+    running = asyncio.create_task(run_sync("finance", work, reason="first"))
+    await asyncio.sleep(0.02)
+    queued = asyncio.create_task(run_sync("finance", work, reason="second"))
+    await asyncio.sleep(0.02)
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    assert await running == "first"
+    assert calls == ["first"]
+    assert get_executor_stats()["finance"]["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_and_are_counted():
+    def boom(reason):
+        raise ValueError("nope")
+
+    with pytest.raises(ValueError, match="nope"):
+        await run_sync("http", boom, reason="x")
+    assert get_executor_stats()["http"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_context_variables_are_propagated():
+    _request_id.set("abc")
+    assert await run_sync("dev", lambda reason: _request_id.get(), reason="x") == "abc"
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_runs_sync_targets_off_loop():
+    loop_thread = threading.get_ident()
+    seen = {}
+
+    def fake_search(reason, query):
+        seen["thread"] = threading.get_ident()
+        return '{"tool":"web_search","data":{"results":[]}}'
+
+    with patch("aria.tools.search.web_search.web_search", fake_search):
+        await ax(reason="r", family="web", command="search", args={"query": "q"})
+    assert seen["thread"] != loop_thread
+    assert get_executor_stats()["web"]["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_logs_stats():
+    from loguru import logger
+
+    await run_sync("http", lambda: None)
+    messages: list[str] = []
+    sink = logger.add(messages.append, level="INFO", format="{message}")
+    try:
+        shutdown_executors()
+    finally:
+        logger.remove(sink)
+
+    assert any(m.startswith("ax http: 1 calls (1 ok") for m in messages)
+    assert get_executor_stats() == {}
@@ -0,0 +1,179 @@
+"""Rendered-content cache for browser navigations.
+
+Rendering a page in Lightpanda costs seconds of JavaScript execution,
+and agents often open a page and read it again in a following call.
+:class:`ContentCache` remembers the captures written by
+``LightpandaManager._persist_content`` and serves them back, keyed by
+browser session, normalized URL and content mode.
+
+The capture files are the backing store: the cache only keeps their
+paths and metadata in memory.  Entries expire after ``ttl`` seconds and
+the least recently used ones are dropped once the captures they point
+at exceed ``max_bytes``.  Dropped captures stay on disk, since earlier
+tool results reference them.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from loguru import logger
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Return *url* in a canonical form for cache keys.
+
+    Lowercases the scheme and host, drops default ports and the
+    fragment, and gives an empty path a ``/``.  Query strings are kept
+    as-is since their order may matter to the site.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        host = f"{userinfo}@{host}"
+    path = parts.path or ("/" if parts.netloc else "")
+    return urlunsplit((scheme, host, path, parts.query, ""))
+
+
+@dataclass(frozen=True)
+class CachedContent:
+    """One persisted capture of a rendered page."""
+
+    url: str
+    """Final page URL (after redirects)."""
+    title: str
+    path: Path
+    size: int
+    expires: float
+    navigated: bool = True
+    """Captured right after navigating to the URL, not after a click."""
+
+
+class ContentCache:
+    """In-memory index of persisted page captures with TTL and size cap.
+
+    Args:
+        ttl: Seconds a capture is served for; ``0`` disables the cache.
+        max_bytes: Total size of the captures the index may point at.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, str], CachedContent] = OrderedDict()
+        # Requested URL -> final URL, per session, for redirected pages.
+        self._aliases: dict[tuple[str, str], str] = {}
+        self._bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    def get(
+        self, session: str, url: str, mode: str
+    ) -> tuple[CachedContent, str] | None:
+        """Return the fresh capture of *url* and its text, if any."""
+        if not self.enabled:
+            return None
+        normalized = normalize_url(url)
+        normalized = self._aliases.get((session, normalized), normalized)
+        key = (session, normalized, mode)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if time.monotonic() >= entry.expires:
+            self._drop(key)
+            self.stats["misses"] += 1
+            return None
+        try:
+            content = entry.path.read_text(encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"browser cache: capture {entry.path} unreadable: {e}")
+            self._drop(key)
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry, content
+
+    def put(
+        self,
+        session: str,
+        url: str,
+        mode: str,
+        *,
+        final_url: str,
+        title: str,
+        path: Path,
+        size: int,
+        navigated: bool = True,
+    ) -> None:
+        """Index the capture at *path* of *url* rendered in *mode*.
+
+        Pass ``navigated=False`` for captures of a page changed in place
+        (e.g. by a click), which must not stand in for loading *url*.
+        """
+        if not self.enabled or size > self.max_bytes:
+            return
+        final = normalize_url(final_url)
+        requested = normalize_url(url)
+        if requested != final:
+            self._aliases[(session, requested)] = final
+        key = (session, final, mode)
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = CachedContent(
+            url=final_url,
+            title=title,
+            path=path,
+            size=size,
+            expires=time.monotonic() + self.ttl,
+            navigated=navigated,
+        )
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.stats["evicted"] += 1
+
+    def invalidate(self, session: str, url: str) -> None:
+        """Forget every capture of *url* (all modes) for *session*."""
+        normalized = normalize_url(url)
+        normalized = self._aliases.get((session, normalized), normalized)
+        for key in [k for k in self._entries if k[:2] == (session, normalized)]:
+            self._drop(key)
+
+    def clear(self) -> None:
+        """Forget every capture."""
+        self._entries.clear()
+        self._aliases.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        session, url, _ = key
+        if not any(k[:2] == (session, url) for k in self._entries):
+            for alias in [a for a, t in self._aliases.items() if t == url]:
+                if alias[0] == session:
+                    del self._aliases[alias]
@@ -11,6 +11,14 @@ from aria.config.folders import Workspace
 # Long enough for slow pages but not so long that failures waste time
 BROWSER_COMMAND_TIMEOUT = 30
 
+# How long a browser call waits for a free page from the pool (seconds)
+BROWSER_QUEUE_TIMEOUT = 60
+
+# Rendered-content cache: how long a capture is reused (seconds) and the
+# total size of the captures it may serve
+BROWSER_CACHE_TTL = 300
+BROWSER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # Default wait strategy after navigation
 # "domcontentloaded" is reliable; "networkidle" fails on most modern sites
 # because analytics, CDNs, and trackers keep connections open.
@@ -86,7 +86,10 @@ async def open_url(reason: Reason, url: str, content_mode: str = "text") -> str:
     """Open a URL in the headless browser and capture rendered content.
 
     Use this for JavaScript-heavy pages, consent flows, or sites that need
-    real browser rendering. Do not use it for plain API calls.
+    real browser rendering. Do not use it for plain API calls. Opening the
+    page you are already on returns its saved capture (``cached: true``)
+    without rendering it again; after a ``browser_click`` it reloads the
+    page instead.
 
     Args:
         reason: Required. Brief explanation of why you are opening this URL.
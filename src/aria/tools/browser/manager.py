@@ -5,6 +5,31 @@ The LightpandaManager follows the same pattern as LlamaCppServerManager:
 - Stopped during on_app_shutdown()
 - Agents use browser tools without worrying about lifecycle
 
+Browser calls are served from a bounded pool of pages so one slow site
+does not hold up every other chat:
+
+- Each pool slot is its own CDP connection with one browser context and
+  one page.  Slots are spread over ``processes`` Lightpanda instances
+  (consecutive ports from ``port``) and opened on first use.
+- Each call checks a slot out for its duration.  A slot stays bound to
+  the chat thread (browser session) that last used it, so
+  ``browser_click`` acts on the page that thread opened, and its cookies
+  are never seen by another thread: rebinding a slot to a new session
+  replaces its context.  Calls of one session run one at a time.
+- A slot is health-checked on checkout and rebuilt (restarting its
+  Lightpanda process if that died) when broken; its page is replaced
+  after ``recycle_after`` navigations.
+- Time spent waiting for a free slot is tracked in :meth:`pool_stats`.
+
+Rendered content is cached per session (see :mod:`.cache`): opening the
+URL a session's page already shows, or reading that page again, is
+answered from the persisted capture without navigating or re-rendering.
+Captures taken after a click only answer reads: opening the URL again
+reloads the page, so the agent can always reset it.
+
+The session comes from :func:`set_browser_session`, which the chat
+pipeline calls with the thread id before running the agent.
+
 Example:
     ```python
     from aria.tools.browser.manager import (
@@ -13,7 +38,7 @@ Example:
     )
 
     # During app startup
-    manager = LightpandaManager(binary_path, port=9222)
+    manager = LightpandaManager(binary_path, port=9222, pool_size=4)
     if await manager.start():
         set_browser_manager(manager)
 
@@ -26,18 +51,31 @@ Example:
 import asyncio
 import hashlib
 import subprocess
+import time
 from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from loguru import logger
-from playwright.async_api import Browser, Page, Playwright, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
 
 from aria.tools import tool_error_response, tool_success_response
+from aria.tools.browser.cache import CachedContent, ContentCache, normalize_url
 from aria.tools.browser.constants import (
+    BROWSER_CACHE_MAX_BYTES,
+    BROWSER_CACHE_TTL,
     BROWSER_COMMAND_TIMEOUT,
     BROWSER_CONTENT_DIR,
+    BROWSER_QUEUE_TIMEOUT,
     DEFAULT_WAIT_STRATEGY,
     LIGHTPANDA_DEFAULT_PORT,
 )
@@ -45,6 +83,9 @@ from aria.tools.browser.constants import (
 # Module-level singleton — set during app startup
 _manager: Optional["LightpandaManager"] = None
 
+_DEFAULT_SESSION = "default"
+_session: ContextVar[str] = ContextVar("aria_browser_session", default=_DEFAULT_SESSION)
+
 
 def _build_content_filepath(url: str, action: str) -> Path:
     """Build a stable, timestamped path for persisted page content."""
@@ -71,6 +112,114 @@ def set_browser_manager(manager: Optional["LightpandaManager"]) -> None:
     _manager = manager
 
 
+def set_browser_session(session: str | None) -> None:
+    """Bind browser calls made from the current context to *session*.
+
+    Pages and cookies are kept per session (a chat thread id); tasks
+    started afterwards from this context inherit the binding.
+    """
+    _session.set(session or _DEFAULT_SESSION)
+
+
+class _LightpandaProcess:
+    """One ``lightpanda serve`` instance and its CDP endpoint."""
+
+    def __init__(self, binary_path: Path, port: int):
+        self.binary = binary_path
+        self.port = port
+        self.process: subprocess.Popen | None = None
+        self.restart_lock = asyncio.Lock()
+
+    @property
+    def cdp_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    async def start(self) -> bool:
+        cmd = [
+            str(self.binary),
+            "serve",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(self.port),
+        ]
+        logger.debug(f"Starting Lightpanda: {' '.join(cmd)}")
+        self.process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if await self._wait_for_cdp():
+            return True
+        logger.error(f"Lightpanda CDP endpoint on port {self.port} did not start")
+        self.stop()
+        return False
+
+    def stop(self) -> None:
+        """Terminate the Lightpanda subprocess."""
+        if self.process:
+            try:
+                self.process.terminate()
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            except Exception as e:
+                logger.warning(f"Error terminating Lightpanda: {e}")
+            finally:
+                self.process = None
+
+    async def _wait_for_cdp(self, timeout: float = 15.0) -> bool:
+        """Wait for the CDP endpoint to be ready.
+
+        Polls the ``/json/version`` HTTP endpoint rather than just
+        checking that the TCP port is open.  This avoids a race where
+        the port is bound but the HTTP handler is not yet serving.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if CDP is ready, False if timeout.
+        """
+        import urllib.request
+
+        url = f"{self.cdp_url}/json/version"
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        while loop.time() - start_time < timeout:
+            try:
+                await loop.run_in_executor(
+                    None, lambda: urllib.request.urlopen(url, timeout=2)
+                )
+                logger.debug("CDP endpoint is ready")
+                return True
+            except Exception:
+                pass
+            await asyncio.sleep(0.3)
+
+        return False
+
+
+@dataclass(eq=False)
+class _Slot:
+    """One pooled CDP connection, its browser context and its page."""
+
+    process: _LightpandaProcess
+    browser: Browser | None = None
+    context: BrowserContext | None = None
+    page: Page | None = None
+    # Browser session (chat thread) whose cookies the context holds.
+    session: str | None = None
+    navigations: int = 0
+    busy: bool = False
+    last_used: float = 0.0
+
+
 class LightpandaManager:
     """Manages Lightpanda browser lifecycle via CDP + Playwright.
 
@@ -78,33 +227,66 @@ class LightpandaManager:
     Agents use browser tools without worrying about lifecycle.
 
     The manager starts Lightpanda in serve mode, which creates a CDP
-    endpoint that Playwright connects to for browser automation.
+    endpoint that Playwright connects to for browser automation, and
+    serves calls from a pool of pages (see the module docstring).
 
     Attributes:
         _binary: Path to the Lightpanda binary.
-        _port: CDP port for Lightpanda serve.
-        _process: Subprocess running Lightpanda serve.
+        _port: CDP port of the first Lightpanda process.
+        _processes: Running Lightpanda processes.
         _playwright: Playwright instance.
-        _browser: Connected Browser instance.
-        _page: Current Page instance.
+        _slots: Pool slots opened so far (at most ``_pool_size``).
+        _content_cache: Persisted captures reusable per session.
     """
 
-    def __init__(self, binary_path: Path, port: int = LIGHTPANDA_DEFAULT_PORT):
+    def __init__(
+        self,
+        binary_path: Path,
+        port: int = LIGHTPANDA_DEFAULT_PORT,
+        *,
+        pool_size: int = 4,
+        processes: int = 1,
+        recycle_after: int = 50,
+        queue_timeout: float = BROWSER_QUEUE_TIMEOUT,
+        cache_ttl: float = BROWSER_CACHE_TTL,
+        cache_max_bytes: int = BROWSER_CACHE_MAX_BYTES,
+    ):
         """Initialize the Lightpanda manager.
 
         Args:
             binary_path: Path to the Lightpanda binary.
             port: CDP port for Lightpanda serve (default: 9222).
+            pool_size: Maximum concurrent pages.
+            processes: Lightpanda processes to spread the pages over,
+                on ports ``port``, ``port + 1``, ...
+            recycle_after: Navigations before a page is replaced
+                (0 never replaces it).
+            queue_timeout: Seconds a call waits for a free page.
+            cache_ttl: Seconds rendered content is reused (0 disables).
+            cache_max_bytes: Size cap of the reusable captures.
         """
         self._binary = binary_path
         self._port = port
-        self._process: subprocess.Popen | None = None
+        self._pool_size = max(1, pool_size)
+        self._recycle_after = recycle_after
+        self._queue_timeout = queue_timeout
+        self._processes = [
+            _LightpandaProcess(binary_path, port + i)
+            for i in range(max(1, min(processes, self._pool_size)))
+        ]
         self._playwright: Playwright | None = None
-        self._browser: Browser | None = None
-        self._page: Page | None = None
-        # Serialise all page operations — Lightpanda serves a single page
-        # and concurrent navigations destroy each other's execution context.
-        self._page_lock = asyncio.Lock()
+        self._slots: list[_Slot] = []
+        self._pool_changed = asyncio.Condition()
+        self._content_cache = ContentCache(cache_ttl, cache_max_bytes)
+        self._stats = {
+            "checkouts": 0,
+            "waited": 0,
+            "wait_total_s": 0.0,
+            "wait_max_s": 0.0,
+            "timeouts": 0,
+            "recycled": 0,
+            "rebuilt": 0,
+        }
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -113,44 +295,28 @@ class LightpandaManager:
     async def start(self) -> bool:
         """Start Lightpanda serve and connect Playwright via CDP.
 
-        This starts the Lightpanda process in serve mode, waits for
-        the CDP endpoint to be ready, then connects Playwright.
+        This starts the Lightpanda processes, waits for their CDP
+        endpoints to be ready, then connects Playwright and opens the
+        first page of the pool.
 
         Returns:
             True if started successfully, False otherwise.
         """
         try:
-            cmd = [
-                str(self._binary),
-                "serve",
-                "--host",
-                "127.0.0.1",
-                "--port",
-                str(self._port),
-            ]
-            logger.debug(f"Starting Lightpanda: {' '.join(cmd)}")
-
-            self._process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-
-            if not await self._wait_for_cdp():
-                logger.error("Lightpanda CDP endpoint did not become ready")
-                self._cleanup_process()
-                return False
+            for process in self._processes:
+                if not await process.start():
+                    await self.stop()
+                    return False
 
             self._playwright = await async_playwright().start()
-            cdp_url = f"http://127.0.0.1:{self._port}"
-            self._browser = await self._playwright.chromium.connect_over_cdp(cdp_url)
-
-            # Lightpanda workaround: ignore SSL errors
-            context = await self._browser.new_context(ignore_https_errors=True)
-            self._page = await context.new_page()
+            slot = _Slot(process=self._processes[0])
+            await self._connect(slot)
+            self._slots.append(slot)
 
-            logger.info(f"Lightpanda browser started on port {self._port}")
+            logger.info(
+                f"Lightpanda browser started on port {self._port} "
+                f"(pool of {self._pool_size}, {len(self._processes)} process(es))"
+            )
             return True
 
         except Exception as e:
@@ -159,17 +325,13 @@ class LightpandaManager:
             return False
 
     async def stop(self) -> None:
-        """Close Playwright, terminate Lightpanda process.
+        """Close Playwright, terminate the Lightpanda processes.
 
         Called from on_app_shutdown().
         """
-        if self._browser:
-            try:
-                await self._browser.close()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
-            finally:
-                self._browser = None
+        for slot in self._slots:
+            await self._disconnect(slot)
+        self._slots = []
 
         if self._playwright:
             try:
@@ -179,94 +341,201 @@ class LightpandaManager:
             finally:
                 self._playwright = None
 
-        self._cleanup_process()
-        self._page = None
+        for process in self._processes:
+            process.stop()
         logger.info("Lightpanda browser stopped")
 
-    def _cleanup_process(self) -> None:
-        """Terminate the Lightpanda subprocess."""
-        if self._process:
-            try:
-                self._process.terminate()
-                self._process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
-                self._process.wait()
-            except Exception as e:
-                logger.warning(f"Error terminating Lightpanda: {e}")
-            finally:
-                self._process = None
-
-    async def _wait_for_cdp(self, timeout: float = 15.0) -> bool:
-        """Wait for the CDP endpoint to be ready.
-
-        Polls the ``/json/version`` HTTP endpoint rather than just
-        checking that the TCP port is open.  This avoids a race where
-        the port is bound but the HTTP handler is not yet serving.
-
-        Args:
-            timeout: Maximum time to wait in seconds.
-
-        Returns:
-            True if CDP is ready, False if timeout.
-        """
-        import urllib.request
-
-        url = f"http://127.0.0.1:{self._port}/json/version"
-        loop = asyncio.get_running_loop()
-        start_time = loop.time()
-        while loop.time() - start_time < timeout:
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: urllib.request.urlopen(url, timeout=2)
-                )
-                logger.debug("CDP endpoint is ready")
-                return True
-            except Exception:
-                pass
-            await asyncio.sleep(0.3)
-
-        return False
-
     # ------------------------------------------------------------------
-    # Page state helpers
+    # Pool
     # ------------------------------------------------------------------
 
     @property
     def is_running(self) -> bool:
         """Check if the browser is running."""
-        return (
-            self._process is not None
-            and self._browser is not None
-            and self._page is not None
+        return self._playwright is not None and any(
+            process.alive for process in self._processes
         )
 
-    async def _ensure_page(self) -> bool:
-        """Ensure a valid page exists, restarting browser if needed.
-
-        Returns:
-            True if a valid page is available, False otherwise.
-        """
-        if self._is_page_valid():
-            return True
-
-        logger.warning("Browser page invalid, attempting to restart...")
-        await self.stop()
+    def pool_stats(self) -> dict[str, Any]:
+        """Return pool occupancy, checkout queue-wait and cache counters."""
+        return {
+            "size": self._pool_size,
+            "open": len(self._slots),
+            "in_use": sum(slot.busy for slot in self._slots),
+            "sessions": len({s.session for s in self._slots if s.session}),
+            **self._stats,
+            "content_cache": {
+                "entries": len(self._content_cache),
+                **self._content_cache.stats,
+            },
+        }
 
-        if await self.start():
-            logger.info("Browser restarted successfully")
-            return True
+    async def _connect(self, slot: _Slot) -> None:
+        """Open the slot's CDP connection, context and page."""
+        assert self._playwright is not None
+        slot.browser = await self._playwright.chromium.connect_over_cdp(
+            slot.process.cdp_url
+        )
+        await self._new_context(slot)
 
-        logger.error("Failed to restart browser")
-        return False
+    async def _new_context(self, slot: _Slot) -> None:
+        """Give the slot a fresh context (no cookies) and page."""
+        if slot.context is not None:
+            try:
+                await slot.context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {e}")
+        assert slot.browser is not None
+        # Lightpanda workaround: ignore SSL errors
+        slot.context = await slot.browser.new_context(ignore_https_errors=True)
+        slot.page = await slot.context.new_page()
+        slot.session = None
+        slot.navigations = 0
+
+    async def _new_page(self, slot: _Slot) -> None:
+        """Replace the slot's page, keeping its context and cookies."""
+        if slot.page is not None:
+            try:
+                await slot.page.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser page: {e}")
+        assert slot.context is not None
+        slot.page = await slot.context.new_page()
+        slot.navigations = 0
+        self._stats["recycled"] += 1
+
+    async def _disconnect(self, slot: _Slot) -> None:
+        if slot.browser is not None:
+            try:
+                await slot.browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+        slot.browser = slot.context = slot.page = None
+        slot.session = None
 
-    def _is_page_valid(self) -> bool:
-        """Check if the page is still valid and not closed."""
+    def _is_slot_healthy(self, slot: _Slot) -> bool:
+        """Check that the slot's process, connection and page are usable."""
         try:
-            return self._page is not None and not self._page.is_closed()
+            return (
+                slot.process.alive
+                and slot.browser is not None
+                and slot.browser.is_connected()
+                and slot.page is not None
+                and not slot.page.is_closed()
+            )
         except Exception:
             return False
 
+    async def _rebuild(self, slot: _Slot) -> None:
+        """Reconnect a broken slot, restarting its process if it died."""
+        logger.warning("Browser page invalid, rebuilding it...")
+        self._stats["rebuilt"] += 1
+        await self._disconnect(slot)
+        process = slot.process
+        async with process.restart_lock:
+            if not process.alive:
+                process.stop()
+                if not await process.start():
+                    raise RuntimeError("Failed to restart browser")
+        await self._connect(slot)
+
+    def _pick(self, session: str) -> _Slot | None:
+        """Choose the slot for *session*; ``None`` means wait."""
+        own = next((s for s in self._slots if s.session == session), None)
+        if own is not None:
+            # One call per session at a time: they share the page.
+            return None if own.busy else own
+        idle = [s for s in self._slots if not s.busy]
+        unbound = [s for s in idle if s.session is None]
+        if unbound:
+            return unbound[0]
+        if len(self._slots) < self._pool_size:
+            process = self._processes[len(self._slots) % len(self._processes)]
+            slot = _Slot(process=process)
+            self._slots.append(slot)
+            return slot
+        if idle:
+            # Evict the least recently used session.
+            return min(idle, key=lambda s: s.last_used)
+        return None
+
+    async def _checkout(self, session: str) -> _Slot:
+        """Take a slot for *session*, waiting while none is free.
+
+        Raises:
+            TimeoutError: No slot freed up within the queue timeout.
+        """
+        start = time.monotonic()
+        async with self._pool_changed:
+            while (slot := self._pick(session)) is None:
+                remaining = self._queue_timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise TimeoutError(
+                        f"No browser page free after {self._queue_timeout:.0f}s"
+                    )
+                try:
+                    await asyncio.wait_for(self._pool_changed.wait(), remaining)
+                except TimeoutError:
+                    pass
+            slot.busy = True
+
+        waited = time.monotonic() - start
+        self._stats["checkouts"] += 1
+        self._stats["wait_total_s"] += waited
+        if waited > 0.001:
+            self._stats["waited"] += 1
+            self._stats["wait_max_s"] = max(self._stats["wait_max_s"], waited)
+            logger.debug(f"Browser call waited {waited * 1000:.0f} ms for a page")
+        return slot
+
+    async def _release(self, slot: _Slot) -> None:
+        async with self._pool_changed:
+            slot.busy = False
+            slot.last_used = time.monotonic()
+            self._pool_changed.notify_all()
+
+    async def _prepare(self, slot: _Slot, session: str) -> None:
+        """Make *slot* healthy and bound to *session*."""
+        if slot.browser is None:
+            await self._connect(slot)
+        elif not self._is_slot_healthy(slot):
+            await self._rebuild(slot)
+        if slot.session != session:
+            if slot.session is not None:
+                # Another thread's cookies must not leak into this one.
+                await self._new_context(slot)
+            slot.session = session
+        elif self._recycle_after and slot.navigations >= self._recycle_after:
+            await self._new_page(slot)
+
+    def _current_url(self, session: str) -> str | None:
+        """URL the session's page shows, unless a call is using it."""
+        slot = next((s for s in self._slots if s.session == session), None)
+        if slot is None or slot.busy or not self._is_slot_healthy(slot):
+            return None
+        return slot.page.url  # type: ignore[union-attr]
+
+    def _cached(
+        self, session: str, url: str, mode: str, *, navigating: bool = False
+    ) -> tuple[CachedContent, str] | None:
+        """Cached capture of *url*, if the session's page still shows it.
+
+        Serving a page the session's tab has moved away from would leave
+        ``browser_click`` acting on a different page than the agent saw.
+        When *navigating*, captures of a page changed by a click are
+        ignored, so opening its URL reloads it.
+        """
+        current = self._current_url(session)
+        if current is None or not self._content_cache.enabled:
+            return None
+        hit = self._content_cache.get(session, url, mode)
+        if hit is None or normalize_url(hit[0].url) != normalize_url(current):
+            return None
+        if navigating and not hit[0].navigated:
+            return None
+        return hit
+
     # ------------------------------------------------------------------
     # Response helpers
     # ------------------------------------------------------------------
@@ -307,11 +576,12 @@ class LightpandaManager:
         path.write_text(content, encoding="utf-8")
         return path
 
-    async def _safe_title(self) -> str:
+    @staticmethod
+    async def _safe_title(page: Page) -> str:
         """Get page title with fallback to 'Unknown'."""
         try:
-            if self._is_page_valid():
-                return await self._page.title()  # type: ignore[union-attr]
+            if not page.is_closed():
+                return await page.title()
         except Exception:
             pass
         return "Unknown"
@@ -325,6 +595,7 @@ class LightpandaManager:
         *,
         tool: str = "",
         reason: str = "",
+        cached: bool = False,
     ) -> str:
         """Build the standard content JSON response.
 
@@ -335,23 +606,23 @@ class LightpandaManager:
             content_path: Path where content was persisted.
             tool: Tool name for the response envelope.
             reason: Agent reason for the response envelope.
+            cached: Content was served from the content cache.
 
         Returns:
             JSON string with page metadata.
         """
-        return self._success(
-            {
-                "url": url,
-                "title": title,
-                "content_file": str(content_path),
-                "content_preview": (
-                    content[:500] + "..." if len(content) > 500 else content
-                ),
-                "content_size": len(content),
-            },
-            tool=tool,
-            reason=reason,
-        )
+        data = {
+            "url": url,
+            "title": title,
+            "content_file": str(content_path),
+            "content_preview": (
+                content[:500] + "..." if len(content) > 500 else content
+            ),
+            "content_size": len(content),
+        }
+        if cached:
+            data["cached"] = True
+        return self._success(data, tool=tool, reason=reason)
 
     # ------------------------------------------------------------------
     # Recovery wrapper
@@ -364,40 +635,62 @@ class LightpandaManager:
         *,
         tool: str = "",
         reason: str = "",
+        navigates: bool = False,
     ) -> str:
-        """Run *fn* with page validation, serialisation, and crash recovery.
+        """Run *fn* on the current session's page with crash recovery.
 
-        All page operations are serialised through ``_page_lock`` because
-        Lightpanda serves a single page — concurrent navigations destroy
-        each other's execution context.
-
-        Ensures a valid page before calling *fn(page)*. If *fn* raises
-        and the page has crashed, the browser is restarted and a
-        recovery error is returned so the caller can retry.
+        Checks a slot out of the pool for the duration of the call (see
+        :meth:`_checkout`) and makes sure it is healthy before calling
+        *fn(page)*.  If *fn* raises and the slot has crashed, the slot
+        is rebuilt and a recovery error is returned so the caller can
+        retry.
 
         Args:
             action_name: Human-readable label for log messages.
-            fn: Async callable that receives the current Page and
+            fn: Async callable that receives the session's Page and
                 returns a JSON string result.
             tool: Tool name for the response envelope.
             reason: Agent reason for the response envelope.
+            navigates: Count the call towards the page's recycling.
 
         Returns:
             JSON string — either the result of *fn* or an error.
         """
-        async with self._page_lock:
-            if not await self._ensure_page():
+        session = _session.get()
+        try:
+            slot = await self._checkout(session)
+        except TimeoutError as e:
+            return self._error(
+                f"Browser busy: {e}. Retry, or use the download tool.",
+                tool=tool,
+                reason=reason,
+            )
+
+        try:
+            try:
+                await self._prepare(slot, session)
+            except Exception as e:
+                logger.error(f"Browser not available: {e}")
+                await self._disconnect(slot)
                 return self._error("Browser not available", tool=tool, reason=reason)
 
+            if navigates:
+                slot.navigations += 1
             try:
-                return await fn(self._page)  # type: ignore[arg-type]
+                return await fn(slot.page)  # type: ignore[arg-type]
             except Exception as e:
                 logger.error(f"{action_name} error: {e}")
-                if not self._is_page_valid():
+                if not self._is_slot_healthy(slot):
                     logger.warning(
                         f"Browser crashed during {action_name}, attempting restart..."
                     )
-                    if await self._ensure_page():
+                    try:
+                        await self._rebuild(slot)
+                        slot.session = session
+                    except Exception as restart_error:
+                        logger.error(f"Failed to restart browser: {restart_error}")
+                        await self._disconnect(slot)
+                    else:
                         return self._error(
                             str(e), recovery=True, tool=tool, reason=reason
                         )
@@ -406,6 +699,8 @@ class LightpandaManager:
                     tool=tool,
                     reason=reason,
                 )
+        finally:
+            await self._release(slot)
 
     # ------------------------------------------------------------------
     # Browser actions
@@ -421,6 +716,10 @@ class LightpandaManager:
     ) -> str:
         """Navigate to URL and return rendered content.
 
+        When the session's page already shows *url* and its capture in
+        *content_mode* is cached, that capture is returned instead.  A
+        page changed in place by ``click`` is always reloaded.
+
         Args:
             url: URL to navigate to.
             tool: Tool name for the response envelope.
@@ -429,6 +728,19 @@ class LightpandaManager:
         Returns:
             JSON string with page content and metadata.
         """
+        session = _session.get()
+        if hit := self._cached(session, url, content_mode, navigating=True):
+            entry, content = hit
+            logger.debug(f"Browser content cache hit for {url}")
+            return self._content_response(
+                content,
+                entry.url,
+                entry.title,
+                entry.path,
+                tool=tool,
+                reason=reason,
+                cached=True,
+            )
 
         async def _do_navigate(page: Page) -> str:
             timeout_ms = BROWSER_COMMAND_TIMEOUT * 1000
@@ -453,7 +765,16 @@ class LightpandaManager:
             content_path = self._persist_content(
                 content, page.url, f"open_{content_mode}"
             )
-            title = await self._safe_title()
+            title = await self._safe_title(page)
+            self._content_cache.put(
+                session,
+                url,
+                content_mode,
+                final_url=page.url,
+                title=title,
+                path=content_path,
+                size=content_path.stat().st_size,
+            )
             return self._content_response(
                 content,
                 page.url,
@@ -464,7 +785,7 @@ class LightpandaManager:
             )
 
         return await self._with_recovery(
-            "navigate", _do_navigate, tool=tool, reason=reason
+            "navigate", _do_navigate, tool=tool, reason=reason, navigates=True
         )
 
     async def click(
@@ -486,8 +807,13 @@ class LightpandaManager:
             JSON string with updated page content.
         """
 
+        session = _session.get()
+
         async def _do_click(page: Page) -> str:
             timeout_ms = BROWSER_COMMAND_TIMEOUT * 1000
+            # The click may change the page in place (consent banners,
+            # "load more"), so earlier captures of it are stale.
+            self._content_cache.invalidate(session, page.url)
             await page.click(selector, timeout=timeout_ms)
             await page.wait_for_load_state(DEFAULT_WAIT_STRATEGY, timeout=timeout_ms)
 
@@ -495,7 +821,18 @@ class LightpandaManager:
             content_path = self._persist_content(
                 content, page.url, f"click_{content_mode}"
             )
-            title = await self._safe_title()
+            title = await self._safe_title(page)
+            self._content_cache.invalidate(session, page.url)
+            self._content_cache.put(
+                session,
+                page.url,
+                content_mode,
+                final_url=page.url,
+                title=title,
+                path=content_path,
+                size=content_path.stat().st_size,
+                navigated=False,
+            )
             return self._content_response(
                 content,
                 page.url,
@@ -505,7 +842,9 @@ class LightpandaManager:
                 reason=reason,
             )
 
-        return await self._with_recovery("click", _do_click, tool=tool, reason=reason)
+        return await self._with_recovery(
+            "click", _do_click, tool=tool, reason=reason, navigates=True
+        )
 
     async def close_page(
         self,
@@ -513,10 +852,11 @@ class LightpandaManager:
         tool: str = "",
         reason: str = "",
     ) -> str:
-        """Close the current page by navigating to about:blank.
+        """Close the session's page by navigating to about:blank.
 
-        Lightpanda is a single-page browser, so "closing" means
-        navigating to a blank page. The browser stays running.
+        The page stays in the pool (with the session's cookies), so
+        "closing" means navigating to a blank page. The browser stays
+        running.
 
         Args:
             tool: Tool name for the response envelope.
@@ -555,6 +895,9 @@ class LightpandaManager:
     ) -> str:
         """Get current page content as clean text.
 
+        Served from the content cache when the page's capture in
+        *content_mode* is still fresh.
+
         Args:
             tool: Tool name for the response envelope.
             reason: Agent reason for the response envelope.
@@ -562,6 +905,10 @@ class LightpandaManager:
         Returns:
             Page content as text, or error JSON if unavailable.
         """
+        session = _session.get()
+        current = self._current_url(session)
+        if current and (hit := self._cached(session, current, content_mode)):
+            return hit[1]
 
         async def _do_get_content(page: Page) -> str:
             return await self._get_text_content(page, mode=content_mode)
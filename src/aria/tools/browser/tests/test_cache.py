@@ -0,0 +1,132 @@
+"""Tests for the rendered-content cache."""
+
+from pathlib import Path
+
+import pytest
+
+from aria.tools.browser.cache import ContentCache, normalize_url
+
+
+def _capture(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _put(cache: ContentCache, path: Path, url: str, **kwargs) -> None:
+    kwargs.setdefault("final_url", url)
+    cache.put(
+        kwargs.pop("session", "s"),
+        url,
+        kwargs.pop("mode", "text"),
+        title="T",
+        path=path,
+        size=path.stat().st_size,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("HTTPS://Example.COM", "https://example.com/"),
+        ("https://example.com:443/a#frag", "https://example.com/a"),
+        ("http://example.com:8080/a?b=1&a=2", "http://example.com:8080/a?b=1&a=2"),
+        ("http://[::1]:80/x", "http://[::1]/x"),
+        ("about:blank", "about:blank"),
+    ],
+)
+def test_normalize_url(url: str, expected: str) -> None:
+    assert normalize_url(url) == expected
+
+
+def test_get_returns_capture_by_normalized_url(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=60, max_bytes=1024)
+    _put(cache, _capture(tmp_path, "a.txt", "page a"), "https://example.com/a")
+
+    hit = cache.get("s", "https://EXAMPLE.com/a#section", "text")
+
+    assert hit is not None
+    assert hit[1] == "page a"
+    assert hit[0].title == "T"
+    assert cache.get("s", "https://example.com/a", "article") is None
+    assert cache.get("other", "https://example.com/a", "text") is None
+
+
+def test_redirected_page_is_found_by_requested_url(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=60, max_bytes=1024)
+    _put(
+        cache,
+        _capture(tmp_path, "a.txt", "final"),
+        "http://example.com/old",
+        final_url="https://example.com/new",
+    )
+
+    hit = cache.get("s", "http://example.com/old", "text")
+
+    assert hit is not None
+    assert hit[0].url == "https://example.com/new"
+
+
+def test_expired_entry_is_dropped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ContentCache(ttl=60, max_bytes=1024)
+    _put(cache, _capture(tmp_path, "a.txt", "page a"), "https://example.com/a")
+    monkeypatch.setattr("aria.tools.browser.cache.time.monotonic", lambda: float("inf"))
+
+    assert cache.get("s", "https://example.com/a", "text") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_evicted_over_size_cap(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=60, max_bytes=20)
+    _put(cache, _capture(tmp_path, "a.txt", "a" * 8), "https://example.com/a")
+    _put(cache, _capture(tmp_path, "b.txt", "b" * 8), "https://example.com/b")
+    cache.get("s", "https://example.com/a", "text")
+
+    _put(cache, _capture(tmp_path, "c.txt", "c" * 8), "https://example.com/c")
+
+    assert cache.get("s", "https://example.com/b", "text") is None
+    assert cache.get("s", "https://example.com/a", "text") is not None
+    assert cache.stats["evicted"] == 1
+    # Evicted captures stay on disk for earlier tool results.
+    assert (tmp_path / "b.txt").exists()
+
+
+def test_oversized_capture_is_not_indexed(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=60, max_bytes=4)
+    _put(cache, _capture(tmp_path, "a.txt", "too large"), "https://example.com/a")
+
+    assert len(cache) == 0
+
+
+def test_missing_capture_file_is_a_miss(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=60, max_bytes=1024)
+    path = _capture(tmp_path, "a.txt", "page a")
+    _put(cache, path, "https://example.com/a")
+    path.unlink()
+
+    assert cache.get("s", "https://example.com/a", "text") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_drops_all_modes_of_a_page(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=60, max_bytes=1024)
+    path = _capture(tmp_path, "a.txt", "page a")
+    _put(cache, path, "https://example.com/a", mode="text")
+    _put(cache, path, "https://example.com/a", mode="article")
+    _put(cache, path, "https://example.com/b")
+
+    cache.invalidate("s", "https://example.com/a")
+
+    assert len(cache) == 1
+    assert cache.get("s", "https://example.com/b", "text") is not None
+
+
+def test_zero_ttl_disables_cache(tmp_path: Path) -> None:
+    cache = ContentCache(ttl=0, max_bytes=1024)
+    _put(cache, _capture(tmp_path, "a.txt", "page a"), "https://example.com/a")
+
+    assert not cache.enabled
+    assert cache.get("s", "https://example.com/a", "text") is None
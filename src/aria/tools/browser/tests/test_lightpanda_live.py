@@ -2,16 +2,19 @@
 
 Starts the real Lightpanda binary, connects via CDP + Playwright,
 navigates to a real URL, clicks an element, and exercises concurrent
-access to verify the asyncio.Lock serialisation.
+access through the page pool.
 """
 
 import asyncio
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
 
-from aria.tools.browser.manager import LightpandaManager
+from aria.tools.browser.manager import LightpandaManager, set_browser_session
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -94,7 +97,8 @@ async def test_concurrent_navigations_are_serialised(
     """Fire two navigate() calls concurrently.
 
     Before the fix this would crash with "Execution context was destroyed".
-    With the asyncio.Lock they run one after the other and both succeed.
+    Calls of one session share a page, so they run one after the other
+    and both succeed.
     """
     results = await asyncio.gather(
         manager.navigate("https://example.com", tool="open_url", reason="concurrent A"),
@@ -194,3 +198,55 @@ async def test_navigate_invalid_url(manager: LightpandaManager):
     assert payload["status"] == "error"
     assert manager.is_running, "Manager should still be running after error"
     print(f"\n✓ invalid URL handled gracefully: {payload['error']['message'][:80]}")
+
+
+# ---------------------------------------------------------------------------
+# 8. Concurrent sessions against a local server
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_sessions_use_separate_pages_and_cookies():
+    """Two chat threads browse a local site in parallel without sharing
+    cookies."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(0.5)
+            cookie = self.headers.get("Cookie") or "none"
+            body = f"<html><body><p>cookies: {cookie}</p></body></html>".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            if self.path.startswith("/set"):
+                self.send_header("Set-Cookie", f"{self.path[5:]}; Path=/")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    site = f"http://127.0.0.1:{server.server_address[1]}"
+
+    async def visit(session: str) -> dict:
+        set_browser_session(session)
+        await manager.navigate(f"{site}/set?user={session}")
+        return json.loads(await manager.navigate(f"{site}/whoami"))
+
+    manager = LightpandaManager(BINARY, port=PORT, pool_size=2, processes=2)
+    assert await manager.start()
+    try:
+        start = time.perf_counter()
+        a, b = await asyncio.gather(visit("a"), visit("b"))
+        elapsed = time.perf_counter() - start
+    finally:
+        await manager.stop()
+        server.shutdown()
+
+    assert "user=a" in a["data"]["content_preview"]
+    assert "user=b" not in a["data"]["content_preview"]
+    assert "user=b" in b["data"]["content_preview"]
+    assert elapsed < 4 * 0.5
+    print(f"\n✓ 2 sessions in {elapsed:.2f}s, pool {manager.pool_stats()}")
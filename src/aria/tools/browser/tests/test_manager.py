@@ -1,12 +1,19 @@
-"""Tests for browser manager response helpers and recovery behavior."""
+"""Tests for browser manager response helpers, page pool and recovery."""
 
+import asyncio
 import json
+import re
+import threading
+import time
+import urllib.request
+from collections.abc import Awaitable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from aria.tools.browser.manager import LightpandaManager
+from aria.tools.browser.manager import LightpandaManager, set_browser_session
 
 
 def _make_manager() -> LightpandaManager:
@@ -19,14 +26,6 @@ def test_is_running_false_when_not_started() -> None:
     assert manager.is_running is False
 
 
-def test_is_running_true_when_all_set() -> None:
-    manager = _make_manager()
-    manager._process = Mock()
-    manager._browser = Mock()
-    manager._page = Mock()
-    assert manager.is_running is True
-
-
 def test_success_uses_standard_envelope() -> None:
     manager = _make_manager()
 
@@ -64,185 +63,537 @@ def test_error_without_recovery() -> None:
     assert "how_to_fix" not in payload["error"]
 
 
+# ---------------------------------------------------------------------------
+# Page pool — fake Playwright stack against a local HTTP server
+# ---------------------------------------------------------------------------
+
+_DELAY = 0.3
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """``/slow`` answers after ``_DELAY``; ``/set?v=x`` sets a cookie;
+    ``/whoami`` echoes the request's cookies."""
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition("?")
+        headers = {}
+        if path == "/slow":
+            time.sleep(_DELAY)
+            body = "slow page"
+        elif path == "/set":
+            headers["Set-Cookie"] = f"{query}; Path=/"
+            body = f"cookie set {query}"
+        else:
+            body = f"cookies: {self.headers.get('Cookie', 'none')}"
+        html = f"<html><title>{path}</title><body><p>{body}</p></body></html>"
+        data = html.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def site() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+class _FakePage:
+    """Loads pages over HTTP with its context's cookie jar."""
+
+    def __init__(self, context: "_FakeContext"):
+        self.context = context
+        self.url = "about:blank"
+        self.html = ""
+        self.closed = False
+        self.error: Exception | None = None
+        self.loads = 0
+
+    async def goto(self, url: str, **kwargs) -> None:
+        if self.error:
+            raise self.error
+        self.loads += 1
+        if url == "about:blank":
+            self.url, self.html = url, ""
+            return
+        request = urllib.request.Request(url)
+        if self.context.cookies:
+            request.add_header(
+                "Cookie",
+                "; ".join(f"{k}={v}" for k, v in self.context.cookies.items()),
+            )
+        response = await asyncio.to_thread(urllib.request.urlopen, request)
+        if cookie := response.headers.get("Set-Cookie"):
+            name, _, value = cookie.split(";")[0].partition("=")
+            self.context.cookies[name] = value
+        self.url, self.html = url, response.read().decode()
+
+    async def click(self, selector: str, **kwargs) -> None:
+        if self.error:
+            raise self.error
+
+    async def wait_for_load_state(self, *args, **kwargs) -> None:
+        pass
+
+    async def evaluate(self, script: str, mode: str) -> str:
+        return re.sub(r"<[^>]+>", "\n", self.html.split("</title>")[-1])
+
+    async def title(self) -> str:
+        match = re.search(r"<title>(.*)</title>", self.html)
+        return match.group(1) if match else ""
+
+    async def content(self) -> str:
+        return self.html
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self):
+        self.cookies: dict[str, str] = {}
+        self.pages: list[_FakePage] = []
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        for page in self.pages:
+            page.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **kwargs) -> _FakeContext:
+        return _FakeContext()
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.chromium = Mock()
+        self.chromium.connect_over_cdp = AsyncMock(side_effect=self._connect)
+        self.connections = 0
+
+    async def _connect(self, url: str) -> _FakeBrowser:
+        self.connections += 1
+        return _FakeBrowser()
+
+    async def stop(self) -> None:
+        pass
+
+
+class _FakeProcess:
+    """Stands in for a running ``lightpanda serve``."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.alive = True
+        self.starts = 0
+        self.restart_lock = asyncio.Lock()
+
+    @property
+    def cdp_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self) -> bool:
+        self.starts += 1
+        self.alive = True
+        return True
+
+    def stop(self) -> None:
+        self.alive = False
+
+
+def _make_pool(**kwargs) -> LightpandaManager:
+    """A started manager whose Lightpanda processes and CDP are faked.
+
+    The content cache is off unless a ``cache_ttl`` is given, so every
+    call renders.
+    """
+    kwargs.setdefault("cache_ttl", 0)
+    manager = LightpandaManager(Path("/tmp/lightpanda"), **kwargs)
+    manager._processes = [
+        _FakeProcess(9222 + i) for i in range(len(manager._processes))
+    ]
+    manager._playwright = _FakePlaywright()
+    return manager
+
+
+async def _as(session: str, call: Awaitable[str]) -> dict:
+    """Await a browser call made from *session* and decode its envelope."""
+    set_browser_session(session)
+    return json.loads(await call)
+
+
+def test_is_running_true_when_pool_started() -> None:
+    assert _make_pool().is_running is True
+
+
 @pytest.mark.asyncio
-async def test_with_recovery_returns_error_when_page_unavailable() -> None:
-    manager = _make_manager()
-    manager._ensure_page = AsyncMock(return_value=False)
+async def test_sessions_browse_concurrently(
+    site: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = _make_pool(pool_size=2)
+    # Each navigation only proceeds once the other one is in flight too.
+    both_loading = asyncio.Barrier(2)
+    goto = _FakePage.goto
+
+    async def goto_together(page: _FakePage, url: str, **kwargs) -> None:
+        if url.endswith("/slow"):
+            await asyncio.wait_for(both_loading.wait(), timeout=5)
+        await goto(page, url, **kwargs)
+
+    monkeypatch.setattr(_FakePage, "goto", goto_together)
+
+    results = await asyncio.gather(
+        _as("a", manager.navigate(f"{site}/slow")),
+        _as("b", manager.navigate(f"{site}/slow")),
+    )
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    stats = manager.pool_stats()
+    assert stats["open"] == 2
+    assert stats["sessions"] == 2
+    assert stats["in_use"] == 0
+
 
-    result = await manager._with_recovery(
-        "test", AsyncMock(return_value="ok"), tool="t", reason="i"
+@pytest.mark.asyncio
+async def test_same_session_calls_are_serialised(site: str) -> None:
+    manager = _make_pool(pool_size=2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        _as("a", manager.navigate(f"{site}/slow")),
+        _as("a", manager.navigate(f"{site}/slow")),
     )
-    payload = json.loads(result)
-    assert payload["status"] == "error"
-    assert payload["error"]["message"] == "Browser not available"
+    elapsed = time.perf_counter() - start
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    assert elapsed >= 2 * _DELAY
+    stats = manager.pool_stats()
+    assert stats["open"] == 1
+    assert stats["waited"] == 1
+    assert stats["wait_max_s"] >= _DELAY * 0.9
 
 
 @pytest.mark.asyncio
-async def test_with_recovery_calls_fn_on_valid_page() -> None:
-    manager = _make_manager()
-    page = Mock()
-    manager._page = page
-    manager._ensure_page = AsyncMock(return_value=True)
+async def test_click_acts_on_the_sessions_own_page(site: str) -> None:
+    manager = _make_pool(pool_size=2)
+    await _as("a", manager.navigate(f"{site}/set?v=a"))
+    await _as("b", manager.navigate(f"{site}/whoami"))
 
-    fn = AsyncMock(return_value='{"ok": true}')
-    result = await manager._with_recovery("test", fn)
+    result = await _as("a", manager.click("a"))
 
-    fn.assert_awaited_once_with(page)
-    assert result == '{"ok": true}'
+    assert result["data"]["url"] == f"{site}/set?v=a"
 
 
 @pytest.mark.asyncio
-async def test_with_recovery_returns_recovery_error_on_crash() -> None:
-    manager = _make_manager()
-    page = Mock()
-    manager._page = page
-    manager._ensure_page = AsyncMock(side_effect=[True, True])
-    manager._is_page_valid = Mock(return_value=False)
+async def test_cookies_are_isolated_per_session(site: str) -> None:
+    manager = _make_pool(pool_size=2)
 
-    fn = AsyncMock(side_effect=Exception("crashed"))
-    result = await manager._with_recovery("test", fn, tool="t", reason="i")
-    payload = json.loads(result)
+    await _as("a", manager.navigate(f"{site}/set?v=a"))
+    other = await _as("b", manager.navigate(f"{site}/whoami"))
+    own = await _as("a", manager.navigate(f"{site}/whoami"))
 
-    assert payload["status"] == "error"
-    assert payload["error"]["message"] == "crashed"
-    assert payload["error"]["recoverable"] is True
-    assert payload["error"]["how_to_fix"] == ("Browser crashed. Restarted. Retry.")
+    assert "cookies: none" in other["data"]["content_preview"]
+    assert "cookies: v=a" in own["data"]["content_preview"]
 
 
 @pytest.mark.asyncio
-async def test_with_recovery_returns_plain_error_when_page_still_valid() -> None:
-    manager = _make_manager()
-    page = Mock()
-    manager._page = page
-    manager._ensure_page = AsyncMock(return_value=True)
-    manager._is_page_valid = Mock(return_value=True)
+async def test_rebinding_a_slot_drops_the_previous_sessions_cookies(
+    site: str,
+) -> None:
+    manager = _make_pool(pool_size=1)
 
-    fn = AsyncMock(side_effect=Exception("timeout"))
-    result = await manager._with_recovery("test", fn, tool="t", reason="i")
-    payload = json.loads(result)
+    await _as("a", manager.navigate(f"{site}/set?v=a"))
+    other = await _as("b", manager.navigate(f"{site}/whoami"))
 
-    assert payload["status"] == "error"
-    assert "timeout" in payload["error"]["message"]
-    assert "download tool" in payload["error"]["message"]
-    assert payload["error"]["recoverable"] is False
+    assert "cookies: none" in other["data"]["content_preview"]
+    assert manager.pool_stats()["open"] == 1
 
 
 @pytest.mark.asyncio
-async def test_navigate_returns_recovery_error_after_crash() -> None:
-    manager = _make_manager()
-    page = Mock()
-    page.url = "https://example.com"
-    page.goto = AsyncMock(side_effect=Exception("nav failed"))
-    page.wait_for_load_state = AsyncMock()
-    page.title = AsyncMock(return_value="Example")
-
-    manager._process = Mock()
-    manager._browser = Mock()
-    manager._page = page
-
-    # _ensure_page succeeds initially; after crash _is_page_valid returns
-    # False so _with_recovery enters the crash-recovery branch, then
-    # _ensure_page succeeds again for the restart.
-    manager._is_page_valid = Mock(return_value=False)
-    manager._ensure_page = AsyncMock(side_effect=[True, True])
-
-    result = await manager.navigate(
-        "https://example.com", tool="open_url", reason="testing"
+async def test_page_recycled_after_navigations(site: str) -> None:
+    manager = _make_pool(recycle_after=2)
+
+    await _as("a", manager.navigate(f"{site}/set?v=a"))
+    first = manager._slots[0].page
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    result = await _as("a", manager.navigate(f"{site}/whoami"))
+
+    slot = manager._slots[0]
+    assert slot.page is not first
+    assert first.closed
+    assert manager.pool_stats()["recycled"] == 1
+    # Recycling keeps the session's cookies.
+    assert "cookies: v=a" in result["data"]["content_preview"]
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_slot_is_rebuilt_on_checkout(site: str) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    manager._slots[0].browser.connected = False
+
+    result = await _as("a", manager.navigate(f"{site}/whoami"))
+
+    assert result["status"] == "success"
+    assert manager.pool_stats()["rebuilt"] == 1
+    assert manager._playwright.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_dead_process_is_restarted(site: str) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    process = manager._processes[0]
+    process.alive = False
+
+    result = await _as("a", manager.navigate(f"{site}/whoami"))
+
+    assert result["status"] == "success"
+    assert process.starts == 1
+
+
+@pytest.mark.asyncio
+async def test_pages_spread_over_processes(site: str) -> None:
+    manager = _make_pool(pool_size=2, processes=2)
+
+    await asyncio.gather(
+        _as("a", manager.navigate(f"{site}/slow")),
+        _as("b", manager.navigate(f"{site}/slow")),
     )
-    payload = json.loads(result)
+
+    assert {slot.process.port for slot in manager._slots} == {9222, 9223}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("action", ["navigate", "click"])
+async def test_crash_during_call_returns_recovery_error(site: str, action: str) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    page = manager._slots[0].page
+
+    async def crash(*args, **kwargs) -> None:
+        page.closed = True
+        raise Exception(f"{action} failed")
+
+    setattr(page, "goto" if action == "navigate" else "click", crash)
+
+    if action == "navigate":
+        call = manager.navigate(f"{site}/whoami", tool="open_url", reason="t")
+    else:
+        call = manager.click("button", tool="browser_click", reason="t")
+    payload = await _as("a", call)
 
     assert payload["status"] == "error"
-    assert payload["error"]["message"] == "nav failed"
+    assert payload["error"]["message"] == f"{action} failed"
     assert payload["error"]["recoverable"] is True
+    # The rebuilt slot is still bound to the session.
+    assert manager._slots[0].session == "a"
+    assert manager._slots[0].page is not page
 
 
 @pytest.mark.asyncio
-async def test_click_returns_recovery_error_after_crash() -> None:
-    manager = _make_manager()
-    page = Mock()
-    page.url = "https://example.com"
-    page.click = AsyncMock(side_effect=Exception("click failed"))
-    page.wait_for_load_state = AsyncMock()
-    page.title = AsyncMock(return_value="Example")
-
-    manager._process = Mock()
-    manager._browser = Mock()
-    manager._page = page
-
-    # _ensure_page succeeds initially; after crash _is_page_valid returns
-    # False so _with_recovery enters the crash-recovery branch.
-    manager._is_page_valid = Mock(return_value=False)
-    manager._ensure_page = AsyncMock(side_effect=[True, True])
-
-    result = await manager.click(
-        "button.accept", tool="browser_click", reason="testing"
-    )
-    payload = json.loads(result)
+async def test_error_on_healthy_page_suggests_download_tool(site: str) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    manager._slots[0].page.error = Exception("timeout")
+
+    payload = await _as("a", manager.navigate(f"{site}/whoami", tool="t", reason="i"))
 
     assert payload["status"] == "error"
-    assert payload["error"]["message"] == "click failed"
-    assert payload["error"]["recoverable"] is True
+    assert "timeout" in payload["error"]["message"]
+    assert "download tool" in payload["error"]["message"]
+    assert payload["error"]["recoverable"] is False
 
 
 @pytest.mark.asyncio
-async def test_get_page_content_returns_error_json_when_unavailable() -> None:
-    manager = _make_manager()
-    manager._ensure_page = AsyncMock(return_value=False)
+async def test_queue_timeout_returns_busy_error(site: str) -> None:
+    manager = _make_pool(pool_size=1, queue_timeout=0.05)
+
+    slow, queued = await asyncio.gather(
+        _as("a", manager.navigate(f"{site}/slow")),
+        _as("b", manager.navigate(f"{site}/whoami")),
+    )
+
+    assert slow["status"] == "success"
+    assert queued["status"] == "error"
+    assert queued["error"]["message"].startswith("Browser busy")
+    assert manager.pool_stats()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_returns_error_when_browser_unavailable() -> None:
+    manager = _make_pool()
+    manager._playwright.chromium.connect_over_cdp.side_effect = Exception("refused")
 
-    result = await manager.get_page_content(tool="t", reason="i")
-    payload = json.loads(result)
+    payload = await _as("a", manager.navigate("http://127.0.0.1:1/"))
 
     assert payload["status"] == "error"
     assert payload["error"]["message"] == "Browser not available"
+    assert manager.pool_stats()["in_use"] == 0
 
 
 @pytest.mark.asyncio
-async def test_get_page_content_returns_cleaned_text() -> None:
-    manager = _make_manager()
-    page = Mock()
-    page.evaluate = AsyncMock(return_value="  Line 1\n\n   Line 2  ")
-
-    manager._process = Mock()
-    manager._browser = Mock()
-    manager._page = page
-    manager._ensure_page = AsyncMock(return_value=True)
+async def test_get_page_content_returns_cleaned_text(site: str) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    manager._slots[0].page.evaluate = AsyncMock(return_value="  Line 1\n\n   Line 2  ")
 
+    set_browser_session("a")
     result = await manager.get_page_content()
 
     assert result == "Line 1\nLine 2"
 
 
 @pytest.mark.asyncio
-async def test_get_page_content_supports_article_mode() -> None:
-    manager = _make_manager()
-    page = Mock()
+async def test_get_page_content_supports_article_mode(site: str) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    page = manager._slots[0].page
     page.evaluate = AsyncMock(return_value="Headline\n\nParagraph 1\n\nParagraph 2")
 
-    manager._process = Mock()
-    manager._browser = Mock()
-    manager._page = page
-    manager._ensure_page = AsyncMock(return_value=True)
-
+    set_browser_session("a")
     result = await manager.get_page_content(content_mode="article")
 
     assert result == "Headline\nParagraph 1\nParagraph 2"
+    assert page.evaluate.await_args.args[1] == "article"
 
 
 @pytest.mark.asyncio
-async def test_get_page_content_falls_back_to_html_on_evaluate_error() -> None:
-    manager = _make_manager()
-    page = Mock()
+async def test_get_page_content_falls_back_to_html_on_evaluate_error(
+    site: str,
+) -> None:
+    manager = _make_pool()
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    page = manager._slots[0].page
     page.evaluate = AsyncMock(side_effect=RuntimeError("eval failed"))
-    page.content = AsyncMock(return_value="<html><body>fallback</body></html>")
-
-    manager._process = Mock()
-    manager._browser = Mock()
-    manager._page = page
-    manager._ensure_page = AsyncMock(return_value=True)
 
+    set_browser_session("a")
     result = await manager.get_page_content()
 
-    assert result == "<html><body>fallback</body></html>"
+    assert result == page.html
+
+
+# ---------------------------------------------------------------------------
+# Content cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_reopening_the_current_page_is_served_from_cache(site: str) -> None:
+    manager = _make_pool(cache_ttl=300)
+    first = await _as("a", manager.navigate(f"{site}/whoami"))
+    page = manager._slots[0].page
+
+    again = await _as("a", manager.navigate(f"{site}/whoami#top"))
+
+    assert page.loads == 1
+    assert again["data"]["cached"] is True
+    assert again["data"]["content_file"] == first["data"]["content_file"]
+    assert again["data"]["content_preview"] == first["data"]["content_preview"]
+    assert again["data"]["title"] == "/whoami"
+    assert manager.pool_stats()["content_cache"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_page_content_is_served_from_cache(site: str) -> None:
+    manager = _make_pool(cache_ttl=300)
+    await _as("a", manager.navigate(f"{site}/whoami", content_mode="article"))
+    page = manager._slots[0].page
+    page.evaluate = AsyncMock(side_effect=AssertionError("re-rendered"))
+
+    set_browser_session("a")
+    result = await manager.get_page_content(content_mode="article")
+
+    assert result == "cookies: none"
+    # Another mode has no capture yet.
+    assert await manager.get_page_content() == page.html
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_once_the_page_moved_on(site: str) -> None:
+    manager = _make_pool(cache_ttl=300)
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    await _as("a", manager.navigate(f"{site}/set?v=a"))
+
+    result = await _as("a", manager.navigate(f"{site}/whoami"))
+
+    assert "cached" not in result["data"]
+    assert "cookies: v=a" in result["data"]["content_preview"]
+    assert manager._slots[0].page.loads == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_is_per_session(site: str) -> None:
+    manager = _make_pool(pool_size=2, cache_ttl=300)
+    await _as("a", manager.navigate(f"{site}/set?v=a"))
+    await _as("a", manager.navigate(f"{site}/whoami"))
+
+    other = await _as("b", manager.navigate(f"{site}/whoami"))
+
+    assert "cached" not in other["data"]
+    assert "cookies: none" in other["data"]["content_preview"]
+
+
+@pytest.mark.asyncio
+async def test_click_capture_answers_reads_but_not_reopening(site: str) -> None:
+    manager = _make_pool(cache_ttl=300)
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    page = manager._slots[0].page
+
+    clicked = await _as("a", manager.click("button.accept"))
+    page.evaluate = AsyncMock(side_effect=AssertionError("re-rendered"))
+    set_browser_session("a")
+    assert await manager.get_page_content() == clicked["data"]["content_preview"]
+    del page.evaluate
+
+    # Opening the URL again reloads the page the click changed in place.
+    reopened = await _as("a", manager.navigate(f"{site}/whoami"))
+    assert "cached" not in reopened["data"]
+    assert page.loads == 2
+
+    again = await _as("a", manager.navigate(f"{site}/whoami"))
+    assert again["data"]["cached"] is True
+    assert again["data"]["content_file"] == reopened["data"]["content_file"]
+
+
+@pytest.mark.asyncio
+async def test_expired_capture_is_rendered_again(
+    site: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = _make_pool(cache_ttl=300)
+    await _as("a", manager.navigate(f"{site}/whoami"))
+    now = time.monotonic()
+    monkeypatch.setattr("aria.tools.browser.cache.time.monotonic", lambda: now + 301)
+
+    result = await _as("a", manager.navigate(f"{site}/whoami"))
+
+    assert "cached" not in result["data"]
+    assert manager._slots[0].page.loads == 2
 
 
 def test_navigation_failed_on_empty_content() -> None:
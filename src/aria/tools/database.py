@@ -3,20 +3,149 @@
 Provides a singleton SQLAlchemy engine and session factory that all
 tool database classes can use. This ensures a single connection pool
 to the tools.db file.
+
+Fire-and-forget mutations (audit events, reasoning steps, scratchpad
+upserts, ...) go through :meth:`ToolsDatabase.submit`.  In ``sync`` mode
+each one is committed immediately, exactly as before.  In ``batched``
+mode they are queued and committed together in one transaction by a
+background writer once ``ARIA_TOOLS_DB_BATCH_SIZE`` operations are
+pending or ``ARIA_TOOLS_DB_FLUSH_INTERVAL_MS`` has elapsed.  Every
+:meth:`ToolsDatabase.get_session` call flushes the queue first, so reads
+and synchronous writes always observe earlier submitted writes.
+
+Batched mode trades durability for throughput: ``submit`` returns before
+the write reaches the database, so a write that later fails cannot raise
+to its caller.  Failed writes are logged, counted in
+:attr:`ToolsDatabase.dropped_writes` and reported to the ``on_error``
+callback passed to ``submit``, if any, so callers holding state derived
+from the write can discard it.
 """
 
+import atexit
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 from loguru import logger
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from aria.config import get_optional_env
 from aria.config.folders import DB
+from aria.helpers.sqlite import create_sqlite_engine, verify_sqlite_pragmas
 
 from .models import Base
 
 _DEFAULT_DB_PATH = str(DB.path / "tools.db")
 
+WRITE_MODES = ("sync", "batched")
+
+# "sync" commits every mutation immediately; "batched" enables write-behind.
+DEFAULT_WRITE_MODE = get_optional_env("ARIA_TOOLS_DB_WRITE_MODE", "sync").lower()
+DEFAULT_BATCH_SIZE = int(get_optional_env("ARIA_TOOLS_DB_BATCH_SIZE", "64"))
+DEFAULT_FLUSH_INTERVAL = (
+    int(get_optional_env("ARIA_TOOLS_DB_FLUSH_INTERVAL_MS", "50")) / 1000
+)
+
+WriteOperation = Callable[[Session], None]
+WriteErrorHandler = Callable[[Exception], None]
+
+
+class _WriteBehindQueue:
+    """Background writer that commits queued operations in grouped batches."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self._session_factory = session_factory
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(0.0, flush_interval)
+        self._pending: list[tuple[WriteOperation, WriteErrorHandler | None]] = []
+        self.dropped = 0
+        self._cond = threading.Condition()
+        # Serialises drains so batches are committed in submission order.
+        self._commit_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="tools-db-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, op: WriteOperation, on_error: WriteErrorHandler | None = None
+    ) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Tools database write queue is closed")
+            self._pending.append((op, on_error))
+            if len(self._pending) == 1 or len(self._pending) >= self._batch_size:
+                self._cond.notify()
+
+    def flush(self) -> None:
+        """Commit everything queued so far on the calling thread."""
+        self._drain()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+        self._drain()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if len(self._pending) < self._batch_size:
+                    self._cond.wait(self._flush_interval)
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._commit_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._commit(batch)
+
+    def _commit(
+        self, batch: list[tuple[WriteOperation, WriteErrorHandler | None]]
+    ) -> None:
+        try:
+            with self._session_factory() as session:
+                for op, _ in batch:
+                    op(session)
+                session.commit()
+            logger.debug(f"Tools database committed {len(batch)} queued writes")
+            return
+        except Exception as exc:
+            logger.warning(
+                f"Batched tools database commit failed ({exc}); "
+                f"retrying {len(batch)} writes individually"
+            )
+
+        # Isolate the failing operation so one bad write does not drop
+        # the rest of the batch.
+        for op, on_error in batch:
+            try:
+                with self._session_factory() as session:
+                    op(session)
+                    session.commit()
+            except Exception as exc:
+                self.dropped += 1
+                logger.exception("Dropped queued tools database write")
+                if on_error is not None:
+                    try:
+                        on_error(exc)
+                    except Exception:
+                        logger.exception("Tools database write error handler failed")
+
 
 class ToolsDatabase:
     """Shared database engine for all tool modules.
@@ -26,15 +155,37 @@ class ToolsDatabase:
     removed to avoid redundant dual-singleton patterns.
     """
 
-    def __init__(self, db_path: str = _DEFAULT_DB_PATH):
+    def __init__(
+        self,
+        db_path: str = _DEFAULT_DB_PATH,
+        write_mode: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
         if getattr(self, "_initialized", False):
             return
 
+        write_mode = (write_mode or DEFAULT_WRITE_MODE).lower()
+        if write_mode not in WRITE_MODES:
+            raise ValueError(
+                f"Invalid tools database write mode '{write_mode}'. "
+                f"Expected one of: {', '.join(WRITE_MODES)}"
+            )
+
         self.db_path = db_path
+        self.write_mode = write_mode
         self._ensure_directory()
         self._setup_engine()
+        verify_sqlite_pragmas(self._engine)
+        self._write_queue: _WriteBehindQueue | None = None
+        self._dropped_writes = 0
+        if write_mode == "batched":
+            self._write_queue = _WriteBehindQueue(
+                self._session_factory, batch_size, flush_interval
+            )
+            atexit.register(self.close)
         self._initialized = True
-        logger.info(f"ToolsDatabase initialized at {db_path}")
+        logger.info(f"ToolsDatabase initialized at {db_path} ({write_mode} writes)")
 
     def _ensure_directory(self) -> None:
         db_dir = Path(self.db_path).parent
@@ -42,7 +193,7 @@ class ToolsDatabase:
 
     def _setup_engine(self) -> None:
         database_url = f"sqlite:///{self.db_path}"
-        self._engine = create_engine(database_url, echo=False, pool_pre_ping=True)
+        self._engine = create_sqlite_engine(database_url, echo=False)
         self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False)
         logger.debug(f"Tools database engine created: {database_url}")
 
@@ -52,11 +203,54 @@ class ToolsDatabase:
         logger.debug("Tool database tables created/verified")
 
     def get_session(self) -> Session:
-        """Get a new database session."""
+        """Get a new database session.
+
+        Pending queued writes are flushed first so the session sees them.
+        """
+        self.flush()
         return self._session_factory()
 
+    @property
+    def dropped_writes(self) -> int:
+        """Number of queued writes that failed and were discarded."""
+        if self._write_queue is not None:
+            return self._dropped_writes + self._write_queue.dropped
+        return self._dropped_writes
+
+    def submit(
+        self, op: WriteOperation, on_error: WriteErrorHandler | None = None
+    ) -> None:
+        """Run a write operation that does not need to return a value.
+
+        ``op`` receives a session and must not commit it.  In ``sync`` mode
+        it runs and commits immediately and any error propagates.  In
+        ``batched`` mode it is queued and committed later together with
+        other writes; if it then fails it is dropped and ``on_error`` is
+        called with the exception on the writer thread.
+        """
+        if self._write_queue is None:
+            with self._session_factory() as session:
+                op(session)
+                session.commit()
+            return
+        self._write_queue.submit(op, on_error)
+
+    def flush(self) -> None:
+        """Commit all queued writes. No-op in ``sync`` mode."""
+        if self._write_queue is not None:
+            self._write_queue.flush()
+
     def close(self) -> None:
-        """Close database connections."""
+        """Flush queued writes and close database connections."""
+        if self._write_queue is not None:
+            self._write_queue.close()
+            self._dropped_writes += self._write_queue.dropped
+            self._write_queue = None
+            if self._dropped_writes:
+                logger.warning(
+                    f"Tools database dropped {self._dropped_writes} queued writes"
+                )
+            atexit.unregister(self.close)
         if self._engine:
             self._engine.dispose()
             logger.debug("Tools database connections closed")
@@ -71,3 +265,11 @@ def get_tools_database() -> ToolsDatabase:
     if _db_instance is None:
         _db_instance = ToolsDatabase()
     return _db_instance
+
+
+def close_tools_database() -> None:
+    """Flush and close the global tools database, if one was created."""
+    global _db_instance
+    if _db_instance is not None:
+        _db_instance.close()
+        _db_instance = None
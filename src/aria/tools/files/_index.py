@@ -0,0 +1,277 @@
+"""In-memory index of the workspace directory tree.
+
+``list_files`` and ``search_files(mode="name")`` are called many times per
+turn on the same tree.  Walking it with ``Path.rglob`` costs a ``stat`` per
+entry each time.  This index caches each directory's listing (name, type,
+size and mtime of every entry) and revalidates it with a single ``stat``
+of the directory: a directory's mtime changes whenever an entry is added,
+removed or renamed in it, so an unchanged mtime means the cached listing
+is still complete.  Listings whose mtime is within the filesystem's
+timestamp granularity of "now" are treated as unverified and rescanned
+on next use, so a change made in the same tick as the scan is not missed.
+
+File writes do not change the parent directory's mtime, so the size and
+mtime of a file edited in place can be stale until the directory is
+rescanned.  The file tools call :func:`record_file_change` after every
+write so that their own changes are reflected immediately.
+
+One index is kept per workspace root (``BASE_DIR``).  Paths outside it
+are not indexed.  Memory is bounded by ``ARIA_FILE_INDEX_MAX_ENTRIES``:
+least recently used directory listings are dropped first and rescanned
+on demand.
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from aria.config import get_optional_env
+from aria.tools import constants
+
+MAX_ENTRIES = int(get_optional_env("ARIA_FILE_INDEX_MAX_ENTRIES", "200000"))
+
+# Listings scanned less than this long after their directory changed are
+# rescanned on next use (covers 1-2 s mtime resolution on some filesystems).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """One directory entry as seen when its directory was last scanned."""
+
+    name: str
+    is_dir: bool
+    is_symlink: bool
+    size: int
+    mtime_ns: int
+
+
+@dataclass(slots=True)
+class _Listing:
+    mtime_ns: int
+    verified: bool
+    entries: list[IndexEntry]
+
+
+def _scan_entry(entry: os.DirEntry) -> IndexEntry | None:
+    try:
+        is_dir = entry.is_dir()
+        info = entry.stat()
+        return IndexEntry(
+            name=entry.name,
+            is_dir=is_dir,
+            is_symlink=entry.is_symlink(),
+            size=0 if is_dir else info.st_size,
+            mtime_ns=info.st_mtime_ns,
+        )
+    except OSError:
+        # Broken symlink or entry removed mid-scan.
+        return None
+
+
+class WorkspaceIndex:
+    """Cached directory listings for one root, validated by directory mtime."""
+
+    def __init__(self, root: Path, max_entries: int = MAX_ENTRIES):
+        self.root = root
+        self.max_entries = max(1, max_entries)
+        self._listings: OrderedDict[str, _Listing] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.scans = 0
+
+    def __contains__(self, path: Path) -> bool:
+        return path == self.root or self.root in path.parents
+
+    # -- listings ----------------------------------------------------------
+
+    def listdir(self, directory: Path) -> list[IndexEntry]:
+        """Return the entries of ``directory`` sorted by name.
+
+        Raises:
+            OSError: If the directory cannot be listed.
+        """
+        key = str(directory)
+        mtime_ns = os.stat(key).st_mtime_ns
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is not None and listing.verified:
+                if listing.mtime_ns == mtime_ns:
+                    self._listings.move_to_end(key)
+                    self.hits += 1
+                    return listing.entries
+
+        with os.scandir(key) as it:
+            entries = sorted(
+                (e for e in map(_scan_entry, it) if e is not None),
+                key=lambda e: e.name,
+            )
+        verified = time.time_ns() - mtime_ns > _RACY_WINDOW_NS
+        self._store(key, _Listing(mtime_ns, verified, entries))
+        return entries
+
+    def _store(self, key: str, listing: _Listing) -> None:
+        with self._lock:
+            self.scans += 1
+            old = self._listings.pop(key, None)
+            if old is not None:
+                self._size -= len(old.entries)
+            self._listings[key] = listing
+            self._size += len(listing.entries)
+            while self._size > self.max_entries and len(self._listings) > 1:
+                _, evicted = self._listings.popitem(last=False)
+                self._size -= len(evicted.entries)
+
+    def walk(
+        self, directory: Path, recursive: bool = True
+    ) -> Iterator[tuple[str, IndexEntry]]:
+        """Yield ``(relative_path, entry)`` for everything under ``directory``.
+
+        Entries of a directory come before its subdirectories' contents,
+        in name order.  Symlinked directories are listed but not entered.
+        Unreadable directories are skipped.
+        """
+        stack: list[tuple[Path, str]] = [(directory, "")]
+        while stack:
+            current, rel_dir = stack.pop()
+            try:
+                entries = self.listdir(current)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                yield rel_path, entry
+                if recursive and entry.is_dir and not entry.is_symlink:
+                    subdirs.append((current / entry.name, rel_path))
+            stack.extend(reversed(subdirs))
+
+    def tree(self, directory: Path, max_depth: int) -> dict[str, Any]:
+        """Build the ``list_files`` tree structure for ``directory``."""
+        result: dict[str, Any] = {
+            "name": directory.name,
+            "type": "directory",
+            "children": [],
+        }
+        if max_depth <= 0:
+            result["truncated"] = True
+            return result
+        try:
+            entries = self.listdir(directory)
+        except PermissionError:
+            return {
+                "name": directory.name,
+                "type": "directory",
+                "error": "Permission denied",
+            }
+        for entry in entries:
+            if entry.is_dir:
+                result["children"].append(
+                    self.tree(directory / entry.name, max_depth - 1)
+                )
+            else:
+                result["children"].append({"name": entry.name, "type": "file"})
+        return result
+
+    # -- invalidation and write hooks --------------------------------------
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop cached listings for ``path`` and everything below it.
+
+        With no argument the whole index is cleared.
+        """
+        with self._lock:
+            if path is None:
+                self._listings.clear()
+                self._size = 0
+                return
+            key = str(path)
+            prefix = key + os.sep
+            for stale in [
+                k for k in self._listings if k == key or k.startswith(prefix)
+            ]:
+                self._size -= len(self._listings.pop(stale).entries)
+
+    def record_change(self, path: Path) -> None:
+        """Bring the cached listing of ``path``'s parent up to date.
+
+        An in-place write leaves the parent's mtime alone, so the cached
+        entry is refreshed from a ``stat`` of the file.  A create, delete
+        or rename changes the parent's mtime; its listing is dropped and
+        rescanned on next use.  Removed directories are dropped entirely.
+        """
+        parent = str(path.parent)
+        with self._lock:
+            listing = self._listings.get(parent)
+        if listing is None:
+            self.invalidate(path)
+            return
+        try:
+            parent_mtime = os.stat(parent).st_mtime_ns
+            info = os.stat(path, follow_symlinks=False)
+        except OSError:
+            self.invalidate(path.parent)
+            return
+        if parent_mtime != listing.mtime_ns or stat.S_ISDIR(info.st_mode):
+            self.invalidate(path.parent)
+            return
+
+        updated = IndexEntry(
+            name=path.name,
+            is_dir=False,
+            is_symlink=stat.S_ISLNK(info.st_mode),
+            size=info.st_size,
+            mtime_ns=info.st_mtime_ns,
+        )
+        entries = [updated if e.name == path.name else e for e in listing.entries]
+        with self._lock:
+            if self._listings.get(parent) is listing:
+                listing.entries = entries
+
+
+_indexes: dict[Path, WorkspaceIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_workspace_index(path: Path) -> WorkspaceIndex | None:
+    """Return the index covering ``path``, or None if it is outside BASE_DIR."""
+    root = constants.BASE_DIR.resolve()
+    if not (path == root or root in path.parents):
+        return None
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = WorkspaceIndex(root)
+            logger.debug(f"Created workspace file index for {root}")
+        return index
+
+
+def index_for(path: Path) -> WorkspaceIndex:
+    """Return the shared index for ``path``, or a throwaway one outside BASE_DIR."""
+    return get_workspace_index(path) or WorkspaceIndex(path)
+
+
+def invalidate_workspace_index(path: Path | None = None) -> None:
+    """Drop cached listings under ``path`` (or everything) in every index."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        if path is None or path in index:
+            index.invalidate(path)
+
+
+def record_file_change(*paths: Path) -> None:
+    """Tell the workspace index that ``paths`` were written, created or removed."""
+    for path in paths:
+        index = get_workspace_index(path)
+        if index is not None:
+            index.record_change(path)
@@ -0,0 +1,263 @@
+"""Sparse line-offset index for paging through large files.
+
+Without an index, reading lines ``offset .. offset + n`` means scanning
+every line before ``offset``, and reporting ``total_lines`` means
+scanning the whole file again.  Paging through a multi-GB log is then
+quadratic in the file size.
+
+The index records, for every ``_BLOCK_BYTES`` block of the file, how
+many newlines come before it.  Building it is a single ``bytes.count``
+pass.  Locating line ``n`` is a bisect over the blocks followed by at
+most one block's worth of ``find`` calls.  The page itself is sliced out
+of an ``mmap`` for large files, so nothing before it is read.
+
+Lines are delimited by ``\\n`` (a trailing ``\\r`` is stripped), and a
+final line without a newline still counts, matching iteration over a
+text file.
+
+Indexes are cached in memory by ``(path, size, mtime, inode)``.  Indexes
+of files over ``ARIA_LINE_INDEX_PERSIST_MB`` are also written under
+``~/.aria/cache/line-index`` so they survive restarts.  Non-regular and
+empty files (``/proc`` entries, pipes) are not indexed; they are read
+line by line, and reading stops after the requested page.
+"""
+
+import hashlib
+import mmap
+import os
+import stat
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+
+from loguru import logger
+
+from aria.config import folders, get_optional_env
+
+PERSIST_MIN_BYTES = (
+    int(get_optional_env("ARIA_LINE_INDEX_PERSIST_MB", "64")) * 1024 * 1024
+)
+
+_BLOCK_BYTES = 64 * 1024
+_MMAP_MIN_BYTES = 1024 * 1024
+_MEMORY_CACHE_SIZE = 128
+_HEADER = struct.Struct("<8sQQQQQQ")
+_MAGIC = b"ARIALIX1"
+
+
+@dataclass(frozen=True)
+class LineIndex:
+    """Newline counts at fixed byte intervals for one version of a file."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    total_lines: int
+    block_bytes: int
+    # newlines_before[k] is the number of newlines in bytes [0, k * block_bytes)
+    newlines_before: array
+
+    def line_start(self, line: int) -> tuple[int, int]:
+        """Return ``(byte_offset, newlines_to_skip)`` to reach ``line``.
+
+        ``byte_offset`` is a block boundary at or before the start of
+        ``line``; skipping ``newlines_to_skip`` newlines from there lands
+        on it.
+        """
+        if line == 0:
+            return 0, 0
+        block = bisect_left(self.newlines_before, line) - 1
+        return block * self.block_bytes, line - self.newlines_before[block]
+
+
+_cache: OrderedDict[str, LineIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _build(path: Path, info: os.stat_result) -> LineIndex:
+    newlines_before = array("Q", [0])
+    total = 0
+    last = b""
+    with open(path, "rb") as f:
+        while block := f.read(_BLOCK_BYTES):
+            total += block.count(b"\n")
+            newlines_before.append(total)
+            last = block[-1:]
+    if last and last != b"\n":
+        total += 1
+    return LineIndex(
+        size=info.st_size,
+        mtime_ns=info.st_mtime_ns,
+        inode=info.st_ino,
+        total_lines=total,
+        block_bytes=_BLOCK_BYTES,
+        newlines_before=newlines_before,
+    )
+
+
+def _disk_path(path: Path) -> Path:
+    digest = hashlib.sha1(str(path).encode(), usedforsecurity=False).hexdigest()
+    return folders.Cache.path / "line-index" / f"{digest}.idx"
+
+
+def _load(path: Path, info: os.stat_result) -> LineIndex | None:
+    try:
+        with open(_disk_path(path), "rb") as f:
+            header = f.read(_HEADER.size)
+            magic, size, mtime_ns, inode, total, block_bytes, count = _HEADER.unpack(
+                header
+            )
+            if (magic, size, mtime_ns, inode) != (
+                _MAGIC,
+                info.st_size,
+                info.st_mtime_ns,
+                info.st_ino,
+            ):
+                return None
+            newlines_before = array("Q")
+            newlines_before.fromfile(f, count)
+    except (OSError, EOFError, struct.error):
+        return None
+    return LineIndex(size, mtime_ns, inode, total, block_bytes, newlines_before)
+
+
+def _save(path: Path, index: LineIndex) -> None:
+    target = _disk_path(path)
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    index.size,
+                    index.mtime_ns,
+                    index.inode,
+                    index.total_lines,
+                    index.block_bytes,
+                    len(index.newlines_before),
+                )
+            )
+            index.newlines_before.tofile(f)
+        os.replace(tmp, target)
+    except OSError as exc:
+        logger.debug(f"Could not persist line index for {path}: {exc}")
+        tmp.unlink(missing_ok=True)
+
+
+def get_line_index(path: Path, info: os.stat_result | None = None) -> LineIndex:
+    """Return an up-to-date line index for the regular file at ``path``."""
+    info = info or os.stat(path)
+    key = str(path)
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None and (index.size, index.mtime_ns, index.inode) == (
+            info.st_size,
+            info.st_mtime_ns,
+            info.st_ino,
+        ):
+            _cache.move_to_end(key)
+            return index
+
+    persist = info.st_size >= PERSIST_MIN_BYTES
+    index = _load(path, info) if persist else None
+    if index is None:
+        index = _build(path, info)
+        if persist:
+            _save(path, index)
+
+    with _cache_lock:
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > _MEMORY_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
+
+
+def clear_line_index_cache() -> None:
+    """Drop all in-memory line indexes (on-disk ones are revalidated on load)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _indexable(info: os.stat_result) -> bool:
+    return stat.S_ISREG(info.st_mode) and info.st_size > 0
+
+
+def _split(data: bytes) -> list[str]:
+    text = data.decode("utf-8")
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [line.rstrip("\r") for line in lines]
+
+
+def _slice_lines(buf, start: int, skip: int, length: int) -> list[str]:
+    """Cut ``length`` lines (0 = all) out of ``buf`` after skipping ``skip``."""
+    pos = start
+    for _ in range(skip):
+        nl = buf.find(b"\n", pos)
+        if nl < 0:
+            return []
+        pos = nl + 1
+    end = len(buf)
+    if length > 0:
+        end = pos
+        for _ in range(length):
+            nl = buf.find(b"\n", end)
+            if nl < 0:
+                end = len(buf)
+                break
+            end = nl + 1
+    if pos >= end:
+        return []
+    return _split(buf[pos:end])
+
+
+def count_lines(path: Path) -> int:
+    """Return the number of lines in ``path``."""
+    info = os.stat(path)
+    if _indexable(info):
+        return get_line_index(path, info).total_lines
+
+    count = 0
+    last = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(_BLOCK_BYTES):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    return count + (1 if last and last != b"\n" else 0)
+
+
+def read_lines(path: Path, offset: int, length: int) -> list[str]:
+    """Return lines ``offset .. offset + length`` of ``path`` (0 = to the end).
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the returned lines are not valid UTF-8.
+    """
+    info = os.stat(path)
+    if not _indexable(info):
+        with open(path, "rb") as f:
+            stop = offset + length if length > 0 else None
+            return [
+                line.decode("utf-8").removesuffix("\n").rstrip("\r")
+                for line in islice(f, offset, stop)
+            ]
+
+    index = get_line_index(path, info)
+    if offset >= index.total_lines:
+        return []
+    start, skip = index.line_start(offset)
+
+    with open(path, "rb") as f:
+        if info.st_size < _MMAP_MIN_BYTES:
+            f.seek(start)
+            return _slice_lines(f.read(), 0, skip, length)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _slice_lines(mm, start, skip, length)
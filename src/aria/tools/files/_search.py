@@ -0,0 +1,528 @@
+"""Streaming, parallel content search for ``search_files``.
+
+The directory walk is a lazy ``os.scandir`` traversal that prunes paths
+ignored by ``.gitignore`` files (and always skips ``.git``), so results
+start flowing before the whole tree has been listed.  Files are searched
+in a thread pool: each worker maps the file, skips it if the first block
+contains a NUL byte (binary), and runs the regex over large decoded
+chunks instead of line by line.  Lines are only split out where the
+chunk-level scan finds a hit, and context lines are sliced from the
+already-decoded chunk (or completed from the next one) only for emitted
+matches.  The search stops scheduling work once ``max_results`` matches
+have been collected.
+"""
+
+import mmap
+import os
+import re
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aria.config import get_optional_env
+from aria.tools.files.constants import BLOCKED_EXTENSIONS
+
+SEARCH_WORKERS = int(
+    get_optional_env("ARIA_SEARCH_WORKERS", str(min(8, (os.cpu_count() or 1) + 4)))
+)
+
+# Bytes inspected for NUL to decide a file is binary (same heuristic as git).
+_BINARY_SNIFF_BYTES = 8192
+# Decoded and scanned at once; chunks always end on a newline.
+_CHUNK_BYTES = 4 * 1024 * 1024
+# Files handed to a worker per task; amortises executor overhead.
+_BATCH_FILES = 32
+_ALWAYS_SKIPPED_DIRS = frozenset({".git"})
+
+
+# ---------------------------------------------------------------------------
+# .gitignore matching
+# ---------------------------------------------------------------------------
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regex (without anchors)."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                before_ok = i == 0 or pattern[i - 1] == "/"
+                after = pattern[i + 2 : i + 3]
+                if before_ok and after == "/":
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if before_ok and after == "":
+                    out.append(".*")
+                    i += 2
+                    continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace('\\', '\\\\')}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+def _parse_gitignore(text: str) -> list[_IgnoreRule]:
+    rules = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # A slash anywhere but the end anchors the pattern to its directory.
+        if "/" in line:
+            expr = _glob_to_regex(line.lstrip("/"))
+        else:
+            expr = "(?:.*/)?" + _glob_to_regex(line)
+        rules.append(_IgnoreRule(re.compile(expr + r"\Z"), negated, dir_only))
+    return rules
+
+
+@dataclass
+class _IgnoreScope:
+    """Rules from one ``.gitignore`` and the directory they apply to."""
+
+    base: str
+    rules: list[_IgnoreRule]
+
+
+def _is_ignored(scopes: list[_IgnoreScope], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    # Deeper .gitignore files and later rules take precedence.
+    for scope in scopes:
+        if scope.base:
+            if not rel_path.startswith(scope.base + "/"):
+                continue
+            local = rel_path[len(scope.base) + 1 :]
+        else:
+            local = rel_path
+        for rule in scope.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(local):
+                ignored = not rule.negated
+    return ignored
+
+
+def _load_scope(directory: str, rel_dir: str) -> _IgnoreScope | None:
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8") as f:
+            rules = _parse_gitignore(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+    return _IgnoreScope(rel_dir, rules) if rules else None
+
+
+def iter_files(
+    root: Path,
+    file_pattern: str = "**/*",
+    recursive: bool = True,
+    respect_gitignore: bool = True,
+) -> Iterator[tuple[str, str]]:
+    """Lazily yield ``(path, relative_path)`` strings for files under ``root``.
+
+    ``file_pattern`` follows ``Path.rglob`` semantics when ``recursive``
+    (the pattern may match at any depth) and ``Path.glob`` otherwise.
+    Symlinked directories are not followed.  Entries are yielded in
+    name order within each directory.
+    """
+    pattern = file_pattern or "**/*"
+    if recursive:
+        file_re = re.compile("(?:.*/)?" + _glob_to_regex(pattern) + r"\Z")
+    else:
+        file_re = re.compile(_glob_to_regex(pattern) + r"\Z")
+
+    root_str = str(root)
+    stack: list[tuple[str, str, list[_IgnoreScope]]] = [(root_str, "", [])]
+    while stack:
+        directory, rel_dir, scopes = stack.pop()
+        if respect_gitignore:
+            scope = _load_scope(directory, rel_dir)
+            if scope is not None:
+                scopes = [*scopes, scope]
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                if not recursive or entry.name in _ALWAYS_SKIPPED_DIRS:
+                    continue
+                if scopes and _is_ignored(scopes, rel_path, True):
+                    continue
+                subdirs.append((entry.path, rel_path, scopes))
+            elif is_file and file_re.match(rel_path):
+                if scopes and _is_ignored(scopes, rel_path, False):
+                    continue
+                yield entry.path, rel_path
+        # Reversed so the stack pops subdirectories in name order.
+        stack.extend(reversed(subdirs))
+
+
+# ---------------------------------------------------------------------------
+# Per-file scanning
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _FileResult:
+    matches: list[dict[str, Any]] = field(default_factory=list)
+    binary: bool = False
+    skipped: bool = False
+
+
+def _split_lines(text: str) -> list[str]:
+    if not text:
+        return []
+    return (text[:-1] if text.endswith("\n") else text).split("\n")
+
+
+def _last_lines(text: str, count: int) -> list[str]:
+    if not text or count <= 0:
+        return []
+    body = text[:-1] if text.endswith("\n") else text
+    return body.rsplit("\n", count)[-count:]
+
+
+def _line_matches(regex: re.Pattern[str], line: str) -> bool:
+    """Test *line* (with its newline) against *regex*.
+
+    A match starting after the newline (``^$`` under ``re.MULTILINE``)
+    belongs to no line and is ignored.
+    """
+    hit = regex.search(line + "\n")
+    return hit is not None and hit.start() <= len(line)
+
+
+class _FileScanner:
+    """Scan one file chunk by chunk, emitting matches with context.
+
+    Chunks are fed in order and each ends on a line boundary.  Context
+    before a match may come from the previous chunk (kept in a small tail
+    buffer); context after a match that runs past the end of a chunk is
+    completed when the next chunk arrives.
+    """
+
+    def __init__(
+        self,
+        rel_path: str,
+        regex: re.Pattern[str],
+        scan_regex: re.Pattern[str],
+        context_lines: int,
+        limit: int,
+    ):
+        self.rel_path = rel_path
+        self.regex = regex
+        self.scan_regex = scan_regex
+        self.context_lines = context_lines
+        self.limit = limit
+        self.matches: list[dict[str, Any]] = []
+        self.awaiting: list[dict[str, Any]] = []
+        self._tail: list[str] = []
+        self._line_base = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.matches) >= self.limit
+
+    def feed(self, text: str, final: bool) -> None:
+        lines: list[str] | None = None
+        if self.awaiting:
+            lines = _split_lines(text)
+            self._complete_awaiting(lines)
+
+        pos = counted_to = 0
+        line_index = 0
+        while not self.full and pos < len(text):
+            hit = self.scan_regex.search(text, pos)
+            if hit is None:
+                break
+            if hit.start() == len(text) and text.endswith("\n"):
+                # An empty match after the last newline is not a line:
+                # the file (or the next chunk's first line) starts there.
+                break
+            start = text.rfind("\n", 0, hit.start()) + 1
+            end = text.find("\n", hit.start())
+            if end == -1:
+                end = len(text)
+            line_index += text.count("\n", counted_to, start)
+            counted_to = start
+            line = text[start:end]
+            # The chunk-wide scan can match across a newline; the caller's
+            # per-line regex decides whether this line really matches.
+            if _line_matches(self.regex, line):
+                if lines is None:
+                    lines = _split_lines(text)
+                self._emit(lines, line_index, line)
+            pos = end + 1
+
+        if final:
+            return
+        if lines is not None:
+            line_count = len(lines)
+            self._tail = lines[-self.context_lines :] if self.context_lines else []
+        else:
+            line_count = text.count("\n") + (0 if text.endswith("\n") else 1)
+            self._tail = _last_lines(text, self.context_lines)
+        self._line_base += line_count
+
+    def _emit(self, lines: list[str], index: int, line: str) -> None:
+        ctx = self.context_lines
+        before = lines[max(0, index - ctx) : index]
+        if len(before) < ctx and self._tail:
+            before = self._tail[len(self._tail) - (ctx - len(before)) :] + before
+        match = {
+            "file": self.rel_path,
+            "line_number": self._line_base + index + 1,
+            "line_content": line,
+            "context_before": before,
+            "context_after": lines[index + 1 : index + 1 + ctx],
+        }
+        self.matches.append(match)
+        if len(match["context_after"]) < ctx:
+            self.awaiting.append(match)
+
+    def _complete_awaiting(self, lines: list[str]) -> None:
+        still_waiting = []
+        for match in self.awaiting:
+            after = match["context_after"]
+            after.extend(lines[: self.context_lines - len(after)])
+            if len(after) < self.context_lines:
+                still_waiting.append(match)
+        self.awaiting = still_waiting
+
+
+def _scan_file(
+    path: str,
+    rel_path: str,
+    regex: re.Pattern[str],
+    scan_regex: re.Pattern[str],
+    context_lines: int,
+    limit: int,
+    stop: threading.Event,
+) -> _FileResult:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return _FileResult(skipped=True)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return _FileResult()
+        scanner = _FileScanner(rel_path, regex, scan_regex, context_lines, limit)
+        if size <= _CHUNK_BYTES:
+            data = os.read(fd, size)
+            if b"\x00" in data[:_BINARY_SNIFF_BYTES]:
+                return _FileResult(binary=True)
+            scanner.feed(_decode(data), final=True)
+            return _FileResult(matches=scanner.matches)
+
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            if b"\x00" in mapped[:_BINARY_SNIFF_BYTES]:
+                return _FileResult(binary=True)
+            offset = 0
+            # Keep reading after the limit only to finish context_after.
+            while offset < size and (not scanner.full or scanner.awaiting):
+                if stop.is_set():
+                    break
+                end = min(offset + _CHUNK_BYTES, size)
+                if end < size:
+                    newline = mapped.find(b"\n", end)
+                    end = size if newline == -1 else newline + 1
+                scanner.feed(_decode(mapped[offset:end]), final=end >= size)
+                offset = end
+        return _FileResult(matches=scanner.matches)
+    except (OSError, ValueError):
+        return _FileResult(skipped=True)
+    finally:
+        os.close(fd)
+
+
+def _decode(data: bytes) -> str:
+    text = data.decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n") if "\r" in text else text
+
+
+def _scan_batch(
+    batch: list[tuple[str, str]],
+    regex: re.Pattern[str],
+    scan_regex: re.Pattern[str],
+    context_lines: int,
+    limit: int,
+    stop: threading.Event,
+) -> list[_FileResult]:
+    results = []
+    for path, rel_path in batch:
+        if stop.is_set():
+            break
+        results.append(
+            _scan_file(path, rel_path, regex, scan_regex, context_lines, limit, stop)
+        )
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Public entry point
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ContentSearchResult:
+    """Outcome of :func:`search_content`."""
+
+    matches: list[dict[str, Any]]
+    files_searched: int
+    binary_files_skipped: int
+    truncated: bool
+
+
+def search_content(
+    root: Path,
+    regex: re.Pattern[str],
+    file_pattern: str = "**/*",
+    recursive: bool = True,
+    max_results: int = 500,
+    context_lines: int = 2,
+    workers: int = SEARCH_WORKERS,
+) -> ContentSearchResult:
+    """Search file contents under ``root`` for ``regex``.
+
+    Matches are returned in walk order (files in name order, lines in file
+    order), exactly as a sequential search would produce them.
+
+    Args:
+        root: Directory to search.
+        regex: Compiled pattern, applied to each line.
+        file_pattern: Glob filter for files.
+        recursive: Descend into subdirectories.
+        max_results: Stop after this many matches.
+        context_lines: Lines of context before and after each match.
+        workers: Size of the thread pool.
+
+    Returns:
+        The matches, the number of files whose content was searched, the
+        number of binary files skipped, and whether the result was cut off
+        by ``max_results``.
+    """
+    matches: list[dict[str, Any]] = []
+    files_searched = 0
+    binary_skipped = 0
+    if max_results <= 0:
+        return ContentSearchResult(matches, 0, 0, truncated=True)
+
+    context_lines = max(0, context_lines)
+    scan_regex = re.compile(regex.pattern, regex.flags | re.MULTILINE)
+    stop = threading.Event()
+    window = max(1, workers) * 4
+    pending: deque[Future[list[_FileResult]]] = deque()
+
+    def consume(results: list[_FileResult]) -> None:
+        nonlocal files_searched, binary_skipped
+        for result in results:
+            if len(matches) >= max_results:
+                return
+            if result.binary:
+                binary_skipped += 1
+            elif not result.skipped:
+                files_searched += 1
+                matches.extend(result.matches[: max_results - len(matches)])
+
+    def drain(block: bool) -> None:
+        # Results are consumed in submission order to keep output stable.
+        while pending and len(matches) < max_results:
+            if not block and len(pending) < window and not pending[0].done():
+                return
+            consume(pending.popleft().result())
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="search"
+    ) as pool:
+        batch: list[tuple[str, str]] = []
+        for path, rel in iter_files(root, file_pattern, recursive):
+            if os.path.splitext(rel)[1].lower() in BLOCKED_EXTENSIONS:
+                continue
+            batch.append((path, rel))
+            if len(batch) < _BATCH_FILES:
+                continue
+            pending.append(
+                pool.submit(
+                    _scan_batch,
+                    batch,
+                    regex,
+                    scan_regex,
+                    context_lines,
+                    max_results,
+                    stop,
+                )
+            )
+            batch = []
+            drain(block=False)
+            if len(matches) >= max_results:
+                break
+        else:
+            if batch:
+                pending.append(
+                    pool.submit(
+                        _scan_batch,
+                        batch,
+                        regex,
+                        scan_regex,
+                        context_lines,
+                        max_results,
+                        stop,
+                    )
+                )
+        drain(block=True)
+
+        truncated = len(matches) >= max_results
+        stop.set()
+        for future in pending:
+            future.cancel()
+
+    return ContentSearchResult(matches, files_searched, binary_skipped, truncated)
@@ -6,6 +6,7 @@ from loguru import logger
 
 from aria.tools import Reason
 from aria.tools.decorators import tool_function
+from aria.tools.files._index import record_file_change
 from aria.tools.files._internals import (
     _create_backup,
     validate_and_resolve_file,
@@ -60,6 +61,7 @@ def copy_file(
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
     copy2(source_path, dest_path)
+    record_file_change(dest_path)
     bytes_copied = dest_path.stat().st_size
 
     # Build and return response
@@ -110,6 +112,7 @@ def delete_file(reason: Reason, file_name: str) -> str:
 
     # Delete file
     resolved_path.unlink()
+    record_file_change(resolved_path)
 
     # Build and return response
     data = {
@@ -162,6 +165,7 @@ def rename_file(reason: Reason, old_name: str, new_name: str) -> str:
     # Create parent directories and rename
     new_path.parent.mkdir(parents=True, exist_ok=True)
     old_path.rename(new_path)
+    record_file_change(old_path, new_path)
 
     # Build and return response
     data = {
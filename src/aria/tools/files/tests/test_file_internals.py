@@ -556,9 +556,9 @@ class TestBuildDirectoryTree:
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir_path = Path(tmpdir)
 
-            # Mock iterdir to raise PermissionError
-            with patch.object(Path, "iterdir") as mock_iterdir:
-                mock_iterdir.side_effect = PermissionError("Access denied")
+            # Mock scandir to raise PermissionError
+            with patch("aria.tools.files._index.os.scandir") as mock_scandir:
+                mock_scandir.side_effect = PermissionError("Access denied")
                 tree = _build_directory_tree(tmpdir_path, 0, 2)
                 assert tree["type"] == "directory"
                 assert tree["error"] == "Permission denied"
@@ -0,0 +1,179 @@
+"""Tests for the in-memory workspace file index."""
+
+import json
+import os
+import time
+
+import pytest
+
+from aria.tools import constants
+from aria.tools.files._index import (
+    WorkspaceIndex,
+    get_workspace_index,
+    invalidate_workspace_index,
+)
+from aria.tools.files.unified_read import list_files, search_files
+from aria.tools.files.write_operations import write_file
+
+
+def _backdate(*paths):
+    """Move mtimes out of the racy window so listings are cacheable."""
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    tmp_path = tmp_path / "tree"
+    tmp_path.mkdir()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print(1)\n")
+    (tmp_path / "src" / "deep").mkdir()
+    (tmp_path / "src" / "deep" / "x.txt").write_text("x")
+    (tmp_path / "README.md").write_text("hi")
+    _backdate(tmp_path, tmp_path / "src", tmp_path / "src" / "deep")
+    return tmp_path
+
+
+class TestWorkspaceIndex:
+    def test_walk_order(self, tree):
+        index = WorkspaceIndex(tree)
+        assert [rel for rel, _ in index.walk(tree)] == [
+            "README.md",
+            "src",
+            "src/app.py",
+            "src/deep",
+            "src/deep/x.txt",
+        ]
+        assert [rel for rel, _ in index.walk(tree, recursive=False)] == [
+            "README.md",
+            "src",
+        ]
+
+    def test_does_not_enter_symlinked_directories(self, tree):
+        (tree / "link").symlink_to(tree / "src")
+        index = WorkspaceIndex(tree)
+        rels = [rel for rel, _ in index.walk(tree)]
+        assert "link" in rels
+        assert not any(rel.startswith("link/") for rel in rels)
+
+    def test_unchanged_directories_are_served_from_cache(self, tree):
+        index = WorkspaceIndex(tree)
+        list(index.walk(tree))
+        scans = index.scans
+
+        list(index.walk(tree))
+        assert index.scans == scans
+        assert index.hits == 3
+
+    def test_directory_mtime_change_triggers_rescan(self, tree):
+        index = WorkspaceIndex(tree)
+        list(index.walk(tree))
+
+        (tree / "src" / "new.py").write_text("")
+        rels = [rel for rel, _ in index.walk(tree)]
+        assert "src/new.py" in rels
+
+    def test_recently_modified_directory_is_not_trusted(self, tmp_path):
+        tmp_path = tmp_path / "fresh"
+        tmp_path.mkdir()
+        (tmp_path / "a.txt").write_text("")
+        index = WorkspaceIndex(tmp_path)
+        index.listdir(tmp_path)
+        index.listdir(tmp_path)
+        assert index.scans == 2
+        assert index.hits == 0
+
+    def test_record_change_refreshes_in_place_write(self, tree):
+        index = WorkspaceIndex(tree)
+        index.listdir(tree / "src")
+
+        (tree / "src" / "app.py").write_text("print('longer')\n")
+        index.record_change(tree / "src" / "app.py")
+
+        entry = next(e for e in index.listdir(tree / "src") if e.name == "app.py")
+        assert entry.size == len("print('longer')\n")
+        assert index.scans == 1
+
+    def test_record_change_drops_listing_after_delete(self, tree):
+        index = WorkspaceIndex(tree)
+        index.listdir(tree)
+
+        (tree / "README.md").unlink()
+        index.record_change(tree / "README.md")
+
+        assert [e.name for e in index.listdir(tree)] == ["src"]
+
+    def test_invalidate_subtree(self, tree):
+        index = WorkspaceIndex(tree)
+        list(index.walk(tree))
+
+        index.invalidate(tree / "src")
+        scans = index.scans
+        list(index.walk(tree))
+        assert index.scans == scans + 2
+
+    def test_memory_is_bounded(self, tmp_path):
+        tmp_path = tmp_path / "big"
+        tmp_path.mkdir()
+        for d in range(10):
+            sub = tmp_path / f"d{d}"
+            sub.mkdir()
+            for f in range(5):
+                (sub / f"f{f}").write_text("")
+            _backdate(sub)
+        _backdate(tmp_path)
+
+        index = WorkspaceIndex(tmp_path, max_entries=12)
+        assert len(list(index.walk(tmp_path))) == 60
+        assert index._size <= 12
+
+    def test_tree_structure(self, tree):
+        result = WorkspaceIndex(tree).tree(tree, max_depth=2)
+        src = result["children"][1]
+        assert result["children"][0] == {"name": "README.md", "type": "file"}
+        assert src["children"][0] == {"name": "app.py", "type": "file"}
+        assert src["children"][1] == {
+            "name": "deep",
+            "type": "directory",
+            "children": [],
+            "truncated": True,
+        }
+
+
+class TestSharedIndex:
+    def test_only_paths_inside_base_dir_are_indexed(self, tmp_path):
+        base = constants.BASE_DIR.resolve()
+        assert get_workspace_index(base / "sub") is get_workspace_index(base)
+        assert get_workspace_index(tmp_path) is None
+
+    def test_invalidate_workspace_index(self):
+        base = constants.BASE_DIR.resolve()
+        index = get_workspace_index(base)
+        _backdate(base)
+        index.listdir(base)
+
+        invalidate_workspace_index()
+        assert str(base) not in index._listings
+
+    def test_file_tools_see_their_own_writes(self):
+        base = constants.BASE_DIR.resolve()
+        (base / "pkg").mkdir()
+        (base / "pkg" / "a.py").write_text("")
+        _backdate(base, base / "pkg")
+
+        found = json.loads(
+            list_files(reason="test", path=str(base / "pkg"), pattern="*.py")
+        )
+        assert found["data"]["result"]["files"] == ["a.py"]
+
+        write_file(reason="test", file_name=str(base / "pkg/b.py"), contents="x = 1\n")
+        found = json.loads(
+            search_files(reason="test", pattern=r"\.py$", path=str(base / "pkg"))
+        )
+        assert found["data"]["result"]["matches"] == ["a.py", "b.py"]
+
+        index = get_workspace_index(base)
+        entry = next(e for e in index.listdir(base / "pkg") if e.name == "b.py")
+        assert entry.size == len("x = 1\n")
@@ -0,0 +1,126 @@
+"""Tests for the sparse line-offset index."""
+
+import os
+import random
+import threading
+
+import pytest
+
+from aria.tools.files import _line_index
+from aria.tools.files._line_index import (
+    clear_line_index_cache,
+    count_lines,
+    get_line_index,
+    read_lines,
+)
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    """Use tiny blocks so lines straddle block boundaries."""
+    monkeypatch.setattr(_line_index, "_BLOCK_BYTES", 16)
+    clear_line_index_cache()
+    yield
+    clear_line_index_cache()
+
+
+def _reference(text: str, offset: int, length: int) -> list[str]:
+    lines = [line.rstrip("\r") for line in text.split("\n")]
+    if lines[-1] == "":
+        lines.pop()
+    return lines[offset : offset + length] if length else lines[offset:]
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_pages_match_reference(tmp_path, monkeypatch, use_mmap):
+    if use_mmap:
+        monkeypatch.setattr(_line_index, "_MMAP_MIN_BYTES", 0)
+    rng = random.Random(3)
+    lines = ["x" * rng.randint(0, 40) for _ in range(300)]
+    text = "\n".join(lines)  # no trailing newline
+    path = tmp_path / "data.txt"
+    path.write_text(text)
+
+    assert count_lines(path) == 300
+    for offset in (0, 1, 17, 150, 299, 300, 500):
+        for length in (0, 1, 7, 200):
+            assert read_lines(path, offset, length) == _reference(text, offset, length)
+
+
+def test_crlf_and_unicode(tmp_path):
+    path = tmp_path / "win.txt"
+    path.write_bytes("één\r\ntwee\r\ndrie\r\n".encode())
+    assert count_lines(path) == 3
+    assert read_lines(path, 1, 2) == ["twee", "drie"]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert count_lines(path) == 0
+    assert read_lines(path, 0, 10) == []
+
+
+def test_index_is_rebuilt_when_file_changes(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("a\nb\n")
+    first = get_line_index(path)
+    assert get_line_index(path) is first
+
+    with open(path, "a") as f:
+        f.write("c\n")
+    assert count_lines(path) == 3
+    assert read_lines(path, 2, 1) == ["c"]
+
+
+def test_large_indexes_are_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(_line_index, "PERSIST_MIN_BYTES", 0)
+    path = tmp_path / "big.log"
+    path.write_text("".join(f"line {i}\n" for i in range(100)))
+    assert count_lines(path) == 100
+    assert _line_index._disk_path(path).exists()
+
+    clear_line_index_cache()
+
+    def fail(*args):
+        raise AssertionError("index should be loaded from disk")
+
+    monkeypatch.setattr(_line_index, "_build", fail)
+    assert read_lines(path, 42, 2) == ["line 42", "line 43"]
+
+
+def test_stale_persisted_index_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(_line_index, "PERSIST_MIN_BYTES", 0)
+    path = tmp_path / "big.log"
+    path.write_text("a\nb\n")
+    count_lines(path)
+    clear_line_index_cache()
+
+    path.write_text("a\nb\nc\nd\n")
+    os.utime(path, ns=(0, 123))
+    assert count_lines(path) == 4
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_pipe_is_streamed_up_to_the_page(tmp_path):
+    fifo = tmp_path / "pipe"
+    os.mkfifo(fifo)
+    done = threading.Event()
+    closing = threading.Event()
+
+    def writer():
+        with open(fifo, "wb") as f:
+            f.write(b"".join(f"line {i}\r\n".encode() for i in range(10)))
+            f.flush()
+            # Keep the pipe open: reading must not wait for EOF.
+            done.wait(5)
+            closing.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        assert read_lines(fifo, 2, 3) == ["line 2", "line 3", "line 4"]
+        assert not closing.is_set()
+    finally:
+        done.set()
+        thread.join()
@@ -0,0 +1,197 @@
+"""Tests for the streaming content search engine."""
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from aria.tools.files import _search
+from aria.tools.files._search import iter_files, search_content
+
+
+def _naive_search(root, regex, context):
+    """Reference implementation: read every file and test each line."""
+    matches = []
+    for path, rel in iter_files(root):
+        lines = Path(path).read_text().split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        for i, line in enumerate(lines):
+            # Matches after the line's newline (``^$``) belong to no line.
+            hit = regex.search(line + "\n")
+            if hit and hit.start() <= len(line):
+                matches.append(
+                    {
+                        "file": rel,
+                        "line_number": i + 1,
+                        "line_content": line,
+                        "context_before": lines[max(0, i - context) : i],
+                        "context_after": lines[i + 1 : i + 1 + context],
+                    }
+                )
+    return matches
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("import os\nTODO: fix\nprint(1)\n")
+    (tmp_path / "src" / "util.py").write_text("def f():\n    # TODO later\n")
+    (tmp_path / "notes.md").write_text("TODO list\n")
+    return tmp_path
+
+
+class TestIterFiles:
+    def test_walks_in_name_order(self, tree):
+        rels = [rel for _, rel in iter_files(tree)]
+        assert rels == ["notes.md", "src/app.py", "src/util.py"]
+
+    def test_file_pattern_matches_at_any_depth(self, tree):
+        assert [rel for _, rel in iter_files(tree, "*.py")] == [
+            "src/app.py",
+            "src/util.py",
+        ]
+
+    def test_non_recursive(self, tree):
+        assert [rel for _, rel in iter_files(tree, recursive=False)] == ["notes.md"]
+
+    def test_honours_gitignore(self, tree):
+        (tree / ".gitignore").write_text("build/\n*.log\n!keep.log\n/notes.md\n")
+        (tree / "build").mkdir()
+        (tree / "build" / "out.py").write_text("x")
+        (tree / "debug.log").write_text("x")
+        (tree / "keep.log").write_text("x")
+        (tree / "src" / "notes.md").write_text("x")
+
+        rels = {rel for _, rel in iter_files(tree)}
+        assert "build/out.py" not in rels
+        assert "debug.log" not in rels
+        assert "keep.log" in rels
+        # Anchored pattern only applies at the .gitignore's own level.
+        assert "notes.md" not in rels
+        assert "src/notes.md" in rels
+
+    def test_nested_gitignore_is_scoped(self, tree):
+        (tree / "src" / ".gitignore").write_text("util.py\n")
+        (tree / "util.py").write_text("x")
+
+        rels = {rel for _, rel in iter_files(tree)}
+        assert "src/util.py" not in rels
+        assert "util.py" in rels
+
+    def test_skips_git_directory(self, tree):
+        (tree / ".git").mkdir()
+        (tree / ".git" / "config").write_text("TODO")
+        assert all(not rel.startswith(".git/") for _, rel in iter_files(tree))
+
+
+class TestSearchContent:
+    def test_matches_with_context(self, tree):
+        result = search_content(tree, re.compile("TODO"), context_lines=1)
+        assert [(m["file"], m["line_number"]) for m in result.matches] == [
+            ("notes.md", 1),
+            ("src/app.py", 2),
+            ("src/util.py", 2),
+        ]
+        app = result.matches[1]
+        assert app["context_before"] == ["import os"]
+        assert app["context_after"] == ["print(1)"]
+        assert result.files_searched == 3
+        assert not result.truncated
+
+    def test_skips_binary_files(self, tree):
+        (tree / "blob.dat").write_bytes(b"TODO\x00\x01\x02")
+        result = search_content(tree, re.compile("TODO"))
+        assert all(m["file"] != "blob.dat" for m in result.matches)
+        assert result.binary_files_skipped == 1
+
+    def test_stops_at_max_results(self, tmp_path):
+        for i in range(50):
+            (tmp_path / f"f{i:02}.txt").write_text("hit\nhit\n")
+
+        result = search_content(tmp_path, re.compile("hit"), max_results=5)
+        assert len(result.matches) == 5
+        assert result.truncated
+        assert result.files_searched < 50
+        assert [m["file"] for m in result.matches] == [
+            "f00.txt",
+            "f00.txt",
+            "f01.txt",
+            "f01.txt",
+            "f02.txt",
+        ]
+
+    def test_searches_files_larger_than_old_limit(self, tmp_path):
+        big = tmp_path / "big.txt"
+        big.write_text("filler line\n" * 200_000 + "needle\n")
+
+        result = search_content(tmp_path, re.compile("needle"))
+        assert result.matches[0]["line_number"] == 200_001
+
+    def test_context_across_chunk_boundaries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_search, "_CHUNK_BYTES", 16)
+        lines = [f"line {i}" for i in range(40)]
+        lines[10] = lines[25] = "match here"
+        (tmp_path / "a.txt").write_text("\n".join(lines) + "\n")
+
+        result = search_content(tmp_path, re.compile("match"), context_lines=3)
+        assert result.matches == _naive_search(tmp_path, re.compile("match"), 3)
+
+    def test_empty_line_pattern_ignores_end_of_file(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\ny = 2\n")
+        result = search_content(tmp_path, re.compile(r"^$", re.M))
+        assert result.matches == []
+
+    def test_empty_line_pattern_at_chunk_boundaries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_search, "_CHUNK_BYTES", 16)
+        lines = [f"line {i}" for i in range(40)]
+        lines[7] = lines[21] = ""
+        (tmp_path / "a.txt").write_text("\n".join(lines) + "\n")
+
+        regex = re.compile(r"^\s*$", re.M)
+        result = search_content(tmp_path, regex, context_lines=2)
+        assert [m["line_number"] for m in result.matches] == [8, 22]
+        assert result.matches == _naive_search(tmp_path, regex, 2)
+
+    def test_match_straddling_chunk_boundary(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_search, "_CHUNK_BYTES", 16)
+        # The 16-byte boundary falls inside the long matching line.
+        (tmp_path / "a.txt").write_text("short\nneedle in a long line\nafter\n" * 3)
+
+        regex = re.compile("needle")
+        result = search_content(tmp_path, regex, context_lines=1)
+        assert [m["line_number"] for m in result.matches] == [2, 5, 8]
+        assert result.matches == _naive_search(tmp_path, regex, 1)
+
+    def test_crlf_line_endings(self, tmp_path):
+        (tmp_path / "win.txt").write_bytes(b"one\r\ntwo end\r\nthree\r\n")
+        result = search_content(tmp_path, re.compile("end$"), context_lines=1)
+        assert len(result.matches) == 1
+        assert result.matches[0]["line_content"] == "two end"
+        assert result.matches[0]["context_after"] == ["three"]
+
+    def test_regex_does_not_match_across_lines(self, tmp_path):
+        (tmp_path / "a.txt").write_text("foo\nbar\n")
+        result = search_content(tmp_path, re.compile(r"foo\s+bar"))
+        assert result.matches == []
+
+    def test_matches_reference_search(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_search, "_CHUNK_BYTES", 64)
+        rng = random.Random(7)
+        words = ["alpha", "beta", "gamma", "delta", ""]
+        for i in range(30):
+            sub = tmp_path / f"d{i % 4}"
+            sub.mkdir(exist_ok=True)
+            text = "\n".join(
+                " ".join(rng.choices(words, k=rng.randint(0, 4)))
+                for _ in range(rng.randint(0, 60))
+            )
+            (sub / f"f{i}.txt").write_text(text + ("\n" if i % 2 else ""))
+
+        regex = re.compile(r"^gamma|delta$")
+        result = search_content(
+            tmp_path, regex, max_results=10_000, context_lines=2, workers=3
+        )
+        assert result.matches == _naive_search(tmp_path, regex, 2)
+        assert result.files_searched == 30
@@ -18,12 +18,14 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from aria.tools import Reason
-from aria.tools.constants import BASE_DIR
 from aria.tools.decorators import tool_function
+from aria.tools.files._index import index_for
 from aria.tools.files._internals import (
     _secure_resolve_dir,
     _secure_resolve_path,
 )
+from aria.tools.files._line_index import count_lines, read_lines
+from aria.tools.files._search import _glob_to_regex, search_content
 from aria.tools.files.decorators import with_file_operation_error_handling
 from aria.tools.files.exceptions import FileOperationError
 from aria.tools.utils import _truncate_json
@@ -155,7 +157,7 @@ class SearchFilesSchema(BaseModel):
 
 
 def _read_lines_streaming(file_path: Path, offset: int, length: int) -> list[str]:
-    """Read lines from file using streaming.
+    """Read a range of lines using the file's line-offset index.
 
     Args:
         file_path: Path to the file
@@ -165,24 +167,15 @@ def _read_lines_streaming(file_path: Path, offset: int, length: int) -> list[str
     Returns:
         List[str]: Lines read from file (without newline characters)
     """
-    lines = []
     try:
-        with open(file_path, encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                if i < offset:
-                    continue
-                if length > 0 and i >= offset + length:
-                    break
-                lines.append(line.rstrip("\n\r"))
-        return lines
+        return read_lines(file_path, offset, length)
     except OSError as exc:
         raise FileOperationError(f"Failed to read file: {exc}") from exc
 
 
 def _count_lines_efficiently(file_path: Path) -> int:
-    """Memory-efficient line counting for large files.
+    """Count lines using the file's cached line-offset index.
 
-    Reads file in chunks to avoid loading entire file into memory.
     Counts the number of lines the same way iteration over a text file
     does: every ``\\n`` starts a new line, and a final chunk that does
     not end with ``\\n`` still counts as its own line.
@@ -199,18 +192,8 @@ def _count_lines_efficiently(file_path: Path) -> int:
     if file_path.is_dir():
         raise FileOperationError(f"Path is a directory, not a file: {file_path}")
 
-    count = 0
-    last_byte = b""
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                count += chunk.count(b"\n")
-                last_byte = chunk[-1:]
-        # If the file is non-empty and doesn't end with a newline,
-        # there is one more line that was not counted.
-        if last_byte and last_byte != b"\n":
-            count += 1
-        return count
+        return count_lines(file_path)
     except OSError as exc:
         raise FileOperationError(
             f"Failed to read file for line counting: {exc}"
@@ -220,7 +203,7 @@ def _count_lines_efficiently(file_path: Path) -> int:
 def _build_directory_tree(
     path: Path, current_depth: int, max_depth: int
 ) -> dict[str, Any]:
-    """Build directory tree structure recursively.
+    """Build directory tree structure from the workspace index.
 
     Args:
         path: Path to build tree from
@@ -230,28 +213,7 @@ def _build_directory_tree(
     Returns:
         Dict representing directory tree
     """
-    try:
-        result = {"name": path.name, "type": "directory", "children": []}
-
-        if current_depth >= max_depth:
-            result["truncated"] = True
-            return result
-
-        for child in sorted(path.iterdir()):
-            if child.is_dir():
-                result["children"].append(
-                    _build_directory_tree(child, current_depth + 1, max_depth)
-                )
-            else:
-                result["children"].append({"name": child.name, "type": "file"})
-
-        return result
-    except PermissionError:
-        return {
-            "name": path.name,
-            "type": "directory",
-            "error": "Permission denied",
-        }
+    return index_for(path).tree(path, max_depth - current_depth)
 
 
 def _count_tree_items(tree: dict[str, Any]) -> tuple[int, int]:
@@ -578,29 +540,25 @@ def list_files(
                 path=path_value,
             )
         else:
-            matches = list(
-                resolved_path.rglob(pattern_value)
-                if recursive_value
-                else resolved_path.glob(pattern_value)
+            # rglob semantics: a recursive pattern may match at any depth.
+            pattern_re = re.compile(
+                ("(?:.*/)?" if recursive_value else "")
+                + _glob_to_regex(pattern_value)
+                + r"\Z"
+            )
+            entries = index_for(resolved_path).walk(
+                resolved_path, recursive=recursive_value or "/" in pattern_value
             )
 
             files = []
-            for match in matches:
-                if match.is_file():
-                    try:
-                        try:
-                            rel_path = match.relative_to(resolved_path)
-                        except ValueError:
-                            rel_path = match.relative_to(BASE_DIR)
-                        files.append(str(rel_path))
-                        if len(files) >= max_results_value:
-                            break
-                    except ValueError:
-                        files.append(str(match))
-                        if len(files) >= max_results_value:
-                            break
-
-            truncated = len(matches) > max_results_value
+            truncated = False
+            for rel_path, entry in entries:
+                if entry.is_dir or not pattern_re.match(rel_path):
+                    continue
+                if len(files) >= max_results_value:
+                    truncated = True
+                    break
+                files.append(rel_path)
 
             return _ok(
                 tool="list_files",
@@ -644,7 +602,8 @@ def search_files(
     Args:
         reason: Required. Brief explanation of why you are searching files.
         pattern: Regex to match filenames or content.
-        mode: name|content (default: name).
+        mode: name|content (default: name). Content search skips binary
+            files and paths ignored by .gitignore.
         file_pattern: Glob filter for files (default: "**/*").
         recursive: Search recursively (default: True).
         max_results: Cap results (default: 500).
@@ -654,9 +613,6 @@ def search_files(
     Returns:
         JSON with matches[] (file, line, context), count.
     """
-    # Maximum file size for content search (1MB) to prevent RAM exhaustion
-    MAX_CONTENT_FILE_SIZE = 1024 * 1024
-
     mode_value = mode or "name"
     file_pattern_value = file_pattern or "**/*"
     recursive_value = True if recursive is None else recursive
@@ -694,19 +650,14 @@ def search_files(
 
         if mode_value == "name":
             matches = []
-            paths = (
-                resolved_path.rglob("*") if recursive_value else resolved_path.glob("*")
+            entries = index_for(resolved_path).walk(
+                resolved_path, recursive=recursive_value
             )
-
-            for file_path in paths:
-                if file_path.is_file() and regex.search(file_path.name):
-                    try:
-                        rel_path = file_path.relative_to(resolved_path)
-                        matches.append(str(rel_path))
-                        if len(matches) >= max_results_value:
-                            break
-                    except ValueError:
-                        continue
+            for rel_path, entry in entries:
+                if not entry.is_dir and regex.search(entry.name):
+                    matches.append(rel_path)
+                    if len(matches) >= max_results_value:
+                        break
 
             truncated = len(matches) >= max_results_value
 
@@ -725,92 +676,26 @@ def search_files(
             )
 
         elif mode_value == "content":
-            matches = []
-            files_searched = 0
-            max_files = 100
-
-            paths = list(
-                resolved_path.rglob(file_pattern_value)
-                if recursive_value
-                else resolved_path.glob(file_pattern_value)
+            search = search_content(
+                resolved_path,
+                regex,
+                file_pattern=file_pattern_value,
+                recursive=recursive_value,
+                max_results=max_results_value,
+                context_lines=context_lines_value,
             )
 
-            for file_path in paths:
-                if not file_path.is_file() or files_searched >= max_files:
-                    if files_searched >= max_files:
-                        break
-                    continue
-
-                # Skip files that are too large to prevent RAM exhaustion
-                try:
-                    file_size = file_path.stat().st_size
-                    if file_size > MAX_CONTENT_FILE_SIZE:
-                        logger.debug(
-                            f"Skipping {file_path}: size {file_size} exceeds "
-                            f"limit {MAX_CONTENT_FILE_SIZE}"
-                        )
-                        continue
-                except OSError:
-                    continue
-
-                files_searched += 1
-
-                try:
-                    rel_path = str(file_path.relative_to(resolved_path))
-
-                    lines = []
-                    with open(file_path, encoding="utf-8", errors="ignore") as f:
-                        for line in f:
-                            lines.append(line)
-                            # Safety limit on lines per file
-                            if len(lines) > 10000:
-                                break
-
-                    for line_num, line in enumerate(lines):
-                        if len(matches) >= max_results_value:
-                            break
-
-                        if regex.search(line):
-                            # Get context
-                            start = max(0, line_num - context_lines_value)
-                            end = min(len(lines), line_num + context_lines_value + 1)
-
-                            context_before = [
-                                lines[i].rstrip("\n\r") for i in range(start, line_num)
-                            ]
-                            context_after = [
-                                lines[i].rstrip("\n\r")
-                                for i in range(line_num + 1, end)
-                            ]
-
-                            matches.append(
-                                {
-                                    "file": rel_path,
-                                    "line_number": line_num + 1,
-                                    "line_content": line.rstrip("\n\r"),
-                                    "context_before": context_before,
-                                    "context_after": context_after,
-                                }
-                            )
-
-                    if len(matches) >= max_results_value:
-                        break
-
-                except (OSError, UnicodeDecodeError):
-                    continue
-
-            truncated = len(matches) >= max_results_value or files_searched >= max_files
-
             return _ok(
                 tool="search_files",
                 reason=reason,
                 result={
                     "pattern": pattern,
                     "mode": "content",
-                    "matches": matches,
-                    "total_matches": len(matches),
-                    "files_searched": files_searched,
-                    "truncated": truncated,
+                    "matches": search.matches,
+                    "total_matches": len(search.matches),
+                    "files_searched": search.files_searched,
+                    "binary_files_skipped": search.binary_files_skipped,
+                    "truncated": search.truncated,
                 },
                 path=path_value,
                 pattern=pattern,
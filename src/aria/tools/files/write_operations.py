@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 
 from aria.tools import Reason
 from aria.tools.decorators import tool_function
+from aria.tools.files._index import record_file_change
 from aria.tools.files._internals import _create_backup, _secure_resolve_path
 from aria.tools.files._responses import file_success_response
 from aria.tools.files.decorators import (
@@ -239,6 +240,7 @@ def _write_file_overwrite(reason: str, file_name: str, contents: str) -> str:
 
     # Write content atomically
     _atomic_write(resolved_path, contents)
+    record_file_change(resolved_path)
 
     # Calculate metrics
     bytes_written = len(contents.encode("utf-8"))
@@ -269,6 +271,7 @@ def _write_file_append(reason: str, file_name: str, contents: str) -> str:
     # Append content
     with open(resolved_path, "a", encoding="utf-8") as f:
         f.write(contents)
+    record_file_change(resolved_path)
 
     # Calculate metrics
     bytes_appended = len(contents.encode("utf-8"))
@@ -342,6 +345,7 @@ def edit_file(
     old_total_lines, new_total_lines = _modify_lines_streaming(
         resolved_path, offset, length, new_lines
     )
+    record_file_change(resolved_path)
 
     # Calculate lines affected
     if operation == "delete":
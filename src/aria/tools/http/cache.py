@@ -0,0 +1,838 @@
+"""On-disk HTTP response cache (RFC 9111) for the shared HTTP clients.
+
+The clients from :mod:`aria.tools.http.client` send every request
+through :class:`CachingTransport`, so ``http_request``, ``download`` and
+the SearXNG fetcher share one cache under ``~/.aria/cache/http``.  It
+behaves like a browser's private cache:
+
+* ``GET`` responses are stored when RFC 9111 allows it (no
+  ``no-store``; an explicit lifetime, ``public``/``private``, or a
+  heuristically cacheable status), and served without contacting the
+  origin while fresh.  Freshness comes from ``max-age``, ``Expires`` or,
+  failing both, 10% of the time since ``Last-Modified`` (at most a day).
+* A stale entry — or one marked ``no-cache`` — is revalidated with
+  ``If-None-Match`` / ``If-Modified-Since``; a ``304`` refreshes the
+  stored headers and the stored body is served.
+* ``Vary`` keeps one entry per combination of the listed request
+  headers; ``Vary: *`` is never stored.
+* Request directives ``no-cache``, ``no-store``, ``max-age``,
+  ``min-fresh``, ``max-stale`` and ``only-if-cached`` (and
+  ``Pragma: no-cache``) are honoured.
+* A successful ``POST``/``PUT``/``PATCH``/``DELETE`` invalidates the
+  entries of its URL and of its ``Location``/``Content-Location``.
+
+Requests carrying ``Authorization``, ``Range`` or their own conditional
+headers go straight to the network.  Pass ``extensions={CACHE_EXTENSION:
+"bypass"}`` to skip the lookup for one call (the fresh response still
+replaces the stored one).  Responses report how they were served in
+``response.extensions[CACHE_EXTENSION]``: ``hit``, ``revalidated``,
+``miss`` or ``bypass``.
+
+Bodies are stored as received (still content-encoded) and streamed back
+from disk.  The cache holds at most ``ARIA_HTTP_CACHE_MAX_MB`` (default
+256); the least recently used entries are evicted beyond that.
+``ARIA_HTTP_CACHE=0`` disables it.  The same directory also keeps
+converted documents keyed by body hash (:meth:`HTTPCache.get_converted`)
+so a re-downloaded file is not converted again.
+
+:class:`AsyncCachingTransport` runs lookups, stores and the size
+accounting in worker threads so disk work never blocks the event loop.
+The total size on disk is scanned once, in the background, when the
+cache is created.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import urljoin
+
+import httpx
+from loguru import logger
+
+from aria.config import folders, get_optional_env
+
+CACHE_EXTENSION = "aria.cache"
+
+_CHUNK_SIZE = 64 * 1024
+# Heuristic freshness: this fraction of the time since Last-Modified ...
+_HEURISTIC_FRACTION = 0.1
+# ... but never longer than this.
+_MAX_HEURISTIC_S = 24 * 3600
+# Evict down to this fraction of the limit, so eviction is not run per store.
+_EVICT_TO = 0.9
+
+# RFC 9110 §15.1: statuses cacheable without explicit freshness.
+_HEURISTIC_STATUSES = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
+_HOP_BY_HOP = {
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "te",
+    "transfer-encoding",
+    "upgrade",
+}
+_BYPASS_HEADERS = (
+    "authorization",
+    "range",
+    "if-match",
+    "if-none-match",
+    "if-modified-since",
+    "if-unmodified-since",
+    "if-range",
+)
+_DIRECTIVE = re.compile(r'\s*([^\s=,]+)\s*(?:=\s*("(?:[^"\\]|\\.)*"|[^,]*))?\s*(?:,|$)')
+
+
+def parse_cache_control(values: list[str]) -> dict[str, str | None]:
+    """Parse ``Cache-Control`` header values into ``{directive: argument}``."""
+    directives: dict[str, str | None] = {}
+    for match in _DIRECTIVE.finditer(",".join(values)):
+        name, argument = match.group(1).lower(), match.group(2)
+        if argument is not None:
+            argument = argument.strip()
+            if argument.startswith('"'):
+                argument = argument[1:-1]
+        directives.setdefault(name, argument)
+    return directives
+
+
+def _seconds(directives: dict[str, str | None], name: str) -> int | None:
+    try:
+        return max(0, int(directives[name] or ""))
+    except (KeyError, ValueError):
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _normalize(value: str | None) -> str | None:
+    return None if value is None else " ".join(value.split())
+
+
+def _request_directives(request: httpx.Request) -> dict[str, str | None]:
+    values = request.headers.get_list("cache-control")
+    if not values and "no-cache" in request.headers.get("pragma", "").lower():
+        return {"no-cache": None}
+    return parse_cache_control(values)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One stored response (one ``Vary`` variant of a URL)."""
+
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    # Values of the request headers named by Vary when it was stored.
+    vary: dict[str, str | None]
+    # Wall-clock times the request was sent and the response received.
+    request_time: float
+    response_time: float
+    meta_path: Path
+    body_path: Path
+
+    def header(self, name: str) -> str | None:
+        values = [v for k, v in self.headers if k.lower() == name]
+        return ", ".join(values) if values else None
+
+    @property
+    def directives(self) -> dict[str, str | None]:
+        return parse_cache_control(
+            [v for k, v in self.headers if k.lower() == "cache-control"]
+        )
+
+    def freshness_lifetime(self) -> float:
+        """RFC 9111 §4.2.1, as a private cache."""
+        directives = self.directives
+        max_age = _seconds(directives, "max-age")
+        if max_age is not None:
+            return max_age
+        date = _http_date(self.header("date")) or self.response_time
+        if self.header("expires") is not None:
+            expires = _http_date(self.header("expires"))
+            return max(0.0, expires - date) if expires is not None else 0.0
+        last_modified = _http_date(self.header("last-modified"))
+        if last_modified is not None and (
+            self.status in _HEURISTIC_STATUSES or "public" in directives
+        ):
+            return min(
+                max(0.0, date - last_modified) * _HEURISTIC_FRACTION, _MAX_HEURISTIC_S
+            )
+        return 0.0
+
+    def current_age(self, now: float) -> float:
+        """RFC 9111 §4.2.3."""
+        date = _http_date(self.header("date")) or self.response_time
+        try:
+            age_value = max(0, int(self.header("age") or 0))
+        except ValueError:
+            age_value = 0
+        apparent_age = max(0.0, self.response_time - date)
+        response_delay = self.response_time - self.request_time
+        corrected_initial_age = max(apparent_age, age_value + response_delay)
+        return corrected_initial_age + (now - self.response_time)
+
+
+class _FileStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """A stored body, read back in chunks (local reads are done inline)."""
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self._file = file
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self._file.read(_CHUNK_SIZE):
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while chunk := self._file.read(_CHUNK_SIZE):
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+    async def aclose(self) -> None:
+        self._file.close()
+
+
+class _Writer:
+    """Copies a response body into the cache as it is read.
+
+    The entry is committed only if the body was read to the end, so a
+    download aborted half-way is never served later.
+    """
+
+    def __init__(self, cache: HTTPCache, entry: CacheEntry, max_size: int) -> None:
+        self._cache = cache
+        self._entry = entry
+        self._max_size = max_size
+        self._part = entry.body_path.with_name(f".{entry.body_path.name}.part")
+        self._file: IO[bytes] | None = None
+        self._size = 0
+        self._failed = False
+        self.complete = False
+
+    def write(self, chunk: bytes) -> None:
+        if self._failed:
+            return
+        self._size += len(chunk)
+        try:
+            if self._size > self._max_size:
+                raise OSError("body exceeds the cache entry limit")
+            if self._file is None:
+                self._part.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._part, "wb")
+            self._file.write(chunk)
+        except OSError as exc:
+            logger.debug(f"http cache: not storing {self._entry.url}: {exc}")
+            self._failed = True
+            self._discard()
+
+    def finish(self) -> None:
+        if self._failed:
+            return
+        if not self.complete:
+            self._discard()
+            return
+        try:
+            if self._file is None:
+                # Empty body.
+                self._part.parent.mkdir(parents=True, exist_ok=True)
+                self._part.touch()
+            else:
+                self._file.close()
+            os.replace(self._part, self._entry.body_path)
+            self._cache._commit(self._entry, self._size)
+        except OSError as exc:
+            logger.debug(f"http cache: failed to store {self._entry.url}: {exc}")
+            self._discard()
+
+    def _discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._part.unlink(missing_ok=True)
+
+
+class _TeeStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, stream: Any, writer: _Writer) -> None:
+        self._stream = stream
+        self._writer = writer
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._writer.write(chunk)
+            yield chunk
+        self._writer.complete = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._writer.write(chunk)
+            yield chunk
+        self._writer.complete = True
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._writer.finish()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            await asyncio.to_thread(self._writer.finish)
+
+
+class HTTPCache:
+    """Stored responses under *directory*, at most *max_bytes* in total."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._used = 0
+        self._lock = threading.Lock()
+        # Set once the initial size scan has finished.
+        self._scanned = threading.Event()
+        threading.Thread(target=self._scan, name="http-cache-scan", daemon=True).start()
+
+    # -- layout ------------------------------------------------------------
+
+    def _url_dir(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.directory / "responses" / digest[:2] / digest
+
+    def _new_entry(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        request_time: float,
+        response_time: float,
+    ) -> CacheEntry:
+        url = str(request.url)
+        vary = {
+            name: _normalize(", ".join(request.headers.get_list(name)) or None)
+            for name in _vary_names(response.headers)
+        }
+        variant = hashlib.sha256(json.dumps(vary, sort_keys=True).encode()).hexdigest()
+        url_dir = self._url_dir(url)
+        return CacheEntry(
+            url=url,
+            status=response.status_code,
+            headers=_storable_headers(response.headers),
+            vary=vary,
+            request_time=request_time,
+            response_time=response_time,
+            meta_path=url_dir / f"{variant[:32]}.json",
+            body_path=url_dir / f"{variant[:32]}.{uuid.uuid4().hex[:12]}.body",
+        )
+
+    # -- lookup ------------------------------------------------------------
+
+    def lookup(self, request: httpx.Request) -> CacheEntry | None:
+        """Return the stored variant matching *request*, fresh or not."""
+        url_dir = self._url_dir(str(request.url))
+        try:
+            metas = list(url_dir.glob("*.json"))
+        except OSError:
+            return None
+        for meta_path in metas:
+            entry = _load_entry(meta_path)
+            if entry is None or entry.url != str(request.url):
+                continue
+            if all(
+                _normalize(", ".join(request.headers.get_list(name)) or None) == value
+                for name, value in entry.vary.items()
+            ):
+                return entry
+        return None
+
+    def usable(self, request: httpx.Request, entry: CacheEntry) -> bool:
+        """Whether *entry* may answer *request* without revalidation."""
+        requested = _request_directives(request)
+        stored = entry.directives
+        if "no-cache" in requested or "no-cache" in stored:
+            return False
+        lifetime = entry.freshness_lifetime()
+        age = entry.current_age(time.time())
+        max_age = _seconds(requested, "max-age")
+        if max_age is not None and age > max_age:
+            return False
+        min_fresh = _seconds(requested, "min-fresh")
+        if min_fresh is not None and lifetime - age < min_fresh:
+            return False
+        if age < lifetime:
+            return True
+        if "max-stale" not in requested or "must-revalidate" in stored:
+            return False
+        max_stale = _seconds(requested, "max-stale")
+        return max_stale is None or age - lifetime <= max_stale
+
+    def conditional(
+        self, request: httpx.Request, entry: CacheEntry
+    ) -> httpx.Request | None:
+        """Build the revalidation request for *entry*, if it has validators."""
+        etag = entry.header("etag")
+        last_modified = entry.header("last-modified")
+        if etag is None and last_modified is None:
+            return None
+        headers = request.headers.copy()
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            extensions=request.extensions,
+        )
+
+    def response(self, entry: CacheEntry, status: str) -> httpx.Response | None:
+        """Serve *entry*; ``None`` if its body has been evicted meanwhile."""
+        try:
+            file = open(entry.body_path, "rb")
+        except OSError:
+            return None
+        try:
+            os.utime(entry.meta_path)
+        except OSError:
+            pass
+        headers = [(k, v) for k, v in entry.headers if k.lower() != "age"]
+        headers.append(("Age", str(int(entry.current_age(time.time())))))
+        return httpx.Response(
+            entry.status,
+            headers=headers,
+            stream=_FileStream(file),
+            extensions={CACHE_EXTENSION: status},
+        )
+
+    # -- storing -----------------------------------------------------------
+
+    def store(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        request_time: float,
+    ) -> None:
+        """Arrange for *response* to be stored once its body has been read."""
+        if not _storable(request, response):
+            return
+        entry = self._new_entry(request, response, request_time, time.time())
+        writer = _Writer(self, entry, max(1, self.max_bytes // 4))
+        try:
+            body = response.content
+        except httpx.ResponseNotRead:
+            response.stream = _TeeStream(response.stream, writer)
+            return
+        # Built with its body already in memory.
+        writer.write(body)
+        writer.complete = True
+        writer.finish()
+
+    def freshen(
+        self, entry: CacheEntry, not_modified: httpx.Response, request_time: float
+    ) -> CacheEntry:
+        """Update *entry* from a ``304`` response (RFC 9111 §4.3.4)."""
+        updated = {k.lower() for k, _ in _storable_headers(not_modified.headers)}
+        updated.discard("content-length")
+        headers = [(k, v) for k, v in entry.headers if k.lower() not in updated]
+        headers += [
+            (k, v)
+            for k, v in _storable_headers(not_modified.headers)
+            if k.lower() in updated
+        ]
+        fresh = replace(
+            entry,
+            headers=headers,
+            request_time=request_time,
+            response_time=time.time(),
+        )
+        try:
+            _write_meta(fresh)
+        except OSError as exc:
+            logger.debug(f"http cache: failed to refresh {entry.url}: {exc}")
+        return fresh
+
+    def _commit(self, entry: CacheEntry, body_size: int) -> None:
+        old = _load_entry(entry.meta_path)
+        freed = _unlink(entry.meta_path) if old is not None else 0
+        _write_meta(entry)
+        if old is not None and old.body_path != entry.body_path:
+            freed += _unlink(old.body_path)
+        self._account(body_size + entry.meta_path.stat().st_size - freed)
+
+    # -- invalidation ------------------------------------------------------
+
+    def invalidate(self, url: str) -> None:
+        """Drop every stored variant of *url*."""
+        url_dir = self._url_dir(url)
+        freed = 0
+        try:
+            paths = list(url_dir.iterdir())
+        except OSError:
+            return
+        for path in paths:
+            freed += _unlink(path)
+        self._account(-freed)
+
+    def invalidate_after(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> None:
+        """Invalidate what an unsafe request may have changed (RFC 9111 §4.4)."""
+        if request.method in _SAFE_METHODS or not 200 <= response.status_code < 400:
+            return
+        self.invalidate(str(request.url))
+        for name in ("location", "content-location"):
+            value = response.headers.get(name)
+            if not value:
+                continue
+            target = httpx.URL(urljoin(str(request.url), value))
+            if (target.scheme, target.host, target.port) == (
+                request.url.scheme,
+                request.url.host,
+                request.url.port,
+            ):
+                self.invalidate(str(target))
+
+    # -- converted documents -----------------------------------------------
+
+    def _converted_path(self, key: str) -> Path:
+        return self.directory / "converted" / key[:2] / key
+
+    def get_converted(self, key: str) -> str | None:
+        """Return text stored with :meth:`put_converted`, if still cached."""
+        path = self._converted_path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        return text
+
+    def put_converted(self, key: str, text: str) -> None:
+        """Store *text* (e.g. a document's markdown) under *key*."""
+        path = self._converted_path(key)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            freed = path.stat().st_size if path.exists() else 0
+            os.replace(tmp, path)
+            self._account(path.stat().st_size - freed)
+        except OSError as exc:
+            logger.debug(f"http cache: failed to store converted {key}: {exc}")
+            tmp.unlink(missing_ok=True)
+
+    # -- size limit ----------------------------------------------------------
+
+    def _scan(self) -> None:
+        try:
+            self._used = sum(size for _, size, _ in self._items())
+        finally:
+            self._scanned.set()
+
+    def _account(self, delta: int) -> None:
+        # Wait for the initial total; a file written while it ran may be
+        # counted twice, which only makes eviction start a little early.
+        self._scanned.wait()
+        with self._lock:
+            self._used += delta
+            if self._used <= self.max_bytes:
+                return
+            self._used = self._evict(int(self.max_bytes * _EVICT_TO))
+
+    def _items(self) -> list[tuple[float, int, list[Path]]]:
+        """``(last_used, size, paths)`` for every entry and converted file."""
+        items: list[tuple[float, int, list[Path]]] = []
+        for meta in self.directory.glob("responses/*/*/*.json"):
+            paths = [meta, *meta.parent.glob(f"{meta.stem}.*.body")]
+            try:
+                stats = [p.stat() for p in paths]
+            except OSError:
+                continue
+            items.append((stats[0].st_mtime, sum(s.st_size for s in stats), paths))
+        for path in self.directory.glob("converted/*/*"):
+            try:
+                info = path.stat()
+            except OSError:
+                continue
+            items.append((info.st_mtime, info.st_size, [path]))
+        return items
+
+    def _evict(self, target: int) -> int:
+        items = sorted(self._items(), key=lambda item: item[0])
+        used = sum(size for _, size, _ in items)
+        for _, size, paths in items:
+            if used <= target:
+                break
+            for path in paths:
+                _unlink(path)
+            used -= size
+        return used
+
+    def clear(self) -> None:
+        """Remove every stored response and converted document."""
+        self._scanned.wait()
+        with self._lock:
+            for path in sorted(self.directory.rglob("*"), reverse=True):
+                if path.is_dir():
+                    path.rmdir()
+                else:
+                    path.unlink(missing_ok=True)
+            self._used = 0
+
+
+def _vary_names(headers: httpx.Headers) -> list[str]:
+    names = {
+        name.strip().lower()
+        for value in headers.get_list("vary")
+        for name in value.split(",")
+        if name.strip()
+    }
+    return sorted(names)
+
+
+def _storable_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    connection = {
+        token.strip().lower()
+        for value in headers.get_list("connection")
+        for token in value.split(",")
+    }
+    return [
+        (k.decode("latin-1"), v.decode("latin-1"))
+        for k, v in headers.raw
+        if k.decode("latin-1").lower() not in _HOP_BY_HOP | connection
+    ]
+
+
+def _storable(request: httpx.Request, response: httpx.Response) -> bool:
+    """RFC 9111 §3, for a private cache."""
+    if request.method != "GET" or response.status_code < 200:
+        return False
+    if response.status_code == 206:
+        return False
+    if "no-store" in _request_directives(request):
+        return False
+    directives = parse_cache_control(response.headers.get_list("cache-control"))
+    if "no-store" in directives or "*" in _vary_names(response.headers):
+        return False
+    explicit = (
+        "max-age" in directives
+        or "public" in directives
+        or "private" in directives
+        or "expires" in response.headers
+    )
+    if not explicit and response.status_code not in _HEURISTIC_STATUSES:
+        return False
+    # Worth keeping only if it can be served fresh or revalidated.
+    return explicit or "last-modified" in response.headers or "etag" in response.headers
+
+
+def _load_entry(meta_path: Path) -> CacheEntry | None:
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return CacheEntry(
+            url=meta["url"],
+            status=meta["status"],
+            headers=[(k, v) for k, v in meta["headers"]],
+            vary=meta["vary"],
+            request_time=meta["request_time"],
+            response_time=meta["response_time"],
+            meta_path=meta_path,
+            body_path=meta_path.with_name(meta["body"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_meta(entry: CacheEntry) -> None:
+    tmp = entry.meta_path.with_name(f".{entry.meta_path.name}.{uuid.uuid4().hex[:8]}")
+    tmp.write_text(
+        json.dumps(
+            {
+                "url": entry.url,
+                "status": entry.status,
+                "headers": entry.headers,
+                "vary": entry.vary,
+                "request_time": entry.request_time,
+                "response_time": entry.response_time,
+                "body": entry.body_path.name,
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp, entry.meta_path)
+
+
+def _unlink(path: Path) -> int:
+    try:
+        size = path.stat().st_size
+        path.unlink()
+    except OSError:
+        return 0
+    return size
+
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+_caches: dict[tuple[Path, int], HTTPCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Return the shared cache, or ``None`` when ``ARIA_HTTP_CACHE=0``."""
+    if get_optional_env("ARIA_HTTP_CACHE", "1").strip().lower() in ("0", "false", "no"):
+        return None
+    try:
+        max_mb = float(get_optional_env("ARIA_HTTP_CACHE_MAX_MB", "256"))
+    except ValueError:
+        max_mb = 256.0
+    if max_mb <= 0:
+        return None
+    key = (folders.Cache.path / "http", int(max_mb * 1024 * 1024))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = HTTPCache(*key)
+        return cache
+
+
+def _plan(request: httpx.Request) -> tuple[HTTPCache | None, bool]:
+    """Return the cache to use for *request* and whether to look it up."""
+    cache = get_http_cache()
+    if cache is None or request.method != "GET":
+        return cache, False
+    if any(name in request.headers for name in _BYPASS_HEADERS):
+        return None, False
+    return cache, request.extensions.get(CACHE_EXTENSION) != "bypass"
+
+
+def _only_if_cached(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(504, extensions={CACHE_EXTENSION: "miss"}, request=request)
+
+
+class CachingTransport(httpx.BaseTransport):
+    """Answers from :func:`get_http_cache` where allowed; see the module docs."""
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cache, look_up = _plan(request)
+        if cache is None:
+            return self._transport.handle_request(request)
+        if request.method != "GET":
+            response = self._transport.handle_request(request)
+            cache.invalidate_after(request, response)
+            return response
+
+        entry = cache.lookup(request) if look_up else None
+        outgoing = request
+        if entry is not None:
+            if cache.usable(request, entry):
+                served = cache.response(entry, "hit")
+                if served is not None:
+                    return served
+            outgoing = cache.conditional(request, entry) or request
+        if look_up and "only-if-cached" in _request_directives(request):
+            return _only_if_cached(request)
+
+        request_time = time.time()
+        response = self._transport.handle_request(outgoing)
+        if (
+            entry is not None
+            and response.status_code == 304
+            and outgoing is not request
+        ):
+            response.close()
+            served = cache.response(
+                cache.freshen(entry, response, request_time), "revalidated"
+            )
+            if served is not None:
+                return served
+            response = self._transport.handle_request(request)
+        response.extensions[CACHE_EXTENSION] = "miss" if look_up else "bypass"
+        cache.store(request, response, request_time)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`CachingTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cache, look_up = _plan(request)
+        if cache is None:
+            return await self._transport.handle_async_request(request)
+        if request.method != "GET":
+            response = await self._transport.handle_async_request(request)
+            await asyncio.to_thread(cache.invalidate_after, request, response)
+            return response
+
+        entry = await asyncio.to_thread(cache.lookup, request) if look_up else None
+        outgoing = request
+        if entry is not None:
+            if cache.usable(request, entry):
+                served = await asyncio.to_thread(cache.response, entry, "hit")
+                if served is not None:
+                    return served
+            outgoing = cache.conditional(request, entry) or request
+        if look_up and "only-if-cached" in _request_directives(request):
+            return _only_if_cached(request)
+
+        request_time = time.time()
+        response = await self._transport.handle_async_request(outgoing)
+        if (
+            entry is not None
+            and response.status_code == 304
+            and outgoing is not request
+        ):
+            await response.aclose()
+            served = await asyncio.to_thread(
+                self._revalidated, cache, entry, response, request_time
+            )
+            if served is not None:
+                return served
+            response = await self._transport.handle_async_request(request)
+        response.extensions[CACHE_EXTENSION] = "miss" if look_up else "bypass"
+        await asyncio.to_thread(cache.store, request, response, request_time)
+        return response
+
+    @staticmethod
+    def _revalidated(
+        cache: HTTPCache,
+        entry: CacheEntry,
+        not_modified: httpx.Response,
+        request_time: float,
+    ) -> httpx.Response | None:
+        fresh = cache.freshen(entry, not_modified, request_time)
+        return cache.response(fresh, "revalidated")
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
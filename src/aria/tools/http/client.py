@@ -0,0 +1,448 @@
+"""Process-wide pooled HTTP clients for the network tools.
+
+The tools in ``aria.tools.search`` and ``aria.tools.http`` send their
+requests through the clients returned here instead of opening a client
+per call.  Repeated requests to a host then reuse keep-alive connections
+(no new TCP/TLS handshake) and resolved addresses.
+
+* :func:`get_sync_client` — one ``httpx.Client`` for the process, shared
+  by the blocking tools the ax executors run in threads;
+* :func:`get_async_client` — one ``httpx.AsyncClient`` per event loop
+  (connections are bound to the loop that opened them).
+
+Both are configured from the environment:
+
+* ``ARIA_HTTP_MAX_CONNECTIONS`` pooled connections (default 100), idle
+  ones kept for ``ARIA_HTTP_KEEPALIVE_EXPIRY`` seconds (default 30);
+* at most ``ARIA_HTTP_MAX_PER_HOST`` concurrent requests per host
+  (default 10), so one slow site cannot hold the whole pool;
+* host names resolved at most once per ``ARIA_DNS_CACHE_TTL`` seconds
+  (default 300; 0 disables the cache);
+* HTTP/2 with ``ARIA_HTTP2=1``, if the optional ``h2`` package is
+  installed.
+
+Responses go through the on-disk HTTP cache of
+:mod:`aria.tools.http.cache`.  The clients never store cookies, because
+they are shared by every chat session.  Pass ``timeout``, ``headers``
+and ``follow_redirects`` per request.  :func:`aclose_http_clients`
+closes them on application shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.cookiejar
+import importlib.util
+import ipaddress
+import socket
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import anyio
+import httpcore
+import httpx
+from loguru import logger
+
+from aria.config import get_optional_env
+from aria.tools.http.cache import AsyncCachingTransport, CachingTransport
+
+_DEFAULT_TIMEOUT = 30.0
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(get_optional_env(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _limits() -> httpx.Limits:
+    max_connections = max(1, int(_env_number("ARIA_HTTP_MAX_CONNECTIONS", 100)))
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=_env_number("ARIA_HTTP_KEEPALIVE_EXPIRY", 30.0),
+    )
+
+
+def _per_host() -> int:
+    return max(1, int(_env_number("ARIA_HTTP_MAX_PER_HOST", 10)))
+
+
+def _http2() -> bool:
+    if get_optional_env("ARIA_HTTP2", "0").strip().lower() not in ("1", "true", "yes"):
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "ARIA_HTTP2 is set but the 'h2' package is missing; using HTTP/1.1"
+        )
+        return False
+    return True
+
+
+def _no_cookies() -> http.cookiejar.CookieJar:
+    return http.cookiejar.CookieJar(
+        policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+
+
+# ---------------------------------------------------------------------------
+# DNS cache
+# ---------------------------------------------------------------------------
+
+
+class DNSCache:
+    """Resolved addresses per ``(host, port)``, kept for *ttl* seconds."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str, port: int) -> list[str] | None:
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry is None or time.monotonic() >= entry[0]:
+                return None
+            return entry[1]
+
+    def put(self, host: str, port: int, addresses: list[str]) -> None:
+        if self.ttl > 0 and addresses:
+            with self._lock:
+                self._entries[(host, port)] = (time.monotonic() + self.ttl, addresses)
+
+    def forget(self, host: str, port: int) -> None:
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_dns_cache = DNSCache(_env_number("ARIA_DNS_CACHE_TTL", 300.0))
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def _addresses(infos: list) -> list[str]:
+    # Keep resolver order (it already prefers the better family).
+    return list(dict.fromkeys(str(info[4][0]) for info in infos))
+
+
+class _CachedDNSBackend(httpcore.NetworkBackend):
+    """Synchronous network backend that resolves hosts through the DNS cache.
+
+    The TLS server name still comes from the request URL, so connecting
+    to a cached address does not affect certificate checks.
+    """
+
+    def __init__(self, cache: DNSCache) -> None:
+        self._cache = cache
+        self._inner = httpcore.SyncBackend()
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options=None,
+    ) -> httpcore.NetworkStream:
+        if self._cache.ttl <= 0 or _is_ip(host):
+            return self._inner.connect_tcp(
+                host, port, timeout, local_address, socket_options
+            )
+        addresses = self._cache.get(host, port)
+        if addresses is None:
+            try:
+                infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as exc:
+                raise httpcore.ConnectError(str(exc)) from exc
+            addresses = _addresses(infos)
+            self._cache.put(host, port, addresses)
+        error: Exception | None = None
+        for address in addresses:
+            try:
+                return self._inner.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                error = exc
+        self._cache.forget(host, port)
+        assert error is not None
+        raise error
+
+    def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return self._inner.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        self._inner.sleep(seconds)
+
+
+class _AsyncCachedDNSBackend(httpcore.AsyncNetworkBackend):
+    """Async counterpart of :class:`_CachedDNSBackend`."""
+
+    def __init__(self, cache: DNSCache) -> None:
+        self._cache = cache
+        self._inner = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        if self._cache.ttl <= 0 or _is_ip(host):
+            return await self._inner.connect_tcp(
+                host, port, timeout, local_address, socket_options
+            )
+        addresses = self._cache.get(host, port)
+        if addresses is None:
+            try:
+                infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as exc:
+                raise httpcore.ConnectError(str(exc)) from exc
+            addresses = _addresses(infos)
+            self._cache.put(host, port, addresses)
+        error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                error = exc
+        self._cache.forget(host, port)
+        assert error is not None
+        raise error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._inner.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+# ---------------------------------------------------------------------------
+# Transports: connection pool + per-host limit
+# ---------------------------------------------------------------------------
+
+
+def _once(fn: Callable[[], None]) -> Callable[[], None]:
+    called = False
+
+    def wrapper() -> None:
+        nonlocal called
+        if not called:
+            called = True
+            fn()
+
+    return wrapper
+
+
+def _pool_timeout(request: httpx.Request) -> float | None:
+    return request.extensions.get("timeout", {}).get("pool")
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class PooledTransport(httpx.HTTPTransport):
+    """``HTTPTransport`` with the DNS cache and a per-host request limit.
+
+    A request holds its host's slot until its response is closed, so a
+    streamed download counts against the limit while it is being read.
+    """
+
+    def __init__(self, *, verify: bool, per_host: int, dns_cache: DNSCache) -> None:
+        limits = _limits()
+        http2 = _http2()
+        super().__init__(verify=verify, limits=limits, http2=http2)
+        # Rebuilt with our network backend; HTTPTransport has no option for it.
+        self._pool = httpcore.ConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=_CachedDNSBackend(dns_cache),
+        )
+        self._per_host = per_host
+        self._hosts: dict[tuple[str, int | None], threading.BoundedSemaphore] = {}
+        self._hosts_lock = threading.Lock()
+
+    def _slot(self, request: httpx.Request) -> threading.BoundedSemaphore:
+        key = (request.url.host, request.url.port)
+        with self._hosts_lock:
+            slot = self._hosts.get(key)
+            if slot is None:
+                slot = self._hosts[key] = threading.BoundedSemaphore(self._per_host)
+            return slot
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slot(request)
+        timeout = _pool_timeout(request)
+        if not slot.acquire(timeout=timeout):
+            raise httpx.PoolTimeout(
+                f"Too many concurrent requests to {request.url.host}",
+                request=request,
+            )
+        release = _once(slot.release)
+        try:
+            response = super().handle_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingStream(response.stream, release)  # type: ignore[arg-type]
+        return response
+
+
+class AsyncPooledTransport(httpx.AsyncHTTPTransport):
+    """Async counterpart of :class:`PooledTransport` (one per event loop)."""
+
+    def __init__(self, *, verify: bool, per_host: int, dns_cache: DNSCache) -> None:
+        limits = _limits()
+        http2 = _http2()
+        super().__init__(verify=verify, limits=limits, http2=http2)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=_AsyncCachedDNSBackend(dns_cache),
+        )
+        self._per_host = per_host
+        self._hosts: dict[tuple[str, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = (request.url.host, request.url.port)
+        slot = self._hosts.get(key)
+        if slot is None:
+            slot = self._hosts[key] = asyncio.Semaphore(self._per_host)
+        try:
+            await asyncio.wait_for(slot.acquire(), _pool_timeout(request))
+        except TimeoutError:
+            raise httpx.PoolTimeout(
+                f"Too many concurrent requests to {request.url.host}",
+                request=request,
+            ) from None
+        release = _once(slot.release)
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _AsyncReleasingStream(response.stream, release)  # type: ignore[arg-type]
+        return response
+
+
+# ---------------------------------------------------------------------------
+# Shared clients
+# ---------------------------------------------------------------------------
+
+_lock = threading.Lock()
+_sync_clients: dict[bool, httpx.Client] = {}
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[bool, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def get_sync_client(*, verify: bool = True) -> httpx.Client:
+    """Return the process-wide blocking client.
+
+    Args:
+        verify: Verify TLS certificates.  Unverified requests use a
+            separate pool.
+    """
+    with _lock:
+        client = _sync_clients.get(verify)
+        if client is None or client.is_closed:
+            client = _sync_clients[verify] = httpx.Client(
+                transport=CachingTransport(
+                    PooledTransport(
+                        verify=verify, per_host=_per_host(), dns_cache=_dns_cache
+                    )
+                ),
+                timeout=_DEFAULT_TIMEOUT,
+                cookies=_no_cookies(),
+            )
+        return client
+
+
+def get_async_client(*, verify: bool = True) -> httpx.AsyncClient:
+    """Return the async client of the running event loop.
+
+    Args:
+        verify: Verify TLS certificates.  Unverified requests use a
+            separate pool.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(verify)
+        if client is None or client.is_closed:
+            client = clients[verify] = httpx.AsyncClient(
+                transport=AsyncCachingTransport(
+                    AsyncPooledTransport(
+                        verify=verify, per_host=_per_host(), dns_cache=_dns_cache
+                    )
+                ),
+                timeout=_DEFAULT_TIMEOUT,
+                cookies=_no_cookies(),
+            )
+        return client
+
+
+async def aclose_http_clients() -> None:
+    """Close the blocking clients and the running loop's async clients."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        sync_clients = list(_sync_clients.values())
+        _sync_clients.clear()
+        async_clients = list(_async_clients.pop(loop, {}).values())
+    for client in sync_clients:
+        client.close()
+    for client in async_clients:
+        await client.aclose()
@@ -12,6 +12,8 @@ from aria.tools.constants import (
     MAX_TIMEOUT,
 )
 from aria.tools.decorators import log_tool_call
+from aria.tools.http.cache import CACHE_EXTENSION
+from aria.tools.http.client import get_sync_client
 
 HTTP_OUTPUT_DIR = BASE_DIR / "http"
 HTTP_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -38,6 +40,7 @@ def http_request(
     headers: dict[str, str] | None = None,
     body: str | None = None,
     timeout: int | None = None,
+    bypass_cache: bool = False,
 ) -> str:
     """Make HTTP requests to web APIs with redirect following.
 
@@ -53,9 +56,13 @@ def http_request(
         headers: Optional request headers (dict).
         body: Optional request body string (for POST/PUT/PATCH).
         timeout: Timeout in seconds (default: 30, max: 300).
+        bypass_cache: Skip the local HTTP cache and fetch from the server
+            (default: False). GET responses are otherwise reused while the
+            server's Cache-Control headers allow it.
 
     Returns:
-        JSON with status_code, headers, final url, saved body file path.
+        JSON with status_code, headers, final url, saved body file path,
+        and cache ("hit", "revalidated", "miss" or "bypass").
     """
     method = method.upper().strip()
 
@@ -77,16 +84,15 @@ def http_request(
     )
 
     try:
-        with httpx.Client(
+        response = get_sync_client().request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=body,
             timeout=actual_timeout,
             follow_redirects=True,
-        ) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                content=body,
-            )
+            extensions={CACHE_EXTENSION: "bypass"} if bypass_cache else None,
+        )
 
         body_file, body_size, content_type = _persist_http_body(response)
 
@@ -100,6 +106,7 @@ def http_request(
                 "body_file": body_file,
                 "body_size": body_size,
                 "content_type": content_type,
+                "cache": response.extensions.get(CACHE_EXTENSION),
             },
         )
 
@@ -0,0 +1,246 @@
+"""Tests for the on-disk RFC 9111 HTTP cache."""
+
+import threading
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from aria.tools.http.cache import (
+    CACHE_EXTENSION,
+    AsyncCachingTransport,
+    CachingTransport,
+    HTTPCache,
+    get_http_cache,
+    parse_cache_control,
+)
+
+
+class Origin:
+    """A MockTransport handler that records requests."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.respond(request)
+
+
+def _client(origin: Origin) -> httpx.Client:
+    return httpx.Client(transport=CachingTransport(httpx.MockTransport(origin)))
+
+
+def _status(response: httpx.Response) -> str | None:
+    return response.extensions.get(CACHE_EXTENSION)
+
+
+def test_parse_cache_control():
+    assert parse_cache_control(['max-age=60, no-cache="Set-Cookie"', "Private"]) == {
+        "max-age": "60",
+        "no-cache": "Set-Cookie",
+        "private": None,
+    }
+
+
+def test_fresh_response_is_served_from_disk():
+    origin = Origin(
+        lambda r: httpx.Response(
+            200, content=b"payload", headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    with _client(origin) as client:
+        first = client.get("https://example.com/a")
+        second = client.get("https://example.com/a")
+        reload = client.get(
+            "https://example.com/a", extensions={CACHE_EXTENSION: "bypass"}
+        )
+        forced = client.get(
+            "https://example.com/a", headers={"Cache-Control": "no-cache"}
+        )
+
+    assert (_status(first), _status(second)) == ("miss", "hit")
+    assert second.content == b"payload"
+    assert "age" in second.headers
+    assert _status(reload) == "bypass"
+    assert _status(forced) == "miss"
+    assert len(origin.requests) == 3
+
+
+def test_stale_entry_is_revalidated_with_etag():
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"', "X-Seen": "2"})
+        return httpx.Response(
+            200,
+            content=b"body",
+            headers={"ETag": '"v1"', "Cache-Control": "no-cache", "X-Seen": "1"},
+        )
+
+    origin = Origin(respond)
+    with _client(origin) as client:
+        client.get("https://example.com/doc")
+        again = client.get("https://example.com/doc")
+
+    assert _status(again) == "revalidated"
+    assert again.content == b"body"
+    assert again.headers["x-seen"] == "2"
+    assert origin.requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test_heuristic_freshness_from_last_modified():
+    origin = Origin(
+        lambda r: httpx.Response(
+            200,
+            content=b"old page",
+            headers={"Last-Modified": formatdate(0, usegmt=True)},
+        )
+    )
+    with _client(origin) as client:
+        client.get("https://example.com/old")
+        assert _status(client.get("https://example.com/old")) == "hit"
+
+
+def test_vary_keeps_one_entry_per_header_value():
+    origin = Origin(
+        lambda r: httpx.Response(
+            200,
+            content=r.headers.get("accept-language", "").encode(),
+            headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+        )
+    )
+    with _client(origin) as client:
+        en = client.get("https://example.com/", headers={"Accept-Language": "en"})
+        de = client.get("https://example.com/", headers={"Accept-Language": "de"})
+        en_again = client.get("https://example.com/", headers={"Accept-Language": "en"})
+
+    assert [_status(r) for r in (en, de, en_again)] == ["miss", "miss", "hit"]
+    assert (de.content, en_again.content) == (b"de", b"en")
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Cache-Control": "no-store, max-age=60"},
+        {"Cache-Control": "max-age=60", "Vary": "*"},
+        {},  # nothing to serve it fresh or revalidate it with
+    ],
+)
+def test_unstorable_responses_are_not_cached(headers):
+    origin = Origin(lambda r: httpx.Response(200, content=b"x", headers=headers))
+    with _client(origin) as client:
+        client.get("https://example.com/x")
+        assert _status(client.get("https://example.com/x")) == "miss"
+
+
+def test_unsafe_request_invalidates():
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(201, headers={"Location": "/items/1"})
+        return httpx.Response(
+            200, content=b"x", headers={"Cache-Control": "max-age=60"}
+        )
+
+    origin = Origin(respond)
+    with _client(origin) as client:
+        client.get("https://example.com/items")
+        client.get("https://example.com/items/1")
+        client.post("https://example.com/items", content=b"{}")
+        assert _status(client.get("https://example.com/items")) == "miss"
+        assert _status(client.get("https://example.com/items/1")) == "miss"
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    monkeypatch.setenv("ARIA_HTTP_CACHE_MAX_MB", "0.02")  # ~20 KiB
+    origin = Origin(
+        lambda r: httpx.Response(
+            200, content=b"x" * 2000, headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    with _client(origin) as client:
+        client.get("https://example.com/0")
+        for i in range(1, 20):
+            client.get("https://example.com/0")  # keep 0 recently used
+            client.get(f"https://example.com/{i}")
+        assert _status(client.get("https://example.com/0")) == "hit"
+        assert _status(client.get("https://example.com/1")) == "miss"
+
+    cache = get_http_cache()
+    assert sum(p.stat().st_size for p in cache.directory.rglob("*") if p.is_file()) <= (
+        cache.max_bytes
+    )
+
+
+@pytest.mark.asyncio
+async def test_partially_read_body_is_not_stored():
+    async def body():
+        for _ in range(30):
+            yield b"y" * 10_000
+
+    origin = Origin(
+        lambda r: httpx.Response(
+            200, content=body(), headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    transport = AsyncCachingTransport(httpx.MockTransport(origin))
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://example.com/big") as response:
+            async for _ in response.aiter_bytes(1024):
+                break
+        missed = await client.get("https://example.com/big")
+        hit = await client.get("https://example.com/big")
+
+    assert _status(missed) == "miss"
+    assert _status(hit) == "hit"
+    assert hit.content == b"y" * 300_000
+
+
+@pytest.mark.asyncio
+async def test_async_transport_keeps_disk_work_off_the_loop(monkeypatch):
+    loop_thread = threading.current_thread()
+    seen: list[threading.Thread] = []
+    cache = get_http_cache()
+    for name in ("lookup", "response", "store"):
+        method = getattr(cache, name)
+
+        def record(*args, _method=method, **kwargs):
+            seen.append(threading.current_thread())
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, record)
+
+    origin = Origin(
+        lambda r: httpx.Response(
+            200, content=b"payload", headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    transport = AsyncCachingTransport(httpx.MockTransport(origin))
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://example.com/a")
+        hit = await client.get("https://example.com/a")
+
+    assert _status(hit) == "hit"
+    assert seen and loop_thread not in seen
+
+
+def test_existing_entries_are_counted_at_startup(tmp_path):
+    HTTPCache(tmp_path, 1 << 20).put_converted("ab" * 32, "x" * 100)
+
+    cache = HTTPCache(tmp_path, 1 << 20)
+    cache._scanned.wait(5)
+
+    assert cache._used == 100
+
+
+def test_disabled_cache_passes_through(monkeypatch):
+    monkeypatch.setenv("ARIA_HTTP_CACHE", "0")
+    origin = Origin(
+        lambda r: httpx.Response(
+            200, content=b"x", headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    with _client(origin) as client:
+        client.get("https://example.com/x")
+        client.get("https://example.com/x")
+    assert len(origin.requests) == 2
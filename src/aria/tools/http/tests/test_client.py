@@ -0,0 +1,111 @@
+"""Tests for the shared pooled HTTP clients."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from aria.tools.http import client as http_client
+from aria.tools.http.client import (
+    DNSCache,
+    PooledTransport,
+    aclose_http_clients,
+    get_async_client,
+    get_sync_client,
+)
+
+
+@pytest.fixture
+def server():
+    """Local HTTP/1.1 server; tracks connections and concurrent requests."""
+    stats = {"connections": 0, "active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with lock:
+                stats["connections"] += 1
+
+        def do_GET(self):
+            with lock:
+                stats["active"] += 1
+                stats["max_active"] = max(stats["max_active"], stats["active"])
+            if self.path.startswith("/slow"):
+                time.sleep(0.1)
+            with lock:
+                stats["active"] -= 1
+            body = b"ok"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://localhost:{httpd.server_address[1]}", stats
+    httpd.shutdown()
+
+
+def test_sync_client_is_shared_and_keeps_connections_alive(server):
+    url, stats = server
+    client = get_sync_client()
+    assert get_sync_client() is client
+    assert get_sync_client(verify=False) is not client
+
+    for _ in range(5):
+        assert client.get(url).text == "ok"
+    assert stats["connections"] == 1
+    assert not client.cookies.jar
+
+
+def test_async_client_is_per_event_loop(server):
+    url, stats = server
+
+    async def fetch():
+        client = get_async_client()
+        assert get_async_client() is client
+        await asyncio.gather(*(client.get(url) for _ in range(3)))
+        await aclose_http_clients()
+        return client
+
+    first, second = asyncio.run(fetch()), asyncio.run(fetch())
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+def test_per_host_limit(server):
+    url, stats = server
+    transport = PooledTransport(verify=True, per_host=2, dns_cache=DNSCache(60))
+    with httpx.Client(transport=transport) as client:
+        with ThreadPoolExecutor(6) as pool:
+            list(pool.map(lambda _: client.get(f"{url}/slow"), range(6)))
+    assert stats["max_active"] == 2
+
+
+def test_dns_cache_resolves_host_once(server, monkeypatch):
+    url, _ = server
+    lookups: list[str] = []
+    real = http_client.socket.getaddrinfo
+
+    def getaddrinfo(host, *args, **kwargs):
+        lookups.append(host)
+        return real(host, *args, **kwargs)
+
+    monkeypatch.setattr(http_client.socket, "getaddrinfo", getaddrinfo)
+    transport = PooledTransport(verify=True, per_host=4, dns_cache=DNSCache(60))
+    with httpx.Client(transport=transport) as client:
+        for _ in range(3):
+            client.get(url, headers={"Connection": "close"})
+    # Connecting to the cached IP still calls getaddrinfo, without DNS.
+    assert [host for host in lookups if host != "127.0.0.1"] == ["localhost"]
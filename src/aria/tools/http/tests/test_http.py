@@ -18,7 +18,7 @@ class TestHttpRequest:
         assert "error" in data["data"]
         assert "not allowed" in data["data"]["error"]
 
-    @patch("aria.tools.http.functions.httpx.Client")
+    @patch("aria.tools.http.functions.get_sync_client")
     def test_successful_get_request(self, mock_client_cls):
         """Test successful GET request."""
         mock_response = MagicMock()
@@ -26,6 +26,7 @@ class TestHttpRequest:
         mock_response.headers = {"content-type": "application/json"}
         mock_response.text = '{"result": "ok"}'
         mock_response.url = "http://example.com/api"
+        mock_response.extensions = {}
 
         mock_client = MagicMock()
         mock_client.request.return_value = mock_response
@@ -40,7 +41,7 @@ class TestHttpRequest:
         assert data["data"]["body_size"] == len('{"result": "ok"}')
         assert data["data"]["body_file"].endswith(".json")
 
-    @patch("aria.tools.http.functions.httpx.Client")
+    @patch("aria.tools.http.functions.get_sync_client")
     def test_timeout_error(self, mock_client_cls):
         """Test timeout handling."""
         mock_client_cls.side_effect = httpx.TimeoutException("timeout")
@@ -55,7 +56,7 @@ class TestHttpRequest:
         assert "error" in data["data"]
         assert "timed out" in data["data"]["error"].lower()
 
-    @patch("aria.tools.http.functions.httpx.Client")
+    @patch("aria.tools.http.functions.get_sync_client")
     def test_connection_error(self, mock_client_cls):
         """Test connection error handling."""
         mock_client_cls.side_effect = httpx.ConnectError("refused")
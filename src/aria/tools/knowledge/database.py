@@ -1,15 +1,108 @@
-"""Database operations for knowledge store persistence."""
+"""Database operations for knowledge store persistence.
+
+Searches use an SQLite FTS5 index (``knowledge_entries_fts``) over the
+``key`` and ``value`` columns, ranked with BM25.  The index is an
+external-content table kept in sync with ``knowledge_entries`` by
+triggers, so every write path (ORM, bulk SQL, cleanup) updates it.
+Existing databases are migrated on first use: the index and triggers are
+created and back-filled from the current rows.  When FTS5 is unavailable,
+or a query has no full-text match, search falls back to the original
+substring scan.
+
+Semantic search is served by the vector index in :mod:`.semantic`; every
+store, update and delete here also queues the entry for (re-)embedding.
+"""
 
 import json
+import re
 from datetime import UTC, datetime
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 
 from aria.tools.database import get_tools_database
 
 from .models import KnowledgeEntryModel
+from .semantic import IndexEntry, get_semantic_index, load_semantic_index
+
+_FTS_TABLE = "knowledge_entries_fts"
+
+_FTS_SCHEMA = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {_FTS_TABLE} USING fts5(
+        key, value,
+        content='knowledge_entries',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_FTS_TABLE}_ai
+    AFTER INSERT ON knowledge_entries BEGIN
+        INSERT INTO {_FTS_TABLE}(rowid, key, value)
+        VALUES (new.rowid, new.key, new.value);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_FTS_TABLE}_ad
+    AFTER DELETE ON knowledge_entries BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, key, value)
+        VALUES ('delete', old.rowid, old.key, old.value);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_FTS_TABLE}_au
+    AFTER UPDATE OF key, value ON knowledge_entries BEGIN
+        INSERT INTO {_FTS_TABLE}({_FTS_TABLE}, rowid, key, value)
+        VALUES ('delete', old.rowid, old.key, old.value);
+        INSERT INTO {_FTS_TABLE}(rowid, key, value)
+        VALUES (new.rowid, new.key, new.value);
+    END
+    """,
+)
+
+# Key matches weigh twice as much as value matches.
+_FTS_SEARCH = text(
+    f"""
+    SELECT e.id AS id,
+           snippet({_FTS_TABLE}, -1, '[', ']', '…', 16) AS snippet,
+           bm25({_FTS_TABLE}, 2.0, 1.0) AS score
+    FROM {_FTS_TABLE}
+    JOIN knowledge_entries AS e ON e.rowid = {_FTS_TABLE}.rowid
+    WHERE {_FTS_TABLE} MATCH :match
+      AND e.agent_id = :agent_id
+      AND e.is_active = 1
+    ORDER BY score
+    LIMIT :limit
+    """
+)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts_match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 prefix query (all terms must match).
+
+    Each word becomes a quoted prefix term, so user input can never be
+    interpreted as FTS5 syntax.  Returns None when the query has no words.
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _entry_to_dict(entry: KnowledgeEntryModel) -> dict:
+    return {
+        "id": entry.id,
+        "key": entry.key,
+        "value": entry.value,
+        "tags": json.loads(entry.tags) if entry.tags else [],
+        "created_at": entry.created_at.isoformat(),
+        "updated_at": entry.updated_at.isoformat(),
+    }
 
 
 class KnowledgeDatabase:
@@ -31,12 +124,58 @@ class KnowledgeDatabase:
 
         self._tools_db = get_tools_database()
         self._tools_db.create_tables()
+        self._fts_enabled = self._ensure_search_index()
         self._initialized = True
         logger.info("KnowledgeDatabase initialized")
 
     def get_session(self):
         return self._tools_db.get_session()
 
+    def _ensure_search_index(self) -> bool:
+        """Create the FTS5 index and triggers, back-filling existing rows.
+
+        Returns:
+            True if full-text search is available.
+        """
+        try:
+            with self.get_session() as session:
+                exists = session.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+                    {"name": _FTS_TABLE},
+                ).first()
+                for statement in _FTS_SCHEMA:
+                    session.execute(text(statement))
+                if not exists:
+                    session.execute(
+                        text(
+                            f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')"
+                        )
+                    )
+                    logger.info("Created knowledge full-text index")
+                session.commit()
+            return True
+        except OperationalError as exc:
+            logger.warning(
+                f"SQLite FTS5 unavailable ({exc}); knowledge search will use "
+                "substring matching"
+            )
+            return False
+
+    def rebuild_search_index(self) -> None:
+        """Rebuild the full-text index from ``knowledge_entries``.
+
+        Only needed if the index drifted, e.g. after a ``VACUUM`` renumbered
+        rowids or rows were modified with triggers disabled.
+        """
+        if not self._fts_enabled:
+            return
+        with self.get_session() as session:
+            session.execute(
+                text(f"INSERT INTO {_FTS_TABLE}({_FTS_TABLE}) VALUES ('rebuild')")
+            )
+            session.commit()
+        logger.info("Rebuilt knowledge full-text index")
+
     def store(
         self,
         entry_id: str,
@@ -46,7 +185,8 @@ class KnowledgeDatabase:
         tags: list[str] | None = None,
     ) -> None:
         """Store a new knowledge entry."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             entry = KnowledgeEntryModel(
                 id=entry_id,
                 agent_id=agent_id,
@@ -58,9 +198,25 @@ class KnowledgeDatabase:
                 is_active=True,
             )
             session.add(entry)
-            session.commit()
             logger.debug(f"Stored knowledge entry {entry_id} with key '{key}'")
 
+        index = get_semantic_index()
+        if index is None:
+            self._tools_db.submit(_write)
+            return
+
+        def _on_error(exc: Exception) -> None:
+            # The row never landed; keep the vector index consistent.
+            index.remove(entry_id)
+
+        # Enqueue first so a dropped batched write cannot race the removal.
+        index.enqueue(IndexEntry(entry_id, agent_id, key, value))
+        try:
+            self._tools_db.submit(_write, _on_error)
+        except Exception as exc:
+            _on_error(exc)
+            raise
+
     def recall(self, agent_id: str, key: str) -> dict | None:
         """Recall a knowledge entry by key."""
         with self.get_session() as session:
@@ -93,7 +249,55 @@ class KnowledgeDatabase:
         query: str,
         max_results: int = 10,
     ) -> list[dict]:
-        """Search knowledge entries by key or value substring."""
+        """Search knowledge entries, best matches first.
+
+        Uses BM25-ranked full-text search with prefix matching and adds a
+        highlighted ``snippet`` and ``score`` to each result.  Falls back to
+        a key/value substring scan (newest first) when full-text search is
+        unavailable or finds nothing.
+        """
+        match = _fts_match_expression(query) if self._fts_enabled else None
+        if match is not None:
+            results = self._search_fts(agent_id, match, max_results)
+            if results:
+                return results
+        return self._search_substring(agent_id, query, max_results)
+
+    def _search_fts(self, agent_id: str, match: str, max_results: int) -> list[dict]:
+        with self.get_session() as session:
+            try:
+                rows = session.execute(
+                    _FTS_SEARCH,
+                    {"match": match, "agent_id": agent_id, "limit": max_results},
+                ).all()
+            except OperationalError as exc:
+                logger.warning(f"Knowledge full-text search failed: {exc}")
+                return []
+            if not rows:
+                return []
+
+            stmt = select(KnowledgeEntryModel).where(
+                KnowledgeEntryModel.id.in_([row.id for row in rows])
+            )
+            entries = {e.id: e for e in session.execute(stmt).scalars()}
+
+            results = []
+            for row in rows:
+                entry = entries.get(row.id)
+                if entry is None:
+                    continue
+                results.append(
+                    {
+                        **_entry_to_dict(entry),
+                        "snippet": row.snippet,
+                        "score": round(-row.score, 4),
+                    }
+                )
+            return results
+
+    def _search_substring(
+        self, agent_id: str, query: str, max_results: int
+    ) -> list[dict]:
         with self.get_session() as session:
             pattern = f"%{query}%"
             stmt = (
@@ -111,18 +315,54 @@ class KnowledgeDatabase:
             )
             entries = session.execute(stmt).scalars().all()
 
+            return [_entry_to_dict(e) for e in entries]
+
+    def semantic_search(
+        self,
+        agent_id: str,
+        query: str,
+        max_results: int = 10,
+    ) -> list[dict] | None:
+        """Search knowledge entries by embedding similarity.
+
+        Each result carries a cosine-similarity ``score``.
+
+        Returns:
+            Results, most similar first, or None if no embedding backend is
+            available.
+        """
+        index = load_semantic_index(self.index_entries)
+        if index is None:
+            return None
+
+        matches = index.query(agent_id, query, max_results)
+        if not matches:
+            return []
+
+        with self.get_session() as session:
+            stmt = select(KnowledgeEntryModel).where(
+                KnowledgeEntryModel.id.in_([entry_id for entry_id, _ in matches]),
+                KnowledgeEntryModel.is_active.is_(True),
+            )
+            entries = {e.id: e for e in session.execute(stmt).scalars()}
+
             return [
-                {
-                    "id": e.id,
-                    "key": e.key,
-                    "value": e.value,
-                    "tags": json.loads(e.tags) if e.tags else [],
-                    "created_at": e.created_at.isoformat(),
-                    "updated_at": e.updated_at.isoformat(),
-                }
-                for e in entries
+                {**_entry_to_dict(entries[entry_id]), "score": score}
+                for entry_id, score in matches
+                if entry_id in entries
             ]
 
+    def index_entries(self) -> list[IndexEntry]:
+        """Return every active entry in the form the semantic index embeds."""
+        with self.get_session() as session:
+            stmt = select(
+                KnowledgeEntryModel.id,
+                KnowledgeEntryModel.agent_id,
+                KnowledgeEntryModel.key,
+                KnowledgeEntryModel.value,
+            ).where(KnowledgeEntryModel.is_active.is_(True))
+            return [IndexEntry(*row) for row in session.execute(stmt)]
+
     def list_entries(
         self,
         agent_id: str,
@@ -175,7 +415,11 @@ class KnowledgeDatabase:
             entry.updated_at = datetime.now(UTC)
             session.commit()
             logger.debug(f"Updated knowledge entry {entry_id}")
-            return True
+
+        index = get_semantic_index()
+        if index is not None:
+            index.enqueue(IndexEntry(entry_id, agent_id, entry.key, value))
+        return True
 
     def delete(self, entry_id: str, agent_id: str) -> bool:
         """Soft-delete a knowledge entry."""
@@ -194,7 +438,11 @@ class KnowledgeDatabase:
             entry.updated_at = datetime.now(UTC)
             session.commit()
             logger.debug(f"Deleted knowledge entry {entry_id}")
-            return True
+
+        index = get_semantic_index()
+        if index is not None:
+            index.remove(entry_id)
+        return True
 
     def cleanup_old_entries(self, days: int = 30) -> int:
         """Permanently delete inactive entries older than specified days."""
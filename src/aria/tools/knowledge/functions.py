@@ -77,19 +77,24 @@ def knowledge(
     Actions:
         - "store": Save a new entry (requires key and value).
         - "recall": Retrieve an entry by key (requires key).
-        - "search": Search entries by query string (requires query).
+        - "search": Full-text search ranked by relevance, with prefix
+          matching and highlighted snippets (requires query).
+        - "semantic_search": Find entries by meaning rather than exact
+          words, ranked by embedding similarity (requires query). Falls back
+          to "search" when the embedding model is unavailable.
         - "list": List all entries (optional tag filter).
         - "update": Update an existing entry (requires entry_id and value).
         - "delete": Remove an entry (requires entry_id).
 
     Args:
         reason: Required. Brief explanation of why you are calling this tool (e.g. "Store user's preferred language").
-        action: One of: store, recall, search, list, update, delete.
+        action: One of: store, recall, search, semantic_search, list,
+            update, delete.
         key: Unique key for the entry (required for store/recall).
         value: Value to store (required for store/update).
         tags: Optional list of tags for categorization.
         entry_id: UUID of entry to update/delete.
-        query: Search query for text search.
+        query: Search query for search/semantic_search.
         max_results: Maximum results for search/list (default: 10).
         agent_id: Agent identifier (auto-set, do not provide).
 
@@ -109,6 +114,8 @@ def knowledge(
         return _action_recall(db, reason, agent_id, key)
     elif action == "search":
         return _action_search(db, reason, agent_id, query, max_results)
+    elif action == "semantic_search":
+        return _action_semantic_search(db, reason, agent_id, query, max_results)
     elif action == "list":
         return _action_list(db, reason, agent_id, tags, max_results)
     elif action == "update":
@@ -121,9 +128,13 @@ def knowledge(
             code="INVALID_ACTION",
             message=(
                 f"Unknown action '{action}'. "
-                "Valid: store, recall, search, list, update, delete"
+                "Valid: store, recall, search, semantic_search, list, update, "
+                "delete"
+            ),
+            how_to_fix=(
+                "Use one of: store, recall, search, semantic_search, list, "
+                "update, delete"
             ),
-            how_to_fix="Use one of: store, recall, search, list, update, delete",
         )
 
 
@@ -221,6 +232,39 @@ def _action_search(
     )
 
 
+def _action_semantic_search(
+    db: KnowledgeDatabase,
+    reason: str,
+    agent_id: str,
+    query: str | None,
+    max_results: int,
+) -> str:
+    """Search knowledge entries by embedding similarity."""
+    if not query:
+        return _err(
+            reason=reason,
+            code="MISSING_QUERY",
+            message="Missing required 'query' parameter.",
+            how_to_fix="Provide the 'query' parameter.",
+        )
+
+    results = db.semantic_search(agent_id, query, max_results)
+    mode = "semantic"
+    if results is None:
+        results = db.search(agent_id, query, max_results)
+        mode = "fulltext"
+    return _ok(
+        reason=reason,
+        data={
+            "action": "semantic_search",
+            "mode": mode,
+            "query": query,
+            "results_count": len(results),
+            "results": results,
+        },
+    )
+
+
 def _action_list(
     db: KnowledgeDatabase,
     reason: str,
@@ -0,0 +1,302 @@
+"""Vector index for semantic knowledge search.
+
+Knowledge entries are embedded into a dedicated ChromaDB collection
+(``aria_knowledge``) so agents can find memories by meaning instead of by
+exact key or keyword.  The web app attaches its already-loaded embedding
+model and Chroma client at startup via :func:`set_semantic_backend`;
+other processes (CLI, ``ax``) load their own on first semantic query.
+
+Embedding happens off the request path.  ``store``, ``update`` and
+``delete`` only enqueue the entry id; a background thread embeds pending
+entries in batches of ``ARIA_KNOWLEDGE_EMBED_BATCH_SIZE`` once the batch
+fills or ``ARIA_KNOWLEDGE_EMBED_FLUSH_MS`` elapses.  Queries flush the
+queue first, so an entry is searchable as soon as ``store`` returns.
+
+Entries written while no backend is attached (e.g. by a CLI process) are
+picked up by :meth:`SemanticIndex.sync` when a backend is attached or
+loaded, and :meth:`SemanticIndex.reindex` rebuilds the whole collection.
+"""
+
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from aria.config import get_optional_env
+
+COLLECTION_NAME = "aria_knowledge"
+
+EMBED_BATCH_SIZE = int(get_optional_env("ARIA_KNOWLEDGE_EMBED_BATCH_SIZE", "32"))
+EMBED_FLUSH_INTERVAL = (
+    int(get_optional_env("ARIA_KNOWLEDGE_EMBED_FLUSH_MS", "200")) / 1000
+)
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Text and filter metadata for one knowledge entry."""
+
+    entry_id: str
+    agent_id: str
+    key: str
+    value: str
+
+    @property
+    def document(self) -> str:
+        return f"{self.key}\n{self.value}"
+
+
+# ``None`` marks a pending removal.
+_Pending = dict[str, IndexEntry | None]
+
+
+class SemanticIndex:
+    """Batched embedding writer and similarity search over one collection."""
+
+    def __init__(
+        self,
+        embed_model: Any,
+        vector_db: Any,
+        batch_size: int = EMBED_BATCH_SIZE,
+        flush_interval: float = EMBED_FLUSH_INTERVAL,
+    ):
+        self._embed_model = embed_model
+        self._collection = vector_db.get_or_create_collection(
+            COLLECTION_NAME, metadata={"hnsw:space": "cosine"}
+        )
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(0.0, flush_interval)
+        # Keyed by entry id so repeated updates before a flush embed once.
+        self._pending: _Pending = {}
+        self._cond = threading.Condition()
+        self._index_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="knowledge-embedder", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, entry: IndexEntry) -> None:
+        """Schedule ``entry`` to be (re-)embedded."""
+        self._put(entry.entry_id, entry)
+
+    def remove(self, entry_id: str) -> None:
+        """Schedule ``entry_id`` to be removed from the collection."""
+        self._put(entry_id, None)
+
+    def _put(self, entry_id: str, item: IndexEntry | None) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._pending[entry_id] = item
+            if len(self._pending) == 1 or len(self._pending) >= self._batch_size:
+                self._cond.notify()
+
+    def flush(self) -> None:
+        """Embed everything queued so far on the calling thread."""
+        self._drain()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+        self._drain()
+
+    def query(
+        self, agent_id: str, text: str, max_results: int
+    ) -> list[tuple[str, float]]:
+        """Return ``(entry_id, similarity)`` pairs, most similar first."""
+        self.flush()
+        if max_results < 1:
+            return []
+        embedding = self._embed_model.get_query_embedding(text)
+        result = self._collection.query(
+            query_embeddings=[embedding],
+            n_results=max_results,
+            where={"agent_id": agent_id},
+            include=["distances"],
+        )
+        ids = result["ids"][0] if result["ids"] else []
+        distances = result["distances"][0] if result.get("distances") else []
+        # Cosine distance -> cosine similarity.
+        return [
+            (entry_id, round(1.0 - distance, 4))
+            for entry_id, distance in zip(ids, distances, strict=False)
+        ]
+
+    def indexed_ids(self) -> set[str]:
+        """Return the ids currently stored in the collection."""
+        self.flush()
+        return set(self._collection.get(include=[])["ids"])
+
+    def sync(self, entries: Iterable[IndexEntry]) -> int:
+        """Queue active entries missing from the collection.
+
+        Returns:
+            Number of entries queued.
+        """
+        indexed = self.indexed_ids()
+        queued = 0
+        for entry in entries:
+            if entry.entry_id not in indexed:
+                self.enqueue(entry)
+                queued += 1
+        if queued:
+            logger.info(f"Queued {queued} knowledge entries for embedding")
+        return queued
+
+    def reindex(
+        self,
+        entries: Iterable[IndexEntry],
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Re-embed ``entries`` and drop vectors for everything else.
+
+        Runs synchronously on the calling thread in batches.
+
+        Returns:
+            Number of entries embedded.
+        """
+        self.flush()
+        with self._index_lock:
+            keep: set[str] = set()
+            batch: list[IndexEntry] = []
+            for entry in entries:
+                keep.add(entry.entry_id)
+                batch.append(entry)
+                if len(batch) >= self._batch_size:
+                    self._upsert(batch)
+                    if progress is not None:
+                        progress(len(keep))
+                    batch = []
+            if batch:
+                self._upsert(batch)
+                if progress is not None:
+                    progress(len(keep))
+
+            stale = set(self._collection.get(include=[])["ids"]) - keep
+            if stale:
+                self._collection.delete(ids=list(stale))
+        logger.info(
+            f"Re-indexed {len(keep)} knowledge entries "
+            f"({len(stale)} stale vectors removed)"
+        )
+        return len(keep)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if len(self._pending) < self._batch_size:
+                    self._cond.wait(self._flush_interval)
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._index_lock:
+            with self._cond:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            upserts = [item for item in pending.values() if item is not None]
+            removals = [eid for eid, item in pending.items() if item is None]
+            try:
+                for start in range(0, len(upserts), self._batch_size):
+                    self._upsert(upserts[start : start + self._batch_size])
+                if removals:
+                    self._collection.delete(ids=removals)
+                logger.debug(
+                    f"Knowledge index: embedded {len(upserts)}, removed {len(removals)}"
+                )
+            except Exception:
+                # Missing vectors are restored by the next sync()/reindex().
+                logger.exception("Knowledge embedding batch failed")
+
+    def _upsert(self, batch: list[IndexEntry]) -> None:
+        embeddings = self._embed_model.get_text_embedding_batch(
+            [entry.document for entry in batch]
+        )
+        self._collection.upsert(
+            ids=[entry.entry_id for entry in batch],
+            embeddings=embeddings,
+            metadatas=[{"agent_id": entry.agent_id} for entry in batch],
+        )
+
+
+_index: SemanticIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_semantic_index() -> SemanticIndex | None:
+    """Return the attached semantic index, or None if no backend is set."""
+    return _index
+
+
+def set_semantic_backend(embed_model: Any | None, vector_db: Any | None) -> None:
+    """Attach (or detach, with ``None``) the embedding model and Chroma client.
+
+    Called from on_app_startup() and on_app_shutdown().
+    """
+    global _index
+    with _index_lock:
+        if _index is not None:
+            _index.close()
+            _index = None
+        if embed_model is not None and vector_db is not None:
+            _index = SemanticIndex(embed_model, vector_db)
+
+
+def _load_backend() -> tuple[Any, Any]:
+    """Load the configured embeddings model and open the ChromaDB directory."""
+    from chromadb import PersistentClient
+
+    from aria.config.database import ChromaDB as ChromaDBConfig
+    from aria.config.models import Embeddings as EmbeddingsConfig
+    from aria.llm import get_embeddings_model
+
+    model_ref = EmbeddingsConfig.model_path or EmbeddingsConfig.model
+    if not Path(model_ref).is_dir():
+        model_ref = EmbeddingsConfig.model
+    embed_model = get_embeddings_model(model_name=model_ref)
+    return embed_model, PersistentClient(path=str(ChromaDBConfig.db_path))
+
+
+def load_semantic_index(
+    entries: Callable[[], Iterable[IndexEntry]] | None = None,
+) -> SemanticIndex | None:
+    """Return the attached index, loading a default backend if needed.
+
+    Outside the web app this opens the configured ChromaDB directory and
+    loads the embeddings model, which can take several seconds.  When a
+    backend is loaded here and ``entries`` is given, the rows it returns
+    are reconciled with :meth:`SemanticIndex.sync`, so entries stored
+    while no backend was attached are embedded before the first query.
+
+    Returns:
+        The index, or None if the backend could not be loaded.
+    """
+    global _index
+    if _index is not None:
+        return _index
+    try:
+        embed_model, vector_db = _load_backend()
+    except Exception as exc:
+        logger.warning(f"Semantic knowledge search unavailable: {exc}")
+        return None
+
+    with _index_lock:
+        if _index is not None:
+            return _index
+        # Publish before syncing so concurrent stores enqueue themselves.
+        _index = SemanticIndex(embed_model, vector_db)
+        if entries is not None:
+            _index.sync(entries())
+        return _index
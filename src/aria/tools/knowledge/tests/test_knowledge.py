@@ -204,3 +204,259 @@ class TestKnowledgeStore:
 
         assert json.loads(r1)["data"]["value"] == "agent1_data"
         assert json.loads(r2)["data"]["value"] == "agent2_data"
+
+
+class TestKnowledgeFullTextSearch:
+    """Test suite for the FTS5-backed knowledge search."""
+
+    def test_search_ranks_by_relevance(self, test_db):
+        """Entries matching in the key rank above value-only matches."""
+        knowledge("Store", action="store", key="notes", value="mentions deploy once")
+        knowledge(
+            "Store", action="store", key="deploy_steps", value="deploy with docker"
+        )
+
+        data = json.loads(knowledge("Search", action="search", query="deploy"))
+        results = data["data"]["results"]
+        assert [r["key"] for r in results] == ["deploy_steps", "notes"]
+        assert results[0]["score"] >= results[1]["score"]
+
+    def test_search_prefix_and_snippet(self, test_db):
+        """Words match by prefix and the snippet highlights the hit."""
+        knowledge(
+            "Store",
+            action="store",
+            key="stack",
+            value="The backend is written in Python with PostgreSQL",
+        )
+
+        data = json.loads(knowledge("Search", action="search", query="postgre"))
+        results = data["data"]["results"]
+        assert len(results) == 1
+        assert "[PostgreSQL]" in results[0]["snippet"]
+
+    def test_search_reflects_update_and_delete(self, test_db):
+        """The index follows updates and soft deletes."""
+        knowledge("Store", action="store", key="editor", value="vim")
+        entry_id = json.loads(knowledge("Search", action="search", query="vim"))[
+            "data"
+        ]["results"][0]["id"]
+
+        knowledge("Update", action="update", entry_id=entry_id, value="emacs")
+        data = json.loads(knowledge("Search", action="search", query="emacs"))
+        assert data["data"]["results_count"] == 1
+        data = json.loads(knowledge("Search", action="search", query="vim"))
+        assert data["data"]["results_count"] == 0
+
+        knowledge("Delete", action="delete", entry_id=entry_id)
+        data = json.loads(knowledge("Search", action="search", query="emacs"))
+        assert data["data"]["results_count"] == 0
+
+    def test_search_falls_back_to_substring(self, test_db):
+        """Mid-word matches still work through the substring fallback."""
+        knowledge("Store", action="store", key="token", value="abc123xyz")
+
+        data = json.loads(knowledge("Search", action="search", query="123"))
+        assert data["data"]["results_count"] == 1
+        assert "snippet" not in data["data"]["results"][0]
+
+    def test_search_ignores_fts_syntax(self, test_db):
+        """Operators and quotes in the query are treated as plain text."""
+        knowledge("Store", action="store", key="quote", value='say "hi" OR bye')
+
+        data = json.loads(knowledge("Search", action="search", query='"hi" OR ('))
+        assert data["data"]["results_count"] == 1
+
+    def test_existing_rows_are_indexed_on_migration(self, test_tools_db):
+        """A database created before the index existed is back-filled."""
+        from sqlalchemy import text
+
+        knowledge("Store", action="store", key="legacy", value="old fact")
+        with test_tools_db.get_session() as session:
+            for suffix in ("", "_ai", "_ad", "_au"):
+                kind = "TABLE" if not suffix else "TRIGGER"
+                session.execute(
+                    text(f"DROP {kind} IF EXISTS knowledge_entries_fts{suffix}")
+                )
+            session.commit()
+
+        KnowledgeDatabase._instance = None
+        KnowledgeDatabase()
+
+        data = json.loads(knowledge("Search", action="search", query="fact"))
+        assert data["data"]["results"][0]["key"] == "legacy"
+        assert "snippet" in data["data"]["results"][0]
+
+
+_CONCEPTS = {
+    "cat": 0,
+    "kitten": 0,
+    "feline": 0,
+    "dog": 1,
+    "puppy": 1,
+    "python": 2,
+    "programming": 2,
+    "code": 2,
+    "coffee": 3,
+    "espresso": 3,
+}
+
+
+class _ConceptEmbedding:
+    """Deterministic stand-in for the embedding model: one axis per concept."""
+
+    def __init__(self):
+        self.batches: list[int] = []
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * 5
+        for word in text.lower().replace("\n", " ").split():
+            vector[_CONCEPTS.get(word.strip(".,"), 4)] += 1.0
+        return vector
+
+    def get_text_embedding_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(len(texts))
+        return [self._embed(t) for t in texts]
+
+    def get_query_embedding(self, query: str) -> list[float]:
+        return self._embed(query)
+
+
+@pytest.fixture()
+def semantic_backend(tmp_path):
+    """Attach a fake embedding model and a throwaway Chroma client."""
+    import chromadb
+
+    from aria.tools.knowledge.semantic import set_semantic_backend
+
+    model = _ConceptEmbedding()
+    client = chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+    set_semantic_backend(model, client)
+    yield model, client
+    set_semantic_backend(None, None)
+
+
+class TestKnowledgeSemanticSearch:
+    """Test suite for embedding-based knowledge search."""
+
+    def test_finds_entries_by_meaning(self, test_db, semantic_backend):
+        """A query matches entries that share no words with it."""
+        knowledge("Store", action="store", key="pet", value="has a kitten")
+        knowledge("Store", action="store", key="drink", value="likes espresso")
+        knowledge("Store", action="store", key="job", value="writes python code")
+
+        data = json.loads(
+            knowledge("Search", action="semantic_search", query="feline", max_results=1)
+        )["data"]
+        assert data["mode"] == "semantic"
+        assert [r["key"] for r in data["results"]] == ["pet"]
+        assert 0 < data["results"][0]["score"] <= 1
+
+    def test_store_embeds_in_batches(self, test_db, semantic_backend):
+        """Stores are queued and embedded together, not one call each."""
+        model, _ = semantic_backend
+        for i in range(5):
+            knowledge("Store", action="store", key=f"k{i}", value="dog")
+
+        knowledge("Search", action="semantic_search", query="puppy")
+        assert sum(model.batches) == 5
+        assert len(model.batches) < 5
+
+    def test_follows_update_and_delete(self, test_db, semantic_backend):
+        """Updated entries are re-embedded and deleted ones disappear."""
+        knowledge("Store", action="store", key="drink", value="coffee")
+        entry_id = json.loads(
+            knowledge("Search", action="semantic_search", query="espresso")
+        )["data"]["results"][0]["id"]
+
+        knowledge("Update", action="update", entry_id=entry_id, value="puppy")
+        data = json.loads(
+            knowledge("Search", action="semantic_search", query="dog", max_results=1)
+        )["data"]
+        assert data["results"][0]["value"] == "puppy"
+
+        knowledge("Delete", action="delete", entry_id=entry_id)
+        data = json.loads(knowledge("Search", action="semantic_search", query="dog"))
+        assert data["data"]["results_count"] == 0
+
+    def test_results_are_scoped_to_agent(self, test_db, semantic_backend):
+        """Entries from other agents are never returned."""
+        knowledge("Store", action="store", key="pet", value="cat", agent_id="a1")
+
+        data = json.loads(
+            knowledge("Search", action="semantic_search", query="cat", agent_id="a2")
+        )
+        assert data["data"]["results_count"] == 0
+
+    def test_reindex_embeds_existing_rows(self, test_db, semantic_backend):
+        """Entries stored before the backend was attached are back-filled."""
+        from aria.tools.knowledge.semantic import (
+            get_semantic_index,
+            set_semantic_backend,
+        )
+
+        model, client = semantic_backend
+        set_semantic_backend(None, None)
+        knowledge("Store", action="store", key="pet", value="kitten")
+        set_semantic_backend(model, client)
+
+        index = get_semantic_index()
+        assert index is not None
+        assert index.indexed_ids() == set()
+        assert index.reindex(test_db.index_entries()) == 1
+
+        data = json.loads(knowledge("Search", action="semantic_search", query="cat"))
+        assert data["data"]["results"][0]["key"] == "pet"
+
+    def test_sync_queues_only_missing_rows(self, test_db, semantic_backend):
+        """sync() embeds rows missing from the collection and nothing else."""
+        from aria.tools.knowledge.semantic import (
+            get_semantic_index,
+            set_semantic_backend,
+        )
+
+        model, client = semantic_backend
+        knowledge("Store", action="store", key="pet", value="cat")
+        get_semantic_index().flush()
+        set_semantic_backend(None, None)
+        knowledge("Store", action="store", key="drink", value="coffee")
+        set_semantic_backend(model, client)
+
+        assert get_semantic_index().sync(test_db.index_entries()) == 1
+
+    def test_loaded_index_embeds_entries_stored_without_backend(
+        self, test_db, tmp_path, monkeypatch
+    ):
+        """A process that loads its own backend back-fills earlier stores."""
+        import chromadb
+
+        import aria.tools.knowledge.semantic as semantic
+
+        knowledge("Store", action="store", key="pet", value="kitten")
+        model = _ConceptEmbedding()
+        client = chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+        monkeypatch.setattr(semantic, "_load_backend", lambda: (model, client))
+        try:
+            data = json.loads(
+                knowledge("Search", action="semantic_search", query="cat")
+            )["data"]
+        finally:
+            semantic.set_semantic_backend(None, None)
+
+        assert data["mode"] == "semantic"
+        assert [r["key"] for r in data["results"]] == ["pet"]
+
+    def test_falls_back_to_fulltext_without_backend(self, test_db, monkeypatch):
+        """Without an embedding model the action uses full-text search."""
+        import aria.tools.knowledge.database as kdb
+
+        monkeypatch.setattr(kdb, "load_semantic_index", lambda entries=None: None)
+        knowledge("Store", action="store", key="pet", value="cat")
+
+        data = json.loads(knowledge("Search", action="semantic_search", query="cat"))
+        assert data["data"]["mode"] == "fulltext"
+        assert data["data"]["results"][0]["key"] == "pet"
+
+    def test_requires_query(self, test_db):
+        data = json.loads(knowledge("Search", action="semantic_search"))
+        assert data["data"]["error"]["code"] == "MISSING_QUERY"
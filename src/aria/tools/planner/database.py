@@ -5,6 +5,7 @@ from datetime import UTC, datetime, timedelta
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import Session
 
 from aria.tools.database import get_tools_database
 
@@ -45,7 +46,8 @@ class PlannerDatabase:
         created_at: str,
     ) -> None:
         """Save a new plan with its steps."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             # Create plan
             plan = PlanModel(
                 id=plan_id,
@@ -71,9 +73,10 @@ class PlannerDatabase:
                 )
                 session.add(step)
 
-            session.commit()
             logger.debug(f"Saved plan {plan_id} with {len(steps)} steps")
 
+        self._tools_db.submit(_write)
+
     def load_plan(self, plan_id: str) -> dict | None:
         """Load a plan by its ID."""
         with self.get_session() as session:
@@ -55,3 +55,7 @@ COGNITIVE_SCAFFOLDING = {
     "creative": "Generate alternatives and reframes.",
     "reflection": "Surface assumptions and possible bias.",
 }
+
+# In-process cache of live reasoning sessions (see registry.py).
+SESSION_CACHE_MAX_SIZE = 64
+SESSION_CACHE_IDLE_SECONDS = 30 * 60
@@ -1,6 +1,7 @@
 """Database operations for reasoning persistence using SQLAlchemy."""
 
 import json
+import threading
 from datetime import UTC, datetime, timedelta
 
 from loguru import logger
@@ -8,7 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm import Session
 
-from aria.tools.database import get_tools_database
+from aria.tools.database import WriteErrorHandler, get_tools_database
 
 from .models import (
     ReasoningReflectionModel,
@@ -43,6 +44,9 @@ class ReasoningDatabase:
 
         self._tools_db = get_tools_database()
         self._tools_db.create_tables()  # ensures reasoning tables exist
+        # Internal ids of sessions with a dropped queued write.
+        self._stale_sessions: set[str] = set()
+        self._stale_lock = threading.Lock()
         self._initialized = True
         logger.info("ReasoningDatabase initialized")
 
@@ -50,6 +54,26 @@ class ReasoningDatabase:
         """Get a new database session."""
         return self._tools_db.get_session()
 
+    def _on_write_error(self, internal_id: str) -> WriteErrorHandler:
+        """Return a callback marking *internal_id* stale if its write is dropped."""
+
+        def _mark_stale(exc: Exception) -> None:
+            with self._stale_lock:
+                self._stale_sessions.add(internal_id)
+
+        return _mark_stale
+
+    def pop_stale(self, internal_id: str) -> bool:
+        """Return whether a queued write for the session was dropped.
+
+        The mark is cleared, so each dropped write is reported once.
+        """
+        with self._stale_lock:
+            if internal_id in self._stale_sessions:
+                self._stale_sessions.discard(internal_id)
+                return True
+            return False
+
     def save_session_metadata(
         self,
         internal_id: str,
@@ -58,7 +82,8 @@ class ReasoningDatabase:
         created_at: str,
     ) -> None:
         """Save or update session metadata."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             # Check if session exists
             stmt = select(ReasoningSessionModel).where(
                 ReasoningSessionModel.id == internal_id
@@ -81,9 +106,10 @@ class ReasoningDatabase:
                 )
                 session.add(new_session)
 
-            session.commit()
             logger.debug(f"Saved session metadata: {session_id} for agent {agent_id}")
 
+        self._tools_db.submit(_write, self._on_write_error(internal_id))
+
     def load_session(self, session_id: str, agent_id: str) -> dict | None:
         """Load complete session data from database."""
         with self.get_session() as session:
@@ -176,7 +202,8 @@ class ReasoningDatabase:
 
     def save_step(self, session_internal_id: str, step: dict) -> None:
         """Save a reasoning step."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             step_model = ReasoningStepModel(
                 session_id=session_internal_id,
                 step_number=step["id"],
@@ -198,12 +225,14 @@ class ReasoningDatabase:
             session_model = session.execute(stmt).scalar_one()
             session_model.updated_at = datetime.now(UTC)
 
-            session.commit()
             logger.debug(f"Saved step {step['id']} for session {session_internal_id}")
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def save_reflection(self, session_internal_id: str, reflection: dict) -> None:
         """Save a reflection."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             refl_model = ReasoningReflectionModel(
                 session_id=session_internal_id,
                 content=reflection["content"],
@@ -220,9 +249,10 @@ class ReasoningDatabase:
             session_model = session.execute(stmt).scalar_one()
             session_model.updated_at = datetime.now(UTC)
 
-            session.commit()
             logger.debug(f"Saved reflection for session {session_internal_id}")
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def save_scratchpad_item(
         self,
         session_internal_id: str,
@@ -232,7 +262,8 @@ class ReasoningDatabase:
         reason: str | None = None,
     ) -> None:
         """Save or update a scratchpad item."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             # Check if item exists
             stmt = select(ReasoningScratchpadModel).where(
                 ReasoningScratchpadModel.session_id == session_internal_id,
@@ -255,11 +286,12 @@ class ReasoningDatabase:
                 )
                 session.add(item)
 
-            session.commit()
             logger.debug(
                 f"Saved scratchpad item {key} for session {session_internal_id}"
             )
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def save_tool_event(
         self,
         session_internal_id: str,
@@ -269,7 +301,8 @@ class ReasoningDatabase:
         payload: dict | None = None,
     ) -> None:
         """Persist an audit event for a tool call."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             ev = ReasoningToolEventModel(
                 session_id=session_internal_id,
                 tool_name=tool_name,
@@ -286,14 +319,16 @@ class ReasoningDatabase:
             session_model = session.execute(stmt).scalar_one()
             session_model.updated_at = datetime.now(UTC)
 
-            session.commit()
             logger.debug(
                 f"Saved tool event {tool_name} for session {session_internal_id}",
             )
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def delete_scratchpad_item(self, session_internal_id: str, key: str) -> None:
         """Delete a scratchpad item."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             stmt = select(ReasoningScratchpadModel).where(
                 ReasoningScratchpadModel.session_id == session_internal_id,
                 ReasoningScratchpadModel.key == key,
@@ -302,14 +337,16 @@ class ReasoningDatabase:
 
             if item:
                 session.delete(item)
-                session.commit()
                 logger.debug(
                     f"Deleted scratchpad item {key} for session {session_internal_id}"
                 )
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def clear_scratchpad(self, session_internal_id: str) -> None:
         """Clear all scratchpad items for a session."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             stmt = select(ReasoningScratchpadModel).where(
                 ReasoningScratchpadModel.session_id == session_internal_id
             )
@@ -318,9 +355,10 @@ class ReasoningDatabase:
             for item in items:
                 session.delete(item)
 
-            session.commit()
             logger.debug(f"Cleared scratchpad for session {session_internal_id}")
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def delete_session(self, session_id: str, agent_id: str) -> bool:
         """Mark session as inactive (soft delete)."""
         with self.get_session() as session:
@@ -342,7 +380,7 @@ class ReasoningDatabase:
         """Clear all steps, reflections, and scratchpad for a session."""
         from sqlalchemy import delete as sa_delete
 
-        with self.get_session() as session:
+        def _write(session: Session) -> None:
             # Bulk delete all related data
             session.execute(
                 sa_delete(ReasoningStepModel).where(
@@ -367,9 +405,10 @@ class ReasoningDatabase:
             session_model = session.execute(stmt).scalar_one()
             session_model.updated_at = datetime.now(UTC)
 
-            session.commit()
             logger.debug(f"Reset session {session_internal_id}")
 
+        self._tools_db.submit(_write, self._on_write_error(session_internal_id))
+
     def list_sessions(self, agent_id: str | None = None) -> list[dict]:
         """List all active sessions, optionally filtered by agent."""
         with self.get_session() as session:
@@ -228,13 +228,14 @@ def _action_start(reason: str, agent_id: str) -> dict[str, Any]:
     session = ReasoningSession(session_id=session_id, agent_id=agent_id)
     session.set_database(registry.get_db())
     session.persist_metadata()
+    registry.cache_session(session)
 
     if old_session_id is not None:
         logger.info(
             f"Replacing active session {old_session_id} with {session_id} "
             f"for agent '{agent_id}'"
         )
-        registry.get_db().delete_session(old_session_id, agent_id)
+        registry.delete_session(old_session_id, agent_id)
 
     logger.success(f"Started reasoning session for agent '{agent_id}'")
     now = utc_timestamp()
@@ -312,6 +313,8 @@ def _action_step(
         )
     except Exception as exc:
         logger.exception("reasoning step failed")
+        # A failed write may leave the cached session ahead of the database.
+        registry.remove_session(agent_id, session_id)
         return _err(
             tool="reasoning",
             reason=reason,
@@ -371,6 +374,8 @@ def _action_reflect(
         )
     except Exception as exc:
         logger.exception("reasoning reflect failed")
+        # A failed write may leave the cached session ahead of the database.
+        registry.remove_session(agent_id, session_id)
         return _err(
             tool="reasoning",
             reason=reason,
@@ -482,8 +487,8 @@ def _action_end(reason: str, agent_id: str) -> dict[str, Any]:
         # Ending should still succeed even if session can't be loaded.
         logger.debug(f"Could not persist reasoning end tool event for {session_id}")
 
-    # Mark inactive in persistence store
-    registry.get_db().delete_session(session_id, agent_id)
+    # Mark inactive in persistence store and drop the cached session
+    registry.delete_session(session_id, agent_id)
 
     logger.info(f"Ended reasoning session for agent '{agent_id}'")
     return _ok(
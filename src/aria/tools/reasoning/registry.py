@@ -1,7 +1,24 @@
-"""Session registry helpers backed by the database."""
+"""Session registry helpers backed by the database.
+
+Loaded sessions are kept in a small per-process LRU cache keyed by
+``(agent_id, session_id)``.  ``ReasoningSession`` writes every mutation
+through to the database, so the cached object always mirrors the stored
+rows and repeated tool calls no longer rebuild the whole session from
+SQLite.  Entries are evicted when the cache is full, when they have been
+idle for too long, or explicitly when a session is replaced or ended.
+
+With batched tool database writes a mutation can fail after the tool
+call returned; the database marks the session stale and the next lookup
+drops the cached object and reloads what was actually stored.
+"""
+
+import threading
+import time
+from collections import OrderedDict
 
 from loguru import logger
 
+from .constants import SESSION_CACHE_IDLE_SECONDS, SESSION_CACHE_MAX_SIZE
 from .database import get_database
 from .session import ReasoningSession
 
@@ -9,6 +26,10 @@ from .session import ReasoningSession
 # This avoids creating the production database at import time.
 _db = None
 
+# (agent_id, session_id) -> (session, last access in monotonic seconds)
+_cache: OrderedDict[tuple[str, str], tuple[ReasoningSession, float]] = OrderedDict()
+_cache_lock = threading.Lock()
+
 
 def _get_db():
     """Get or create the database instance (lazy initialization)."""
@@ -18,6 +39,54 @@ def _get_db():
     return _db
 
 
+def _evict_expired(now: float) -> None:
+    """Drop idle entries and trim the cache to its size limit.
+
+    Must be called with ``_cache_lock`` held.
+    """
+    expired = [
+        key
+        for key, (_, last_access) in _cache.items()
+        if now - last_access > SESSION_CACHE_IDLE_SECONDS
+    ]
+    for key in expired:
+        del _cache[key]
+    while len(_cache) > SESSION_CACHE_MAX_SIZE:
+        _cache.popitem(last=False)
+
+
+def _cache_get(session_id: str, agent_id: str, db) -> ReasoningSession | None:
+    now = time.monotonic()
+    with _cache_lock:
+        _evict_expired(now)
+        entry = _cache.get((agent_id, session_id))
+        if entry is None:
+            return None
+        session = entry[0]
+        if session._db is not db or db.pop_stale(session.id):
+            # The database was swapped (e.g. tests) or a queued write for
+            # this session was dropped; the entry is stale.
+            del _cache[(agent_id, session_id)]
+            return None
+        _cache[(agent_id, session_id)] = (session, now)
+        _cache.move_to_end((agent_id, session_id))
+        return session
+
+
+def cache_session(session: ReasoningSession) -> None:
+    """Register a live session so later calls reuse it.
+
+    Sessions without an agent or session identifier are not cached.
+    """
+    if not session.session_id or not session.agent_id:
+        return
+    now = time.monotonic()
+    with _cache_lock:
+        _cache[(session.agent_id, session.session_id)] = (session, now)
+        _cache.move_to_end((session.agent_id, session.session_id))
+        _evict_expired(now)
+
+
 def get_active_session_id(agent_id: str) -> str | None:
     """Get most-recent active session ID for an agent from the database."""
     sessions = _get_db().list_sessions(agent_id)
@@ -35,7 +104,7 @@ def get_active_session_id(agent_id: str) -> str | None:
 
 
 def get_session(session_id: str, agent_id: str) -> ReasoningSession:
-    """Load session from database.
+    """Get session from the cache or load it from the database.
 
     Args:
         session_id: Session identifier
@@ -48,6 +117,10 @@ def get_session(session_id: str, agent_id: str) -> ReasoningSession:
         ValueError: If the session does not exist
     """
     db = _get_db()
+    cached = _cache_get(session_id, agent_id, db)
+    if cached is not None:
+        return cached
+
     session_data = db.load_session(session_id, agent_id)
     if session_data is None:
         available = [s["session_id"] for s in db.list_sessions(agent_id)]
@@ -62,22 +135,32 @@ def get_session(session_id: str, agent_id: str) -> ReasoningSession:
 
     session = ReasoningSession.from_dict(session_data)
     session.set_database(db)
+    db.pop_stale(session.id)
+    cache_session(session)
     logger.debug(f"Loaded session {session_id} for agent {agent_id} from database")
     return session
 
 
 def remove_session(agent_id: str, session_id: str) -> None:
-    """No-op for backward compatibility.
+    """Evict a session from the in-memory cache.
 
-    Session state is DB-backed; no in-memory registry is maintained.
+    The database is left untouched; the next ``get_session`` call reloads
+    the session from storage.
     """
-    _ = (agent_id, session_id)
+    with _cache_lock:
+        _cache.pop((agent_id, session_id), None)
+
+
+def delete_session(session_id: str, agent_id: str) -> bool:
+    """Mark a session inactive in the database and evict it from the cache."""
+    remove_session(agent_id, session_id)
+    return _get_db().delete_session(session_id, agent_id)
 
 
 def clear_all() -> None:
-    """Reset in-memory state. Kept for test compatibility."""
-    # DB-backed registry has no in-memory state to clear.
-    return None
+    """Drop every cached session."""
+    with _cache_lock:
+        _cache.clear()
 
 
 def get_db():
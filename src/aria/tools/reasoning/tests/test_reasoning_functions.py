@@ -1,5 +1,7 @@
 """Tests for reasoning functions with persistence and multi-agent support."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from aria.tools.reasoning import reasoning, registry
@@ -483,3 +485,101 @@ def test_invalid_action(test_agent_id, test_db):
     result = reasoning("Testing reason", action="invalid", agent_id=test_agent_id)
     assert result["status"] == "error"
     assert result["error"]["code"] == "INVALID_ACTION"
+
+
+def test_session_cache_reuses_live_session(test_agent_id, test_db, monkeypatch):
+    """Repeated calls reuse the cached session instead of reloading it."""
+    reasoning("Testing reason", action="start", agent_id=test_agent_id)
+    session_id = registry.get_active_session_id(test_agent_id)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("load_session should not be called on a cache hit")
+
+    monkeypatch.setattr(test_db, "load_session", _fail)
+
+    for i in range(3):
+        result = reasoning(
+            "Testing reason",
+            action="step",
+            content=f"Step {i}",
+            agent_id=test_agent_id,
+        )
+        assert result["status"] == "success"
+
+    assert registry.get_session(session_id, test_agent_id) is registry.get_session(
+        session_id, test_agent_id
+    )
+    monkeypatch.undo()
+
+    # The database stays in sync with the cached object (write-through).
+    stored = test_db.load_session(session_id, test_agent_id)
+    assert [s["content"] for s in stored["steps"]] == ["Step 0", "Step 1", "Step 2"]
+
+    reasoning("Testing reason", action="end", agent_id=test_agent_id)
+
+
+def test_session_cache_invalidated_on_end(test_agent_id, test_db):
+    """Ending a session evicts it so it can no longer be resolved."""
+    reasoning("Testing reason", action="start", agent_id=test_agent_id)
+    session_id = registry.get_active_session_id(test_agent_id)
+    registry.get_session(session_id, test_agent_id)
+
+    reasoning("Testing reason", action="end", agent_id=test_agent_id)
+
+    with pytest.raises(ValueError):
+        registry.get_session(session_id, test_agent_id)
+
+
+def test_session_cache_invalidated_on_replace(test_agent_id, test_db):
+    """Starting a new session evicts the one it replaces."""
+    reasoning("Testing reason", action="start", agent_id=test_agent_id)
+    old_session_id = registry.get_active_session_id(test_agent_id)
+
+    reasoning("Testing reason", action="start", agent_id=test_agent_id)
+
+    assert (test_agent_id, old_session_id) not in registry._cache
+    with pytest.raises(ValueError):
+        registry.get_session(old_session_id, test_agent_id)
+
+    reasoning("Testing reason", action="end", agent_id=test_agent_id)
+
+
+def test_session_cache_reset_stays_consistent(test_agent_id, test_db):
+    """A reset clears both the cached session and the stored rows."""
+    reasoning("Testing reason", action="start", agent_id=test_agent_id)
+    reasoning("Testing reason", action="step", content="A", agent_id=test_agent_id)
+    session_id = registry.get_active_session_id(test_agent_id)
+
+    registry.get_session(session_id, test_agent_id).reset("Start over")
+    registry.clear_all()
+
+    summary = reasoning("Testing reason", action="summary", agent_id=test_agent_id)
+    assert summary["data"]["steps_count"] == 0
+
+    reasoning("Testing reason", action="end", agent_id=test_agent_id)
+
+
+def test_session_cache_evicts_lru_and_idle(test_db, monkeypatch):
+    """The cache is bounded by size and drops idle sessions."""
+    monkeypatch.setattr(registry, "SESSION_CACHE_MAX_SIZE", 2)
+
+    agents = ["agent_a", "agent_b", "agent_c"]
+    for agent in agents:
+        reasoning("Testing reason", action="start", agent_id=agent)
+
+    cached_agents = {agent for agent, _ in registry._cache}
+    assert cached_agents == {"agent_b", "agent_c"}
+
+    clock = [1000.0]
+    monkeypatch.setattr(registry, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    registry.clear_all()
+    session_id = registry.get_active_session_id("agent_a")
+    registry.get_session(session_id, "agent_a")
+    assert len(registry._cache) == 1
+
+    clock[0] += registry.SESSION_CACHE_IDLE_SECONDS + 1
+    assert registry._cache_get(session_id, "agent_a", test_db) is None
+    assert len(registry._cache) == 0
+
+    for agent in agents:
+        reasoning("Testing reason", action="end", agent_id=agent)
@@ -12,9 +12,24 @@ Categories:
 - finance: On-demand stock tools
 - entertainment: On-demand imdb tools
 - system: On-demand http_request, process
+
+Tools listed in :data:`PARALLEL_SAFE_TOOLS` (and ax commands in
+:data:`PARALLEL_SAFE_AX_COMMANDS`) have no side effects, so several calls
+from one model response may run at the same time.  Everything else —
+file writes, ``edit_file``, ``shell``, ``python``, HTTP requests, the
+browser, process and worker control — runs one call at a time.
+
+Tools with a :class:`MemoPolicy` in :data:`MEMO_POLICIES` (and ax
+commands in :data:`MEMO_AX_POLICIES`) are idempotent: a repeated call
+with the same arguments in the same turn is answered with a reference to
+the earlier result, as long as the file it read is unchanged or its TTL
+has not expired.  :data:`WRITE_PATH_ARGS` names the path arguments of
+file-writing tools, whose calls invalidate memoized results for those
+paths.
 """
 
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from llama_index.core.tools import FunctionTool
 from loguru import logger
@@ -43,6 +58,126 @@ ALL_CATEGORIES = [
 ]
 
 
+# Read-only tools that may run concurrently with each other.
+PARALLEL_SAFE_TOOLS = frozenset(
+    {
+        "read_file",
+        "list_files",
+        "search_files",
+        "file_info",
+        "fetch_current_stock_price",
+        "fetch_company_information",
+        "fetch_ticker_news",
+        "search_imdb_titles",
+        "get_movie_details",
+        "get_person_details",
+        "get_person_filmography",
+        "get_all_series_episodes",
+        "get_movie_reviews",
+        "get_movie_trivia",
+        "get_youtube_video_transcription",
+    }
+)
+
+# Read-only ax commands, by family.
+PARALLEL_SAFE_AX_COMMANDS: dict[str, frozenset[str]] = {
+    "web": frozenset({"search", "weather", "youtube"}),
+    "knowledge": frozenset({"recall", "search", "semantic_search", "list"}),
+    "finance": frozenset({"stock", "company", "news"}),
+    "imdb": frozenset(
+        {"search", "movie", "person", "filmography", "episodes", "reviews", "trivia"}
+    ),
+    "processes": frozenset({"status", "logs", "list"}),
+    "worker": frozenset({"list", "status", "logs"}),
+    "check": frozenset({"extras"}),
+}
+
+
+def _ax_command(tool_kwargs: dict | None) -> tuple[str, str]:
+    kwargs = tool_kwargs or {}
+    family = str(kwargs.get("family") or "").lower().strip()
+    command = str(kwargs.get("command") or "").lower().strip()
+    return family, command
+
+
+def is_parallel_safe(tool_name: str, tool_kwargs: dict | None = None) -> bool:
+    """Return whether a call may run concurrently with other safe calls.
+
+    Args:
+        tool_name: Name of the called tool.
+        tool_kwargs: Call arguments; used to classify ``ax`` calls by
+            family and command.
+    """
+    if tool_name in PARALLEL_SAFE_TOOLS:
+        return True
+    if tool_name == "ax":
+        family, command = _ax_command(tool_kwargs)
+        return command in PARALLEL_SAFE_AX_COMMANDS.get(family, frozenset())
+    return False
+
+
+@dataclass(frozen=True)
+class MemoPolicy:
+    """How long a tool's result may be reused within a turn.
+
+    Attributes:
+        path_arg: Argument naming the file or directory read; the result
+            is reused while its mtime and size are unchanged.
+        ttl_s: Seconds the result is reused (network tools).
+    """
+
+    path_arg: str | None = None
+    ttl_s: float | None = None
+
+
+MEMO_POLICIES: dict[str, MemoPolicy] = {
+    "read_file": MemoPolicy(path_arg="file_name"),
+    "file_info": MemoPolicy(path_arg="file_name"),
+    "list_files": MemoPolicy(path_arg="path"),
+    "fetch_current_stock_price": MemoPolicy(ttl_s=60),
+    "fetch_company_information": MemoPolicy(ttl_s=3600),
+    "fetch_ticker_news": MemoPolicy(ttl_s=300),
+    "search_imdb_titles": MemoPolicy(ttl_s=3600),
+    "get_movie_details": MemoPolicy(ttl_s=3600),
+    "get_person_details": MemoPolicy(ttl_s=3600),
+    "get_person_filmography": MemoPolicy(ttl_s=3600),
+    "get_all_series_episodes": MemoPolicy(ttl_s=3600),
+    "get_movie_reviews": MemoPolicy(ttl_s=3600),
+    "get_movie_trivia": MemoPolicy(ttl_s=3600),
+    "get_youtube_video_transcription": MemoPolicy(ttl_s=3600),
+}
+
+MEMO_AX_POLICIES: dict[tuple[str, str], MemoPolicy] = {
+    ("web", "search"): MemoPolicy(ttl_s=300),
+    ("web", "weather"): MemoPolicy(ttl_s=600),
+    ("web", "youtube"): MemoPolicy(ttl_s=3600),
+    ("finance", "stock"): MemoPolicy(ttl_s=60),
+    ("finance", "company"): MemoPolicy(ttl_s=3600),
+    ("finance", "news"): MemoPolicy(ttl_s=300),
+    **{
+        ("imdb", command): MemoPolicy(ttl_s=3600)
+        for command in PARALLEL_SAFE_AX_COMMANDS["imdb"]
+    },
+}
+
+# Path arguments of tools that write files.  Other tools with side
+# effects (shell, python, ...) may touch any path.
+WRITE_PATH_ARGS: dict[str, tuple[str, ...]] = {
+    "write_file": ("file_name",),
+    "edit_file": ("file_name",),
+    "copy_file": ("destination",),
+    "delete_file": ("file_name",),
+    "rename_file": ("old_name", "new_name"),
+}
+
+
+def memo_policy(tool_name: str, tool_kwargs: dict | None = None) -> MemoPolicy | None:
+    """Return the memoization policy of a call, or ``None`` if not idempotent."""
+    if tool_name == "ax":
+        return MEMO_AX_POLICIES.get(_ax_command(tool_kwargs))
+    return MEMO_POLICIES.get(tool_name)
+
+
 def _import_function(module_path: str, function_name: str) -> Callable:
     """Import a function from a module path."""
     import importlib
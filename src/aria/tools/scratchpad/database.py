@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import Session
 
 from aria.tools.database import get_tools_database
 from aria.tools.models import ScratchpadItemModel
@@ -43,7 +44,8 @@ class ScratchpadDatabase:
         reason: str | None = None,
     ) -> None:
         """Set a scratchpad item (upsert by agent_id + key)."""
-        with self.get_session() as session:
+
+        def _write(session: Session) -> None:
             stmt = select(ScratchpadItemModel).where(
                 ScratchpadItemModel.agent_id == agent_id,
                 ScratchpadItemModel.key == key,
@@ -67,9 +69,10 @@ class ScratchpadDatabase:
                 )
                 session.add(item)
 
-            session.commit()
             logger.debug(f"Scratchpad set: {key} for agent {agent_id}")
 
+        self._tools_db.submit(_write)
+
     def get_item(self, agent_id: str, key: str) -> dict | None:
         """Get a scratchpad item by key."""
         with self.get_session() as session:
@@ -4,12 +4,14 @@ This module contains internal functions used by get_file_from_url.
 These are not part of the public API and may change without notice.
 """
 
+import asyncio
+import hashlib
 import mimetypes
 import os
 import random
 import re
 import tempfile
-import time
+from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -21,6 +23,8 @@ from aria.tools import (
     tool_success_response,
     utc_timestamp,
 )
+from aria.tools.http.cache import CACHE_EXTENSION, get_http_cache
+from aria.tools.http.client import get_async_client
 from aria.tools.search.constants import (
     BINARY_CONTENT_TYPES,
     HTML_CONTENT_TYPES,
@@ -31,6 +35,24 @@ from aria.tools.search.constants import (
     USER_AGENTS,
 )
 
+# Bytes read from the network per write to disk.
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class FetchedFile:
+    """A downloaded body, already on disk."""
+
+    path: Path
+    content_type: str
+    filename: str | None
+    size: int
+    sha256: str
+    # Body is markup/text (HTML) rather than an opaque file.
+    text: bool
+    # How the HTTP cache served the body ("hit", "miss", ...), if it did.
+    cache: str | None = None
+
 
 def _validate_url(url: str) -> str:
     """Validate that a URL is well-formed and uses HTTP or HTTPS protocol."""
@@ -98,12 +120,17 @@ def _extract_filename_from_response(response: httpx.Response, url: str) -> str |
     return None
 
 
-def _fetch_file(
+async def _fetch_file(
     url: str,
     custom_headers: dict[str, str] | None = None,
     max_size: int = MAX_FILE_SIZE,
-) -> tuple[str | bytes, str, str | None]:
-    """Download a file from a URL with simple retry logic."""
+    download_path: str | None = None,
+    bypass_cache: bool = False,
+) -> FetchedFile:
+    """Stream a URL's body to its file under *download_path*, with retries.
+
+    The request goes through the shared HTTP cache unless *bypass_cache*.
+    """
     from aria.tools.search.download import URLDownloadError
 
     last_error = ""
@@ -111,19 +138,21 @@ def _fetch_file(
     if custom_headers:
         headers.update(custom_headers)
 
-    with httpx.Client(
-        timeout=httpx.Timeout(TIMEOUT),
-        follow_redirects=True,
-        headers=headers,
-        verify=False,
-    ) as client:
-        for attempt in range(MAX_RETRIES):
-            try:
-                if attempt > 0:
-                    delay = min(2**attempt, 10) + random.uniform(0, 1)
-                    time.sleep(delay)
-
-                response = client.get(url)
+    client = get_async_client(verify=False)
+    for attempt in range(MAX_RETRIES):
+        try:
+            if attempt > 0:
+                delay = min(2**attempt, 10) + random.uniform(0, 1)
+                await asyncio.sleep(delay)
+
+            async with client.stream(
+                "GET",
+                url,
+                headers=headers,
+                timeout=httpx.Timeout(TIMEOUT),
+                follow_redirects=True,
+                extensions={CACHE_EXTENSION: "bypass"} if bypass_cache else None,
+            ) as response:
                 response.raise_for_status()
 
                 content_length = response.headers.get("content-length")
@@ -138,41 +167,80 @@ def _fetch_file(
                 content_type = content_type.split(";", 1)[0].strip()
                 filename = _extract_filename_from_response(response, url)
 
-                if _is_html_content(content_type):
-                    text_content = response.text
-                    encoded_size = len(text_content.encode("utf-8"))
-                    if encoded_size > max_size:
-                        raise URLDownloadError(
-                            f"File size ({encoded_size} bytes) exceeds maximum allowed size ({max_size} bytes)"
-                        )
-                    return text_content, content_type, filename
-
-                content = response.content
-                if len(content) > max_size:
-                    raise URLDownloadError(
-                        f"File size ({len(content)} bytes) exceeds maximum allowed size ({max_size} bytes)"
-                    )
-                return content, content_type, filename
-
-            except httpx.TimeoutException:
-                last_error = f"Request timeout (attempt {attempt + 1}/{MAX_RETRIES})"
-            except httpx.HTTPStatusError as exc:
-                last_error = f"HTTP error {exc.response.status_code}"
-                if exc.response.status_code in [429, 503]:
-                    time.sleep(2**attempt)
-                    continue
-                break
-            except URLDownloadError:
-                raise
-            except Exception as exc:
-                last_error = f"Request failed: {exc}"
-                break
+                download_dir, base_filename, file_ext = _resolve_target(
+                    url,
+                    content_type or "application/octet-stream",
+                    filename,
+                    download_path,
+                )
+                path = download_dir / f"{base_filename}{file_ext}"
+                size, sha256 = await _stream_to_file(response, path, max_size)
+
+            return FetchedFile(
+                path=path,
+                content_type=content_type,
+                filename=filename,
+                size=size,
+                sha256=sha256,
+                text=_is_html_content(content_type),
+                cache=response.extensions.get(CACHE_EXTENSION),
+            )
+
+        except httpx.TimeoutException:
+            last_error = f"Request timeout (attempt {attempt + 1}/{MAX_RETRIES})"
+        except httpx.HTTPStatusError as exc:
+            last_error = f"HTTP error {exc.response.status_code}"
+            if exc.response.status_code in [429, 503]:
+                await asyncio.sleep(2**attempt)
+                continue
+            break
+        except URLDownloadError:
+            raise
+        except Exception as exc:
+            last_error = f"Request failed: {exc}"
+            break
 
     raise URLDownloadError(
         f"Failed to fetch file after {MAX_RETRIES} attempts: {last_error}"
     )
 
 
+async def _stream_to_file(
+    response: httpx.Response, path: Path, max_size: int
+) -> tuple[int, str]:
+    """Write the body of *response* to *path* in chunks.
+
+    The body goes to a hidden ``.part`` file that replaces *path* once
+    complete, so an aborted download never leaves a truncated file
+    behind.  Returns the size in bytes and the SHA-256 of the body.
+
+    Raises:
+        URLDownloadError: The body grows beyond *max_size* bytes.
+    """
+    from aria.tools.search.download import URLDownloadError
+
+    part = path.with_name(f".{path.name}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        # One chunk of local-disk write is short next to the network wait
+        # for the next one, so it is done inline rather than in a thread.
+        with open(part, "wb") as f:
+            async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise URLDownloadError(
+                        f"File size exceeds maximum allowed size ({max_size} bytes)"
+                    )
+                digest.update(chunk)
+                f.write(chunk)
+        os.replace(part, path)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    return size, digest.hexdigest()
+
+
 def _is_markitdown_supported(content_type: str) -> bool:
     """Check if a content type is supported by MarkItDown for conversion."""
     supported_types = [
@@ -221,10 +289,32 @@ def _clean_text(text: str) -> str:
     return text
 
 
-def _markitdown(content: str | bytes, content_type: str, url: str) -> str:
-    """Convert content to markdown using MarkItDown."""
-    from markitdown import MarkItDown
+def _markitdown_file(path: str | Path) -> str:
+    """Convert a file on disk to markdown using MarkItDown."""
+    from aria.helpers.documents import convert_file
+
+    return _clean_text(convert_file(str(path)))
+
+
+def _markitdown_cached(fetched: FetchedFile) -> str:
+    """Convert a download with MarkItDown, reusing an earlier conversion.
+
+    Conversions are kept in the HTTP cache directory, keyed by the body's
+    SHA-256 and extension, so fetching the same document again (from the
+    HTTP cache or not) skips the conversion.
+    """
+    cache = get_http_cache()
+    key = f"{fetched.sha256}{fetched.path.suffix}.md"
+    converted = cache.get_converted(key) if cache is not None else None
+    if converted is None:
+        converted = _markitdown_file(fetched.path)
+        if cache is not None:
+            cache.put_converted(key, converted)
+    return converted
+
 
+def _markitdown(content: str | bytes, content_type: str, url: str) -> str:
+    """Convert in-memory content to markdown using MarkItDown."""
     if isinstance(content, str):
         content = content.encode("utf-8")
     file_ext = _get_file_extension(url, content_type)
@@ -232,8 +322,7 @@ def _markitdown(content: str | bytes, content_type: str, url: str) -> str:
         temp_file_path = os.path.join(temp_dir, f"content{file_ext}")
         with open(temp_file_path, "wb") as temp_file:
             temp_file.write(content)
-        result = MarkItDown().convert(temp_file_path).text_content
-    return _clean_text(result)
+        return _markitdown_file(temp_file_path)
 
 
 def _create_response(tool: str, reason: str, file_path: str, metadata: dict) -> str:
@@ -250,15 +339,13 @@ def _create_error_response(tool: str, reason: str, error_message: str) -> str:
     return tool_error_response(tool, reason, RuntimeError(error_message))
 
 
-def _save_content_to_file(
-    content: str | bytes,
+def _resolve_target(
     url: str,
     content_type: str,
-    output_format: str = "auto",
-    original_filename: str | None = None,
-    download_path: str | None = None,
-) -> tuple[str, dict]:
-    """Save content to a file on disk and return the file path and metadata."""
+    original_filename: str | None,
+    download_path: str | None,
+) -> tuple[Path, str, str]:
+    """Return the directory, base name and extension for a download."""
     if download_path:
         resolved_path = Path(download_path).expanduser().resolve()
         if resolved_path.is_dir() or (
@@ -287,183 +374,118 @@ def _save_content_to_file(
         download_dir = Path(tempfile.mkdtemp(prefix="aria2_download_"))
         base_filename = "content"
         file_ext = _get_file_extension(url, content_type)
+    return download_dir, base_filename, file_ext
 
-    if output_format == "auto":
-        output_format = _auto_detect_format(content_type)
-
-    is_markitdown_binary = _is_binary_content(
-        content_type
-    ) and _is_markitdown_supported(content_type)
-
-    if is_markitdown_binary:
-        original_file_name = f"{base_filename}{file_ext}"
-        original_file_path = download_dir / original_file_name
 
-        if isinstance(content, str):
-            content = content.encode("utf-8")
+def _save_content_to_file(
+    content: str | bytes,
+    url: str,
+    content_type: str,
+    output_format: str = "auto",
+    original_filename: str | None = None,
+    download_path: str | None = None,
+) -> tuple[str, dict]:
+    """Save in-memory content to a file on disk and return path and metadata."""
+    download_dir, base_filename, file_ext = _resolve_target(
+        url, content_type, original_filename, download_path
+    )
+    path = download_dir / f"{base_filename}{file_ext}"
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    path.write_bytes(data)
+    fetched = FetchedFile(
+        path=path,
+        content_type=content_type,
+        filename=original_filename,
+        size=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+        text=isinstance(content, str),
+    )
+    return _finalize_download(fetched, url, output_format)
 
-        with open(original_file_path, "wb") as f:
-            f.write(content)
 
-        try:
-            parsed_text = _markitdown(content, content_type, url)
-            parsed_file_name = f"{base_filename}_parsed.txt"
-            parsed_file_path = download_dir / parsed_file_name
-
-            with open(parsed_file_path, "w", encoding="utf-8") as f:
-                f.write(parsed_text)
-
-            file_size = original_file_path.stat().st_size
-            parsed_file_size = parsed_file_path.stat().st_size
-            metadata = {
-                "url": url,
-                "content_type": content_type,
-                "file_size": file_size,
-                "file_extension": file_ext,
-                "format": "binary",
-                "parsed": True,
-                "parsed_file_path": str(parsed_file_path),
-                "parsed_file_size": parsed_file_size,
-                "original_filename": original_filename,
-                "timestamp": utc_timestamp(),
-            }
-            return str(original_file_path), metadata
-        except Exception as e:
-            file_size = original_file_path.stat().st_size
-            metadata = {
-                "url": url,
-                "content_type": content_type,
-                "file_size": file_size,
-                "file_extension": file_ext,
-                "format": "binary",
-                "parsed": False,
-                "parse_error": str(e),
-                "original_filename": original_filename,
-                "timestamp": utc_timestamp(),
-            }
-            return str(original_file_path), metadata
-
-    elif _is_binary_content(content_type):
-        file_name = f"{base_filename}{file_ext}"
-        file_path = download_dir / file_name
-
-        if isinstance(content, str):
-            content = content.encode("utf-8")
-
-        with open(file_path, "wb") as f:
-            f.write(content)
-
-        file_size = file_path.stat().st_size
-        metadata = {
+def _finalize_download(
+    fetched: FetchedFile, url: str, output_format: str = "auto"
+) -> tuple[str, dict]:
+    """Convert a downloaded file as its type requires; return path and metadata.
+
+    MarkItDown reads the downloaded file directly.  Conversions are
+    written next to it (``<name>_parsed.txt`` for documents, ``<name>.md``
+    for HTML); a text download requested as markdown is replaced by its
+    ``.md`` conversion.
+    """
+    content_type = fetched.content_type
+    path = fetched.path
+    download_dir, base_filename, file_ext = path.parent, path.stem, path.suffix
+
+    def metadata(file_path: Path, format_type: str, **extra: object) -> dict:
+        return {
             "url": url,
             "content_type": content_type,
-            "file_size": file_size,
+            "file_size": file_path.stat().st_size,
             "file_extension": file_ext,
-            "format": "binary",
+            "format": format_type,
             "parsed": False,
-            "original_filename": original_filename,
+            **extra,
+            "original_filename": fetched.filename,
+            "sha256": fetched.sha256,
             "timestamp": utc_timestamp(),
         }
-        return str(file_path), metadata
-
-    elif isinstance(content, str):
-        if _is_html_content(content_type) and output_format == "markdown":
-            html_file_name = f"{base_filename}{file_ext}"
-            html_file_path = download_dir / html_file_name
-
-            with open(html_file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-            try:
-                logger.debug(f"Converting HTML to markdown for {url}")
-                markdown_content = _markitdown(content, content_type, url)
-                logger.debug("HTML to markdown conversion successful")
-
-                markdown_file_name = f"{base_filename}.md"
-                markdown_file_path = download_dir / markdown_file_name
-
-                with open(markdown_file_path, "w", encoding="utf-8") as f:
-                    f.write(markdown_content)
-
-                html_file_size = html_file_path.stat().st_size
-                markdown_file_size = markdown_file_path.stat().st_size
-                metadata = {
-                    "url": url,
-                    "content_type": content_type,
-                    "file_size": html_file_size,
-                    "file_extension": file_ext,
-                    "format": "html",
-                    "parsed": True,
-                    "parsed_file_path": str(markdown_file_path),
-                    "parsed_file_size": markdown_file_size,
-                    "original_filename": original_filename,
-                    "timestamp": utc_timestamp(),
-                }
-                return str(html_file_path), metadata
-
-            except Exception as e:
-                logger.error(f"Failed to convert HTML to markdown: {e}")
-                html_file_size = html_file_path.stat().st_size
-                metadata = {
-                    "url": url,
-                    "content_type": content_type,
-                    "file_size": html_file_size,
-                    "file_extension": file_ext,
-                    "format": "html",
-                    "parsed": False,
-                    "parse_error": str(e),
-                    "original_filename": original_filename,
-                    "timestamp": utc_timestamp(),
-                }
-                return str(html_file_path), metadata
-
-        elif _is_html_content(content_type):
-            format_type = "html"
-            file_name = f"{base_filename}{file_ext}"
-        elif output_format == "markdown":
-            format_type = "markdown"
-            file_name = f"{base_filename}.md"
-            try:
-                content = _markitdown(content, content_type, url)
-            except Exception:
-                pass
-        else:
-            format_type = "text"
-            file_name = f"{base_filename}{file_ext}"
 
-        file_path = download_dir / file_name
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+    if output_format == "auto":
+        output_format = _auto_detect_format(content_type)
 
-        file_size = file_path.stat().st_size
-        metadata = {
-            "url": url,
-            "content_type": content_type,
-            "file_size": file_size,
-            "file_extension": file_ext,
-            "format": format_type,
-            "parsed": False,
-            "original_filename": original_filename,
-            "timestamp": utc_timestamp(),
-        }
-        return str(file_path), metadata
+    is_markitdown_binary = _is_binary_content(
+        content_type
+    ) and _is_markitdown_supported(content_type)
 
-    else:
-        file_name = f"{base_filename}{file_ext}"
-        file_path = download_dir / file_name
+    if is_markitdown_binary:
+        try:
+            parsed_text = _markitdown_cached(fetched)
+            parsed_file_path = download_dir / f"{base_filename}_parsed.txt"
+            parsed_file_path.write_text(parsed_text, encoding="utf-8")
+            return str(path), metadata(
+                path,
+                "binary",
+                parsed=True,
+                parsed_file_path=str(parsed_file_path),
+                parsed_file_size=parsed_file_path.stat().st_size,
+            )
+        except Exception as e:
+            return str(path), metadata(path, "binary", parse_error=str(e))
 
-        with open(file_path, "wb") as f:
-            f.write(content)
+    if _is_binary_content(content_type) or not fetched.text:
+        return str(path), metadata(path, "binary")
 
-        file_size = file_path.stat().st_size
-        metadata = {
-            "url": url,
-            "content_type": content_type,
-            "file_size": file_size,
-            "file_extension": file_ext,
-            "format": "binary",
-            "parsed": False,
-            "original_filename": original_filename,
-            "timestamp": utc_timestamp(),
-        }
-        return str(file_path), metadata
+    if _is_html_content(content_type) and output_format == "markdown":
+        try:
+            logger.debug(f"Converting HTML to markdown for {url}")
+            markdown_content = _markitdown_cached(fetched)
+            logger.debug("HTML to markdown conversion successful")
+
+            markdown_file_path = download_dir / f"{base_filename}.md"
+            markdown_file_path.write_text(markdown_content, encoding="utf-8")
+            return str(path), metadata(
+                path,
+                "html",
+                parsed=True,
+                parsed_file_path=str(markdown_file_path),
+                parsed_file_size=markdown_file_path.stat().st_size,
+            )
+        except Exception as e:
+            logger.error(f"Failed to convert HTML to markdown: {e}")
+            return str(path), metadata(path, "html", parse_error=str(e))
+
+    if _is_html_content(content_type):
+        return str(path), metadata(path, "html")
+
+    if output_format == "markdown":
+        markdown_file_path = download_dir / f"{base_filename}.md"
+        try:
+            markdown_file_path.write_text(_markitdown_cached(fetched), encoding="utf-8")
+            if markdown_file_path != path:
+                path.unlink()
+        except Exception:
+            os.replace(path, markdown_file_path)
+        return str(markdown_file_path), metadata(markdown_file_path, "markdown")
+
+    return str(path), metadata(path, "text")
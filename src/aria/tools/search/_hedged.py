@@ -0,0 +1,342 @@
+"""Hedged web search across SearXNG and DuckDuckGo.
+
+With ``ARIA_SEARCH_MODE=hedged`` (and ``SEARXNG_URL`` set),
+:func:`hedged_web_search` replaces the single-backend dispatch in
+:func:`aria.tools.search.web_search`:
+
+1. The *primary* — the healthy backend with the lowest observed latency
+   — is queried first.
+2. If it has not answered within ``ARIA_SEARCH_HEDGE_FACTOR`` times its
+   usual latency (or it fails), the other backends are queried as well.
+   While latencies are still unknown every backend is queried at once.
+3. The first non-empty answer wins; answers arriving within
+   ``ARIA_SEARCH_MERGE_WINDOW`` seconds after it are merged in, rank by
+   rank, and duplicates are dropped by canonical URL.
+4. Whatever is still running at ``ARIA_SEARCH_DEADLINE`` seconds is
+   cancelled.
+
+Hedging only the slow searches keeps DuckDuckGo traffic (which is rate
+limited) low while cutting the tail latency of a hanging SearXNG
+engine.  Searches with a category or time range need SearXNG's filters
+and always go to SearXNG alone.
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from os import getenv
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from loguru import logger
+
+from aria.tools import tool_error_response, tool_success_response
+
+_TOOL_NAME = "web_search"
+_BACKEND_REASON = "hedged web search"
+
+# EWMA weight of the newest latency sample.
+_LATENCY_ALPHA = 0.3
+# Never hedge sooner than this, so fast answers don't double traffic.
+_MIN_HEDGE_DELAY_S = 0.1
+
+_TRACKING_PARAM = re.compile(r"^(utm_\w+|fbclid|gclid|msclkid|ref|ref_src)$", re.I)
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return float(getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def hedged_search_enabled() -> bool:
+    """Whether ``ARIA_SEARCH_MODE`` selects hedged search."""
+    return getenv("ARIA_SEARCH_MODE", "single").strip().lower() == "hedged"
+
+
+def canonical_url(url: str) -> str:
+    """Normalize *url* for duplicate detection.
+
+    Ignores the scheme (http/https), a leading ``www.``, default ports,
+    trailing slashes, fragments, tracking parameters and query order.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not _TRACKING_PARAM.match(k)
+        )
+    )
+    if scheme in ("http", "https"):
+        scheme = "https"
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), query, ""))
+
+
+@dataclass
+class BackendStats:
+    """Observed health of one search backend."""
+
+    latency_s: float | None = None
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        """Record a finished request."""
+        self._sample(seconds)
+        if ok:
+            self.successes += 1
+            self.consecutive_failures = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+
+    def observe_cancelled(self, seconds: float) -> None:
+        """Record a request cancelled after *seconds* (a latency lower bound)."""
+        if self.latency_s is None or seconds > self.latency_s:
+            self._sample(seconds)
+
+    def _sample(self, seconds: float) -> None:
+        if self.latency_s is None:
+            self.latency_s = seconds
+        else:
+            self.latency_s += _LATENCY_ALPHA * (seconds - self.latency_s)
+
+
+async def _searxng_rows(query: str, max_results: int) -> list[dict[str, Any]]:
+    from aria.tools.search.searxng import searxng_web_search
+
+    response = json.loads(
+        await searxng_web_search(
+            reason=_BACKEND_REASON, query=query, max_results=max_results
+        )
+    )
+    data = response.get("data") or {}
+    if response.get("status") != "success" or not data.get("success"):
+        raise RuntimeError(_error_message(response))
+    return [
+        {"url": r["url"], "title": r["title"], "content": r.get("content", "")}
+        for r in data.get("findings", [])
+    ]
+
+
+async def _duckduckgo_rows(query: str, max_results: int) -> list[dict[str, Any]]:
+    from aria.tools.ax.executors import run_sync
+    from aria.tools.search.duckduckgo import duckduckgo_web_search
+
+    response = json.loads(
+        await run_sync(
+            "web",
+            duckduckgo_web_search,
+            reason=_BACKEND_REASON,
+            query=query,
+            max_results=max_results,
+        )
+    )
+    if response.get("status") != "success":
+        raise RuntimeError(_error_message(response))
+    return [
+        {"url": r["href"], "title": r["title"], "content": ""}
+        for r in (response.get("data") or {}).get("results", [])
+    ]
+
+
+def _error_message(response: dict[str, Any]) -> str:
+    error = response.get("error") or (response.get("data") or {}).get("error")
+    if isinstance(error, dict):
+        return str(error.get("message", error))
+    return str(error or "search failed")
+
+
+Backend = Callable[[str, int], Awaitable[list[dict[str, Any]]]]
+
+_BACKENDS: dict[str, Backend] = {
+    "searxng": _searxng_rows,
+    "duckduckgo": _duckduckgo_rows,
+}
+_stats: dict[str, BackendStats] = {}
+
+
+def get_backend_stats() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of per-backend latency and failure counters."""
+    return {name: asdict(stats) for name, stats in _stats.items()}
+
+
+def reset_backend_stats() -> None:
+    """Forget all observed backend latencies."""
+    _stats.clear()
+
+
+def _ranked_backends() -> list[str]:
+    """Backends ordered healthy-first, then by observed latency."""
+
+    def key(name: str) -> tuple[int, float]:
+        stats = _stats.get(name, BackendStats())
+        return stats.consecutive_failures, stats.latency_s or 0.0
+
+    return sorted(_BACKENDS, key=key)
+
+
+def _hedge_delay(primary: str) -> float:
+    latency = _stats.get(primary, BackendStats()).latency_s
+    if latency is None:
+        return 0.0
+    factor = _env_seconds("ARIA_SEARCH_HEDGE_FACTOR", 1.5)
+    return max(_MIN_HEDGE_DELAY_S, latency * factor)
+
+
+def _merge(
+    ranked: list[str], answers: dict[str, list[dict[str, Any]]], max_results: int
+) -> list[dict[str, Any]]:
+    """Interleave answers rank by rank (primary first), dropping duplicates."""
+    merged: dict[str, dict[str, Any]] = {}
+    depth = max((len(rows) for rows in answers.values()), default=0)
+    for rank in range(depth):
+        for name in ranked:
+            rows = answers.get(name, [])
+            if rank >= len(rows):
+                continue
+            row = rows[rank]
+            key = canonical_url(row["url"])
+            if key in merged:
+                existing = merged[key]
+                existing["sources"].append(name)
+                if not existing["content"] and row["content"]:
+                    existing["content"] = row["content"]
+                continue
+            merged[key] = {**row, "sources": [name]}
+    return list(merged.values())[:max_results]
+
+
+async def hedged_web_search(reason: str, query: str, max_results: int) -> str:
+    """Search all backends with hedging; see the module docstring."""
+    if not query or not query.strip():
+        return tool_error_response(
+            _TOOL_NAME, reason, RuntimeError("query cannot be empty")
+        )
+    if max_results < 1:
+        return tool_error_response(
+            _TOOL_NAME, reason, RuntimeError("max_results must be positive")
+        )
+
+    deadline_s = _env_seconds("ARIA_SEARCH_DEADLINE", 10.0)
+    merge_window_s = _env_seconds("ARIA_SEARCH_MERGE_WINDOW", 0.3)
+    ranked = _ranked_backends()
+    primary = ranked[0]
+
+    start = time.monotonic()
+    deadline = start + deadline_s
+    hedge_at = start + _hedge_delay(primary)
+    first_answer_at: float | None = None
+
+    tasks: dict[asyncio.Task, str] = {}
+    # Launch time per task: latencies are measured from there, not from
+    # the start of the search, so a hedge is not charged the hedge delay.
+    launched_at: dict[asyncio.Task, float] = {}
+    outcomes: dict[str, dict[str, Any]] = {}
+    answers: dict[str, list[dict[str, Any]]] = {}
+
+    def launch(names: list[str]) -> None:
+        for name in names:
+            task = asyncio.create_task(_BACKENDS[name](query.strip(), max_results))
+            tasks[task] = name
+            launched_at[task] = time.monotonic()
+
+    launch([primary])
+    try:
+        while True:
+            now = time.monotonic()
+            waiting = [name for name in ranked if name not in tasks.values()]
+            if first_answer_at is None and waiting and now >= hedge_at:
+                launch(waiting)
+                waiting = []
+            pending = [t for t in tasks if not t.done()]
+            if not pending and not (waiting and first_answer_at is None):
+                break
+            wake = deadline
+            if first_answer_at is not None:
+                wake = min(wake, first_answer_at + merge_window_s)
+            elif waiting:
+                wake = min(wake, hedge_at)
+            if now >= wake and (first_answer_at is not None or now >= deadline):
+                break
+            if not pending:
+                # Primary failed before the hedge delay: hedge now.
+                hedge_at = now
+                continue
+
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=max(0.0, wake - now),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                name = tasks[task]
+                elapsed = time.monotonic() - launched_at[task]
+                stats = _stats.setdefault(name, BackendStats())
+                latency_ms = round(elapsed * 1000)
+                exc = task.exception()
+                if exc is not None:
+                    stats.observe(elapsed, ok=False)
+                    outcomes[name] = {
+                        "status": "error",
+                        "latency_ms": latency_ms,
+                        "error": str(exc),
+                    }
+                    logger.debug(f"hedged search: {name} failed: {exc}")
+                    hedge_at = min(hedge_at, time.monotonic())
+                    continue
+                rows = task.result()
+                stats.observe(elapsed, ok=True)
+                outcomes[name] = {
+                    "status": "ok",
+                    "latency_ms": latency_ms,
+                    "count": len(rows),
+                }
+                answers[name] = rows
+                if rows and first_answer_at is None:
+                    first_answer_at = time.monotonic()
+    finally:
+        for task, name in tasks.items():
+            if not task.done():
+                task.cancel()
+                elapsed = time.monotonic() - launched_at[task]
+                _stats.setdefault(name, BackendStats()).observe_cancelled(elapsed)
+                outcomes[name] = {"status": "cancelled"}
+
+    for name in ranked:
+        outcomes.setdefault(name, {"status": "not_queried"})
+
+    if not answers:
+        errors = "; ".join(
+            f"{name}: {o.get('error', o['status'])}" for name, o in outcomes.items()
+        )
+        return tool_error_response(
+            _TOOL_NAME, reason, RuntimeError(f"All search backends failed ({errors})")
+        )
+
+    findings = _merge(ranked, answers, max_results)
+    return tool_success_response(
+        _TOOL_NAME,
+        reason,
+        {
+            "count": len(findings),
+            "findings": findings,
+            "params": {"query": query, "max_results": max_results, "mode": "hedged"},
+            "primary": primary,
+            "backends": outcomes,
+        },
+    )
@@ -12,6 +12,8 @@ from urllib.parse import urlparse
 
 import httpx
 
+from aria.tools.http.client import get_sync_client
+
 # Extensions that always indicate a downloadable file
 _FILE_EXTENSIONS = {
     ".pdf",
@@ -103,20 +105,19 @@ def classify_url(url: str, timeout: float = 5.0) -> URLType:
 
     # Rule 2: HEAD request content-type sniffing
     try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            resp = client.head(url)
-            content_type = (
-                resp.headers.get("content-type", "").lower().split(";")[0].strip()
-            )
-
-            if any(content_type.startswith(ft) for ft in _FILE_CONTENT_TYPES):
-                return URLType.FILE
-            if any(content_type.startswith(wt) for wt in _WEBSITE_CONTENT_TYPES):
-                return URLType.WEBSITE
-
-            # Binary content types → file
-            if content_type.startswith(("image/", "audio/", "video/", "application/")):
-                return URLType.FILE
+        resp = get_sync_client().head(url, timeout=timeout, follow_redirects=True)
+        content_type = (
+            resp.headers.get("content-type", "").lower().split(";")[0].strip()
+        )
+
+        if any(content_type.startswith(ft) for ft in _FILE_CONTENT_TYPES):
+            return URLType.FILE
+        if any(content_type.startswith(wt) for wt in _WEBSITE_CONTENT_TYPES):
+            return URLType.WEBSITE
+
+        # Binary content types → file
+        if content_type.startswith(("image/", "audio/", "video/", "application/")):
+            return URLType.FILE
     except (httpx.TimeoutException, httpx.ConnectError, Exception):
         pass  # Fall through to default
 
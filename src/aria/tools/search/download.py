@@ -1,5 +1,8 @@
 """Download and convert content from a URL."""
 
+import asyncio
+import dataclasses
+
 from aria.tools import (
     Reason,
     get_function_name,
@@ -9,8 +12,8 @@ from aria.tools import (
 )
 from aria.tools.search._download_internals import (
     _fetch_file,
+    _finalize_download,
     _is_html_content,
-    _save_content_to_file,
     _validate_format,
     _validate_url,
 )
@@ -42,13 +45,14 @@ class ContentParsingError(Exception):
 
 
 @log_tool_call
-def download(
+async def download(
     reason: Reason,
     url: str,
     output: str | None = "auto",
     custom_headers: dict[str, str] | None = None,
     max_size: int | None = None,
     convert_to_markdown: bool = False,
+    bypass_cache: bool = False,
 ) -> str:
     """Download files from URLs (PDFs, images, archives, HTML, etc.).
 
@@ -77,6 +81,8 @@ def download(
         max_size: Max bytes to download (default: 5 MB).
         convert_to_markdown: Convert HTML content to markdown
             (default: False).
+        bypass_cache: Fetch from the server even if the local HTTP cache
+            holds a fresh copy (default: False).
 
     Returns:
         JSON with file_path and metadata about the saved artifact.
@@ -95,27 +101,31 @@ def download(
         validated_format = _validate_format(output_value)
         max_size_value = MAX_FILE_SIZE if max_size is None else max_size
 
-        download_path_value = str(DOWNLOADS_DIR)
-
-        response_data, content_type, filename = _fetch_file(
+        # The body is streamed straight to its file under DOWNLOADS_DIR.
+        fetched = await _fetch_file(
             validated_url,
             custom_headers=custom_headers,
             max_size=max_size_value,
+            download_path=str(DOWNLOADS_DIR),
+            bypass_cache=bypass_cache,
         )
 
         # Request markdown persistence through the save layer
-        if convert_to_markdown and _is_html_content(content_type or ""):
+        if convert_to_markdown and _is_html_content(fetched.content_type):
             validated_format = "markdown"
 
-        file_path, metadata = _save_content_to_file(
-            response_data,
+        # MarkItDown conversion is CPU-bound; keep it off the event loop.
+        file_path, metadata = await asyncio.to_thread(
+            _finalize_download,
+            dataclasses.replace(
+                fetched,
+                content_type=fetched.content_type or "application/octet-stream",
+            ),
             validated_url,
-            content_type or "application/octet-stream",
             validated_format,
-            original_filename=filename,
-            download_path=download_path_value,
         )
 
+        metadata["cache"] = fetched.cache
         result_data = {"file_path": file_path, "metadata": metadata}
 
         return tool_success_response(
@@ -1,5 +1,19 @@
-"""SearXNG-backed web search tool."""
-
+"""SearXNG-backed web search tool.
+
+Result pages are fetched concurrently over the shared keep-alive client
+(:mod:`aria.tools.http.client`).  Pages still in flight are cancelled
+once the pages before them hold enough results.
+
+Normalized results are cached in-process by ``(query, category,
+time_range)`` for ``ARIA_SEARCH_CACHE_TTL`` seconds (default 300; 0
+disables the cache), so a repeated search — or one asking for fewer
+results — costs no round-trip.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from os import getenv
 from typing import Any, Literal, TypedDict
 from urllib.parse import urlencode
@@ -13,9 +27,12 @@ from aria.tools import (
     tool_success_response,
 )
 from aria.tools.decorators import log_tool_call
+from aria.tools.http.client import get_async_client
 
 SEARXNG_URL = getenv("SEARXNG_URL", "").rstrip("/")
 _REQUEST_TIMEOUT_SECONDS = 10.0
+_RESULTS_PER_PAGE = 10
+_CACHE_MAX_ENTRIES = 256
 
 Categories = Literal[
     "general",
@@ -79,8 +96,66 @@ _CATEGORY_FIELD_MAP: dict[str, list[FieldSpec]] = {
 }
 
 
+def _cache_ttl() -> float:
+    try:
+        return float(getenv("ARIA_SEARCH_CACHE_TTL", "300"))
+    except ValueError:
+        return 300.0
+
+
+@dataclass(frozen=True)
+class _CachedSearch:
+    """Normalized rows of the leading pages of one search."""
+
+    rows: list[dict[str, Any]]
+    pages: int
+    dropped_results: int
+    expires: float
+
+
+_cache: OrderedDict[tuple[str, str, str], _CachedSearch] = OrderedDict()
+
+
+def _cache_get(key: tuple[str, str, str], max_results: int) -> _CachedSearch | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry.expires:
+        del _cache[key]
+        return None
+    pages_needed = max(1, (max_results + _RESULTS_PER_PAGE - 1) // _RESULTS_PER_PAGE)
+    if len(entry.rows) < max_results and entry.pages < pages_needed:
+        return None
+    _cache.move_to_end(key)
+    return entry
+
+
+def _cache_put(
+    key: tuple[str, str, str],
+    rows: list[dict[str, Any]],
+    pages: int,
+    dropped_results: int,
+) -> None:
+    ttl = _cache_ttl()
+    if ttl <= 0:
+        return
+    _cache[key] = _CachedSearch(rows, pages, dropped_results, time.monotonic() + ttl)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search results."""
+    _cache.clear()
+
+
+def _get_client() -> httpx.AsyncClient:
+    return get_async_client()
+
+
 @log_tool_call
-def searxng_web_search(
+async def searxng_web_search(
     reason: Reason,
     query: str,
     category: Categories = "general",
@@ -125,7 +200,8 @@ def searxng_web_search(
         )
 
     # Calculate pages needed (approx 10 results per page)
-    pages = max(1, (max_results + 9) // 10)
+    pages = max(1, (max_results + _RESULTS_PER_PAGE - 1) // _RESULTS_PER_PAGE)
+    cache_key = (query, category, time_range)
 
     results: list[dict[str, Any]] = []
     page_errors: list[dict[str, Any]] = []
@@ -133,40 +209,37 @@ def searxng_web_search(
     stats: SearchPageStats = {"requested": pages, "succeeded": 0, "failed": 0}
     field_map = _CATEGORY_FIELD_MAP.get(category, _CATEGORY_FIELD_MAP["general"])
 
-    try:
-        with httpx.Client(timeout=_REQUEST_TIMEOUT_SECONDS) as client:
-            for page_number in range(1, pages + 1):
-                params = {
-                    "safesearch": "0",
-                    "format": "json",
-                    "time_range": time_range,
-                    "categories": category,
-                    "q": query,
-                    "pageno": page_number,
-                }
-                page_result, page_error, page_dropped = _fetch_page(
-                    client=client,
-                    category=category,
-                    field_map=field_map,
-                    params=params,
-                    page_number=page_number,
-                )
-
-                dropped_results += page_dropped
-                if page_error:
-                    stats["failed"] += 1
-                    page_errors.append(page_error)
-                    continue
-
-                stats["succeeded"] += 1
-                results.extend(page_result)
-
-                # Stop if we have enough results
-                if len(results) >= max_results:
-                    break
-
-    except Exception as exc:
-        return tool_error_response(get_function_name(), reason, exc)
+    cached = _cache_get(cache_key, max_results)
+    if cached is not None:
+        results = list(cached.rows)
+        dropped_results = cached.dropped_results
+        stats["succeeded"] = min(pages, cached.pages)
+    else:
+        try:
+            fetched = await _fetch_pages(
+                client=_get_client(),
+                query=query,
+                category=category,
+                time_range=time_range,
+                field_map=field_map,
+                pages=pages,
+                max_results=max_results,
+            )
+        except Exception as exc:
+            return tool_error_response(get_function_name(), reason, exc)
+
+        # Leading pages, in page order.
+        for page_result, page_error, page_dropped in fetched:
+            dropped_results += page_dropped
+            if page_error:
+                stats["failed"] += 1
+                page_errors.append(page_error)
+                continue
+            stats["succeeded"] += 1
+            results.extend(page_result)
+
+        if not page_errors and stats["succeeded"]:
+            _cache_put(cache_key, results, stats["succeeded"], dropped_results)
 
     # Trim to max_results
     results = results[:max_results]
@@ -193,13 +266,74 @@ def searxng_web_search(
             "page_stats": stats,
             "dropped_results": dropped_results,
             "page_errors": page_errors,
+            "cached": cached is not None,
         },
     )
 
 
-def _fetch_page(
+_PageResult = tuple[list[dict[str, Any]], dict[str, Any] | None, int]
+
+
+async def _fetch_pages(
+    *,
+    client: httpx.AsyncClient,
+    query: str,
+    category: str,
+    time_range: str,
+    field_map: list[FieldSpec],
+    pages: int,
+    max_results: int,
+) -> list[_PageResult]:
+    """Fetch result pages concurrently; return the leading finished pages.
+
+    Once pages ``1..n`` have all finished and together hold at least
+    *max_results* rows, the pages still in flight are cancelled and only
+    pages ``1..n`` are returned.
+    """
+    tasks = [
+        asyncio.create_task(
+            _fetch_page(
+                client=client,
+                category=category,
+                field_map=field_map,
+                params={
+                    "safesearch": "0",
+                    "format": "json",
+                    "time_range": time_range,
+                    "categories": category,
+                    "q": query,
+                    "pageno": page_number,
+                },
+                page_number=page_number,
+            )
+        )
+        for page_number in range(1, pages + 1)
+    ]
+    done: dict[int, _PageResult] = {}
+    try:
+        pending = set(tasks)
+        while pending:
+            finished, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                done[tasks.index(task)] = task.result()
+            rows = 0
+            for i in range(pages):
+                if i not in done:
+                    break
+                rows += len(done[i][0])
+                if rows >= max_results:
+                    return [done[j] for j in range(i + 1)]
+    finally:
+        for task in tasks:
+            task.cancel()
+    return [done[i] for i in range(pages)]
+
+
+async def _fetch_page(
     *,
-    client: httpx.Client,
+    client: httpx.AsyncClient,
     category: str,
     field_map: list[FieldSpec],
     params: dict[str, Any],
@@ -209,7 +343,7 @@ def _fetch_page(
     url = f"{SEARXNG_URL}/search?{urlencode(params)}"
 
     try:
-        response = client.get(url)
+        response = await client.get(url, timeout=_REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()
     except httpx.HTTPError as exc:
         return [], _page_error(page_number, "http_error", str(exc)), 0
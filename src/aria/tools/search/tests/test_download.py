@@ -6,16 +6,21 @@ downloads files, saves them to disk, and returns JSON responses with
 metadata for AI agent consumption.
 """
 
+import hashlib
 import importlib
 import json
 import os
 import tempfile
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
-from aria.tools.search import download, get_youtube_video_transcription
+from aria.tools.search import (
+    _download_internals,
+    download,
+    get_youtube_video_transcription,
+)
 from aria.tools.search._download_internals import (
     _auto_detect_format,
     _clean_text,
@@ -56,6 +61,32 @@ def _response_error(raw: str) -> str:
     return json.loads(raw)["error"]["message"]
 
 
+@pytest.fixture
+def serve(monkeypatch):
+    """Answer the download client's requests with ``handler(request)``.
+
+    Returns the list of requests made.
+    """
+
+    def install(handler):
+        requests: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(
+            _download_internals,
+            "get_async_client",
+            lambda verify=True: httpx.AsyncClient(
+                transport=httpx.MockTransport(record)
+            ),
+        )
+        return requests
+
+    return install
+
+
 class TestURLValidation:
     """Test URL validation functionality."""
 
@@ -155,23 +186,19 @@ class TestGetFileFromURL:
     """Test the main download function."""
 
     @_needs_markitdown
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_download_html_success(self, mock_client):
+    @pytest.mark.asyncio
+    async def test_download_html_success(self, serve):
         """Test successful HTML download."""
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=False)
-        mock_client.return_value = mock_client_instance
+        serve(
+            lambda request: httpx.Response(
+                200,
+                content=b"<html><body>Test</body></html>",
+                headers={"content-type": "text/html"},
+            )
+        )
 
         # Download file
-        result_json = download("Testing file download", "https://example.com")
+        result_json = await download("Testing file download", "https://example.com")
         data = _response_data(result_json)
 
         # Verify response structure
@@ -191,23 +218,26 @@ class TestGetFileFromURL:
             content = f.read()
             assert "Test" in content
 
-    def test_download_invalid_url(self):
+    @pytest.mark.asyncio
+    async def test_download_invalid_url(self):
         """Test download with invalid URL."""
-        result_json = download("Testing file download", "not-a-url")
+        result_json = await download("Testing file download", "not-a-url")
         err = _response_error(result_json)
 
         assert "Invalid URL format" in err
 
-    def test_download_empty_url(self):
+    @pytest.mark.asyncio
+    async def test_download_empty_url(self):
         """Test download with empty URL."""
-        result_json = download("Testing file download", "")
+        result_json = await download("Testing file download", "")
         err = _response_error(result_json)
 
         assert "URL cannot be empty" in err
 
-    def test_json_response_structure(self):
+    @pytest.mark.asyncio
+    async def test_json_response_structure(self):
         """Test that JSON response has correct structure."""
-        result_json = download("Testing file download", "invalid-url")
+        result_json = await download("Testing file download", "invalid-url")
         data = json.loads(result_json)
 
         # Check required fields
@@ -217,34 +247,108 @@ class TestGetFileFromURL:
         assert "timestamp" in data
         assert "error" in data
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_download_with_different_formats(self, mock_client):
+    @pytest.mark.asyncio
+    async def test_download_with_different_formats(self, serve):
         """Test download with different output formats."""
-        mock_response = Mock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=False)
-        mock_client.return_value = mock_client_instance
+        serve(
+            lambda request: httpx.Response(
+                200,
+                content=b"<html><body>Test</body></html>",
+                headers={"content-type": "text/html"},
+            )
+        )
 
         for fmt in ["auto", "text", "html"]:
-            result_json = download(
+            result_json = await download(
                 "Testing file download", "https://example.com", output=fmt
             )
             data = _response_data(result_json)
             assert os.path.exists(data["file_path"])
 
+    @pytest.mark.asyncio
+    async def test_download_passes_file_path_to_converter(self, serve, monkeypatch):
+        """Documents are converted from the downloaded file, not a copy."""
+        body = b"%PDF-1.4 " + b"x" * 300_000
+        serve(
+            lambda request: httpx.Response(
+                200, content=body, headers={"content-type": "application/pdf"}
+            )
+        )
+        converted: list[str] = []
+
+        def convert(path):
+            converted.append(str(path))
+            return "Parsed PDF content"
+
+        monkeypatch.setattr(_download_internals, "_markitdown_file", convert)
+
+        result = await download("Testing file download", "https://example.com/a.pdf")
+        data = _response_data(result)
+        assert converted == [data["file_path"]]
+        assert data["metadata"]["parsed"] is True
+        assert data["metadata"]["file_size"] == len(body)
+        assert data["metadata"]["sha256"] == hashlib.sha256(body).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_cached_download_skips_fetch_and_conversion(self, monkeypatch):
+        """A fresh cached document is neither fetched nor converted again."""
+        from aria.tools.http.cache import AsyncCachingTransport
+
+        body = b"%PDF-1.4 " + b"x" * 1000
+        requests: list[httpx.Request] = []
+
+        def origin(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=body,
+                headers={
+                    "content-type": "application/pdf",
+                    "cache-control": "max-age=600",
+                },
+            )
+
+        monkeypatch.setattr(
+            _download_internals,
+            "get_async_client",
+            lambda verify=True: httpx.AsyncClient(
+                transport=AsyncCachingTransport(httpx.MockTransport(origin))
+            ),
+        )
+        converted: list[str] = []
+
+        def convert(path):
+            converted.append(str(path))
+            return "Parsed PDF content"
+
+        monkeypatch.setattr(_download_internals, "_markitdown_file", convert)
+
+        url = "https://example.com/paper.pdf"
+        first = _response_data(await download("Testing file download", url))
+        second = _response_data(await download("Testing file download", url))
+        assert len(requests) == 1
+        assert len(converted) == 1
+        assert (first["metadata"]["cache"], second["metadata"]["cache"]) == (
+            "miss",
+            "hit",
+        )
+        with open(second["metadata"]["parsed_file_path"]) as f:
+            assert f.read() == "Parsed PDF content"
+
+        third = _response_data(
+            await download("Testing file download", url, bypass_cache=True)
+        )
+        assert len(requests) == 2
+        assert third["metadata"]["cache"] == "bypass"
+
 
 class TestIntegration:
     """Integration tests with real HTTP requests."""
 
-    def test_real_download_example_com(self):
+    @pytest.mark.asyncio
+    async def test_real_download_example_com(self):
         """Test real download from example.com."""
-        result_json = download("Testing file download", "https://www.example.com")
+        result_json = await download("Testing file download", "https://www.example.com")
         data = _response_data(result_json)
 
         assert data["file_path"] is not None
@@ -260,9 +364,10 @@ class TestIntegration:
             assert len(content) > 0
             assert "Example Domain" in content
 
-    def test_real_download_with_auto_format(self):
+    @pytest.mark.asyncio
+    async def test_real_download_with_auto_format(self):
         """Test real download with auto format detection."""
-        result_json = download(
+        result_json = await download(
             "Testing file download", "https://www.example.com", output="auto"
         )
         data = _response_data(result_json)
@@ -314,115 +419,118 @@ class TestFilenameExtraction:
 
 
 class TestFetchFile:
-    """Test file fetching with retry logic."""
+    """Test streaming file fetches with retry logic."""
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_fetch_file_success(self, mock_client_class):
+    @pytest.mark.asyncio
+    async def test_fetch_file_success(self, serve, tmp_path):
         """Test successful file fetch."""
-        mock_response = Mock()
-        mock_response.text = "Test content"
-        mock_response.content = b"Test content"
-        mock_response.headers = {"content-type": "text/plain"}
-        mock_response.raise_for_status = Mock()
-
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
-
-        content, content_type, filename = _fetch_file("https://example.com/test.txt")
-        assert content == b"Test content"
-        assert content_type == "text/plain"
-
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_fetch_file_with_custom_headers(self, mock_client_class):
-        """Test file fetch with custom headers."""
-        mock_response = Mock()
-        mock_response.content = b"Test"
-        mock_response.headers = {"content-type": "text/plain"}
-        mock_response.raise_for_status = Mock()
+        serve(
+            lambda request: httpx.Response(
+                200, content=b"Test content", headers={"content-type": "text/plain"}
+            )
+        )
 
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
+        fetched = await _fetch_file(
+            "https://example.com/test.txt", download_path=str(tmp_path)
+        )
+        assert fetched.path == tmp_path / "test.txt"
+        assert fetched.path.read_bytes() == b"Test content"
+        assert fetched.content_type == "text/plain"
+        assert fetched.size == len(b"Test content")
+        assert fetched.sha256 == hashlib.sha256(b"Test content").hexdigest()
+        assert not list(tmp_path.glob(".*.part"))
+
+    @pytest.mark.asyncio
+    async def test_fetch_file_with_custom_headers(self, serve, tmp_path):
+        """Test file fetch with custom headers."""
+        requests = serve(
+            lambda request: httpx.Response(
+                200, content=b"Test", headers={"content-type": "text/plain"}
+            )
+        )
 
         custom_headers = {"Authorization": "Bearer token"}
-        _fetch_file("https://example.com", custom_headers=custom_headers)
-        assert mock_client.get.called
+        await _fetch_file(
+            "https://example.com",
+            custom_headers=custom_headers,
+            download_path=str(tmp_path),
+        )
+        assert requests[0].headers["Authorization"] == "Bearer token"
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_fetch_file_size_limit_exceeded(self, mock_client_class):
+    @pytest.mark.asyncio
+    async def test_fetch_file_size_limit_exceeded(self, serve, tmp_path):
         """Test file fetch with size limit exceeded."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "content-type": "text/plain",
-            "content-length": "999999999",
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
+        serve(
+            lambda request: httpx.Response(
+                200,
+                content=b"x",
+                headers={"content-type": "text/plain", "content-length": "999999999"},
+            )
+        )
 
         with pytest.raises(URLDownloadError, match="exceeds maximum"):
-            _fetch_file("https://example.com", max_size=1000)
-
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    @patch("aria.tools.search._download_internals.time.sleep")
-    def test_fetch_file_retry_on_timeout(self, mock_sleep, mock_client_class):
-        """Test retry logic on timeout."""
-        mock_client = Mock()
-        mock_client.get.side_effect = httpx.TimeoutException("Timeout")
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
+            await _fetch_file(
+                "https://example.com", max_size=1000, download_path=str(tmp_path)
+            )
+
+    @pytest.mark.asyncio
+    async def test_fetch_file_retry_on_timeout(self, serve, tmp_path, monkeypatch):
+        """Test retry logic on timeout, backing off without blocking the loop."""
+
+        def timeout(request):
+            raise httpx.ReadTimeout("Timeout", request=request)
+
+        requests = serve(timeout)
+        sleep = AsyncMock()
+        monkeypatch.setattr(_download_internals.asyncio, "sleep", sleep)
 
         with pytest.raises(URLDownloadError, match="Failed to fetch"):
-            _fetch_file("https://example.com")
+            await _fetch_file("https://example.com", download_path=str(tmp_path))
 
         # Should have retried
-        assert mock_client.get.call_count > 1
+        assert len(requests) > 1
+        assert sleep.await_count == len(requests) - 1
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_fetch_file_html_size_check(self, mock_client_class):
+    @pytest.mark.asyncio
+    async def test_fetch_file_html_size_check(self, serve, tmp_path):
         """Test HTML content size checking."""
-        large_html = "x" * 200_000_000  # Very large HTML
-        mock_response = Mock()
-        mock_response.text = large_html
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status = Mock()
-
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
+        serve(
+            lambda request: httpx.Response(
+                200,
+                stream=httpx.ByteStream(b"x" * 5000),
+                headers={"content-type": "text/html"},
+            )
+        )
 
         with pytest.raises(URLDownloadError, match="exceeds maximum"):
-            _fetch_file("https://example.com", max_size=1000)
+            await _fetch_file(
+                "https://example.com", max_size=1000, download_path=str(tmp_path)
+            )
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_fetch_file_binary_size_check(self, mock_client_class):
-        """Test binary content size checking."""
-        large_content = b"x" * 200_000_000
-        mock_response = Mock()
-        mock_response.content = large_content
-        mock_response.headers = {"content-type": "application/pdf"}
-        mock_response.raise_for_status = Mock()
+    @pytest.mark.asyncio
+    async def test_fetch_file_binary_size_check(self, serve, tmp_path):
+        """An oversized body without Content-Length is cut off mid-stream."""
+
+        async def body():
+            for _ in range(100):
+                yield b"x" * 100
 
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
+        serve(
+            lambda request: httpx.Response(
+                200, content=body(), headers={"content-type": "application/pdf"}
+            )
+        )
 
+        target = tmp_path / "target"
+        target.mkdir()
         with pytest.raises(URLDownloadError, match="exceeds maximum"):
-            _fetch_file("https://example.com", max_size=1000)
+            await _fetch_file(
+                "https://example.com/a.pdf",
+                max_size=1000,
+                download_path=str(target),
+            )
+        # Neither the partial body nor the target file is left behind.
+        assert list(target.iterdir()) == []
 
 
 @_needs_markitdown
@@ -521,7 +629,7 @@ class TestSaveContentToFile:
             assert os.path.exists(file_path)
             assert "custom" in file_path
 
-    @patch("aria.tools.search._download_internals._markitdown")
+    @patch("aria.tools.search._download_internals._markitdown_file")
     def test_save_markitdown_supported_binary(self, mock_markitdown):
         """Test saving MarkItDown-supported binary content."""
         # Mock the markitdown conversion to avoid PDF parsing errors
@@ -617,29 +725,19 @@ class TestYouTubeTranscription:
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_get_file_with_http_error(self, mock_client_class):
+    @pytest.mark.asyncio
+    async def test_get_file_with_http_error(self, serve):
         """Test handling of HTTP errors."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        error = httpx.HTTPStatusError(
-            "Not found", request=Mock(), response=mock_response
-        )
-        mock_response.raise_for_status.side_effect = error
-
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
+        serve(lambda request: httpx.Response(404))
 
-        result = download("Testing file download", "https://example.com/notfound")
+        result = await download("Testing file download", "https://example.com/notfound")
         payload = json.loads(result)
         assert payload["status"] == "error"
 
-    def test_get_file_with_invalid_format(self):
+    @pytest.mark.asyncio
+    async def test_get_file_with_invalid_format(self):
         """Test download with invalid output format."""
-        result = download(
+        result = await download(
             "Testing file download",
             "https://example.com",
             output="invalid_format",
@@ -647,16 +745,16 @@ class TestEdgeCases:
         err = _response_error(result)
         assert "Unsupported format" in err
 
-    @patch("aria.tools.search._download_internals.httpx.Client")
-    def test_get_file_generic_exception(self, mock_client_class):
+    @pytest.mark.asyncio
+    async def test_get_file_generic_exception(self, serve):
         """Test handling of generic exceptions."""
-        mock_client = Mock()
-        mock_client.get.side_effect = Exception("Unexpected error")
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
-        mock_client_class.return_value = mock_client
 
-        result = download("Testing file download", "https://example.com")
+        def fail(request):
+            raise Exception("Unexpected error")
+
+        serve(fail)
+
+        result = await download("Testing file download", "https://example.com")
         err = _response_error(result)
         assert "Failed to fetch" in err
 
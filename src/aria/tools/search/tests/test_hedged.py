@@ -0,0 +1,159 @@
+import asyncio
+import json
+
+import pytest
+
+from aria.tools.search import _hedged
+from aria.tools.search._hedged import canonical_url, hedged_web_search
+
+
+def _rows(prefix: str, n: int = 3) -> list[dict]:
+    return [
+        {
+            "url": f"https://{prefix}.example/{i}",
+            "title": f"{prefix} {i}",
+            "content": "",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    """Fake backends: name -> (delay seconds, rows or exception)."""
+    behaviour: dict[str, tuple[float, object]] = {}
+    calls: list[str] = []
+
+    def make(name):
+        async def backend(query: str, max_results: int):
+            calls.append(name)
+            delay, outcome = behaviour[name]
+            await asyncio.sleep(delay)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return backend
+
+    monkeypatch.setattr(
+        _hedged, "_BACKENDS", {name: make(name) for name in ("searxng", "duckduckgo")}
+    )
+    monkeypatch.setenv("ARIA_SEARCH_MERGE_WINDOW", "0.05")
+    _hedged.reset_backend_stats()
+    yield behaviour, calls
+    _hedged.reset_backend_stats()
+
+
+async def _search(max_results: int = 10) -> dict:
+    return json.loads(await hedged_web_search("test", "aria", max_results))
+
+
+def test_canonical_url():
+    assert canonical_url("http://www.Example.com/a/?utm_source=x&b=2&a=1#top") == (
+        canonical_url("https://example.com/a?a=1&b=2")
+    )
+    assert canonical_url("https://example.com:8443/a") != canonical_url(
+        "https://example.com/a"
+    )
+
+
+@pytest.mark.asyncio
+async def test_merges_and_dedupes_answers_within_window(backends):
+    behaviour, _ = backends
+    shared = {"url": "http://www.shared.example/", "title": "s", "content": "c"}
+    behaviour["searxng"] = (0.0, [*_rows("sx", 2), shared])
+    behaviour["duckduckgo"] = (
+        0.02,
+        [{**shared, "url": "https://shared.example", "content": ""}, *_rows("dd", 1)],
+    )
+
+    data = (await _search())["data"]
+    urls = [f["url"] for f in data["findings"]]
+    # Rank-interleaved, primary first, shared URL kept once.
+    assert urls == [
+        "https://sx.example/0",
+        "https://shared.example",
+        "https://sx.example/1",
+        "https://dd.example/0",
+    ]
+    assert data["findings"][1]["sources"] == ["duckduckgo", "searxng"]
+    assert data["findings"][1]["content"] == "c"
+    assert data["backends"]["searxng"]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_slow_backend_is_cancelled_after_merge_window(backends):
+    behaviour, _ = backends
+    behaviour["searxng"] = (5.0, _rows("sx"))
+    behaviour["duckduckgo"] = (0.01, _rows("dd"))
+
+    start = asyncio.get_running_loop().time()
+    data = (await _search())["data"]
+    assert asyncio.get_running_loop().time() - start < 0.5
+    assert [f["sources"] for f in data["findings"]] == [["duckduckgo"]] * 3
+    assert data["backends"]["searxng"]["status"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_primary_is_chosen_by_latency_and_hedged_when_slow(backends):
+    behaviour, calls = backends
+    behaviour["searxng"] = (0.15, _rows("sx"))
+    behaviour["duckduckgo"] = (0.0, _rows("dd"))
+    await _search()  # learn latencies: duckduckgo becomes primary
+
+    calls.clear()
+    data = (await _search())["data"]
+    assert data["primary"] == "duckduckgo"
+    assert calls == ["duckduckgo"]
+    assert data["backends"]["searxng"]["status"] == "not_queried"
+
+    # The primary stalls beyond its usual latency: the other one is added.
+    behaviour["duckduckgo"] = (5.0, _rows("dd"))
+    calls.clear()
+    data = (await _search())["data"]
+    assert calls == ["duckduckgo", "searxng"]
+    assert data["findings"][0]["sources"] == ["searxng"]
+
+
+@pytest.mark.asyncio
+async def test_hedge_latency_is_measured_from_its_launch(backends):
+    behaviour, calls = backends
+    behaviour["duckduckgo"] = (5.0, _rows("dd"))
+    behaviour["searxng"] = (0.1, _rows("sx"))
+    _hedged._stats["duckduckgo"] = _hedged.BackendStats(latency_s=0.4)
+    # Ranked second despite having no latency sample yet.
+    _hedged._stats["searxng"] = _hedged.BackendStats(consecutive_failures=1)
+
+    data = (await _search())["data"]
+
+    assert calls == ["duckduckgo", "searxng"]
+    # Launched after the 0.6 s hedge delay, answered 0.1 s later.
+    assert data["backends"]["searxng"]["latency_ms"] < 400
+    assert _hedged._stats["searxng"].latency_s < 0.4
+
+
+@pytest.mark.asyncio
+async def test_failing_primary_hedges_immediately(backends):
+    behaviour, calls = backends
+    behaviour["searxng"] = (0.0, _rows("sx"))
+    behaviour["duckduckgo"] = (0.0, _rows("dd"))
+    await _search()
+    primary = (await _search())["data"]["primary"]
+    other = "duckduckgo" if primary == "searxng" else "searxng"
+
+    behaviour[primary] = (0.0, RuntimeError("engine down"))
+    behaviour[other] = (0.0, _rows("ok"))
+    data = (await _search())["data"]
+    assert data["backends"][primary]["status"] == "error"
+    assert data["findings"][0]["sources"] == [other]
+    assert (await _search())["data"]["primary"] == other
+
+
+@pytest.mark.asyncio
+async def test_all_backends_failing_is_an_error(backends):
+    behaviour, _ = backends
+    behaviour["searxng"] = (0.0, RuntimeError("down"))
+    behaviour["duckduckgo"] = (0.0, RuntimeError("rate limited"))
+    result = await _search()
+    assert result["status"] == "error"
+    assert "rate limited" in result["error"]["message"]
@@ -0,0 +1,160 @@
+import asyncio
+import dataclasses
+import importlib
+import json
+
+import httpx
+import pytest
+
+from aria.tools.search import searxng
+from aria.tools.search.web_search import web_search
+
+# The package re-exports the function under the module's name.
+_web_search_module = importlib.import_module("aria.tools.search.web_search")
+
+
+def _page(page: int, size: int = 10) -> dict:
+    return {
+        "results": [
+            {
+                "url": f"https://example.com/{page}/{i}",
+                "title": f"Result {page}.{i}",
+                "content": "text",
+            }
+            for i in range(size)
+        ]
+    }
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Serve SearXNG pages from a MockTransport; page N waits 0.1 / N s."""
+    requests: list[int] = []
+    state = {"fail_page": None, "sizes": {}}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["pageno"])
+        requests.append(page)
+        await asyncio.sleep(0.1 / page)
+        if page == state["fail_page"]:
+            return httpx.Response(500, request=request)
+        return httpx.Response(200, json=_page(page, state["sizes"].get(page, 10)))
+
+    monkeypatch.setattr(searxng, "SEARXNG_URL", "http://searxng.test")
+    monkeypatch.setattr(_web_search_module, "_SEARXNG_URL", "http://searxng.test")
+    monkeypatch.setattr(
+        searxng,
+        "_get_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    searxng.clear_search_cache()
+    yield requests, state
+    searxng.clear_search_cache()
+
+
+async def _search(**kwargs) -> dict:
+    kwargs.setdefault("reason", "test")
+    kwargs.setdefault("query", "aria")
+    return json.loads(await searxng.searxng_web_search(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_pages_are_fetched_concurrently_and_kept_in_order(stub):
+    requests, _ = stub
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await _search(max_results=30)
+    elapsed = loop.time() - start
+
+    assert elapsed < 0.15
+    assert sorted(requests) == [1, 2, 3]
+    findings = result["data"]["findings"]
+    assert len(findings) == 30
+    assert findings[0]["title"] == "Result 1.0"
+    assert findings[-1]["title"] == "Result 3.9"
+    assert result["data"]["page_stats"] == {
+        "requested": 3,
+        "succeeded": 3,
+        "failed": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_page_requests_use_searxng_timeout(stub, monkeypatch):
+    timeouts: list[dict] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json=_page(1))
+
+    monkeypatch.setattr(
+        searxng,
+        "_get_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler), timeout=30),
+    )
+    await _search(max_results=5)
+
+    assert timeouts
+    assert {t["read"] for t in timeouts} == {searxng._REQUEST_TIMEOUT_SECONDS}
+
+
+@pytest.mark.asyncio
+async def test_short_page_keeps_waiting_for_next(stub):
+    _, state = stub
+    state["sizes"] = {1: 4}
+    result = await _search(max_results=12)
+    titles = [f["title"] for f in result["data"]["findings"]]
+    assert len(titles) == 12
+    assert titles[:5] == [*(f"Result 1.{i}" for i in range(4)), "Result 2.0"]
+
+
+@pytest.mark.asyncio
+async def test_repeat_search_is_served_from_cache(stub):
+    requests, _ = stub
+    first = await _search(max_results=20)
+    smaller = await _search(max_results=5, reason="again")
+    assert len(requests) == 2
+    assert not first["data"]["cached"]
+    assert smaller["data"]["cached"]
+    assert smaller["data"]["findings"] == first["data"]["findings"][:5]
+
+    await _search(max_results=5, category="news")
+    await _search(max_results=30)
+    assert len(requests) == 6
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled_and_expires(stub, monkeypatch):
+    requests, _ = stub
+    monkeypatch.setenv("ARIA_SEARCH_CACHE_TTL", "0")
+    await _search()
+    await _search()
+    assert len(requests) == 2
+
+    monkeypatch.setenv("ARIA_SEARCH_CACHE_TTL", "60")
+    await _search()
+    (key,) = searxng._cache
+    searxng._cache[key] = dataclasses.replace(searxng._cache[key], expires=0.0)
+    await _search()
+    assert len(requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_page_reports_partial_success_and_is_not_cached(stub):
+    requests, state = stub
+    state["fail_page"] = 2
+    result = await _search(max_results=20)
+    data = result["data"]
+    assert data["partial_success"]
+    assert data["count"] == 10
+    assert data["page_errors"][0]["page"] == 2
+
+    await _search(max_results=20)
+    assert len(requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_web_search_dispatches_to_searxng(stub):
+    result = json.loads(await web_search(reason="test", query="aria", max_results=3))
+    assert result["tool"] == "searxng_web_search"
+    assert result["data"]["count"] == 3
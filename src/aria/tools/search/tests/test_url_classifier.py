@@ -57,7 +57,7 @@ class TestClassifyUrlByExtension:
 class TestClassifyUrlByContentType:
     """Test classification based on HEAD request Content-Type."""
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_html_content_type_is_website(self, mock_client_cls):
         """text/html Content-Type should classify as WEBSITE."""
         mock_resp = MagicMock()
@@ -72,7 +72,7 @@ class TestClassifyUrlByContentType:
         result = classify_url("https://example.com/page")
         assert result == URLType.WEBSITE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_xhtml_content_type_is_website(self, mock_client_cls):
         """application/xhtml+xml Content-Type should classify as WEBSITE."""
         mock_resp = MagicMock()
@@ -87,7 +87,7 @@ class TestClassifyUrlByContentType:
         result = classify_url("https://example.com/page")
         assert result == URLType.WEBSITE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_pdf_content_type_is_file(self, mock_client_cls):
         """application/pdf Content-Type should classify as FILE."""
         mock_resp = MagicMock()
@@ -102,7 +102,7 @@ class TestClassifyUrlByContentType:
         result = classify_url("https://example.com/download")
         assert result == URLType.FILE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_octet_stream_is_file(self, mock_client_cls):
         """application/octet-stream Content-Type should classify as FILE."""
         mock_resp = MagicMock()
@@ -117,7 +117,7 @@ class TestClassifyUrlByContentType:
         result = classify_url("https://example.com/download")
         assert result == URLType.FILE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_image_content_type_is_file(self, mock_client_cls):
         """image/* Content-Type should classify as FILE."""
         mock_resp = MagicMock()
@@ -132,7 +132,7 @@ class TestClassifyUrlByContentType:
         result = classify_url("https://example.com/image")
         assert result == URLType.FILE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_video_content_type_is_file(self, mock_client_cls):
         """video/* Content-Type should classify as FILE."""
         mock_resp = MagicMock()
@@ -147,7 +147,7 @@ class TestClassifyUrlByContentType:
         result = classify_url("https://example.com/video")
         assert result == URLType.FILE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_audio_content_type_is_file(self, mock_client_cls):
         """audio/* Content-Type should classify as FILE."""
         mock_resp = MagicMock()
@@ -166,7 +166,7 @@ class TestClassifyUrlByContentType:
 class TestClassifyUrlFallback:
     """Test fallback behavior when classification is ambiguous."""
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_head_request_failure_defaults_to_website(self, mock_client_cls):
         """When HEAD request fails, default to WEBSITE."""
         mock_client_cls.side_effect = httpx.ConnectError("refused")
@@ -174,7 +174,7 @@ class TestClassifyUrlFallback:
         result = classify_url("https://example.com/page")
         assert result == URLType.WEBSITE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_timeout_defaults_to_website(self, mock_client_cls):
         """When HEAD request times out, default to WEBSITE."""
         mock_client_cls.side_effect = httpx.TimeoutException("timeout")
@@ -182,7 +182,7 @@ class TestClassifyUrlFallback:
         result = classify_url("https://example.com/page")
         assert result == URLType.WEBSITE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_unknown_content_type_defaults_to_website(self, mock_client_cls):
         """When Content-Type is ambiguous, default to WEBSITE."""
         mock_resp = MagicMock()
@@ -198,7 +198,7 @@ class TestClassifyUrlFallback:
         result = classify_url("https://example.com/thing")
         assert result == URLType.FILE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_no_content_type_header_defaults_to_website(self, mock_client_cls):
         """When no Content-Type header, default to WEBSITE."""
         mock_resp = MagicMock()
@@ -213,7 +213,7 @@ class TestClassifyUrlFallback:
         result = classify_url("https://example.com/page")
         assert result == URLType.WEBSITE
 
-    @patch("aria.tools.search._url_classifier.httpx.Client")
+    @patch("aria.tools.search._url_classifier.get_sync_client")
     def test_content_type_with_charset(self, mock_client_cls):
         """Content-Type with charset parameter should still match."""
         mock_resp = MagicMock()
@@ -234,7 +234,7 @@ class TestClassifyUrlEdgeCases:
 
     def test_url_with_no_path(self):
         """URL with no path should fall through to HEAD request."""
-        with patch("aria.tools.search._url_classifier.httpx.Client") as mock_cls:
+        with patch("aria.tools.search._url_classifier.get_sync_client") as mock_cls:
             mock_resp = MagicMock()
             mock_resp.headers = {"content-type": "text/html"}
 
@@ -254,7 +254,7 @@ class TestClassifyUrlEdgeCases:
 
     def test_extension_takes_priority_over_head(self):
         """Extension match should return immediately without HEAD request."""
-        with patch("aria.tools.search._url_classifier.httpx.Client") as mock_cls:
+        with patch("aria.tools.search._url_classifier.get_sync_client") as mock_cls:
             result = classify_url("https://example.com/file.pdf")
             assert result == URLType.FILE
             # HEAD request should NOT have been made
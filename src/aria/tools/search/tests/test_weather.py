@@ -1,7 +1,9 @@
 import json
+from types import SimpleNamespace
 
 import httpx
 
+from aria.tools.search import weather
 from aria.tools.search.weather import get_current_weather
 
 
@@ -39,7 +41,9 @@ def test_get_current_weather_success(monkeypatch):
             )
         raise AssertionError(f"Unexpected URL: {url}")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(
+        weather, "get_sync_client", lambda: SimpleNamespace(get=fake_get)
+    )
 
     out = json.loads(get_current_weather("need current conditions", "Berlin"))
     assert out["status"] == "success"
@@ -57,7 +61,9 @@ def test_get_current_weather_no_geocode_results(monkeypatch):
             )
         raise AssertionError("Forecast should not be requested")
 
-    monkeypatch.setattr(httpx, "get", fake_get)
+    monkeypatch.setattr(
+        weather, "get_sync_client", lambda: SimpleNamespace(get=fake_get)
+    )
 
     out = json.loads(get_current_weather("test", "Nowhere"))
     assert out["status"] == "error"
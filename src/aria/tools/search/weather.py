@@ -15,6 +15,7 @@ from aria.tools import (
     tool_success_response,
 )
 from aria.tools.constants import NETWORK_TIMEOUT
+from aria.tools.http.client import get_sync_client
 
 # https://open-meteo.com/en/docs
 _WEATHER_CODE_TEXT: dict[int, str] = {
@@ -95,7 +96,8 @@ def get_current_weather(reason: Reason, location: str) -> str:
 
     try:
         # 1) Geocode
-        geo = httpx.get(
+        client = get_sync_client()
+        geo = client.get(
             "https://geocoding-api.open-meteo.com/v1/search",
             params={"name": location_value, "count": 1, "format": "json"},
             timeout=httpx.Timeout(NETWORK_TIMEOUT),
@@ -117,7 +119,7 @@ def get_current_weather(reason: Reason, location: str) -> str:
         timezone = first.get("timezone")
 
         # 2) Forecast (current)
-        forecast = httpx.get(
+        forecast = client.get(
             "https://api.open-meteo.com/v1/forecast",
             params={
                 "latitude": lat,
@@ -1,12 +1,15 @@
 """Unified web search tool.
 
 
-Auto-selects backend based on SEARXNG_URL environment variable.
+Auto-selects backend based on SEARXNG_URL environment variable, or
+races SearXNG and DuckDuckGo with ``ARIA_SEARCH_MODE=hedged`` (see
+:mod:`aria.tools.search._hedged`).
 """
 
 from loguru import logger
 
 from aria.tools import Reason, log_tool_call
+from aria.tools.search._hedged import hedged_search_enabled, hedged_web_search
 
 # Lazy imports to avoid hard dependency on DDGS when SearXNG is available
 _SEARXNG_URL: str = ""
@@ -23,7 +26,7 @@ def _get_searxng_url() -> str:
 
 
 @log_tool_call
-def web_search(
+async def web_search(
     reason: Reason,
     query: str,
     category: str | None = None,
@@ -64,11 +67,22 @@ def web_search(
     searxng_url = _get_searxng_url()
     max_results_value = max_results if max_results is not None else 5
 
+    if (
+        searxng_url
+        and (category or "general") == "general"
+        and not time_range
+        and hedged_search_enabled()
+    ):
+        logger.debug("Using hedged SearXNG + DuckDuckGo web search")
+        return await hedged_web_search(
+            reason=reason, query=query, max_results=max_results_value
+        )
+
     if searxng_url:
         logger.debug("Using SearXNG backend for web search")
         from aria.tools.search.searxng import searxng_web_search
 
-        return searxng_web_search(
+        return await searxng_web_search(
             reason=reason,
             query=query,
             category=(category or "general"),  # type: ignore[arg-type]
@@ -77,9 +91,13 @@ def web_search(
         )
     else:
         logger.debug("Using DuckDuckGo backend for web search")
+        from aria.tools.ax.executors import run_sync
         from aria.tools.search.duckduckgo import duckduckgo_web_search
 
-        return duckduckgo_web_search(
+        # DDGS is blocking; keep it off the event loop.
+        return await run_sync(
+            "web",
+            duckduckgo_web_search,
             reason=reason,
             query=query,
             max_results=max_results_value,
@@ -40,6 +40,9 @@ MAX_OUTPUT_SIZE = (
 )  # 32KB — capped further by MAX_TOOL_OUTPUT_CHARS in tool_success_response
 MAX_LINE_LENGTH = 10000
 
+# Commands of a ``parallel`` batch running at the same time.
+MAX_PARALLEL_COMMANDS = max(1, int(os.environ.get("ARIA_SHELL_MAX_PARALLEL", "4")))
+
 BLOCKED_COMMANDS = [
     # System shutdown/reboot — works without root on many desktop systems
     "shutdown",
@@ -2,22 +2,84 @@
 
 This module provides internal helpers for command execution and
 response building.
+
+Commands run as asyncio subprocesses whose stdout and stderr are
+streamed into :class:`_OutputBuffer` instances, so a command printing
+gigabytes never holds more than ``_CAPTURE_LIMIT`` bytes per stream:
+the head and the tail of the output are kept and the bytes in between
+are counted.  Each command runs in its own process group, and a timeout
+kills the whole group (pipelines and the children they spawned).
 """
 
+import asyncio
+import os
 import re
+import signal
 import subprocess
+import threading
 import time
+from collections.abc import Coroutine
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
-from aria.tools.shell.constants import MAX_OUTPUT_SIZE
+from aria.tools.constants import MAX_TOOL_OUTPUT_CHARS
+from aria.tools.shell.constants import IS_WINDOWS, MAX_OUTPUT_SIZE
 from aria.tools.shell.validation import _extract_command_name
 
 # Strip ANSI escape sequences (colors, cursor movement, etc.)
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]|\x1b\].*?\x07")
 
+_READ_CHUNK = 64 * 1024
+# Bytes kept per stream.  Both streams and the JSON envelope must fit in
+# one tool output, or its truncation would cut off the tail kept here.
+_CAPTURE_LIMIT = min(MAX_OUTPUT_SIZE, MAX_TOOL_OUTPUT_CHARS // 3)
+# Room left in MAX_OUTPUT_SIZE for the "bytes dropped" marker.
+_MARKER_ROOM = 64
+# How long pipes may stay open after the process group was killed.
+_KILL_GRACE = 2.0
+
+
+class _OutputBuffer:
+    """Bounded capture of one output stream: head, tail and dropped bytes.
+
+    The first ``limit // 2`` bytes are kept verbatim; after that only the
+    most recent bytes are kept in a fixed-size tail window, and whatever
+    falls out of it is counted in :attr:`dropped`.
+    """
+
+    def __init__(self, limit: int = _CAPTURE_LIMIT) -> None:
+        self._head_size = limit // 2
+        self._tail_size = max(0, limit - self._head_size - _MARKER_ROOM)
+        self._head = bytearray()
+        self._tail = bytearray()
+        self.dropped = 0
+
+    def write(self, chunk: bytes) -> None:
+        room = self._head_size - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if not chunk:
+            return
+        if len(chunk) >= self._tail_size:
+            self.dropped += len(self._tail) + len(chunk) - self._tail_size
+            self._tail[:] = chunk[len(chunk) - self._tail_size :]
+            return
+        self._tail += chunk
+        excess = len(self._tail) - self._tail_size
+        if excess > 0:
+            del self._tail[:excess]
+            self.dropped += excess
+
+    def text(self) -> str:
+        head = self._head.decode("utf-8", errors="replace")
+        tail = self._tail.decode("utf-8", errors="replace")
+        if self.dropped:
+            return f"{head}\n... [{self.dropped} bytes dropped] ...\n{tail}"
+        return head + tail
+
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from text."""
@@ -34,6 +96,8 @@ def _build_response(
     return_code: int = -1,
     execution_time: float = 0.0,
     timed_out: bool = False,
+    stdout_dropped: int = 0,
+    stderr_dropped: int = 0,
 ) -> dict[str, Any]:
     """Build a lean command execution response dict.
 
@@ -48,6 +112,8 @@ def _build_response(
         return_code: Process exit code.
         execution_time: Duration in seconds.
         timed_out: Whether the command timed out.
+        stdout_dropped: Bytes cut from the middle of stdout.
+        stderr_dropped: Bytes cut from the middle of stderr.
 
     Returns:
         Response dictionary with minimal data payload.
@@ -67,13 +133,69 @@ def _build_response(
         data["stdout"] = clean_stdout
     if clean_stderr:
         data["stderr"] = clean_stderr
+    if stdout_dropped:
+        data["stdout_dropped_bytes"] = stdout_dropped
+    if stderr_dropped:
+        data["stderr_dropped_bytes"] = stderr_dropped
     if timed_out:
         data["timed_out"] = True
 
     return {"data": data}
 
 
-def _execute_command_internal(
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run *coro* to completion from synchronous code.
+
+    Tools are called from worker threads without an event loop, where
+    this is ``asyncio.run``.  If the calling thread already runs a loop,
+    the coroutine gets its own loop on a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome: dict[str, Any] = {}
+
+    def _target() -> None:
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=_target, name="aria-shell")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+async def _pump(stream: asyncio.StreamReader | None, buffer: _OutputBuffer) -> None:
+    """Copy *stream* into *buffer* until EOF."""
+    if stream is None:
+        return
+    while chunk := await stream.read(_READ_CHUNK):
+        buffer.write(chunk)
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill *process* and every process in its group."""
+    if process.returncode is not None:
+        return
+    try:
+        if IS_WINDOWS:
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    except OSError as exc:
+        logger.warning(f"Failed to kill process group {process.pid}: {exc}")
+        process.kill()
+
+
+async def _execute_command_async(
     operation: str,
     display_command: str,
     run_target: str | list[str],
@@ -85,10 +207,14 @@ def _execute_command_internal(
 ) -> dict[str, Any]:
     """Execute a command and return a standardized response dict.
 
+    Streams stdout and stderr into bounded buffers while the command
+    runs and kills its process group once *timeout* expires; output
+    captured up to that point is still returned.
+
     Args:
         operation: The operation name (e.g. ``execute_command``).
         display_command: Human-readable command for response payload.
-        run_target: Command passed to ``subprocess.run``.
+        run_target: Command to run.
             When ``shell=True`` this should be a string.
             When ``shell=False`` this should be a list of strings.
         working_dir: Resolved working directory.
@@ -101,43 +227,79 @@ def _execute_command_internal(
     """
     start_time = time.time()
     working_dir_str = str(working_dir)
+    stdout = _OutputBuffer()
+    stderr = _OutputBuffer()
 
     try:
-        result = subprocess.run(
-            run_target,
-            shell=shell,
-            cwd=working_dir,
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        elapsed = time.time() - start_time
+        options: dict[str, Any] = {
+            "cwd": working_dir,
+            "env": env,
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.PIPE,
+            # Own process group, so a timeout can kill the whole pipeline.
+            "start_new_session": not IS_WINDOWS,
+        }
+        if shell:
+            assert isinstance(run_target, str)
+            process = await asyncio.create_subprocess_shell(run_target, **options)
+        else:
+            process = await asyncio.create_subprocess_exec(*run_target, **options)
 
-        logger.info("Command executed with return code {}", result.returncode)
-        if result.stdout:
-            logger.info("stdout: {}", result.stdout[:2000])
-        if result.stderr:
-            logger.debug("stderr: {}", result.stderr[:2000])
-        return _build_response(
-            operation,
-            display_command,
-            working_dir_str,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            return_code=result.returncode,
-            execution_time=elapsed,
+        pumps = asyncio.gather(
+            _pump(process.stdout, stdout), _pump(process.stderr, stderr)
         )
+        timed_out = False
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.shield(pumps)
+                await process.wait()
+        except TimeoutError:
+            timed_out = True
+        finally:
+            # Also reached when the caller is cancelled.
+            _kill_process_group(process)
+        if timed_out:
+            try:
+                # Daemonized grandchildren may still hold the pipes open.
+                await asyncio.wait_for(pumps, _KILL_GRACE)
+            except TimeoutError:
+                pass
+            await process.wait()
+
+            elapsed = time.time() - start_time
+            logger.warning(f"Command timed out after {timeout}s")
+            return _build_response(
+                operation,
+                display_command,
+                working_dir_str,
+                stdout=stdout.text(),
+                stderr=stderr.text(),
+                execution_time=elapsed,
+                timed_out=True,
+                stdout_dropped=stdout.dropped,
+                stderr_dropped=stderr.dropped,
+            )
 
-    except subprocess.TimeoutExpired:
         elapsed = time.time() - start_time
-        logger.warning(f"Command timed out after {timeout}s")
+        result_stdout = stdout.text()
+        result_stderr = stderr.text()
+
+        logger.info("Command executed with return code {}", process.returncode)
+        if result_stdout:
+            logger.info("stdout: {}", result_stdout[:2000])
+        if result_stderr:
+            logger.debug("stderr: {}", result_stderr[:2000])
         return _build_response(
             operation,
             display_command,
             working_dir_str,
+            stdout=result_stdout,
+            stderr=result_stderr,
+            return_code=process.returncode,  # type: ignore[arg-type]
             execution_time=elapsed,
-            timed_out=True,
+            stdout_dropped=stdout.dropped,
+            stderr_dropped=stderr.dropped,
         )
 
     except FileNotFoundError:
@@ -170,3 +332,27 @@ def _execute_command_internal(
             stderr=str(exc),
             return_code=1,
         )
+
+
+def _execute_command_internal(
+    operation: str,
+    display_command: str,
+    run_target: str | list[str],
+    working_dir: Path,
+    timeout: int,
+    *,
+    shell: bool,
+    env: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Synchronous form of :func:`_execute_command_async`."""
+    return _run_sync(
+        _execute_command_async(
+            operation,
+            display_command,
+            run_target,
+            working_dir,
+            timeout,
+            shell=shell,
+            env=env,
+        )
+    )
@@ -5,6 +5,9 @@ proper timeout handling, output capture, and basic security constraints.
 
 """
 
+import asyncio
+import time
+from pathlib import Path
 from typing import Any
 
 from loguru import logger
@@ -13,7 +16,12 @@ from pydantic import BaseModel, Field
 from aria.tools import get_function_name, tool_response
 from aria.tools.constants import DEFAULT_TIMEOUT, MAX_TIMEOUT
 from aria.tools.decorators import log_tool_call
-from aria.tools.shell.execution import _execute_command_internal
+from aria.tools.shell.constants import MAX_PARALLEL_COMMANDS
+from aria.tools.shell.execution import (
+    _execute_command_async,
+    _execute_command_internal,
+    _run_sync,
+)
 from aria.tools.shell.validation import (
     _validate_command,
     _validate_working_dir,
@@ -34,6 +42,13 @@ class ShellToolSchema(BaseModel):
     )
     commands: str = Field(description="The shell command string to execute")
     stop_on_error: bool = Field(default=True, description="Stop on first failure")
+    parallel: bool = Field(
+        default=False,
+        description=(
+            "Run batch commands concurrently (for independent commands); "
+            "results keep the input order"
+        ),
+    )
     timeout: int | None = Field(
         default=None,
         description="Timeout in seconds (default: 30, max: configurable via ARIA_MAX_TIMEOUT)",
@@ -45,6 +60,31 @@ class ShellToolSchema(BaseModel):
     )
 
 
+def _prepare_shell_command(
+    command: str,
+    timeout: int | None,
+    working_dir: str | None,
+    env: dict[str, str] | None,
+) -> tuple[Path, int, dict[str, str]]:
+    """Validate *command* and resolve its working dir, timeout and env."""
+    logger.info(f"Executing shell command: {command}")
+    _validate_command(command)
+
+    actual_timeout = min(
+        timeout if timeout is not None else DEFAULT_TIMEOUT,
+        MAX_TIMEOUT,
+    )
+    resolved_working_dir = _validate_working_dir(working_dir)
+
+    # Ensure ~/.aria/bin and the current Python env bin are on PATH
+    from aria.config.folders import get_augmented_env
+
+    proc_env = get_augmented_env()
+    if env:
+        proc_env.update(env)
+    return resolved_working_dir, actual_timeout, proc_env
+
+
 def _run_shell_command(
     reason: str,
     command: str,
@@ -64,23 +104,32 @@ def _run_shell_command(
     Returns:
         Dict with data payload (stdout, stderr, return_code, etc.).
     """
-    logger.info(f"Executing shell command: {command}")
-    _validate_command(command)
-
-    actual_timeout = min(
-        timeout if timeout is not None else DEFAULT_TIMEOUT,
-        MAX_TIMEOUT,
+    resolved_working_dir, actual_timeout, proc_env = _prepare_shell_command(
+        command, timeout, working_dir, env
+    )
+    return _execute_command_internal(
+        "shell",
+        command,
+        command,
+        resolved_working_dir,
+        actual_timeout,
+        shell=True,
+        env=proc_env,
     )
-    resolved_working_dir = _validate_working_dir(working_dir)
-
-    # Ensure ~/.aria/bin and the current Python env bin are on PATH
-    from aria.config.folders import get_augmented_env
 
-    proc_env = get_augmented_env()
-    if env:
-        proc_env.update(env)
 
-    return _execute_command_internal(
+async def _run_shell_command_async(
+    reason: str,
+    command: str,
+    timeout: int | None = None,
+    working_dir: str | None = None,
+    env: dict[str, str] | None = None,
+) -> dict:
+    """Async form of :func:`_run_shell_command`."""
+    resolved_working_dir, actual_timeout, proc_env = _prepare_shell_command(
+        command, timeout, working_dir, env
+    )
+    return await _execute_command_async(
         "shell",
         command,
         command,
@@ -91,6 +140,58 @@ def _run_shell_command(
     )
 
 
+async def _run_batch_parallel(
+    commands: list[dict[str, Any]],
+    *,
+    stop_on_error: bool,
+    timeout: int | None,
+    working_dir: str | None,
+    env: dict[str, str] | None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Run *commands* concurrently, at most ``MAX_PARALLEL_COMMANDS`` at once.
+
+    Results keep the input order.  Once a command fails (and neither
+    ``stop_on_error`` is off nor the command allows it), commands that
+    have not started yet are skipped; running ones finish.
+
+    Returns:
+        The results of the commands that ran and whether a failure
+        stopped the batch.
+    """
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_COMMANDS)
+    failed = asyncio.Event()
+
+    async def _run_one(i: int, cmd_dict: dict[str, Any]) -> dict[str, Any] | None:
+        cmd_str = cmd_dict.get("command", "")
+        async with semaphore:
+            if failed.is_set():
+                return None
+            try:
+                result = await _run_shell_command_async(
+                    reason=f"Command {i + 1}/{len(commands)}",
+                    command=cmd_str,
+                    timeout=cmd_dict.get("timeout", timeout),
+                    working_dir=cmd_dict.get("working_dir", working_dir),
+                    env=cmd_dict.get("env", env),
+                )
+                cmd_data = result["data"]
+            except Exception as e:
+                cmd_data = {
+                    "command": cmd_str.strip(),
+                    "error": str(e),
+                    "return_code": 1,
+                }
+        if cmd_data.get("return_code", -1) != 0:
+            if not cmd_dict.get("continue_on_error", False) and stop_on_error:
+                failed.set()
+        return cmd_data
+
+    results = await asyncio.gather(
+        *(_run_one(i, cmd_dict) for i, cmd_dict in enumerate(commands))
+    )
+    return [r for r in results if r is not None], failed.is_set()
+
+
 def _normalize_commands(
     commands: str | dict[str, Any] | list[Any],
 ) -> list[dict[str, Any]]:
@@ -146,6 +247,7 @@ def shell(
     timeout: int | None = None,
     working_dir: str | None = None,
     env: dict[str, str] | None = None,
+    parallel: bool = False,
 ) -> str:
     """Execute shell commands with timeout and security constraints.
 
@@ -161,6 +263,9 @@ def shell(
         timeout: Default timeout seconds (default: 30, max: configurable).
         working_dir: Default working directory.
         env: Additional environment variables for all commands.
+        parallel: Run batch commands concurrently (default: False).
+            Results keep the input order; after a failure, commands not
+            yet started are skipped.
 
     Returns:
         JSON with command output. Single commands return flat response;
@@ -206,7 +311,27 @@ def shell(
                 },
             )
 
-    results: list[dict[str, Any]] = []
+    if parallel:
+        start = time.time()
+        results, stopped_early = _run_sync(
+            _run_batch_parallel(
+                normalized,
+                stop_on_error=stop_on_error,
+                timeout=timeout,
+                working_dir=working_dir,
+                env=env,
+            )
+        )
+        data: dict[str, Any] = {
+            "results": results,
+            # Wall-clock time of the whole batch.
+            "execution_time": round(time.time() - start, 3),
+        }
+        if stopped_early:
+            data["stopped_early"] = True
+        return tool_response(tool=get_function_name(), reason=reason, data=data)
+
+    results = []
     total_execution_time = 0.0
     stopped_early = False
 
@@ -246,7 +371,7 @@ def shell(
                 stopped_early = True
                 break
 
-    data: dict[str, Any] = {
+    data = {
         "results": results,
         "execution_time": round(total_execution_time, 3),
     }
@@ -0,0 +1,170 @@
+"""Tests for streaming shell execution and parallel batches."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from aria.tools.shell import shell
+from aria.tools.shell.constants import IS_LINUX, IS_WINDOWS
+from aria.tools.shell.execution import _CAPTURE_LIMIT, _OutputBuffer
+
+pytestmark = pytest.mark.skipif(IS_WINDOWS, reason="POSIX shell commands")
+
+
+def _data(result: str) -> dict:
+    return json.loads(result)["data"]
+
+
+class TestOutputBuffer:
+    """Tests for the bounded head/tail output capture."""
+
+    def test_small_output_kept_verbatim(self):
+        buffer = _OutputBuffer(limit=1024)
+        buffer.write(b"hello ")
+        buffer.write(b"world")
+
+        assert buffer.text() == "hello world"
+        assert buffer.dropped == 0
+
+    def test_keeps_head_and_tail_and_counts_dropped(self):
+        buffer = _OutputBuffer(limit=200)
+        for i in range(1000):
+            buffer.write(f"{i:05d}\n".encode())
+
+        text = buffer.text()
+        assert text.startswith("00000\n00001\n")
+        assert text.endswith("00999\n")
+        assert buffer.dropped == 6000 - 100 - (200 - 100 - 64)
+        assert f"[{buffer.dropped} bytes dropped]" in text
+
+    def test_chunk_larger_than_tail(self):
+        buffer = _OutputBuffer(limit=200)
+        buffer.write(b"a" * 100)
+        buffer.write(b"b" * 50 + b"c" * 1000)
+
+        text = buffer.text()
+        assert text.startswith("a" * 100)
+        assert text.endswith("c" * 36)
+        assert buffer.dropped == 1050 - 36
+
+    def test_split_utf8_is_replaced_not_raised(self):
+        buffer = _OutputBuffer(limit=1024)
+        buffer.write("é".encode()[:1])
+
+        assert buffer.text() == "�"
+
+
+class TestStreamingExecution:
+    """Tests for bounded capture and process-group timeouts."""
+
+    def test_large_output_is_bounded(self):
+        result = shell(
+            reason="Test large output",
+            commands="python3 -c \"import sys; sys.stdout.write('x' * 5_000_000 + 'END')\"",
+            timeout=30,
+        )
+        data = _data(result)
+
+        assert data["return_code"] == 0
+        assert len(data["stdout"]) <= _CAPTURE_LIMIT
+        assert data["stdout"].startswith("xxx")
+        assert data["stdout"].endswith("END")
+        assert data["stdout_dropped_bytes"] == 5_000_003 - _CAPTURE_LIMIT + 64
+
+    def test_timeout_returns_partial_output(self):
+        result = shell(
+            reason="Test partial output",
+            commands="echo started; sleep 10",
+            timeout=1,
+        )
+        data = _data(result)
+
+        assert data["timed_out"] is True
+        assert data["stdout"] == "started"
+        assert data["execution_time"] < 5
+
+    @pytest.mark.skipif(not IS_LINUX, reason="inspects /proc")
+    def test_timeout_kills_the_process_group(self, tmp_path: Path):
+        pid_file = tmp_path / "pid"
+        result = shell(
+            reason="Test group kill",
+            commands=f"sh -c 'echo $$ > {pid_file}; exec sleep 30' & wait",
+            timeout=1,
+        )
+
+        assert _data(result)["timed_out"] is True
+        stat = Path(f"/proc/{pid_file.read_text().strip()}/stat")
+        # Gone, or a zombie waiting to be reaped.
+        assert not stat.exists() or stat.read_text().split()[2] == "Z"
+
+    async def test_runs_inside_an_event_loop(self):
+        data = _data(shell(reason="Test loop", commands="echo inside"))
+
+        assert data["stdout"] == "inside"
+
+
+class TestParallelBatch:
+    """Tests for ``parallel=True`` batches."""
+
+    def test_commands_run_concurrently_in_order(self):
+        commands = [f"sleep 0.5; echo {i}" for i in range(4)]
+
+        start = time.perf_counter()
+        result = shell(reason="Test parallel", commands=commands, parallel=True)
+        elapsed = time.perf_counter() - start
+
+        results = _data(result)["results"]
+        assert [r["stdout"] for r in results] == ["0", "1", "2", "3"]
+        assert elapsed < 1.5
+
+    def test_concurrency_is_capped(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("aria.tools.shell.functions.MAX_PARALLEL_COMMANDS", 2)
+        commands = ["sleep 0.4"] * 4
+
+        start = time.perf_counter()
+        shell(reason="Test cap", commands=commands, parallel=True)
+
+        assert time.perf_counter() - start >= 0.8
+
+    def test_failure_skips_commands_not_started(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("aria.tools.shell.functions.MAX_PARALLEL_COMMANDS", 1)
+
+        result = shell(
+            reason="Test stop",
+            commands=["exit 3", "echo never"],
+            parallel=True,
+        )
+        data = _data(result)
+
+        assert [r["return_code"] for r in data["results"]] == [3]
+        assert data["stopped_early"] is True
+
+    def test_continue_on_error_runs_everything(self):
+        result = shell(
+            reason="Test continue",
+            commands=[
+                {"command": "exit 1", "continue_on_error": True},
+                {"command": "echo ok"},
+            ],
+            parallel=True,
+        )
+        data = _data(result)
+
+        assert [r["return_code"] for r in data["results"]] == [1, 0]
+        assert "stopped_early" not in data
+
+    def test_blocked_command_reported_in_place(self):
+        result = shell(
+            reason="Test blocked",
+            commands=["echo a", "shutdown now", "echo c"],
+            stop_on_error=False,
+            parallel=True,
+        )
+        results = _data(result)["results"]
+
+        assert results[0]["stdout"] == "a"
+        assert results[1]["return_code"] == 1
+        assert "error" in results[1]
+        assert results[2]["stdout"] == "c"
@@ -0,0 +1,213 @@
+"""Tests for the shared tools database and its write-behind queue."""
+
+import sqlite3
+import time
+
+import pytest
+from sqlalchemy import text
+
+from aria.tools.database import ToolsDatabase
+
+
+def _raw_count(db_path: str) -> int:
+    """Count committed rows using an independent SQLite connection."""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+
+
+def _insert(value: str):
+    def _write(session):
+        session.execute(text("INSERT INTO notes (value) VALUES (:v)"), {"v": value})
+
+    return _write
+
+
+@pytest.fixture
+def make_db(tmp_path):
+    created: list[ToolsDatabase] = []
+
+    def _make(**kwargs) -> ToolsDatabase:
+        db = ToolsDatabase(str(tmp_path / f"tools-{len(created)}.db"), **kwargs)
+        with db._engine.begin() as conn:
+            conn.execute(text("CREATE TABLE notes (value TEXT NOT NULL)"))
+        created.append(db)
+        return db
+
+    yield _make
+
+    for db in created:
+        db.close()
+
+
+class TestToolsDatabaseWriteModes:
+    """Sync and batched write behaviour."""
+
+    def test_invalid_write_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="write mode"):
+            ToolsDatabase(str(tmp_path / "tools.db"), write_mode="eventually")
+
+    def test_sync_mode_commits_immediately(self, make_db):
+        db = make_db(write_mode="sync")
+        db.submit(_insert("a"))
+        assert _raw_count(db.db_path) == 1
+
+    def test_batched_mode_defers_until_flush(self, make_db):
+        db = make_db(write_mode="batched", batch_size=100, flush_interval=60)
+        for i in range(5):
+            db.submit(_insert(str(i)))
+
+        assert _raw_count(db.db_path) == 0
+        db.flush()
+        assert _raw_count(db.db_path) == 5
+
+    def test_get_session_sees_queued_writes(self, make_db):
+        db = make_db(write_mode="batched", batch_size=100, flush_interval=60)
+        db.submit(_insert("a"))
+
+        with db.get_session() as session:
+            count = session.execute(text("SELECT COUNT(*) FROM notes")).scalar()
+        assert count == 1
+
+    def test_batched_mode_flushes_on_size_threshold(self, make_db):
+        db = make_db(write_mode="batched", batch_size=3, flush_interval=60)
+        for i in range(3):
+            db.submit(_insert(str(i)))
+
+        deadline = time.monotonic() + 5
+        while _raw_count(db.db_path) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _raw_count(db.db_path) == 3
+
+    def test_batched_mode_flushes_on_interval(self, make_db):
+        db = make_db(write_mode="batched", batch_size=100, flush_interval=0.02)
+        db.submit(_insert("a"))
+
+        deadline = time.monotonic() + 5
+        while _raw_count(db.db_path) < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _raw_count(db.db_path) == 1
+
+    def test_close_flushes_pending_writes(self, make_db):
+        db = make_db(write_mode="batched", batch_size=100, flush_interval=60)
+        db.submit(_insert("a"))
+        db.submit(_insert("b"))
+        db.close()
+        assert _raw_count(db.db_path) == 2
+
+    def test_failing_write_does_not_drop_batch(self, make_db):
+        db = make_db(write_mode="batched", batch_size=100, flush_interval=60)
+
+        def _bad(session):
+            session.execute(text("INSERT INTO missing_table VALUES (1)"))
+
+        db.submit(_insert("a"))
+        db.submit(_bad)
+        db.submit(_insert("b"))
+        db.flush()
+        assert _raw_count(db.db_path) == 2
+
+    def test_dropped_write_is_reported(self, make_db):
+        db = make_db(write_mode="batched", batch_size=100, flush_interval=60)
+        errors: list[Exception] = []
+
+        def _bad(session):
+            session.execute(text("INSERT INTO missing_table VALUES (1)"))
+
+        db.submit(_insert("a"), errors.append)
+        db.submit(_bad, errors.append)
+        db.flush()
+
+        assert len(errors) == 1
+        assert "missing_table" in str(errors[0])
+        assert db.dropped_writes == 1
+        db.close()
+        assert db.dropped_writes == 1
+
+    def test_sync_mode_failure_raises(self, make_db):
+        db = make_db(write_mode="sync")
+        errors: list[Exception] = []
+
+        with pytest.raises(Exception, match="missing_table"):
+            db.submit(
+                lambda s: s.execute(text("INSERT INTO missing_table VALUES (1)")),
+                errors.append,
+            )
+        assert errors == []
+        assert db.dropped_writes == 0
+
+
+def test_reasoning_workflow_in_batched_mode(tmp_path):
+    """Reasoning writes stay consistent when queued behind the batch writer."""
+    import aria.tools.database as db_module
+    import aria.tools.reasoning.registry as reg_module
+    from aria.tools.reasoning import reasoning
+    from aria.tools.reasoning.database import ReasoningDatabase
+
+    db = ToolsDatabase(
+        str(tmp_path / "tools.db"),
+        write_mode="batched",
+        batch_size=100,
+        flush_interval=60,
+    )
+    db.create_tables()
+    db_module._db_instance = db
+    ReasoningDatabase._instance = None
+    reg_module._db = ReasoningDatabase()
+    reg_module.clear_all()
+    try:
+        reasoning("Batch", action="start", agent_id="batch_agent")
+        for i in range(3):
+            reasoning("Batch", action="step", content=f"s{i}", agent_id="batch_agent")
+        reg_module.clear_all()
+
+        summary = reasoning("Batch", action="summary", agent_id="batch_agent")
+        assert summary["data"]["steps_count"] == 3
+    finally:
+        db.close()
+        db_module._db_instance = None
+        ReasoningDatabase._instance = None
+        reg_module._db = None
+        reg_module.clear_all()
+
+
+def test_dropped_reasoning_write_evicts_cached_session(tmp_path):
+    """A failed queued write makes the registry reload the stored session."""
+    import aria.tools.database as db_module
+    import aria.tools.reasoning.registry as reg_module
+    from aria.tools.reasoning import reasoning
+    from aria.tools.reasoning.database import ReasoningDatabase
+
+    db = ToolsDatabase(
+        str(tmp_path / "tools.db"),
+        write_mode="batched",
+        batch_size=100,
+        flush_interval=60,
+    )
+    db.create_tables()
+    db_module._db_instance = db
+    ReasoningDatabase._instance = None
+    reg_module._db = ReasoningDatabase()
+    reg_module.clear_all()
+    try:
+        reasoning("Drop", action="start", agent_id="drop_agent")
+        reasoning("Drop", action="step", content="kept", agent_id="drop_agent")
+        db.flush()
+
+        def _fail(session):
+            raise RuntimeError("disk full")
+
+        real_submit = db.submit
+        db.submit = lambda op, on_error=None: real_submit(_fail, on_error)
+        reasoning("Drop", action="step", content="lost", agent_id="drop_agent")
+        db.submit = real_submit
+        db.flush()
+
+        summary = reasoning("Drop", action="summary", agent_id="drop_agent")
+        assert summary["data"]["steps_count"] == 1
+        assert db.dropped_writes > 0
+    finally:
+        db.close()
+        db_module._db_instance = None
+        ReasoningDatabase._instance = None
+        reg_module._db = None
+        reg_module.clear_all()
@@ -17,7 +17,6 @@ import os
 
 from chromadb import PersistentClient as ChromaDBPersistentClient
 from loguru import logger
-from sqlalchemy import create_engine
 
 from aria.config.api import Vllm as VllmConfig
 from aria.config.database import ChromaDB as ChromaDBConfig
@@ -26,7 +25,13 @@ from aria.config.folders import Data as DataConfig
 from aria.config.folders import Debug as DebugConfig
 from aria.config.models import Chat as ChatConfig
 from aria.config.models import Embeddings as EmbeddingsConfig
-from aria.llm import get_agent_workflow, get_chat_llm, get_embeddings_model
+from aria.helpers.sqlite import create_sqlite_engine, verify_sqlite_pragmas
+from aria.llm import (
+    get_agent_workflow,
+    get_chat_llm,
+    get_embeddings_model,
+    get_token_counter,
+)
 from aria.server.vllm import VllmServerManager
 from aria.web.state import _state
 
@@ -155,7 +160,8 @@ def _init_database() -> None:
     """Create the SQLite engine and ensure all tables exist."""
     from aria.db.models import Base
 
-    _state.db_engine = create_engine(SQLiteConfig.db_url)
+    _state.db_engine = create_sqlite_engine(SQLiteConfig.db_url)
+    verify_sqlite_pragmas(_state.db_engine)
     Base.metadata.create_all(_state.db_engine)
 
 
@@ -258,7 +264,13 @@ def _cleanup_orphaned_collections() -> None:
             active_thread_ids = {row[0] for row in result}
 
         # Remove collections whose name isn't a known thread
-        orphaned = [c.name for c in collections if c.name not in active_thread_ids]
+        from aria.tools.knowledge.semantic import COLLECTION_NAME
+
+        orphaned = [
+            c.name
+            for c in collections
+            if c.name not in active_thread_ids and c.name != COLLECTION_NAME
+        ]
 
         for name in orphaned:
             _state.vector_db.delete_collection(name)
@@ -269,6 +281,27 @@ def _cleanup_orphaned_collections() -> None:
         logger.warning(f"ChromaDB collection cleanup failed: {e}")
 
 
+def _init_knowledge_index() -> None:
+    """Attach the semantic knowledge index and queue unembedded entries.
+
+    Entries stored while the index was detached (CLI, workers, previous
+    runs) are embedded in the background.
+    """
+    if _state.embeddings is None or _state.vector_db is None:
+        return
+
+    from aria.tools.knowledge.database import get_database
+    from aria.tools.knowledge.semantic import (
+        get_semantic_index,
+        set_semantic_backend,
+    )
+
+    set_semantic_backend(_state.embeddings, _state.vector_db)
+    index = get_semantic_index()
+    if index is not None:
+        index.sync(get_database().index_entries())
+
+
 def _init_agent_workflows() -> None:
     """Create the agent workflow and prompt enhancer."""
     from aria.agents import get_prompt_enhancer_agent
@@ -289,7 +322,15 @@ async def _init_browser() -> None:
 
         binary = Lightpanda.get_binary_path()
         if binary:
-            browser_mgr = LightpandaManager(binary, port=Lightpanda.port)
+            browser_mgr = LightpandaManager(
+                binary,
+                port=Lightpanda.port,
+                pool_size=Lightpanda.pool_size,
+                processes=Lightpanda.processes,
+                recycle_after=Lightpanda.recycle_after,
+                cache_ttl=Lightpanda.cache_ttl,
+                cache_max_bytes=Lightpanda.cache_max_mb * 1024 * 1024,
+            )
             if await browser_mgr.start():
                 _state.browser_manager = browser_mgr
                 set_browser_manager(browser_mgr)
@@ -393,6 +434,8 @@ async def on_app_startup_handler() -> None:
     # the vLLM health-check wait (~300s max).
     logger.info("Loading embeddings model (concurrent with vLLM)...")
     embed_task = asyncio.create_task(asyncio.to_thread(_load_embeddings_sync))
+    # Same for the chat model's tokenizer, used for context accounting.
+    tokenizer_task = asyncio.create_task(asyncio.to_thread(get_token_counter))
 
     if VllmConfig.remote:
         logger.info(
@@ -423,6 +466,7 @@ async def on_app_startup_handler() -> None:
         logger.info("Embeddings model loaded")
     except Exception as e:
         logger.warning(f"Embeddings model failed to load: {e}.")
+    await tokenizer_task
 
     if _vllm_ready:
         try:
@@ -441,6 +485,11 @@ async def on_app_startup_handler() -> None:
     # Clean up ChromaDB collections for deleted threads
     _cleanup_orphaned_collections()
 
+    try:
+        _init_knowledge_index()
+    except Exception as e:
+        logger.warning(f"Semantic knowledge index failed to initialize: {e}.")
+
     if _llm_ready and _state.llm is not None:
         try:
             logger.info("Initializing agent workflows...")
@@ -466,8 +515,11 @@ async def on_app_shutdown_handler() -> None:
     Performs cleanup of:
     - vLLM inference servers
     - Lightpanda browser
-    - Database connections
+    - Database connections (including queued tool writes)
     - Data layer cache
+    - Shared HTTP client
+    - Document conversion worker pool
+    - ax tool executors
     - Logging sinks
     """
     global _log_sink_id, _tool_call_sink_id
@@ -508,6 +560,26 @@ async def on_app_shutdown_handler() -> None:
             set_browser_manager(None)
             _state.browser_manager = None
 
+    from aria.tools.knowledge.semantic import set_semantic_backend
+
+    set_semantic_backend(None, None)
+
+    if _state.http_client is not None:
+        await _state.http_client.aclose()
+        _state.http_client = None
+
+    from aria.tools.http.client import aclose_http_clients
+
+    await aclose_http_clients()
+
+    from aria.helpers.documents import shutdown_conversion_pool
+
+    shutdown_conversion_pool()
+
+    from aria.tools.ax.executors import shutdown_executors
+
+    shutdown_executors()
+
     _state.vllm_manager = None
     _state.llm = None
     _state.embeddings = None
@@ -521,6 +593,10 @@ async def on_app_shutdown_handler() -> None:
         _state.db_engine.dispose()
         _state.db_engine = None
 
+    from aria.tools.database import close_tools_database
+
+    close_tools_database()
+
     logger.info("Aria web UI shutdown complete")
 
     # Log sinks are removed LAST so that all cleanup logging above is
@@ -14,6 +14,9 @@ whenever a user sends a message.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -29,10 +32,11 @@ from aria.agents.prompt_enhancer import PromptEnhancementResult
 from aria.config.api import Vllm as VllmConfig
 from aria.config.models import Chat as ChatConfig
 from aria.helpers.ui import maybe_remove_step, send_tool_step
+from aria.tools.browser.manager import set_browser_session
 from aria.web.hooks import get_data_layer_handler
 from aria.web.session import (
     _sanitize_chat_history,
-    convert_documents_to_markdown,
+    aconvert_documents_to_markdown,
     create_memory,
     extract_file_paths,
     extract_image_data,
@@ -51,9 +55,20 @@ _DEFAULT_METADATA: dict[str, Any] = {
     "processed": False,
     "prompt_enhanced": False,
     "attachments": [],
+    "image_timings": [],
     "error": "",
 }
 
+# Uploads at least this large (in total) get a progress step in the UI
+_CONVERSION_STEP_MIN_BYTES = 1024 * 1024
+
+_IMAGE_DESCRIBE_PROMPT = "Describe this image concisely in 2-3 sentences."
+
+# Image descriptions keyed by content hash, so re-sent or edited messages
+# with the same attachments skip the vision round-trip.
+_IMAGE_CACHE_SIZE = 256
+_image_descriptions: OrderedDict[str, str] = OrderedDict()
+
 # Markdown formatting for thinking/reasoning content (blockquote style)
 _BLOCKQUOTE_PREFIX = "> "
 _BLOCKQUOTE_END = "\n\n"
@@ -169,38 +184,121 @@ async def _reset_memory_for_edit(
 async def _describe_image(mime_type: str, base64_data: str, prompt: str) -> str:
     """Send an image to the vision endpoint and get a text description.
 
-    Uses the same vLLM endpoint configured for the main chat model.
+    Uses the same vLLM endpoint configured for the main chat model and
+    the shared pooled client from ``AppState``.
     Returns a concise description (~2-3 sentences) suitable for context.
     """
     image_url = f"data:{mime_type};base64,{base64_data}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{ChatConfig.api_url}/chat/completions",
-            headers={"Authorization": f"Bearer {VllmConfig.api_key}"},
-            json={
-                "model": ChatConfig.model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt,
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {"url": image_url},
-                            },
-                        ],
-                    }
-                ],
-                "max_tokens": 256,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"] or ""
+    client = _state.get_http_client()
+    response = await client.post(
+        f"{ChatConfig.api_url}/chat/completions",
+        headers={"Authorization": f"Bearer {VllmConfig.api_key}"},
+        json={
+            "model": ChatConfig.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": prompt,
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {"url": image_url},
+                        },
+                    ],
+                }
+            ],
+            "max_tokens": 256,
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data["choices"][0]["message"]["content"] or ""
+
+
+async def _describe_images(images: list[dict]) -> tuple[list[str], list[dict]]:
+    """Describe images concurrently, reusing cached descriptions.
+
+    At most ``VllmConfig.vision_concurrency`` requests are in flight.
+    Identical images in one message share a single request.
+
+    Returns:
+        A ``(descriptions, timings)`` tuple: one prompt line per image
+        and one ``{"name", "ms", "cached"}`` entry per image (plus
+        ``"error"`` when the description failed).
+    """
+    semaphore = asyncio.Semaphore(max(1, VllmConfig.vision_concurrency))
+    pending: dict[str, asyncio.Task[str]] = {}
+
+    async def fetch(img: dict, key: str) -> str:
+        async with semaphore:
+            desc = await _describe_image(
+                img["mime_type"], img["base64"], _IMAGE_DESCRIBE_PROMPT
+            )
+        _image_descriptions[key] = desc
+        while len(_image_descriptions) > _IMAGE_CACHE_SIZE:
+            _image_descriptions.popitem(last=False)
+        return desc
+
+    async def describe(index: int, img: dict) -> tuple[str, dict]:
+        start = time.perf_counter()
+        key = hashlib.sha256(
+            f"{img['mime_type']}\0{img['base64']}".encode()
+        ).hexdigest()
+        timing: dict[str, Any] = {"name": img["name"], "cached": False}
+        desc = _image_descriptions.get(key)
+        if desc is not None:
+            _image_descriptions.move_to_end(key)
+            timing["cached"] = True
+        else:
+            if key not in pending:
+                pending[key] = asyncio.create_task(fetch(img, key))
+            try:
+                desc = await pending[key]
+            except Exception as e:
+                logger.warning(f"Vision description failed for {img['name']}: {e}")
+                desc = "<description unavailable>"
+                timing["error"] = str(e)
+        timing["ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return f"[Image {index} ({img['name']})]: {desc}", timing
+
+    results = await asyncio.gather(
+        *(describe(i, img) for i, img in enumerate(images, 1))
+    )
+    return [line for line, _ in results], [timing for _, timing in results]
+
+
+async def _convert_uploads(file_paths: list[str]) -> list[dict]:
+    """Convert uploaded documents off the event loop.
+
+    Large uploads show a progress step while the worker pool converts
+    them; small ones convert silently.
+    """
+    total_bytes = 0
+    for path in file_paths:
+        try:
+            total_bytes += Path(path).stat().st_size
+        except OSError:
+            pass
+    if total_bytes < _CONVERSION_STEP_MIN_BYTES:
+        return await aconvert_documents_to_markdown(file_paths)
+
+    async with cl.Step(
+        name="Converting documents", type="tool", show_input=False
+    ) as step:
+        done = 0
+
+        async def progress(result: dict) -> None:
+            nonlocal done
+            done += 1
+            step.output = f"Converted {done}/{len(file_paths)}: {result['name']}"
+            await step.update()
+
+        return await aconvert_documents_to_markdown(file_paths, on_progress=progress)
 
 
 async def _handle_message(
@@ -254,7 +352,7 @@ async def _handle_message(
 
     # Non-image files → convert documents to markdown, pass metadata
     if file_paths:
-        conversions = convert_documents_to_markdown(file_paths)
+        conversions = await _convert_uploads(file_paths)
         file_lines = []
         for conv in conversions:
             if conv["markdown_path"]:
@@ -275,20 +373,9 @@ async def _handle_message(
         logger.debug(f"Appended {len(file_paths)} file path(s) to prompt")
 
     # Images → vision description
-    _IMAGE_DESCRIBE_PROMPT = "Describe this image concisely in 2-3 sentences."
     if image_data and VllmConfig.vision_enabled:
-        descriptions = []
-        for i, img in enumerate(image_data, 1):
-            try:
-                desc = await _describe_image(
-                    img["mime_type"], img["base64"], _IMAGE_DESCRIBE_PROMPT
-                )
-                descriptions.append(f"[Image {i} ({img['name']})]: {desc}")
-            except Exception as e:
-                logger.warning(f"Vision description failed for {img['name']}: {e}")
-                descriptions.append(
-                    f"[Image {i} ({img['name']})]: <description unavailable>"
-                )
+        descriptions, timings = await _describe_images(image_data)
+        meta["image_timings"] = timings
 
         if descriptions:
             images_block = "\n".join(descriptions)
@@ -466,6 +553,9 @@ async def on_message_handler(message: cl.Message) -> None:
         # before handing the memory to the workflow.
         await _sanitize_memory(memory)
 
+        # Browser tool calls of this turn use this thread's pages and cookies.
+        set_browser_session(message.thread_id)
+
         handler = _state.agents_workflow.run(
             user_msg=prompt,
             memory=memory,
@@ -12,10 +12,13 @@ persistent conversation state across messages and sessions.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 import shutil
 import uuid
+from collections.abc import Awaitable, Callable
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import chainlit as cl
@@ -28,6 +31,14 @@ from PIL import Image
 from aria.config.folders import Uploads as UploadsConfig
 from aria.config.folders import Workspace as WorkspaceConfig
 from aria.config.models import Embeddings as EmbeddingsConfig
+from aria.helpers.documents import (
+    content_hash,
+    convert_file,
+    get_conversion_pool,
+    load_cached_markdown,
+    shutdown_conversion_pool,
+    store_cached_markdown,
+)
 from aria.llm import get_default_memory
 from aria.web.state import ROOT_MESSAGE_TYPES, _state
 
@@ -285,14 +296,62 @@ _MARKITDOWN_EXTENSIONS = {
 }
 
 
+def _conversion_cache_dir() -> Path:
+    """Directory holding converted markdown keyed by content hash."""
+    return WorkspaceConfig.path / "uploads" / ".converted"
+
+
+def _conversion_result(
+    file_path: str,
+    markdown_path: Path | None = None,
+    md_content: str = "",
+    error: str | None = None,
+) -> dict:
+    return {
+        "original_path": file_path,
+        "markdown_path": str(markdown_path) if markdown_path else None,
+        "name": Path(file_path).name,
+        "lines": md_content.count("\n") + 1 if markdown_path else 0,
+        "chars": len(md_content),
+        "error": error,
+    }
+
+
+def _save_markdown(file_path: str, md_content: str) -> dict:
+    """Write converted markdown into ``~/.aria/workspace/uploads/``."""
+    src = Path(file_path)
+    workspace_uploads = WorkspaceConfig.path / "uploads"
+    workspace_uploads.mkdir(parents=True, exist_ok=True)
+
+    md_dest = workspace_uploads / f"{src.stem}.md"
+    # Reuse an identical earlier conversion; avoid clobbering anything else
+    if md_dest.exists() and md_dest.read_text(encoding="utf-8") != md_content:
+        md_dest = workspace_uploads / f"{src.stem}_{uuid.uuid4().hex[:8]}.md"
+    if not md_dest.exists():
+        md_dest.write_text(md_content, encoding="utf-8")
+
+    result = _conversion_result(file_path, md_dest, md_content)
+    logger.debug(
+        f"Converted {src.name} to markdown: {md_dest} "
+        f"({result['lines']} lines, {result['chars']} chars)"
+    )
+    return result
+
+
+def _convertible(file_path: str) -> bool:
+    return Path(file_path).suffix.lower() in _MARKITDOWN_EXTENSIONS
+
+
 def convert_documents_to_markdown(
     file_paths: list[str],
 ) -> list[dict]:
-    """Convert uploaded documents to markdown using MarkItDown.
+    """Convert uploaded documents to markdown using MarkItDown, in-process.
 
     For each file path, attempts conversion via MarkItDown and saves
     the resulting markdown file into the agent workspace
-    (``~/.aria/workspace/uploads/``).
+    (``~/.aria/workspace/uploads/``).  Conversions are cached by content
+    hash.  Async callers should use :func:`aconvert_documents_to_markdown`,
+    which runs MarkItDown off the event loop.
 
     Args:
         file_paths: List of uploaded file paths to convert.
@@ -306,73 +365,70 @@ def convert_documents_to_markdown(
             - chars: int (character count of converted file)
             - error: str | None (error message if conversion failed)
     """
-    if not file_paths:
-        return []
-
-    workspace_uploads = WorkspaceConfig.path / "uploads"
-    workspace_uploads.mkdir(parents=True, exist_ok=True)
-
     results = []
     for file_path in file_paths:
-        src = Path(file_path)
-        ext = src.suffix.lower()
-
-        # Check if file is convertible
-        if ext not in _MARKITDOWN_EXTENSIONS:
-            results.append(
-                {
-                    "original_path": file_path,
-                    "markdown_path": None,
-                    "name": src.name,
-                    "lines": 0,
-                    "chars": 0,
-                    "error": None,
-                }
-            )
+        if not _convertible(file_path):
+            results.append(_conversion_result(file_path))
             continue
-
         try:
-            from markitdown import MarkItDown
+            cache_dir = _conversion_cache_dir()
+            digest = content_hash(file_path)
+            md_content = load_cached_markdown(cache_dir, digest)
+            if md_content is None:
+                md_content = convert_file(file_path)
+                store_cached_markdown(cache_dir, digest, md_content)
+            results.append(_save_markdown(file_path, md_content))
+        except Exception as e:
+            logger.warning(f"MarkItDown conversion failed for {file_path}: {e}")
+            results.append(_conversion_result(file_path, error=str(e)))
+    return results
 
-            result = MarkItDown().convert(file_path)
-            md_content = result.text_content or ""
 
-            md_name = f"{src.stem}.md"
-            md_dest = workspace_uploads / md_name
-            # Avoid collisions
-            if md_dest.exists():
-                md_dest = workspace_uploads / f"{src.stem}_{uuid.uuid4().hex[:8]}.md"
+async def aconvert_documents_to_markdown(
+    file_paths: list[str],
+    on_progress: Callable[[dict], Awaitable[None]] | None = None,
+) -> list[dict]:
+    """Convert uploaded documents in the MarkItDown worker pool.
 
-            md_dest.write_text(md_content, encoding="utf-8")
+    Files are converted in parallel; cache lookups and file writes run
+    in threads so the event loop is never blocked.  *on_progress* is
+    awaited with each result as it completes.
 
-            results.append(
-                {
-                    "original_path": file_path,
-                    "markdown_path": str(md_dest),
-                    "name": src.name,
-                    "lines": md_content.count("\n") + 1,
-                    "chars": len(md_content),
-                    "error": None,
-                }
-            )
-            logger.debug(
-                f"Converted {src.name} to markdown: {md_dest} "
-                f"({md_content.count(chr(10)) + 1} lines, {len(md_content)} chars)"
-            )
-        except Exception as e:
-            logger.warning(f"MarkItDown conversion failed for {src.name}: {e}")
-            results.append(
-                {
-                    "original_path": file_path,
-                    "markdown_path": None,
-                    "name": src.name,
-                    "lines": 0,
-                    "chars": 0,
-                    "error": str(e),
-                }
-            )
+    Returns:
+        Results in the same order and shape as
+        :func:`convert_documents_to_markdown`.
+    """
+    loop = asyncio.get_running_loop()
+    cache_dir = _conversion_cache_dir()
 
-    return results
+    async def convert(file_path: str) -> dict:
+        if not _convertible(file_path):
+            result = _conversion_result(file_path)
+        else:
+            try:
+                digest = await asyncio.to_thread(content_hash, file_path)
+                md_content = await asyncio.to_thread(
+                    load_cached_markdown, cache_dir, digest
+                )
+                if md_content is None:
+                    md_content = await loop.run_in_executor(
+                        get_conversion_pool(), convert_file, file_path
+                    )
+                    await asyncio.to_thread(
+                        store_cached_markdown, cache_dir, digest, md_content
+                    )
+                result = await asyncio.to_thread(_save_markdown, file_path, md_content)
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # A worker died (e.g. OOM); start a fresh pool next time.
+                    shutdown_conversion_pool()
+                logger.warning(f"MarkItDown conversion failed for {file_path}: {e}")
+                result = _conversion_result(file_path, error=str(e))
+        if on_progress is not None:
+            await on_progress(result)
+        return result
+
+    return list(await asyncio.gather(*(convert(p) for p in file_paths)))
 
 
 def _sanitize_chat_history(
@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
+import httpx
 from chromadb.api import ClientAPI
 from llama_index.core.agent.workflow import AgentWorkflow
 from llama_index.core.base.embeddings.base import BaseEmbedding
@@ -57,6 +58,7 @@ class AppState(BaseModel):
     - vLLM server manager
     - Browser manager
     - Database engine
+    - Pooled HTTP client for side requests (e.g. image descriptions)
 
     The state is populated by on_app_startup_handler() in lifecycle.py
     and cleaned up by on_app_shutdown_handler().
@@ -72,6 +74,7 @@ class AppState(BaseModel):
     vllm_manager: VllmServerManager | None = None
     browser_manager: Any = None
     db_engine: Engine | None = None
+    http_client: httpx.AsyncClient | None = None
     startup_complete: bool = False
     startup_event: asyncio.Event = asyncio.Event()
 
@@ -86,6 +89,19 @@ class AppState(BaseModel):
             and self.startup_complete
         )
 
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled HTTP client, creating it on first use.
+
+        Keeping one client alive lets repeated requests to the inference
+        endpoint reuse TCP/TLS connections instead of reconnecting.
+        """
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            )
+        return self.http_client
+
     def validate_initialized(self) -> None:
         """Validate that the application state is fully initialized."""
         if not self.is_initialized():
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -294,11 +295,10 @@ class TestDescribeImage:
         monkeypatch.setattr(pipeline.VllmConfig, "api_key", "sk-test")
 
     @staticmethod
-    def _make_mock_httpx(mock_client):
-        """Build a mock httpx module with AsyncClient returning mock_client."""
-        mock_httpx = MagicMock()
-        mock_httpx.AsyncClient.return_value = mock_client
-        return mock_httpx
+    def _use_client(monkeypatch, mock_client):
+        """Install mock_client as the shared pooled client on AppState."""
+        mock_client.is_closed = False
+        monkeypatch.setattr(pipeline._state, "http_client", mock_client)
 
     @pytest.mark.asyncio
     async def test_returns_description_on_success(self, monkeypatch) -> None:
@@ -311,11 +311,9 @@ class TestDescribeImage:
         }
 
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        monkeypatch.setattr(pipeline, "httpx", self._make_mock_httpx(mock_client))
+        self._use_client(monkeypatch, mock_client)
 
         result = await pipeline._describe_image("image/png", "base64data", "test.png")
         assert result == "A screenshot of a dashboard."
@@ -334,11 +332,9 @@ class TestDescribeImage:
         )
 
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        monkeypatch.setattr(pipeline, "httpx", self._make_mock_httpx(mock_client))
+        self._use_client(monkeypatch, mock_client)
 
         with pytest.raises(real_httpx.HTTPStatusError):
             await pipeline._describe_image("image/jpeg", "base64data", "bad.jpg")
@@ -354,11 +350,9 @@ class TestDescribeImage:
         }
 
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        monkeypatch.setattr(pipeline, "httpx", self._make_mock_httpx(mock_client))
+        self._use_client(monkeypatch, mock_client)
 
         await pipeline._describe_image("image/png", "abc123", "img.png")
 
@@ -384,6 +378,12 @@ class TestDescribeImage:
 class TestHandleMessageVision:
     """Tests for _handle_message vision image processing."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_description_cache(self):
+        pipeline._image_descriptions.clear()
+        yield
+        pipeline._image_descriptions.clear()
+
     @pytest.mark.asyncio
     async def test_appends_image_descriptions_when_vision_enabled(
         self, monkeypatch
@@ -412,7 +412,9 @@ class TestHandleMessageVision:
 
         assert "[Attached images]:" in prompt
         assert "[Image 1 (a.png)]: A red circle on white background." in prompt
-        assert meta == {}
+        assert [(t["name"], t["cached"]) for t in meta["image_timings"]] == [
+            ("a.png", False)
+        ]
 
     @pytest.mark.asyncio
     async def test_appends_disabled_notice_when_vision_off(self, monkeypatch) -> None:
@@ -467,17 +469,19 @@ class TestHandleMessageVision:
         )
         monkeypatch.setattr(
             pipeline,
-            "convert_documents_to_markdown",
-            lambda paths: [
-                {
-                    "original_path": "/tmp/report.pdf",
-                    "markdown_path": "/workspace/uploads/report.md",
-                    "name": "report.pdf",
-                    "lines": 42,
-                    "chars": 1200,
-                    "error": None,
-                }
-            ],
+            "aconvert_documents_to_markdown",
+            AsyncMock(
+                return_value=[
+                    {
+                        "original_path": "/tmp/report.pdf",
+                        "markdown_path": "/workspace/uploads/report.md",
+                        "name": "report.pdf",
+                        "lines": 42,
+                        "chars": 1200,
+                        "error": None,
+                    }
+                ]
+            ),
         )
         monkeypatch.setattr(
             pipeline,
@@ -542,6 +546,57 @@ class TestHandleMessageVision:
         assert "[Attached images]:" in prompt
         assert "<description unavailable>" in prompt
 
+    @pytest.mark.asyncio
+    async def test_describes_images_concurrently_in_order(self, monkeypatch) -> None:
+        monkeypatch.setattr(pipeline.VllmConfig, "vision_enabled", True)
+        monkeypatch.setattr(pipeline.VllmConfig, "vision_concurrency", 3)
+        images = [
+            {"mime_type": "image/png", "base64": f"img{i}", "name": f"{i}.png"}
+            for i in range(6)
+        ]
+        monkeypatch.setattr(pipeline, "extract_image_data", lambda msg: images)
+        monkeypatch.setattr(pipeline, "extract_file_paths", lambda msg: [])
+
+        in_flight = peak = 0
+
+        async def describe(mime_type, base64_data, prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"desc of {base64_data}"
+
+        monkeypatch.setattr(pipeline, "_describe_image", describe)
+        message = SimpleNamespace(
+            content="Screens", command=None, thread_id="t4", elements=[]
+        )
+
+        prompt, meta = await pipeline._handle_message(message)
+
+        assert peak == 3
+        lines = [line for line in prompt.splitlines() if line.startswith("[Image")]
+        assert lines == [f"[Image {i + 1} ({i}.png)]: desc of img{i}" for i in range(6)]
+        assert len(meta["image_timings"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_reuses_cached_descriptions(self, monkeypatch) -> None:
+        monkeypatch.setattr(pipeline.VllmConfig, "vision_enabled", True)
+        img = {"mime_type": "image/png", "base64": "same", "name": "a.png"}
+        monkeypatch.setattr(pipeline, "extract_image_data", lambda msg: [img, img])
+        monkeypatch.setattr(pipeline, "extract_file_paths", lambda msg: [])
+        describe = AsyncMock(return_value="A cat.")
+        monkeypatch.setattr(pipeline, "_describe_image", describe)
+        message = SimpleNamespace(
+            content="Again", command=None, thread_id="t5", elements=[]
+        )
+
+        await pipeline._handle_message(message)
+        _, meta = await pipeline._handle_message(message)
+
+        assert describe.await_count == 1
+        assert [t["cached"] for t in meta["image_timings"]] == [True, True]
+
 
 class TestEditDetection:
     """Tests for metadata-based edit detection."""
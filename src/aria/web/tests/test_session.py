@@ -677,3 +677,85 @@ def test_sanitize_chat_history_leading_assistant_dropped() -> None:
     ]
     result = session_module._sanitize_chat_history(msgs)
     assert [m.content for m in result] == ["a", "b"]
+
+
+class TestAsyncConvertDocuments:
+    """Tests for aconvert_documents_to_markdown()."""
+
+    @staticmethod
+    @pytest.fixture
+    def fake_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(
+            session_module.WorkspaceConfig, "path", tmp_path / "workspace"
+        )
+        calls: list[str] = []
+
+        def convert(path: str) -> str:
+            calls.append(path)
+            return f"# {Path(path).name}\n\n" + Path(path).read_text()
+
+        pool = ThreadPoolExecutor(max_workers=2)
+        monkeypatch.setattr(session_module, "convert_file", convert)
+        monkeypatch.setattr(session_module, "get_conversion_pool", lambda: pool)
+        yield calls
+        pool.shutdown()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_converts_in_order_with_progress(
+        fake_pool: list[str], tmp_path: Path
+    ) -> None:
+        paths = []
+        for name in ("a.txt", "b.csv", "c.bin"):
+            (tmp_path / name).write_text("data\n")
+            paths.append(str(tmp_path / name))
+        seen: list[str] = []
+
+        async def progress(result: dict) -> None:
+            seen.append(result["name"])
+
+        results = await session_module.aconvert_documents_to_markdown(
+            paths, on_progress=progress
+        )
+
+        assert [r["name"] for r in results] == ["a.txt", "b.csv", "c.bin"]
+        assert results[0]["markdown_path"].endswith("a.md")
+        assert results[2]["markdown_path"] is None
+        assert sorted(seen) == ["a.txt", "b.csv", "c.bin"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_same_content_is_converted_once(
+        fake_pool: list[str], tmp_path: Path
+    ) -> None:
+        first = tmp_path / "report.txt"
+        first.write_text("same bytes\n")
+        copy = tmp_path / "copy" / "report.txt"
+        copy.parent.mkdir()
+        copy.write_text("same bytes\n")
+
+        one = await session_module.aconvert_documents_to_markdown([str(first)])
+        two = await session_module.aconvert_documents_to_markdown([str(copy)])
+
+        assert fake_pool == [str(first)]
+        # Identical output is reused instead of writing a suffixed copy
+        assert one[0]["markdown_path"] == two[0]["markdown_path"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reports_conversion_errors(
+        monkeypatch: pytest.MonkeyPatch, fake_pool: list[str], tmp_path: Path
+    ) -> None:
+        def boom(path: str) -> str:
+            raise ValueError("unsupported layout")
+
+        monkeypatch.setattr(session_module, "convert_file", boom)
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"%PDF")
+
+        results = await session_module.aconvert_documents_to_markdown([str(bad)])
+
+        assert results[0]["markdown_path"] is None
+        assert results[0]["error"] == "unsupported layout"
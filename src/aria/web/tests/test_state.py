@@ -135,3 +135,23 @@ class TestAppStateNotInitializedError:
 
     def test_is_runtime_error(self) -> None:
         assert issubclass(AppStateNotInitializedError, RuntimeError)
+
+
+class TestHttpClient:
+    """Tests for the shared pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self) -> None:
+        state = AppState()
+        client = state.get_http_client()
+        assert state.get_http_client() is client
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self) -> None:
+        state = AppState()
+        client = state.get_http_client()
+        await client.aclose()
+        replacement = state.get_http_client()
+        assert replacement is not client
+        await replacement.aclose()